@@ -54,7 +54,7 @@ async def main() -> None:
     http_client = create_http_client(token)
 
     # Initialize services
-    buffer = BufferManager()
+    buffer = BufferManager(batch_encryption=os.environ.get("KMFLOW_BUFFER_BATCH_ENCRYPTION", "0") == "1")
     config = ConfigManager(
         backend_url=backend_url,
         agent_id=agent_id,
@@ -64,6 +64,8 @@ async def main() -> None:
         buffer=buffer,
         config=config,
         http_client=http_client,
+        max_in_flight=int(os.environ.get("KMFLOW_UPLOAD_MAX_IN_FLIGHT", "4")),
+        compression=os.environ.get("KMFLOW_UPLOAD_COMPRESSION", "gzip"),
     )
     health = HealthReporter(
         backend_url=backend_url,
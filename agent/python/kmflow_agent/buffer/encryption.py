@@ -1,8 +1,9 @@
 """AES-256-GCM envelope encryption for buffer payloads.
 
-Each event is encrypted with a random nonce. The encryption key
-is derived from the macOS Keychain in production, or from an
-environment variable during development.
+Each event (or, with block encryption, each batch of events) is
+encrypted with a random nonce. The encryption key is derived from the
+macOS Keychain in production, or from an environment variable during
+development.
 """
 
 from __future__ import annotations
@@ -34,3 +35,23 @@ def decrypt_payload(data: bytes, key: bytes) -> bytes:
     ciphertext = data[NONCE_SIZE:]
     aesgcm = AESGCM(key[:32])
     return aesgcm.decrypt(nonce, ciphertext, None)
+
+
+class PayloadCipher:
+    """AES-256-GCM cipher bound to one key.
+
+    Same format as ``encrypt_payload``/``decrypt_payload``, without
+    re-running the key setup for every payload.
+    """
+
+    def __init__(self, key: bytes) -> None:
+        self._aesgcm = AESGCM(key[:32])
+
+    def encrypt(self, plaintext: bytes) -> bytes:
+        """Return nonce (12 bytes) || ciphertext."""
+        nonce = os.urandom(NONCE_SIZE)
+        return nonce + self._aesgcm.encrypt(nonce, plaintext, None)
+
+    def decrypt(self, data: bytes) -> bytes:
+        """Decrypt nonce (12 bytes) || ciphertext."""
+        return self._aesgcm.decrypt(data[:NONCE_SIZE], data[NONCE_SIZE:], None)
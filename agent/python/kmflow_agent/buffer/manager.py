@@ -2,7 +2,13 @@
 
 Events are stored in WAL mode for concurrent read/write.
 The buffer enforces a 100MB size limit by pruning oldest events.
-Encryption wraps individual event payloads using AES-256-GCM.
+Encryption wraps individual event payloads using AES-256-GCM, or with
+``batch_encryption`` one payload per written batch.
+
+Writes are group-committed: ``write_event`` queues the event and returns
+its id; queued events are written in one transaction after
+``commit_interval`` seconds, or at once when ``max_batch_events`` are
+queued. Reads, counts and ``close`` flush the queue first.
 """
 
 from __future__ import annotations
@@ -12,43 +18,98 @@ import json
 import logging
 import os
 import sqlite3
+import threading
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from kmflow_agent.buffer.encryption import decrypt_payload, encrypt_payload
+from kmflow_agent.buffer.encryption import PayloadCipher
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_DB_PATH = os.path.expanduser("~/Library/Application Support/KMFlowAgent/buffer.db")
 MAX_BUFFER_SIZE_BYTES = 100 * 1024 * 1024  # 100 MB
+DEFAULT_COMMIT_INTERVAL_SECONDS = 0.005
+DEFAULT_MAX_BATCH_EVENTS = 500
+SIZE_CHECK_EVERY_EVENTS = 100
 
 CREATE_TABLE = """
 CREATE TABLE IF NOT EXISTS events (
     id TEXT PRIMARY KEY,
     event_json_encrypted BLOB NOT NULL,
     created_at TEXT NOT NULL,
-    uploaded INTEGER DEFAULT 0
+    uploaded INTEGER DEFAULT 0,
+    block_id TEXT,
+    block_index INTEGER
+);
+"""
+
+CREATE_BLOCKS_TABLE = """
+CREATE TABLE IF NOT EXISTS event_blocks (
+    id TEXT PRIMARY KEY,
+    payload_encrypted BLOB NOT NULL,
+    created_at TEXT NOT NULL
 );
 """
 
+# Covers read_pending (ordered by created_at, then rowid) and count_pending
 CREATE_INDEX = """
-CREATE INDEX IF NOT EXISTS ix_events_uploaded ON events(uploaded);
+CREATE INDEX IF NOT EXISTS ix_events_uploaded_created_at ON events(uploaded, created_at);
+"""
+
+CREATE_BLOCK_INDEX = """
+CREATE INDEX IF NOT EXISTS ix_events_block_id ON events(block_id) WHERE block_id IS NOT NULL;
 """
 
+# WAL with synchronous=NORMAL only risks the last commits on power loss,
+# never corruption; the journal limit keeps the -wal file from growing unbounded.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA cache_size=-8000;",
+    "PRAGMA busy_timeout=5000;",
+    "PRAGMA wal_autocheckpoint=1000;",
+    "PRAGMA journal_size_limit=16777216;",
+)
+
+_PendingEvent = tuple[str, bytes, str]  # (event id, JSON payload, created_at)
+PendingCursor = tuple[str, int]  # (created_at, rowid) of the last pending event read
+
 
 class BufferManager:
-    """Manages the local SQLite event buffer."""
+    """Manages the local SQLite event buffer.
+
+    Args:
+        db_path: SQLite database file.
+        encryption_key: AES-256 key; read from env or Keychain if omitted.
+        commit_interval: Seconds queued events wait for more to share a commit.
+        max_batch_events: Queue length that triggers an immediate commit.
+        batch_encryption: Encrypt each committed batch as one payload
+            instead of each event separately.
+    """
 
     def __init__(
         self,
         db_path: str = DEFAULT_DB_PATH,
         encryption_key: bytes | None = None,
+        *,
+        commit_interval: float = DEFAULT_COMMIT_INTERVAL_SECONDS,
+        max_batch_events: int = DEFAULT_MAX_BATCH_EVENTS,
+        batch_encryption: bool = False,
     ) -> None:
         self.db_path = db_path
         self._encryption_key = encryption_key or self._default_key()
+        self._cipher = PayloadCipher(self._encryption_key)
+        self.commit_interval = commit_interval
+        self.max_batch_events = max(1, max_batch_events)
+        self.batch_encryption = batch_encryption
         self._conn: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        self._pending: list[_PendingEvent] = []
+        self._flush_lock: asyncio.Lock | None = None
+        self._flush_task: asyncio.Task[None] | None = None
         self._write_count = 0
         self._ensure_db()
 
@@ -154,55 +215,142 @@ class BufferManager:
         """Create the database directory and tables."""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self._conn.execute("PRAGMA journal_mode=WAL;")
+        for pragma in PRAGMAS:
+            self._conn.execute(pragma)
         self._conn.execute(CREATE_TABLE)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(events)")}
+        # Buffers created before block encryption lack the block columns
+        for column, column_type in (("block_id", "TEXT"), ("block_index", "INTEGER")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE events ADD COLUMN {column} {column_type}")
+        self._conn.execute(CREATE_BLOCKS_TABLE)
+        self._conn.execute("DROP INDEX IF EXISTS ix_events_uploaded")
         self._conn.execute(CREATE_INDEX)
+        self._conn.execute(CREATE_BLOCK_INDEX)
         self._conn.commit()
 
-    def _db_write_event(self, event: dict[str, Any]) -> str:
-        """Synchronous DB write — called via asyncio.to_thread."""
-        event_id = str(uuid.uuid4())
-        payload = json.dumps(event).encode("utf-8")
-        encrypted = encrypt_payload(payload, self._encryption_key)
-        now = datetime.now(UTC).isoformat()
+    def _db_write_batch(self, batch: list[_PendingEvent]) -> None:
+        """Synchronous DB write of queued events in one transaction — called via asyncio.to_thread."""
+        if self.batch_encryption:
+            block_id = str(uuid.uuid4())
+            block = self._cipher.encrypt(b"[" + b",".join(payload for _, payload, _ in batch) + b"]")
+            rows = [(event_id, b"", created_at, block_id, i) for i, (event_id, _, created_at) in enumerate(batch)]
+        else:
+            rows = [
+                (event_id, self._cipher.encrypt(payload), created_at, None, None)
+                for event_id, payload, created_at in batch
+            ]
 
         assert self._conn is not None
-        self._conn.execute(
-            "INSERT INTO events (id, event_json_encrypted, created_at) VALUES (?, ?, ?)",
-            (event_id, encrypted, now),
-        )
-        self._conn.commit()
-        self._write_count += 1
+        with self._db_lock:
+            try:
+                if self.batch_encryption:
+                    self._conn.execute(
+                        "INSERT INTO event_blocks (id, payload_encrypted, created_at) VALUES (?, ?, ?)",
+                        (block_id, block, batch[0][2]),
+                    )
+                self._conn.executemany(
+                    "INSERT INTO events (id, event_json_encrypted, created_at, block_id, block_index)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
+                raise
 
         # Check buffer size every 100 writes
-        if self._write_count % 100 == 0:
+        before = self._write_count
+        self._write_count += len(batch)
+        if self._write_count // SIZE_CHECK_EVERY_EVENTS > before // SIZE_CHECK_EVERY_EVENTS:
             self._enforce_size_limit_sync()
 
+    async def write_event(self, event: dict[str, Any]) -> str:
+        """Queue an event for the next group commit. Returns the event ID.
+
+        Waits for a commit only when ``max_batch_events`` are queued, which
+        bounds memory use under sustained load.
+        """
+        event_id = str(uuid.uuid4())
+        self._pending.append((event_id, json.dumps(event).encode("utf-8"), datetime.now(UTC).isoformat()))
+        if len(self._pending) >= self.max_batch_events:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
         return event_id
 
-    async def write_event(self, event: dict[str, Any]) -> str:
-        """Write an event to the buffer. Returns the event ID."""
-        return await asyncio.to_thread(self._db_write_event, event)
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(self.commit_interval)
+        try:
+            await self.flush()
+        except sqlite3.Error:
+            logger.exception("Buffer group commit failed")
+
+    async def flush(self) -> None:
+        """Commit every queued event."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            while self._pending:
+                batch = self._pending[: self.max_batch_events]
+                del self._pending[: len(batch)]
+                await asyncio.to_thread(self._db_write_batch, batch)
+
+    def _decrypt_blocks(self, block_ids: set[str]) -> dict[str, list[dict[str, Any]]]:
+        assert self._conn is not None
+        if not block_ids:
+            return {}
+        placeholders = ",".join("?" for _ in block_ids)
+        cursor = self._conn.execute(
+            f"SELECT id, payload_encrypted FROM event_blocks WHERE id IN ({placeholders})",
+            list(block_ids),
+        )
+        return {block_id: json.loads(self._cipher.decrypt(blob)) for block_id, blob in cursor.fetchall()}
 
-    def _db_read_pending(self, limit: int) -> list[dict[str, Any]]:
+    def _db_read_pending(
+        self, limit: int, after: PendingCursor | None = None
+    ) -> tuple[list[dict[str, Any]], PendingCursor | None]:
         """Synchronous DB read — called via asyncio.to_thread."""
         assert self._conn is not None
-        cursor = self._conn.execute(
-            "SELECT id, event_json_encrypted FROM events WHERE uploaded = 0 ORDER BY created_at LIMIT ?",
-            (limit,),
+        query = (
+            "SELECT id, event_json_encrypted, block_id, block_index, created_at, rowid FROM events WHERE uploaded = 0"
         )
+        params: list[Any] = []
+        if after is not None:
+            query += " AND (created_at, rowid) > (?, ?)"
+            params.extend(after)
+        with self._db_lock:
+            rows = self._conn.execute(f"{query} ORDER BY created_at, rowid LIMIT ?", (*params, limit)).fetchall()
+            blocks = self._decrypt_blocks({row[2] for row in rows if row[2] is not None})
         results = []
-        for row in cursor.fetchall():
-            event_id, encrypted = row
-            payload = decrypt_payload(encrypted, self._encryption_key)
-            event = json.loads(payload.decode("utf-8"))
+        for event_id, encrypted, block_id, block_index, _created_at, _rowid in rows:
+            if block_id is not None:
+                event = dict(blocks[block_id][block_index])
+            else:
+                event = json.loads(self._cipher.decrypt(encrypted).decode("utf-8"))
             event["_buffer_id"] = event_id
             results.append(event)
-        return results
+        cursor = (rows[-1][4], rows[-1][5]) if rows else after
+        return results, cursor
 
     async def read_pending(self, limit: int = 100) -> list[dict[str, Any]]:
         """Read pending (not yet uploaded) events from the buffer."""
-        return await asyncio.to_thread(self._db_read_pending, limit)
+        events, _ = await self.read_pending_page(limit)
+        return events
+
+    async def read_pending_page(
+        self, limit: int = 100, after: PendingCursor | None = None
+    ) -> tuple[list[dict[str, Any]], PendingCursor | None]:
+        """Read the pending events that follow ``after``, oldest first.
+
+        Lets the uploader read ahead while earlier pages are still being
+        uploaded (and so still pending).
+
+        Returns:
+            The events and the cursor to pass as ``after`` for the next page.
+        """
+        await self.flush()
+        return await asyncio.to_thread(self._db_read_pending, limit, after)
 
     def _db_mark_uploaded(self, event_ids: list[str]) -> None:
         """Synchronous DB update — called via asyncio.to_thread."""
@@ -210,21 +358,30 @@ class BufferManager:
             return
         assert self._conn is not None
         placeholders = ",".join("?" for _ in event_ids)
-        self._conn.execute(
-            f"UPDATE events SET uploaded = 1 WHERE id IN ({placeholders})",
-            event_ids,
-        )
-        self._conn.commit()
+        with self._db_lock:
+            self._conn.execute(
+                f"UPDATE events SET uploaded = 1 WHERE id IN ({placeholders})",
+                event_ids,
+            )
+            self._conn.commit()
 
     async def mark_uploaded(self, event_ids: list[str]) -> None:
         """Mark events as successfully uploaded."""
         await asyncio.to_thread(self._db_mark_uploaded, event_ids)
 
+    def _delete_orphan_blocks(self) -> None:
+        assert self._conn is not None
+        self._conn.execute(
+            "DELETE FROM event_blocks WHERE NOT EXISTS (SELECT 1 FROM events WHERE events.block_id = event_blocks.id)"
+        )
+
     def _db_prune_uploaded(self) -> int:
         """Synchronous DB delete — called via asyncio.to_thread."""
         assert self._conn is not None
-        cursor = self._conn.execute("DELETE FROM events WHERE uploaded = 1")
-        self._conn.commit()
+        with self._db_lock:
+            cursor = self._conn.execute("DELETE FROM events WHERE uploaded = 1")
+            self._delete_orphan_blocks()
+            self._conn.commit()
         return cursor.rowcount
 
     async def prune_uploaded(self) -> int:
@@ -234,11 +391,13 @@ class BufferManager:
     def _db_count_pending(self) -> int:
         """Synchronous DB count — called via asyncio.to_thread."""
         assert self._conn is not None
-        cursor = self._conn.execute("SELECT COUNT(*) FROM events WHERE uploaded = 0")
-        return cursor.fetchone()[0]
+        with self._db_lock:
+            cursor = self._conn.execute("SELECT COUNT(*) FROM events WHERE uploaded = 0")
+            return cursor.fetchone()[0]
 
     async def count_pending(self) -> int:
         """Count pending events in the buffer."""
+        await self.flush()
         return await asyncio.to_thread(self._db_count_pending)
 
     def _enforce_size_limit_sync(self) -> None:
@@ -250,13 +409,15 @@ class BufferManager:
             return
 
         if size > MAX_BUFFER_SIZE_BYTES:
-            total = self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
-            to_delete = max(total // 10, 100)
-            self._conn.execute(
-                "DELETE FROM events WHERE id IN (SELECT id FROM events ORDER BY created_at LIMIT ?)",
-                (to_delete,),
-            )
-            self._conn.commit()
+            with self._db_lock:
+                total = self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+                to_delete = max(total // 10, 100)
+                self._conn.execute(
+                    "DELETE FROM events WHERE id IN (SELECT id FROM events ORDER BY created_at LIMIT ?)",
+                    (to_delete,),
+                )
+                self._delete_orphan_blocks()
+                self._conn.commit()
             logger.warning(
                 "Buffer size limit exceeded (%d bytes), pruned %d events",
                 size,
@@ -264,7 +425,12 @@ class BufferManager:
             )
 
     async def close(self) -> None:
-        """Close the database connection."""
+        """Commit queued events and close the database connection."""
         if self._conn:
+            # Waits for a commit already in progress before closing
+            await self.flush()
             self._conn.close()
             self._conn = None
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
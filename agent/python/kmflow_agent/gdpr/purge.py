@@ -49,6 +49,9 @@ class DataPurgeManager:
             count = cursor.fetchone()[0]
 
             conn.execute("DELETE FROM events")
+            # Block-encrypted event batches (BufferManager batch_encryption)
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'event_blocks'").fetchone():
+                conn.execute("DELETE FROM event_blocks")
             conn.execute("VACUUM")
             conn.commit()
             conn.close()
@@ -1,32 +1,61 @@
-"""Batch uploader: gzip-compressed event batches with exponential backoff.
+"""Batch uploader: pipelined, compressed event batches with exponential backoff.
 
-Reads pending events from the SQLite buffer, compresses with gzip,
-uploads to POST /api/v1/taskmining/events, and marks them as uploaded.
+Reads pending events from the SQLite buffer, compresses them (gzip, or
+zstd with a dictionary trained on the agent's own events), uploads them
+to POST /api/v1/taskmining/events, and marks them as uploaded.
+
+Up to ``max_in_flight`` batches are uploaded at once, so a backlog after
+a long offline period drains at the link's throughput rather than one
+round trip at a time. Batches can therefore complete out of order; each
+batch is independent on the backend. The batch size adapts to the
+observed round-trip latency and body size.
 """
 
 from __future__ import annotations
 
 import asyncio
-import gzip
 import hashlib
 import json
 import logging
+import time
 import uuid
 from typing import Any
 
 import httpx
 
-from kmflow_agent.buffer.manager import BufferManager
+from kmflow_agent.buffer.manager import BufferManager, PendingCursor
 from kmflow_agent.config.manager import ConfigManager
+from kmflow_agent.upload.compression import ENCODING_GZIP, PayloadEncoder
 
 logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 5
 BASE_BACKOFF_SECONDS = 2
+DEFAULT_MAX_IN_FLIGHT = 4
+MIN_BATCH_SIZE = 10
+MAX_EVENTS_PER_BATCH = 1000  # EventBatchRequest limit on the backend
+TARGET_LATENCY_SECONDS = 2.0
+MAX_PAYLOAD_BYTES = 1024 * 1024  # compressed body
 
 
 class BatchUploader:
-    """Uploads buffered events to the KMFlow backend."""
+    """Uploads buffered events to the KMFlow backend.
+
+    Args:
+        buffer: Event buffer to drain.
+        config: Backend URL and agent id.
+        http_client: Shared authenticated client.
+        batch_size: Events per batch (the starting size when adaptive).
+        interval_seconds: Pause between drain cycles.
+        max_in_flight: Batches uploaded concurrently.
+        compression: ``"gzip"`` or ``"zstd"``.
+        adaptive_batch_size: Grow the batch size while uploads are fast and
+            small, halve it when they are slow, oversized or failing.
+        min_batch_size: Lower bound for the adaptive batch size.
+        max_batch_size: Upper bound for the adaptive batch size.
+        target_latency_seconds: Upload round trip above which batches shrink.
+        max_payload_bytes: Compressed body size above which batches shrink.
+    """
 
     def __init__(
         self,
@@ -35,17 +64,38 @@ class BatchUploader:
         http_client: httpx.AsyncClient,
         batch_size: int = 100,
         interval_seconds: int = 30,
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        compression: str = ENCODING_GZIP,
+        adaptive_batch_size: bool = True,
+        min_batch_size: int = MIN_BATCH_SIZE,
+        max_batch_size: int = MAX_EVENTS_PER_BATCH,
+        target_latency_seconds: float = TARGET_LATENCY_SECONDS,
+        max_payload_bytes: int = MAX_PAYLOAD_BYTES,
     ) -> None:
         self.buffer = buffer
         self.config = config
         self._client = http_client
         self.batch_size = batch_size
         self.interval_seconds = interval_seconds
+        self.max_in_flight = max(1, max_in_flight)
+        self.adaptive_batch_size = adaptive_batch_size
+        self.min_batch_size = max(1, min(min_batch_size, batch_size))
+        self.max_batch_size = max(batch_size, min(max_batch_size, MAX_EVENTS_PER_BATCH))
+        self.target_latency_seconds = target_latency_seconds
+        self.max_payload_bytes = max_payload_bytes
+        self.encoder = PayloadEncoder(compression)
+        self._dictionary: bytes | None = None
         self._upload_count = 0
 
     async def run(self, shutdown_event: asyncio.Event) -> None:
         """Periodically drain the buffer and upload batches."""
-        logger.info("Batch uploader started (interval=%ds)", self.interval_seconds)
+        logger.info(
+            "Batch uploader started (interval=%ds, in-flight=%d, encoding=%s)",
+            self.interval_seconds,
+            self.max_in_flight,
+            self.encoder.encoding,
+        )
         while not shutdown_event.is_set():
             try:
                 await self._upload_pending()
@@ -60,27 +110,46 @@ class BatchUploader:
         logger.info("Batch uploader stopped (%d batches uploaded)", self._upload_count)
 
     async def _upload_pending(self) -> None:
-        """Upload all pending events from the buffer."""
-        while True:
-            events = await self.buffer.read_pending(limit=self.batch_size)
-            if not events:
-                break
-
-            batch_id = str(uuid.uuid4())
-            event_ids = [e.pop("_buffer_id") for e in events]
-
-            success = await self._upload_batch(batch_id, events)
-            if success:
-                await self.buffer.mark_uploaded(event_ids)
-                self._upload_count += 1
-            else:
-                break  # stop trying, will retry next cycle
+        """Upload all pending events, keeping up to ``max_in_flight`` batches in flight.
+
+        Stops reading new batches after the first failure; batches already
+        in flight finish, and failed events stay pending for the next cycle.
+        """
+        in_flight: set[asyncio.Task[bool]] = set()
+        cursor: PendingCursor | None = None
+        drained = failed = False
+        try:
+            while True:
+                while not (drained or failed) and len(in_flight) < self.max_in_flight:
+                    events, cursor = await self.buffer.read_pending_page(self.batch_size, after=cursor)
+                    if not events:
+                        drained = True
+                        break
+                    await self._maybe_register_dictionary(events)
+                    in_flight.add(asyncio.create_task(self._send(events)))
+                if not in_flight:
+                    break
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                failed = failed or not all(task.result() for task in done)
+        finally:
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
 
         # Prune uploaded events
         await self.buffer.prune_uploaded()
 
-    async def _upload_batch(self, batch_id: str, events: list[dict[str, Any]]) -> bool:
-        """Upload a single batch with gzip compression and retry logic."""
+    async def _send(self, events: list[dict[str, Any]]) -> bool:
+        """Upload one batch and mark its events uploaded on success."""
+        batch_id = str(uuid.uuid4())
+        event_ids = [e.pop("_buffer_id") for e in events]
+        if not await self._upload_batch(batch_id, events):
+            return False
+        await self.buffer.mark_uploaded(event_ids)
+        self._upload_count += 1
+        return True
+
+    def _encode_batch(self, events: list[dict[str, Any]]) -> tuple[bytes, str]:
+        """Serialize and compress a batch — called via asyncio.to_thread."""
         payload = json.dumps(
             {
                 "agent_id": self.config.agent_id,
@@ -88,25 +157,38 @@ class BatchUploader:
                 "events": events,
             }
         ).encode("utf-8")
+        return self.encoder.encode(payload), hashlib.sha256(payload).hexdigest()
 
-        compressed = gzip.compress(payload)
-        checksum = hashlib.sha256(payload).hexdigest()
+    async def _upload_batch(self, batch_id: str, events: list[dict[str, Any]]) -> bool:
+        """Upload a single batch with compression and retry logic."""
+        compressed, checksum = await asyncio.to_thread(self._encode_batch, events)
 
         for attempt in range(MAX_RETRIES):
             try:
+                start = time.monotonic()
                 response = await self._client.post(
                     f"{self.config.backend_url}/api/v1/taskmining/events",
                     content=compressed,
                     headers={
                         "Content-Type": "application/json",
-                        "Content-Encoding": "gzip",
+                        "Content-Encoding": self.encoder.encoding,
                         "X-Batch-Id": batch_id,
                         "X-Checksum": checksum,
                     },
                 )
+                latency = time.monotonic() - start
                 if response.status_code in (200, 201, 202):
                     logger.info("Batch %s uploaded (%d events)", batch_id[:8], len(events))
+                    self._adapt_batch_size(len(events), latency, len(compressed))
                     return True
+                if response.status_code == 409 and self._dictionary is not None:
+                    # The backend lost the dictionary (e.g. Redis was flushed); register it again
+                    logger.warning(
+                        "Backend does not know zstd dictionary %s, re-registering", self.encoder.dictionary_id
+                    )
+                    if await self._register_dictionary(self._dictionary):
+                        continue
+                    return False
                 if response.status_code >= 500:
                     logger.warning(
                         "Server error %d for batch %s (attempt %d/%d)",
@@ -131,6 +213,7 @@ class BatchUploader:
                     str(e),
                 )
 
+            self._shrink_batch_size()
             # Exponential backoff: 2, 4, 8, 16, 32 seconds
             backoff = BASE_BACKOFF_SECONDS * (2**attempt)
             await asyncio.sleep(backoff)
@@ -141,3 +224,48 @@ class BatchUploader:
             MAX_RETRIES,
         )
         return False
+
+    def _adapt_batch_size(self, event_count: int, latency: float, body_bytes: int) -> None:
+        """Grow by half after a fast, full, small upload; halve after a slow or oversized one."""
+        if not self.adaptive_batch_size or event_count == 0:
+            return
+        if latency > self.target_latency_seconds or body_bytes > self.max_payload_bytes:
+            self._shrink_batch_size()
+            return
+        if event_count < self.batch_size:
+            return  # a partial batch says nothing about larger ones
+        fits = int(self.max_payload_bytes / (body_bytes / event_count)) if body_bytes else self.max_batch_size
+        self.batch_size = max(self.min_batch_size, min(self.batch_size * 3 // 2 + 1, fits, self.max_batch_size))
+
+    def _shrink_batch_size(self) -> None:
+        if self.adaptive_batch_size:
+            self.batch_size = max(self.min_batch_size, self.batch_size // 2)
+
+    async def _maybe_register_dictionary(self, events: list[dict[str, Any]]) -> None:
+        """Sample events and, once enough are sampled, train and register a zstd dictionary."""
+        self.encoder.observe(events)
+        if not self.encoder.ready_to_train:
+            return
+        dictionary = await asyncio.to_thread(self.encoder.train)
+        if await self._register_dictionary(dictionary):
+            self.encoder.use_dictionary(dictionary)
+            self._dictionary = dictionary
+        else:
+            self.encoder.stop_training()
+
+    async def _register_dictionary(self, dictionary: bytes) -> bool:
+        """POST a trained dictionary to the backend; False if it was not accepted."""
+        try:
+            response = await self._client.post(
+                f"{self.config.backend_url}/api/v1/taskmining/compression/dictionaries",
+                content=dictionary,
+                headers={"Content-Type": "application/octet-stream"},
+            )
+        except httpx.HTTPError as e:
+            logger.warning("Could not register zstd dictionary: %s", e)
+            return False
+        if response.status_code not in (200, 201):
+            logger.warning("zstd dictionary rejected: %d %s", response.status_code, response.text[:200])
+            return False
+        logger.info("Registered %d-byte zstd dictionary", len(dictionary))
+        return True
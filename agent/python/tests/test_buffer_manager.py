@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import sqlite3
+
 import pytest
+from kmflow_agent.buffer.manager import BufferManager
 
 
 @pytest.mark.asyncio
@@ -74,3 +78,133 @@ async def test_multiple_events_ordering(buffer_manager):
 
     pending = await buffer_manager.read_pending(limit=10)
     assert len(pending) == 10
+
+
+@pytest.mark.asyncio
+async def test_multiple_events_read_in_write_order(buffer_manager):
+    for i in range(250):
+        await buffer_manager.write_event({"seq": i})
+
+    pending = await buffer_manager.read_pending(limit=300)
+    assert [e["seq"] for e in pending] == list(range(250))
+
+
+@pytest.mark.asyncio
+async def test_group_commit_writes_queued_events_in_one_batch(temp_db_path, encryption_key):
+    manager = BufferManager(temp_db_path, encryption_key, commit_interval=60)
+    batches = []
+    write_batch = manager._db_write_batch
+    manager._db_write_batch = lambda batch: (batches.append(len(batch)), write_batch(batch))
+
+    for i in range(20):
+        await manager.write_event({"seq": i})
+    assert batches == []
+
+    assert await manager.count_pending() == 20
+    assert batches == [20]
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_commit_interval_flushes_in_background(temp_db_path, encryption_key):
+    manager = BufferManager(temp_db_path, encryption_key, commit_interval=0.001)
+    await manager.write_event({"seq": 1})
+    await asyncio.sleep(0.1)
+
+    assert manager._pending == []
+    assert manager._db_count_pending() == 1
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_max_batch_events_commits_immediately(temp_db_path, encryption_key):
+    manager = BufferManager(temp_db_path, encryption_key, commit_interval=60, max_batch_events=10)
+    for i in range(25):
+        await manager.write_event({"seq": i})
+
+    assert len(manager._pending) == 5
+    assert manager._db_count_pending() == 20
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_close_commits_queued_events(temp_db_path, encryption_key):
+    manager = BufferManager(temp_db_path, encryption_key, commit_interval=60)
+    await manager.write_event({"event_type": "late"})
+    await manager.close()
+
+    reopened = BufferManager(temp_db_path, encryption_key)
+    assert await reopened.count_pending() == 1
+    await reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_encryption_roundtrip_and_prune(temp_db_path, encryption_key):
+    manager = BufferManager(temp_db_path, encryption_key, batch_encryption=True)
+    for i in range(30):
+        await manager.write_event({"seq": i, "secret": "sensitive data"})
+
+    pending = await manager.read_pending(limit=10)
+    assert [e["seq"] for e in pending] == list(range(10))
+    assert manager._conn.execute("SELECT COUNT(*) FROM event_blocks").fetchone()[0] == 1
+    raw = manager._conn.execute("SELECT payload_encrypted FROM event_blocks").fetchone()[0]
+    assert b"sensitive data" not in raw
+
+    await manager.mark_uploaded([e["_buffer_id"] for e in pending])
+    assert await manager.prune_uploaded() == 10
+    # The block still holds pending events
+    assert manager._conn.execute("SELECT COUNT(*) FROM event_blocks").fetchone()[0] == 1
+
+    rest = await manager.read_pending(limit=100)
+    assert [e["seq"] for e in rest] == list(range(10, 30))
+    await manager.mark_uploaded([e["_buffer_id"] for e in rest])
+    await manager.prune_uploaded()
+    assert manager._conn.execute("SELECT COUNT(*) FROM event_blocks").fetchone()[0] == 0
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_read_pending_uses_covering_index(buffer_manager):
+    plan = buffer_manager._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM events WHERE uploaded = 0 ORDER BY created_at, rowid LIMIT 10"
+    ).fetchall()
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_events_uploaded_created_at" in details
+    assert "TEMP B-TREE" not in details
+
+
+@pytest.mark.asyncio
+async def test_read_pending_page_reads_ahead_of_pending_events(buffer_manager):
+    for i in range(7):
+        await buffer_manager.write_event({"seq": i})
+
+    first, cursor = await buffer_manager.read_pending_page(limit=3)
+    second, cursor = await buffer_manager.read_pending_page(limit=3, after=cursor)
+    third, cursor = await buffer_manager.read_pending_page(limit=3, after=cursor)
+    rest, end = await buffer_manager.read_pending_page(limit=3, after=cursor)
+
+    # Nothing was marked uploaded, yet each page continues after the previous one
+    assert [e["seq"] for e in first + second + third] == list(range(7))
+    assert rest == []
+    assert end == cursor
+    assert await buffer_manager.count_pending() == 7
+
+
+def test_existing_buffer_is_migrated(temp_db_path, encryption_key):
+    conn = sqlite3.connect(temp_db_path)
+    conn.execute(
+        "CREATE TABLE events (id TEXT PRIMARY KEY, event_json_encrypted BLOB NOT NULL,"
+        " created_at TEXT NOT NULL, uploaded INTEGER DEFAULT 0)"
+    )
+    conn.execute("CREATE INDEX ix_events_uploaded ON events(uploaded)")
+    conn.commit()
+    conn.close()
+
+    manager = BufferManager(temp_db_path, encryption_key)
+
+    columns = {row[1] for row in manager._conn.execute("PRAGMA table_info(events)")}
+    indexes = {row[1] for row in manager._conn.execute("PRAGMA index_list(events)")}
+    assert {"block_id", "block_index"} <= columns
+    assert "ix_events_uploaded_created_at" in indexes
+    assert "ix_events_uploaded" not in indexes
+    assert manager._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
@@ -1,7 +1,8 @@
 """Tests for the batch uploader.
 
 Covers: success path, gzip+checksum, retry on 5xx, no-retry on 4xx,
-batch sizing, prune after upload.
+batch sizing, prune after upload, pipelining, adaptive batch size,
+zstd dictionary registration.
 """
 
 from __future__ import annotations
@@ -16,7 +17,9 @@ import httpx
 import pytest
 from kmflow_agent.buffer.manager import BufferManager
 from kmflow_agent.config.manager import ConfigManager
+from kmflow_agent.upload import compression
 from kmflow_agent.upload.batch_uploader import BatchUploader
+from kmflow_agent.upload.compression import PayloadEncoder
 
 # ── Helpers ──────────────────────────────────────────────────────────
 
@@ -274,3 +277,145 @@ class TestRunLoop:
             await uploader.run(shutdown)
 
         await task
+
+
+# ── Pipelining ───────────────────────────────────────────────────────
+
+
+class TestPipelining:
+    @pytest.fixture
+    def buffer(self, tmp_path):
+        return BufferManager(db_path=str(tmp_path / "test.db"), encryption_key=b"k" * 32)
+
+    @pytest.mark.asyncio
+    async def test_batches_overlap_up_to_max_in_flight(self, buffer):
+        """Up to max_in_flight batches are in flight; every event is uploaded once."""
+        in_flight = peak = 0
+        uploaded: list[int] = []
+
+        async def post(url, content, headers):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            uploaded.extend(e["seq"] for e in json.loads(gzip.decompress(content))["events"])
+            return _make_response(201)
+
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.post = AsyncMock(side_effect=post)
+        uploader = BatchUploader(
+            buffer, _make_config(), client, batch_size=10, max_in_flight=3, adaptive_batch_size=False
+        )
+        for i in range(95):
+            await buffer.write_event({"event_type": "click", "seq": i})
+
+        await uploader._upload_pending()
+
+        assert peak == 3
+        assert sorted(uploaded) == list(range(95))
+        assert uploader._upload_count == 10
+        assert await buffer.count_pending() == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_stops_reading_and_keeps_events_pending(self, buffer):
+        """After a rejected batch no new batches start; its events stay pending."""
+
+        async def post(url, content, headers):
+            first_seq = json.loads(gzip.decompress(content))["events"][0]["seq"]
+            return _make_response(400, "Bad Request") if first_seq == 0 else _make_response(201)
+
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.post = AsyncMock(side_effect=post)
+        uploader = BatchUploader(
+            buffer, _make_config(), client, batch_size=10, max_in_flight=2, adaptive_batch_size=False
+        )
+        for i in range(100):
+            await buffer.write_event({"event_type": "click", "seq": i})
+
+        await uploader._upload_pending()
+
+        assert client.post.call_count == 2
+        assert uploader._upload_count == 1
+        pending = await buffer.read_pending(limit=100)
+        assert len(pending) == 90
+        assert pending[0]["seq"] == 0
+
+
+# ── Adaptive batch size ──────────────────────────────────────────────
+
+
+class TestAdaptiveBatchSize:
+    @pytest.fixture
+    def uploader(self, tmp_path):
+        buffer = BufferManager(db_path=str(tmp_path / "test.db"), encryption_key=b"k" * 32)
+        client = AsyncMock(spec=httpx.AsyncClient)
+        return BatchUploader(
+            buffer, _make_config(), client, batch_size=100, target_latency_seconds=1.0, max_payload_bytes=100_000
+        )
+
+    def test_grows_after_fast_full_batch(self, uploader):
+        uploader._adapt_batch_size(100, latency=0.1, body_bytes=5_000)
+        assert uploader.batch_size == 151
+
+    def test_partial_batch_does_not_grow(self, uploader):
+        uploader._adapt_batch_size(40, latency=0.1, body_bytes=2_000)
+        assert uploader.batch_size == 100
+
+    def test_halves_after_slow_batch(self, uploader):
+        uploader._adapt_batch_size(100, latency=3.0, body_bytes=5_000)
+        assert uploader.batch_size == 50
+
+    def test_growth_capped_by_payload_size(self, uploader):
+        # 800 bytes per event: 125 events fill the 100 KB payload limit
+        uploader._adapt_batch_size(100, latency=0.1, body_bytes=80_000)
+        assert uploader.batch_size == 125
+
+    def test_growth_capped_by_backend_limit(self, uploader):
+        for _ in range(20):
+            uploader._adapt_batch_size(uploader.batch_size, latency=0.1, body_bytes=10)
+        assert uploader.batch_size == 1000
+
+    def test_never_below_minimum(self, uploader):
+        for _ in range(20):
+            uploader._shrink_batch_size()
+        assert uploader.batch_size == uploader.min_batch_size == 10
+
+
+# ── Compression ──────────────────────────────────────────────────────
+
+
+class TestCompression:
+    def test_zstd_falls_back_to_gzip_without_zstandard(self, monkeypatch):
+        monkeypatch.setattr(compression, "_HAS_ZSTD", False)
+        encoder = PayloadEncoder("zstd")
+        assert encoder.encoding == "gzip"
+        assert gzip.decompress(encoder.encode(b"payload")) == b"payload"
+
+    def test_unknown_encoding_rejected(self):
+        with pytest.raises(ValueError):
+            PayloadEncoder("br")
+
+    @pytest.mark.asyncio
+    async def test_zstd_dictionary_registered_then_used(self, tmp_path):
+        zstandard = pytest.importorskip("zstandard")
+        buffer = BufferManager(db_path=str(tmp_path / "test.db"), encryption_key=b"k" * 32)
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.post = AsyncMock(return_value=_make_response(201))
+        uploader = BatchUploader(
+            buffer, _make_config(), client, batch_size=100, compression="zstd", adaptive_batch_size=False
+        )
+        uploader.encoder.training_events = 200
+        for i in range(400):
+            await buffer.write_event({"event_type": "app_switch", "application_name": f"App {i % 5}", "seq": i})
+
+        await uploader._upload_pending()
+
+        urls = [call.args[0] for call in client.post.call_args_list]
+        assert urls.count("https://api.example.com/api/v1/taskmining/compression/dictionaries") == 1
+        dictionary = zstandard.ZstdCompressionDict(uploader._dictionary)
+        last = client.post.call_args_list[-1].kwargs
+        assert last["headers"]["Content-Encoding"] == "zstd"
+        assert zstandard.get_frame_parameters(last["content"]).dict_id == dictionary.dict_id()
+        payload = zstandard.ZstdDecompressor(dict_data=dictionary).decompress(last["content"])
+        assert len(json.loads(payload)["events"]) == 100
@@ -0,0 +1,45 @@
+"""093: Add entity_extraction_cache table.
+
+Persists rule-based entity extraction output keyed by (content hash,
+extractor version, seed-list version) so graph rebuilds, POV runs and the
+ingest pipeline skip text that was already extracted.
+
+Revision ID: 093
+Revises: 092
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSON
+
+revision = "093"
+down_revision = "092"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "entity_extraction_cache",
+        sa.Column("content_hash", sa.String(64), nullable=False),
+        sa.Column("extractor_version", sa.String(64), nullable=False),
+        sa.Column("seed_version", sa.String(64), nullable=False),
+        sa.Column("entities", JSON(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("content_hash", "extractor_version", "seed_version"),
+    )
+    op.create_index(
+        "ix_entity_extraction_cache_extractor_version",
+        "entity_extraction_cache",
+        ["extractor_version"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_entity_extraction_cache_extractor_version", table_name="entity_extraction_cache")
+    op.drop_table("entity_extraction_cache")
@@ -0,0 +1,60 @@
+"""094: Add engagement_dashboard_rollups table.
+
+Materialises per-engagement dashboard aggregates (evidence and model counts,
+shelf coverage, gap counts, confidence and brightness distributions) so the
+dashboard endpoints read one row instead of aggregating on every request.
+Rows are backfilled lazily on first read.
+
+Also replaces ``ix_audit_logs_engagement_id`` with an
+``(engagement_id, created_at)`` index serving the recent-activity query.
+
+Revision ID: 094
+Revises: 093
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSON, UUID
+
+revision = "094"
+down_revision = "093"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "engagement_dashboard_rollups",
+        sa.Column("engagement_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("evidence_item_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("process_model_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("latest_model_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("overall_confidence", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("shelf_coverage", JSON(), nullable=False, server_default=sa.text("'{}'::json")),
+        sa.Column("gap_counts", JSON(), nullable=False, server_default=sa.text("'{}'::json")),
+        sa.Column("confidence_buckets", JSON(), nullable=False, server_default=sa.text("'{}'::json")),
+        sa.Column("brightness_counts", JSON(), nullable=False, server_default=sa.text("'{}'::json")),
+        sa.Column("weakest_elements", JSON(), nullable=False, server_default=sa.text("'[]'::json")),
+        sa.Column(
+            "refreshed_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("engagement_id"),
+        sa.ForeignKeyConstraint(["engagement_id"], ["engagements.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["latest_model_id"], ["process_models.id"], ondelete="SET NULL"),
+    )
+
+    op.create_index(
+        "ix_audit_logs_engagement_id_created_at",
+        "audit_logs",
+        ["engagement_id", "created_at"],
+    )
+    op.drop_index("ix_audit_logs_engagement_id", table_name="audit_logs")
+
+
+def downgrade() -> None:
+    op.create_index("ix_audit_logs_engagement_id", "audit_logs", ["engagement_id"])
+    op.drop_index("ix_audit_logs_engagement_id_created_at", table_name="audit_logs")
+    op.drop_table("engagement_dashboard_rollups")
@@ -0,0 +1,33 @@
+"""095: Add a source dedup key to canonical_activity_events.
+
+Streaming connector syncs bulk-load events with COPY and skip rows already
+imported, so a resumed or repeated import never duplicates events. The key
+is the source system's event id when it has one, otherwise a hash of the
+event's case, activity, timestamp and actor.
+
+Revision ID: 095
+Revises: 094
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "095"
+down_revision = "094"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("canonical_activity_events", sa.Column("source_event_key", sa.String(255), nullable=True))
+    op.create_index(
+        "uq_canonical_events_source_key",
+        "canonical_activity_events",
+        ["engagement_id", "source_system", "source_event_key"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_canonical_events_source_key", table_name="canonical_activity_events")
+    op.drop_column("canonical_activity_events", "source_event_key")
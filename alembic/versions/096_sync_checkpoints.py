@@ -0,0 +1,46 @@
+"""096: Add sync_checkpoints table.
+
+Persists connector sync checkpoints, streaming watermarks and per
+(connector, engagement) leases so incremental syncs survive restarts and
+API replicas coordinate instead of re-syncing from scratch.
+
+Revision ID: 096
+Revises: 095
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID
+
+revision = "096"
+down_revision = "095"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sync_checkpoints",
+        sa.Column("connector_type", sa.String(100), nullable=False),
+        sa.Column("engagement_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("last_sync_at", sa.String(64), nullable=True),
+        sa.Column("last_timestamp", sa.String(64), nullable=True),
+        sa.Column("last_offset", sa.BigInteger(), nullable=True),
+        sa.Column("last_cursor", sa.Text(), nullable=True),
+        sa.Column("records_since_reset", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("lease_owner", sa.String(255), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("connector_type", "engagement_id"),
+        sa.ForeignKeyConstraint(["engagement_id"], ["engagements.id"], ondelete="CASCADE"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("sync_checkpoints")
@@ -0,0 +1,30 @@
+"""097: Add a session-ordered index on task_mining_events.
+
+Transition matrices pair consecutive APP_SWITCH events per capture
+session with ``LAG() OVER (PARTITION BY session_id ORDER BY timestamp)``.
+Indexing (engagement_id, event_type, session_id, timestamp) lets
+Postgres read an engagement's switches already in window order instead
+of sorting the period's events.
+
+Revision ID: 097
+Revises: 096
+"""
+
+from alembic import op
+
+revision = "097"
+down_revision = "096"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_task_mining_events_engagement_type_session_ts",
+        "task_mining_events",
+        ["engagement_id", "event_type", "session_id", "timestamp"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_mining_events_engagement_type_session_ts", table_name="task_mining_events")
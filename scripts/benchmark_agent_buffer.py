@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Benchmark the desktop agent's SQLite event buffer.
+
+Writes ``--events`` synthetic captured events (default 20,000) one
+``await`` at a time, the way the IPC socket server does, and reports
+sustained events/sec and process CPU time for:
+
+- ``per_event_commit``: the previous write path (one ``INSERT`` and
+  ``commit()`` per event, a new AES-GCM context per event);
+- ``group_commit``: ``BufferManager`` with per-event encryption;
+- ``group_commit_block_encryption``: ``BufferManager`` with one encrypted
+  payload per committed batch.
+
+Then ``--rate`` events/sec (default 500) are written for ``--seconds``
+(default 5) to show CPU use at a steady capture rate, and the pending
+events are read back in upload-sized pages.
+
+Usage:
+    python scripts/benchmark_agent_buffer.py [--events 20000] [--rate 500] [--seconds 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "agent" / "python"))
+
+_KEY = b"benchmark-key-32-bytes-long!!!!!"
+
+
+def _event(i: int) -> dict[str, Any]:
+    return {
+        "event_type": "app_switch" if i % 3 else "keyboard_action",
+        "application_name": f"App {i % 12}",
+        "window_title": f"Document {i % 250} - Editor",
+        "timestamp": datetime.now(UTC).isoformat(),
+        "idle_seconds": i % 7,
+    }
+
+
+class _PerEventCommitBuffer:
+    """The previous ``BufferManager`` write path, kept for comparison."""
+
+    def __init__(self, db_path: str) -> None:
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL;")
+        self._conn.execute(
+            "CREATE TABLE events (id TEXT PRIMARY KEY, event_json_encrypted BLOB NOT NULL,"
+            " created_at TEXT NOT NULL, uploaded INTEGER DEFAULT 0)"
+        )
+        self._conn.execute("CREATE INDEX ix_events_uploaded ON events(uploaded)")
+        self._conn.commit()
+
+    def _write(self, event: dict[str, Any]) -> str:
+        from kmflow_agent.buffer.encryption import encrypt_payload
+
+        event_id = str(uuid.uuid4())
+        encrypted = encrypt_payload(json.dumps(event).encode("utf-8"), _KEY)
+        self._conn.execute(
+            "INSERT INTO events (id, event_json_encrypted, created_at) VALUES (?, ?, ?)",
+            (event_id, encrypted, datetime.now(UTC).isoformat()),
+        )
+        self._conn.commit()
+        return event_id
+
+    async def write_event(self, event: dict[str, Any]) -> str:
+        return await asyncio.to_thread(self._write, event)
+
+    async def close(self) -> None:
+        self._conn.close()
+
+
+def _make_buffer(mode: str, db_path: str) -> Any:
+    from kmflow_agent.buffer.manager import BufferManager
+
+    if mode == "per_event_commit":
+        return _PerEventCommitBuffer(db_path)
+    return BufferManager(db_path, _KEY, batch_encryption=mode == "group_commit_block_encryption")
+
+
+async def _measure(mode: str, directory: str, event_count: int, rate: float, seconds: float) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+
+    buffer = _make_buffer(mode, str(Path(directory) / f"{mode}-burst.db"))
+    wall, cpu = time.perf_counter(), time.process_time()
+    for i in range(event_count):
+        await buffer.write_event(_event(i))
+    if hasattr(buffer, "flush"):
+        await buffer.flush()
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    result["events_per_second"] = round(event_count / wall)
+    result["cpu_ms_per_1k_events"] = round(cpu / event_count * 1_000_000, 1)
+    if hasattr(buffer, "read_pending"):
+        start = time.perf_counter()
+        read = 0
+        while page := await buffer.read_pending(limit=100):
+            await buffer.mark_uploaded([e["_buffer_id"] for e in page])
+            read += len(page)
+        assert read == event_count, f"{mode} read back {read} events"
+        result["drain_events_per_second"] = round(read / (time.perf_counter() - start))
+    await buffer.close()
+
+    buffer = _make_buffer(mode, str(Path(directory) / f"{mode}-steady.db"))
+    total = int(rate * seconds)
+    wall, cpu = time.perf_counter(), time.process_time()
+    for i in range(total):
+        await buffer.write_event(_event(i))
+        delay = wall + (i + 1) / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    await buffer.close()
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    result[f"cpu_percent_at_{int(rate)}_events_per_second"] = round(cpu / wall * 100, 1)
+    return result
+
+
+async def run_benchmark(event_count: int, rate: float, seconds: float) -> dict[str, Any]:
+    """Run every write mode in a fresh temporary database."""
+    results: dict[str, Any] = {"events": event_count}
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in ("per_event_commit", "group_commit", "group_commit_block_encryption"):
+            results[mode] = await _measure(mode, directory, event_count, rate, seconds)
+    return results
+
+
+def main() -> None:
+    """Entry point for the benchmark script."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=20_000, help="Events written as fast as possible (default 20000)")
+    parser.add_argument("--rate", type=float, default=500, help="Steady capture rate in events/sec (default 500)")
+    parser.add_argument("--seconds", type=float, default=5, help="Duration of the steady run (default 5)")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmark(args.events, args.rate, args.seconds))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
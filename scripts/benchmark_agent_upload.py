@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Benchmark draining the desktop agent's offline backlog.
+
+Fills a buffer with ``--events`` synthetic captured events (default
+1,000,000), then drains a copy of it with ``BatchUploader`` against an
+in-process stub of ``POST /api/v1/taskmining/events``. The stub models a
+shared uplink: request bodies are transmitted one at a time at
+``--bandwidth-mbps`` (default 10), then each response takes ``--rtt-ms``
+(default 50) of round-trip latency. Bodies are decoded with the backend's
+``decode_request_body``, so the server-side cost is included.
+
+Modes:
+
+- ``sequential_gzip``: the previous uploader (100-event gzip batches, one
+  request at a time, no adaptive sizing). Slow, so it drains only
+  ``--sequential-events`` (default 100,000) and its rate is projected;
+- ``pipelined_gzip``: ``max_in_flight`` batches with adaptive sizing;
+- ``pipelined_zstd``: as above with a trained zstd dictionary (skipped
+  if ``zstandard`` is not installed).
+
+Usage:
+    python scripts/benchmark_agent_upload.py [--events 1000000] [--rtt-ms 50] [--bandwidth-mbps 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import shutil
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "agent" / "python"))
+
+_KEY = b"benchmark-key-32-bytes-long!!!!!"
+_APPS = ["Microsoft Excel", "Google Chrome", "Slack", "SAP GUI", "Outlook", "Salesforce"]
+
+
+def _event(i: int, start: datetime) -> dict[str, Any]:
+    app = _APPS[i % len(_APPS)]
+    return {
+        "event_type": ("app_switch", "keyboard_action", "mouse_click", "window_focus")[i % 4],
+        "timestamp": (start + timedelta(milliseconds=250 * i)).isoformat(),
+        "application_name": app,
+        "window_title": f"Invoice {i % 500} - {app}",
+        "event_data": {"bundle_id": f"com.example.{app.lower().replace(' ', '')}", "idle_seconds": i % 7},
+        "idempotency_key": f"evt-{i}",
+    }
+
+
+class _Dictionaries:
+    """Minimal async Redis stand-in holding registered zstd dictionaries."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None, nx: bool = False) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        return key in self.values
+
+
+class _StubBackend:
+    """Event ingest and dictionary registration over a simulated link."""
+
+    def __init__(self, rtt_seconds: float, bandwidth_bytes_per_second: float) -> None:
+        self.rtt_seconds = rtt_seconds
+        self.bandwidth = bandwidth_bytes_per_second
+        self.redis = _Dictionaries()
+        self.events = 0
+        self.bytes_sent = 0
+        self.bytes_decoded = 0
+        self._link = asyncio.Lock()
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        from src.taskmining.compression import decode_request_body, register_dictionary
+
+        body = request.content
+        async with self._link:
+            await asyncio.sleep(len(body) / self.bandwidth)
+        await asyncio.sleep(self.rtt_seconds)
+        self.bytes_sent += len(body)
+        if request.url.path.endswith("/compression/dictionaries"):
+            dictionary_id = await register_dictionary(self.redis, body)
+            return httpx.Response(201, json={"dictionary_id": dictionary_id, "size_bytes": len(body)})
+        decoded = await decode_request_body(body, request.headers.get("content-encoding"), self.redis)
+        self.bytes_decoded += len(decoded)
+        self.events += len(json.loads(decoded)["events"])
+        return httpx.Response(201, json={"accepted": 0, "rejected": 0, "duplicates": 0, "pii_quarantined": 0})
+
+
+async def _fill(db_path: str, event_count: int) -> float:
+    from kmflow_agent.buffer import manager
+    from kmflow_agent.buffer.manager import BufferManager
+
+    # A 1M-event backlog is larger than the agent's 100 MB buffer cap
+    manager.MAX_BUFFER_SIZE_BYTES = 1 << 40
+    buffer = BufferManager(db_path, _KEY, batch_encryption=True)
+    start_time = datetime.now(UTC)
+    start = time.perf_counter()
+    for i in range(event_count):
+        await buffer.write_event(_event(i, start_time))
+    await buffer.close()
+    return time.perf_counter() - start
+
+
+async def _drain(db_path: str, mode: str, event_count: int, rtt: float, bandwidth: float) -> dict[str, Any]:
+    from kmflow_agent.buffer.manager import BufferManager
+    from kmflow_agent.config.manager import ConfigManager
+    from kmflow_agent.upload.batch_uploader import BatchUploader
+
+    backend = _StubBackend(rtt, bandwidth)
+    buffer = BufferManager(db_path, _KEY, batch_encryption=True)
+    if mode == "sequential_gzip":
+        # Only the first event_count events are drained in this mode
+        buffer._conn.execute(
+            "UPDATE events SET uploaded = 1 WHERE rowid NOT IN"
+            " (SELECT rowid FROM events ORDER BY created_at, rowid LIMIT ?)",
+            (event_count,),
+        )
+        buffer._conn.commit()
+        options: dict[str, Any] = {"max_in_flight": 1, "adaptive_batch_size": False}
+    else:
+        options = {"compression": "zstd" if mode == "pipelined_zstd" else "gzip"}
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(backend.handle)) as client:
+        config = ConfigManager(backend_url="http://backend", agent_id="agent-1", http_client=None)
+        uploader = BatchUploader(buffer, config, client, batch_size=100, **options)
+        wall, cpu = time.perf_counter(), time.process_time()
+        await uploader._upload_pending()
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    await buffer.close()
+
+    assert backend.events == event_count, f"{mode} uploaded {backend.events} of {event_count} events"
+    return {
+        "events": backend.events,
+        "seconds": round(wall, 1),
+        "events_per_second": round(backend.events / wall),
+        "cpu_seconds": round(cpu, 1),
+        "batches": uploader._upload_count,
+        "final_batch_size": uploader.batch_size,
+        "mb_sent": round(backend.bytes_sent / 1e6, 1),
+        "compression_ratio": round(backend.bytes_decoded / backend.bytes_sent, 1),
+    }
+
+
+async def run_benchmark(
+    event_count: int, sequential_events: int, rtt_ms: float, bandwidth_mbps: float
+) -> dict[str, Any]:
+    """Fill one backlog, then drain a fresh copy of it in each mode."""
+    from kmflow_agent.upload.compression import zstd_available
+
+    rtt, bandwidth = rtt_ms / 1000, bandwidth_mbps * 1e6 / 8
+    results: dict[str, Any] = {"events": event_count, "rtt_ms": rtt_ms, "bandwidth_mbps": bandwidth_mbps}
+    with tempfile.TemporaryDirectory() as directory:
+        backlog = str(Path(directory) / "backlog.db")
+        results["fill_seconds"] = round(await _fill(backlog, event_count), 1)
+        results["backlog_mb"] = round(Path(backlog).stat().st_size / 1e6, 1)
+        modes = ["sequential_gzip", "pipelined_gzip"] + (["pipelined_zstd"] if zstd_available() else [])
+        if not zstd_available():
+            results["pipelined_zstd"] = "skipped: zstandard is not installed"
+        for mode in modes:
+            copy = str(Path(directory) / f"{mode}.db")
+            shutil.copyfile(backlog, copy)
+            count = min(sequential_events, event_count) if mode == "sequential_gzip" else event_count
+            results[mode] = await _drain(copy, mode, count, rtt, bandwidth)
+        sequential = results["sequential_gzip"]
+        sequential["projected_seconds_for_backlog"] = round(event_count / sequential["events_per_second"], 1)
+    return results
+
+
+def main() -> None:
+    """Entry point for the benchmark script."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=1_000_000, help="Backlog size (default 1000000)")
+    parser.add_argument(
+        "--sequential-events", type=int, default=100_000, help="Events drained in sequential mode (default 100000)"
+    )
+    parser.add_argument("--rtt-ms", type=float, default=50, help="Round-trip latency in ms (default 50)")
+    parser.add_argument("--bandwidth-mbps", type=float, default=10, help="Uplink bandwidth in Mbit/s (default 10)")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmark(args.events, args.sequential_events, args.rtt_ms, args.bandwidth_mbps))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Benchmark TOM alignment scoring at engagement scale.
+
+Scores ``--activities`` synthetic activities (default 5,000) with
+``--dim``-dimensional embeddings (default 768) against every TOM
+dimension twice:
+
+- per pair: ``cosine_similarity`` and ``classify_similarity`` for every
+  (activity, dimension), one ``session.add`` per ``TOMAlignmentResult``;
+- matrix: ``build_result_rows`` (one normalised matrix product, vectorised
+  classification) and a single bulk ``insert``.
+
+Both write to an in-memory SQLite ``tom_alignment_results`` table, so the
+write timings include SQLAlchemy but not network round trips.
+
+Usage:
+    python scripts/benchmark_alignment_scoring.py [--activities 5000] [--dim 768]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def _per_pair_results(run_id: uuid.UUID, activities: list[Any], inputs: dict[str, Any]) -> list[Any]:
+    """Score the way ``_score_activities`` did before the matrix path."""
+    from src.core.models import TOMAlignmentResult, TOMDimension
+    from src.tom.alignment_scoring import AlignmentScoringService
+
+    service = AlignmentScoringService(graph_service=None)  # type: ignore[arg-type]
+    results = []
+    for activity in activities:
+        for dimension in TOMDimension:
+            score = service._score_single(
+                activity=activity,
+                dimension=dimension,
+                aligned_pairs=inputs["aligned_pairs"],
+                activity_emb=inputs["activity_embeddings"].get(str(activity.id)),
+                dim_emb=inputs["dim_embeddings"].get(dimension),
+                dim_description=inputs["dim_descriptions"].get(dimension),
+            )
+            results.append(
+                TOMAlignmentResult(
+                    run_id=run_id,
+                    activity_id=activity.id,
+                    dimension_type=score.dimension_type,
+                    gap_type=score.gap_type,
+                    deviation_score=score.deviation_score,
+                    alignment_evidence=score.alignment_evidence,
+                )
+            )
+    return results
+
+
+async def run_benchmark(activity_count: int, dim: int, seed: int) -> dict[str, Any]:
+    """Build synthetic inputs and time both scoring paths end to end."""
+    from sqlalchemy import func, insert, select
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from src.core.models import TOMAlignmentResult, TOMDimension
+    from src.tom.alignment_scoring import build_result_rows
+
+    rng = np.random.default_rng(seed)
+    activities = [SimpleNamespace(id=uuid.uuid4(), name=f"Activity {i}") for i in range(activity_count)]
+    base = rng.normal(size=dim)
+    inputs = {
+        "aligned_pairs": {(str(a.id), TOMDimension.PROCESS_ARCHITECTURE) for a in activities[::10]},
+        "activity_embeddings": {str(a.id): (base + rng.normal(size=dim)).tolist() for a in activities},
+        "dim_embeddings": {d: (base + rng.normal(size=dim)).tolist() for d in TOMDimension},
+        "dim_descriptions": {d: f"Target state for {d}" for d in TOMDimension},
+    }
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: TOMAlignmentResult.__table__.create(sync_conn))
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    results: dict[str, Any] = {"activities": activity_count, "dimensions": len(TOMDimension), "embedding_dim": dim}
+
+    try:
+        async with session_factory() as session:
+            start = time.perf_counter()
+            per_pair = _per_pair_results(uuid.uuid4(), activities, inputs)
+            results["per_pair_score_seconds"] = round(time.perf_counter() - start, 3)
+            start = time.perf_counter()
+            session.add_all(per_pair)
+            await session.flush()
+            await session.commit()
+            results["per_pair_write_seconds"] = round(time.perf_counter() - start, 3)
+
+        async with session_factory() as session:
+            run_id = uuid.uuid4()
+            start = time.perf_counter()
+            rows = build_result_rows(run_id, activities, **inputs)  # type: ignore[arg-type]
+            results["matrix_score_seconds"] = round(time.perf_counter() - start, 3)
+            start = time.perf_counter()
+            await session.execute(insert(TOMAlignmentResult), rows)
+            await session.commit()
+            results["matrix_write_seconds"] = round(time.perf_counter() - start, 3)
+            written = await session.scalar(
+                select(func.count()).select_from(TOMAlignmentResult).where(TOMAlignmentResult.run_id == run_id)
+            )
+            assert written == len(per_pair) == len(rows)
+
+        mismatched = sum(
+            old.gap_type != new["gap_type"] or abs(old.deviation_score - new["deviation_score"]) > 1e-9
+            for old, new in zip(per_pair, rows, strict=True)
+        )
+        results["mismatched_results"] = mismatched
+        for path in ("per_pair", "matrix"):
+            results[f"{path}_total_seconds"] = round(
+                results[f"{path}_score_seconds"] + results[f"{path}_write_seconds"], 3
+            )
+    finally:
+        await engine.dispose()
+    return results
+
+
+def main() -> None:
+    """Entry point for the benchmark script."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--activities", type=int, default=5000, help="Activities scored (default 5000)")
+    parser.add_argument("--dim", type=int, default=768, help="Embedding dimension (default 768)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default 0)")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmark(args.activities, args.dim, args.seed))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
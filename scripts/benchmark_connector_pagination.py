@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Benchmark connector pagination against a local stub API.
+
+Starts a stub HTTP API on 127.0.0.1 that serves ``--records`` records
+(default one million) through offset pagination, adding ``--latency``
+seconds to every response to stand in for a remote SaaS API. The records
+are then read with ``paginate_offset`` through a pooled connector client,
+once sequentially (``prefetch=1``) and once with ``--prefetch`` pages in
+flight, and once more with cursor pagination.
+
+Usage:
+    python scripts/benchmark_connector_pagination.py [--records 1000000] [--page-size 1000] [--prefetch 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def _stub_app(record_count: int, latency: float) -> Any:
+    """Build the stub API: ``/records`` (offset) and ``/cursor`` (next URL)."""
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    def page(offset: int, limit: int) -> list[dict[str, Any]]:
+        end = min(offset + limit, record_count)
+        return [{"id": i, "activity": f"step-{i % 17}", "case_id": f"case-{i // 50}"} for i in range(offset, end)]
+
+    async def records(request: Request) -> JSONResponse:
+        await asyncio.sleep(latency)
+        offset = int(request.query_params.get("offset", 0))
+        limit = int(request.query_params.get("limit", 100))
+        return JSONResponse({"results": page(offset, limit), "total": record_count})
+
+    async def cursor(request: Request) -> JSONResponse:
+        await asyncio.sleep(latency)
+        offset = int(request.query_params.get("after", 0))
+        limit = int(request.query_params.get("limit", 100))
+        results = page(offset, limit)
+        following = offset + len(results)
+        next_url = f"{request.url.scheme}://{request.url.netloc}/cursor?after={following}&limit={limit}"
+        return JSONResponse({"results": results, "next": next_url if following < record_count else None})
+
+    return Starlette(routes=[Route("/records", records), Route("/cursor", cursor)])
+
+
+async def _read_all(pages: Any) -> int:
+    count = 0
+    async for page in pages:
+        count += len(page)
+    return count
+
+
+async def run_benchmark(record_count: int, page_size: int, prefetch: int, latency: float) -> dict[str, Any]:
+    """Serve the stub API and time each pagination mode against it."""
+    import uvicorn
+
+    from src.integrations.utils import close_connector_clients, get_connector_client, paginate_cursor, paginate_offset
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(
+        uvicorn.Config(_stub_app(record_count, latency), host="127.0.0.1", port=port, log_level="warning")
+    )
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    base_url = f"http://127.0.0.1:{port}"
+    # The stub has no rate limit; keep the bucket out of the measurement.
+    client = get_connector_client("stub", base_url, requests_per_second=1e6, burst=10_000)
+    results: dict[str, Any] = {"records": record_count, "page_size": page_size, "latency_seconds": latency}
+    try:
+        for name, pages in (
+            (
+                "offset_sequential",
+                lambda: paginate_offset(client, f"{base_url}/records", page_size=page_size, prefetch=1),
+            ),
+            (
+                f"offset_prefetch_{prefetch}",
+                lambda: paginate_offset(client, f"{base_url}/records", page_size=page_size, prefetch=prefetch),
+            ),
+            ("cursor_pipelined", lambda: paginate_cursor(client, f"{base_url}/cursor", params={"limit": page_size})),
+        ):
+            start = time.perf_counter()
+            count = await _read_all(pages())
+            seconds = time.perf_counter() - start
+            assert count == record_count, f"{name} read {count} records"
+            results[f"{name}_seconds"] = round(seconds, 2)
+            results[f"{name}_records_per_second"] = round(count / seconds)
+    finally:
+        await close_connector_clients()
+        server.should_exit = True
+        await serving
+    return results
+
+
+def main() -> None:
+    """Entry point for the benchmark script."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=1_000_000, help="Records served (default 1,000,000)")
+    parser.add_argument("--page-size", type=int, default=1000, help="Records per page (default 1000)")
+    parser.add_argument("--prefetch", type=int, default=8, help="Pages in flight (default 8)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Added seconds per response (default 0.05)")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmark(args.records, args.page_size, args.prefetch, args.latency))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
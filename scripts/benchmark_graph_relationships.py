@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark relationship batch creation on a large knowledge graph.
+
+Seeds a scratch engagement with ``--nodes`` Activity nodes (default one
+million) through ``KnowledgeGraphService.batch_create_nodes``, applies the
+KMNode migration so the super-label constraint exists, then times
+``batch_create_relationships`` against it. For comparison it also times the
+previous label-less endpoint lookup on a small sample, since that query
+scans every node per relationship.
+
+Run against a disposable Neo4j instance:
+
+Usage:
+    python scripts/benchmark_graph_relationships.py [--nodes 1000000] [--batch-size 5000] [--rounds 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+_SEED_CHUNK = 10000
+_LEGACY_SAMPLE = 20
+
+_LEGACY_QUERY = """
+UNWIND $rels AS rel
+MATCH (a {id: rel.from_id}), (b {id: rel.to_id})
+CREATE (a)-[r:FOLLOWED_BY]->(b)
+SET r = rel.props
+RETURN count(r) AS created
+"""
+
+
+async def run_benchmark(node_count: int, batch_size: int, rounds: int) -> dict[str, float | int]:
+    """Seed the graph, time relationship batches and clean up."""
+    from neo4j import AsyncGraphDatabase
+
+    from src.core.neo4j import KM_NODE_LABEL, migrate_km_node_label, setup_neo4j_constraints
+    from src.semantic.graph import KnowledgeGraphService
+
+    driver = AsyncGraphDatabase.driver(
+        os.getenv("NEO4J_URI", "bolt://localhost:7687"),
+        auth=(os.getenv("NEO4J_USER", "neo4j"), os.getenv("NEO4J_PASSWORD", "neo4j_dev_password")),
+    )
+    graph = KnowledgeGraphService(driver)
+    engagement_id = f"bench-{uuid.uuid4().hex[:8]}"
+    node_ids = [f"{engagement_id}-{i}" for i in range(node_count)]
+
+    try:
+        await setup_neo4j_constraints(driver)
+        await migrate_km_node_label(driver)
+
+        start = time.perf_counter()
+        for offset in range(0, node_count, _SEED_CHUNK):
+            chunk = node_ids[offset : offset + _SEED_CHUNK]
+            await graph.batch_create_nodes(
+                "Activity",
+                [{"id": node_id, "name": node_id, "engagement_id": engagement_id} for node_id in chunk],
+            )
+        seed_seconds = time.perf_counter() - start
+        logger.info("Seeded %d nodes in %.1fs", node_count, seed_seconds)
+
+        rng = random.Random(32)
+        timings = []
+        for _ in range(rounds):
+            rels = [{"from_id": rng.choice(node_ids), "to_id": rng.choice(node_ids)} for _ in range(batch_size)]
+            start = time.perf_counter()
+            created = await graph.batch_create_relationships("FOLLOWED_BY", rels)
+            timings.append(time.perf_counter() - start)
+            logger.info("Created %d relationships in %.3fs", created, timings[-1])
+
+        legacy_rels = [
+            {"from_id": rng.choice(node_ids), "to_id": rng.choice(node_ids), "props": {"id": uuid.uuid4().hex[:16]}}
+            for _ in range(_LEGACY_SAMPLE)
+        ]
+        start = time.perf_counter()
+        await graph.run_write_query(_LEGACY_QUERY, {"rels": legacy_rels})
+        legacy_seconds = time.perf_counter() - start
+        logger.info("Label-less lookup: %d relationships in %.3fs", _LEGACY_SAMPLE, legacy_seconds)
+
+        best = min(timings)
+        return {
+            "nodes": node_count,
+            "batch_size": batch_size,
+            "seed_seconds": round(seed_seconds, 2),
+            "batch_seconds_best": round(best, 4),
+            "batch_seconds_median": round(sorted(timings)[len(timings) // 2], 4),
+            "relationships_per_second": round(batch_size / best),
+            "legacy_relationships_per_second": round(_LEGACY_SAMPLE / legacy_seconds, 2),
+        }
+    finally:
+        async with driver.session() as session:
+            await session.run(
+                f"""
+                MATCH (n:{KM_NODE_LABEL} {{engagement_id: $engagement_id}})
+                CALL (n) {{ DETACH DELETE n }} IN TRANSACTIONS OF {_SEED_CHUNK} ROWS
+                """,
+                {"engagement_id": engagement_id},
+            )
+        await driver.close()
+
+
+def main() -> None:
+    """Entry point for the benchmark script."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=1_000_000, help="Nodes to seed (default 1,000,000)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Relationships per batch (default 5000)")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed batches (default 5)")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmark(args.nodes, args.batch_size, args.rounds))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
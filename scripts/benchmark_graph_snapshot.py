@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Benchmark in-memory graph snapshot analytics on a synthetic graph.
+
+Builds a ``GraphSnapshot`` with ``--edges`` random relationships (default
+one million) between ``--nodes`` nodes and times each analytics operation
+used by graph health and ``/graph-analytics``. No Neo4j instance is
+needed; loading time from Neo4j is dominated by the paginated subgraph
+reads and is not measured here.
+
+Usage:
+    python scripts/benchmark_graph_snapshot.py [--nodes 200000] [--edges 1000000] [--samples 32]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+_LABELS = ["Activity", "Role", "System", "Document", "Decision"]
+_TYPES = ["PRECEDES", "PERFORMED_BY", "USES", "SUPPORTED_BY"]
+
+
+def _timed(results: dict[str, Any], name: str, func: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    value = func()
+    results[f"{name}_seconds"] = round(time.perf_counter() - start, 3)
+    return value
+
+
+def run_benchmark(node_count: int, edge_count: int, samples: int, seed: int) -> dict[str, Any]:
+    """Build the synthetic snapshot and time every analytics operation."""
+    from src.semantic.graph_snapshot import GraphSnapshot
+
+    rng = np.random.default_rng(seed)
+    node_ids = [f"n{i}" for i in range(node_count)]
+    labels = rng.integers(0, len(_LABELS), size=node_count)
+    endpoints = rng.integers(0, node_count, size=(edge_count, 2))
+    types = rng.integers(0, len(_TYPES), size=edge_count)
+
+    nodes = [(node_ids[i], _LABELS[label]) for i, label in enumerate(labels.tolist())]
+    edges = [
+        (node_ids[a], node_ids[b], _TYPES[t]) for (a, b), t in zip(endpoints.tolist(), types.tolist(), strict=True)
+    ]
+
+    results: dict[str, Any] = {"nodes": node_count, "edges": edge_count}
+    snapshot = _timed(results, "build", lambda: GraphSnapshot.build("bench", nodes, edges))
+    _timed(results, "adjacency", lambda: snapshot._adjacency_csr)
+    _timed(results, "degree_distribution", snapshot.degree_distribution)
+    _timed(results, "orphans", snapshot.orphans)
+    sizes = _timed(results, "components", snapshot.component_sizes)
+    _timed(results, "labels_and_types", lambda: (snapshot.nodes_by_label(), snapshot.relationships_by_type()))
+    _timed(results, "pagerank", snapshot.pagerank)
+    _timed(results, "betweenness_sampled", lambda: snapshot.betweenness(samples=samples, seed=seed))
+    _timed(results, "shortest_path", lambda: snapshot.shortest_path(node_ids[0], node_ids[-1]))
+
+    results["components"] = int(sizes.size)
+    results["largest_component"] = int(sizes[0])
+    results["betweenness_samples"] = samples
+    return results
+
+
+def main() -> None:
+    """Entry point for the benchmark script."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=200_000, help="Nodes (default 200,000)")
+    parser.add_argument("--edges", type=int, default=1_000_000, help="Relationships (default 1,000,000)")
+    parser.add_argument("--samples", type=int, default=32, help="Betweenness source samples (default 32)")
+    parser.add_argument("--seed", type=int, default=35, help="Random seed (default 35)")
+    args = parser.parse_args()
+
+    print(json.dumps(run_benchmark(args.nodes, args.edges, args.samples, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Benchmark session feature extraction and batch ML classification.
+
+Builds ``--sessions`` synthetic ``AggregatedSession`` objects (default
+100,000) and times:
+
+- features: ``extract_features`` per session vs one
+  ``extract_feature_matrix`` call (the outputs are compared for equality);
+- predict: ``GradientBoostingTaskClassifier.predict`` per session vs one
+  ``predict_batch`` call. The per-session loop is slow with a real model,
+  so it scores only ``--loop-sessions`` (default 10,000) and its time is
+  projected to the full batch.
+
+The model is a GradientBoostingClassifier trained on the synthetic
+sessions when scikit-learn is installed; otherwise a NumPy softmax
+stand-in with the same ``predict_proba`` interface is used, which
+measures the feature and per-call overhead but not sklearn's own cost.
+
+Usage:
+    python scripts/benchmark_ml_features.py [--sessions 100000] [--loop-sessions 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+_APPS = ["Microsoft Excel", "Google Chrome", "Slack", "Outlook", "Salesforce", "Jira", "Terminal", "SAP GUI"]
+_LABELS = ["data_entry", "navigation", "communication", "review"]
+
+
+def _sessions(count: int, seed: int) -> list[Any]:
+    from src.taskmining.aggregation.session import AggregatedSession
+
+    rng = np.random.default_rng(seed)
+    counts = rng.poisson(lam=[30, 20, 2, 8, 1, 3], size=(count, 6))
+    durations = rng.integers(1_000, 600_000, size=count)
+    start = datetime(2026, 1, 5, tzinfo=UTC)
+    offsets = rng.integers(0, 14 * 24 * 3600, size=count)
+    sessions = []
+    for i in range(count):
+        kb, mouse, cp, scroll, fo, url = (int(c) for c in counts[i])
+        duration = int(durations[i])
+        sessions.append(
+            AggregatedSession(
+                app_bundle_id=_APPS[i % len(_APPS)],
+                window_title_sample=None,
+                started_at=start + timedelta(seconds=int(offsets[i])),
+                duration_ms=duration,
+                active_duration_ms=duration * 9 // 10,
+                idle_duration_ms=duration - duration * 9 // 10,
+                keyboard_event_count=kb,
+                mouse_event_count=mouse,
+                copy_paste_count=cp,
+                scroll_count=scroll,
+                file_operation_count=fo,
+                url_navigation_count=url,
+                total_event_count=kb + mouse + cp + scroll + fo + url,
+            )
+        )
+    return sessions
+
+
+class _SoftmaxModel:
+    """NumPy stand-in for a fitted classifier when scikit-learn is missing."""
+
+    def __init__(self, n_features: int, n_classes: int, seed: int) -> None:
+        self.weights = np.random.default_rng(seed).normal(size=(n_features, n_classes)) / 50
+
+    def predict_proba(self, x: Any) -> np.ndarray:
+        logits = np.asarray(x, dtype=np.float64) @ self.weights
+        exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+        return exp / exp.sum(axis=1, keepdims=True)
+
+
+def _classifier(sessions: list[Any], seed: int) -> tuple[Any, str]:
+    from src.taskmining.ml.classifier import GradientBoostingTaskClassifier
+    from src.taskmining.ml.dataset import LabeledSample, TrainingDataset
+    from src.taskmining.ml.features import FEATURE_NAMES, extract_features
+
+    clf = GradientBoostingTaskClassifier()
+    try:
+        import sklearn  # noqa: F401
+    except ImportError:
+        clf._model = _SoftmaxModel(len(FEATURE_NAMES), len(_LABELS), seed)
+        clf._label_encoder = SimpleNamespace(classes_=np.array(_LABELS))
+        return clf, "numpy softmax stand-in (scikit-learn not installed)"
+
+    dataset = TrainingDataset()
+    for i, session in enumerate(sessions[:2000]):
+        dataset.add_sample(LabeledSample(features=extract_features(session), label=_LABELS[i % len(_LABELS)]))
+    clf.train(dataset)
+    return clf, "sklearn GradientBoostingClassifier (calibrated)"
+
+
+def run_benchmark(session_count: int, loop_sessions: int, seed: int) -> dict[str, Any]:
+    """Time the per-session and columnar paths on the same sessions."""
+    from src.taskmining.ml.features import extract_feature_matrix, extract_features
+
+    sessions = _sessions(session_count, seed)
+    results: dict[str, Any] = {"sessions": session_count}
+
+    start = time.perf_counter()
+    rows = [extract_features(s) for s in sessions]
+    per_session = time.perf_counter() - start
+    start = time.perf_counter()
+    matrix = extract_feature_matrix(sessions)
+    columnar = time.perf_counter() - start
+    results["features"] = {
+        "per_session_seconds": round(per_session, 3),
+        "matrix_seconds": round(columnar, 3),
+        "speedup": round(per_session / columnar, 1),
+        "identical": bool(np.array_equal(np.asarray(rows), matrix)),
+    }
+
+    clf, model = _classifier(sessions, seed)
+    loop_count = min(loop_sessions, session_count)
+    start = time.perf_counter()
+    looped = [clf.predict(s) for s in sessions[:loop_count]]
+    loop_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    batch = clf.predict_batch(sessions)
+    batch_seconds = time.perf_counter() - start
+    projected = loop_seconds * session_count / loop_count
+    results["predict"] = {
+        "model": model,
+        "loop_sessions": loop_count,
+        "loop_seconds": round(loop_seconds, 3),
+        "loop_projected_seconds": round(projected, 3),
+        "batch_seconds": round(batch_seconds, 3),
+        "speedup": round(projected / batch_seconds, 1),
+        "identical": looped == batch[:loop_count],
+    }
+    return results
+
+
+def main() -> None:
+    """Entry point for the benchmark script."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=100_000, help="Sessions to score (default 100000)")
+    parser.add_argument("--loop-sessions", type=int, default=10_000, help="Sessions scored one by one (default 10000)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed (default 7)")
+    args = parser.parse_args()
+
+    print(json.dumps(run_benchmark(args.sessions, args.loop_sessions, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
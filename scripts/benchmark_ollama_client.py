@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Benchmark per-call overhead of the Ollama provider against a local stub.
+
+Starts a stub ``/api/chat`` server on 127.0.0.1 that answers immediately,
+so the measured time is client overhead rather than inference. The same
+``--calls`` requests are then sent twice: once opening a new
+``httpx.AsyncClient`` per call (the provider's previous behaviour) and once
+through ``OllamaProvider``'s pooled keep-alive client.
+
+Usage:
+    python scripts/benchmark_ollama_client.py [--calls 500] [--concurrency 1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def _stub_app() -> Any:
+    """Build the stub server: ``/api/chat`` returns a fixed message."""
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    async def chat(request: Request) -> JSONResponse:
+        body = await request.json()
+        return JSONResponse({"model": body["model"], "message": {"role": "assistant", "content": "ok"}, "done": True})
+
+    return Starlette(routes=[Route("/api/chat", chat, methods=["POST"])])
+
+
+async def _per_call_client(base_url: str) -> str:
+    """One request the way the provider sent it before pooling."""
+    import httpx
+
+    async with httpx.AsyncClient(timeout=120.0) as client:
+        response = await client.post(
+            f"{base_url}/api/chat",
+            json={
+                "model": "stub",
+                "messages": [{"role": "user", "content": "ping"}],
+                "stream": False,
+                "options": {"num_predict": 16},
+            },
+        )
+        response.raise_for_status()
+        return response.json()["message"]["content"]
+
+
+async def _time_calls(call: Callable[[], Awaitable[str]], calls: int, concurrency: int) -> dict[str, float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(calls)))
+    seconds = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "seconds": round(seconds, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 3),
+        "calls_per_second": round(calls / seconds),
+    }
+
+
+async def run_benchmark(calls: int, concurrency: int) -> dict[str, Any]:
+    """Serve the stub and time per-call clients against the pooled provider."""
+    import uvicorn
+
+    from src.core.llm import OllamaProvider
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(_stub_app(), host="127.0.0.1", port=port, log_level="warning"))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    base_url = f"http://127.0.0.1:{port}"
+    provider = OllamaProvider(base_url=base_url, default_model="stub", max_connections=max(concurrency, 1))
+    results: dict[str, Any] = {"calls": calls, "concurrency": concurrency}
+    try:
+        # Warm up both paths so imports and the first connection are not measured.
+        await _per_call_client(base_url)
+        await provider.generate("ping", max_tokens=16)
+
+        results["per_call_client"] = await _time_calls(lambda: _per_call_client(base_url), calls, concurrency)
+        results["pooled_client"] = await _time_calls(
+            lambda: provider.generate("ping", max_tokens=16), calls, concurrency
+        )
+        results["provider_stats"] = provider.stats.to_dict()
+        results["overhead_saved_ms_per_call"] = round(
+            results["per_call_client"]["mean_ms"] - results["pooled_client"]["mean_ms"], 3
+        )
+    finally:
+        await provider.aclose()
+        server.should_exit = True
+        await serving
+    return results
+
+
+def main() -> None:
+    """Entry point for the benchmark script."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=500, help="Requests per mode (default 500)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Requests in flight (default 1)")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmark(args.calls, args.concurrency))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
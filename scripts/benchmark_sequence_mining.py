@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Benchmark action sequence mining.
+
+Generates ``--sessions`` synthetic action category sequences (default
+1,000,000) drawn from a handful of process templates with random noise
+and times:
+
+- baseline: the previous ``mine_sequences`` (every n-gram of every
+  session collected into per-session tuple sets before filtering);
+- apriori: the encoded level-wise miner in a single pass;
+- partitioned: the same split into ``--workers`` partitions mined in a
+  process pool;
+- gapped: PrefixSpan sequential patterns on the first
+  ``--gapped-sessions`` sessions (default 100,000) at a relative support
+  of ``--gapped-support`` (default 0.2). Sequential patterns are far
+  denser than n-grams, so an absolute n-gram threshold would report
+  nearly every combination of categories.
+
+The baseline also reports how many distinct n-grams it held before
+filtering; the contiguous modes are compared for identical patterns and
+supports.
+
+Usage:
+    python scripts/benchmark_sequence_mining.py [--sessions 1000000] [--workers 4] [--min-support 1000]
+        [--gapped-sessions 100000] [--gapped-support 0.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+_CATEGORIES = [
+    "data_entry",
+    "navigation",
+    "file_operation",
+    "communication",
+    "review",
+    "search",
+    "copy_paste",
+    "approval",
+    "reporting",
+    "idle",
+]
+_TEMPLATES = [
+    [0, 1, 0, 2, 4],
+    [5, 1, 4, 7],
+    [3, 1, 6, 0, 0, 2],
+    [1, 5, 4, 8, 3],
+]
+
+
+def _sequences(count: int, seed: int) -> list[list[str]]:
+    rng = np.random.default_rng(seed)
+    lengths = rng.integers(2, 41, size=count)
+    noise = rng.integers(0, len(_CATEGORIES), size=int(lengths.sum()))
+    keep_template = rng.random(size=int(lengths.sum())) < 0.7
+    templates = rng.integers(0, len(_TEMPLATES), size=count)
+    sequences = []
+    pos = 0
+    for i in range(count):
+        template = _TEMPLATES[templates[i]]
+        length = int(lengths[i])
+        seq = [
+            _CATEGORIES[template[j % len(template)] if keep_template[pos + j] else noise[pos + j]]
+            for j in range(length)
+        ]
+        pos += length
+        sequences.append(seq)
+    return sequences
+
+
+def _baseline(
+    sequences: list[list[str]], min_n: int, max_n: int, min_support: int
+) -> tuple[dict[tuple[str, ...], int], int]:
+    """The previous implementation's counting, kept for comparison."""
+    pattern_sessions: Counter[tuple[str, ...]] = Counter()
+    for seq in sequences:
+        if len(seq) < min_n:
+            continue
+        seen: set[tuple[str, ...]] = set()
+        for n in range(min_n, min(max_n, len(seq)) + 1):
+            for i in range(len(seq) - n + 1):
+                seen.add(tuple(seq[i : i + n]))
+        pattern_sessions.update(seen)
+    return {p: s for p, s in pattern_sessions.items() if s >= min_support}, len(pattern_sessions)
+
+
+def _measure(run: Callable[[], Any]) -> tuple[Any, dict[str, float]]:
+    start = time.perf_counter()
+    value = run()
+    return value, {"seconds": round(time.perf_counter() - start, 2)}
+
+
+def run_benchmark(
+    session_count: int,
+    gapped_sessions: int,
+    gapped_support: float,
+    workers: int,
+    min_n: int,
+    max_n: int,
+    min_support: int,
+    seed: int,
+) -> dict[str, Any]:
+    """Mine the same synthetic sequences with each implementation."""
+    from src.taskmining.ml.sequence_mining import mine_sequences
+
+    sequences = _sequences(session_count, seed)
+    results: dict[str, Any] = {
+        "sessions": session_count,
+        "actions": sum(len(s) for s in sequences),
+        "min_n": min_n,
+        "max_n": max_n,
+        "min_support": min_support,
+    }
+
+    (baseline, enumerated), results["baseline"] = _measure(lambda: _baseline(sequences, min_n, max_n, min_support))
+    results["baseline"]["distinct_ngrams_enumerated"] = enumerated
+    apriori, results["apriori"] = _measure(lambda: mine_sequences(sequences, min_n, max_n, min_support))
+    partitioned, results["partitioned"] = _measure(
+        lambda: mine_sequences(sequences, min_n, max_n, min_support, workers=workers)
+    )
+    mined = {p.pattern: p.support for p in apriori.patterns}
+    results["patterns"] = len(mined)
+    results["apriori"]["speedup"] = round(results["baseline"]["seconds"] / results["apriori"]["seconds"], 1)
+    results["apriori"]["identical"] = mined == baseline
+    results["partitioned"]["workers"] = workers
+    results["partitioned"]["identical"] = partitioned.patterns == apriori.patterns
+
+    subset = sequences[:gapped_sessions]
+    support = max(1, round(gapped_support * len(subset)))
+    gapped, results["gapped"] = _measure(lambda: mine_sequences(subset, min_n, max_n, support, gapped=True))
+    results["gapped"].update({"sessions": len(subset), "min_support": support, "patterns": len(gapped.patterns)})
+    return results
+
+
+def main() -> None:
+    """Entry point for the benchmark script."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=1_000_000, help="Sessions to mine (default 1000000)")
+    parser.add_argument(
+        "--gapped-sessions", type=int, default=100_000, help="Sessions mined with PrefixSpan (default 100000)"
+    )
+    parser.add_argument(
+        "--gapped-support", type=float, default=0.2, help="Gapped support as a share of sessions (default 0.2)"
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Processes in partitioned mode (default 4)")
+    parser.add_argument("--min-n", type=int, default=2, help="Minimum pattern length (default 2)")
+    parser.add_argument("--max-n", type=int, default=5, help="Maximum pattern length (default 5)")
+    parser.add_argument("--min-support", type=int, default=1000, help="Minimum supporting sessions (default 1000)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed (default 7)")
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        args.sessions,
+        args.gapped_sessions,
+        args.gapped_support,
+        args.workers,
+        args.min_n,
+        args.max_n,
+        args.min_support,
+        args.seed,
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -17,12 +17,14 @@ import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
+import redis.asyncio as aioredis
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from neo4j.exceptions import Neo4jError
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.api.middleware.audit import AuditLoggingMiddleware
 from src.api.middleware.csrf import CSRFMiddleware
@@ -117,12 +119,20 @@ from src.api.routes import (
 from src.api.routes import dpa as dpa_routes
 from src.api.routes.auth import limiter
 from src.api.version import API_VERSION
-from src.core.config import get_settings
+from src.core.audit_sink import AuditSink
+from src.core.config import Settings, get_settings
 from src.core.database import create_engine
+from src.core.llm import close_llm_provider
+from src.core.llm_executor import configure_llm_executor
 from src.core.neo4j import create_neo4j_driver, setup_neo4j_constraints, verify_neo4j_connectivity
+from src.core.principal_cache import PrincipalCache, listen_for_principal_changes
+from src.core.realtime_hub import close_realtime_hub
 from src.core.redis import create_redis_client, verify_redis_connectivity
+from src.core.tasks.context import WorkerContext
 from src.integrations.camunda import CamundaClient
+from src.integrations.utils import close_connector_clients
 from src.mcp.server import router as mcp_router
+from src.taskmining.aggregation.engine import StreamingAggregationEngine
 
 logger = logging.getLogger(__name__)
 
@@ -188,6 +198,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.info("Redis connection verified")
     else:
         logger.warning("Redis is not reachable; starting in degraded mode")
+    configure_llm_executor(settings, redis_client)
+
+    # -- Audit sink (write-behind PDP/HTTP audit persistence) ---
+    audit_sink = await _start_audit_sink(settings, session_factory, redis_client)
+    app.state.audit_sink = audit_sink
 
     # -- CIB7 (Camunda) ---
     cib7_url = os.environ.get("CIB7_URL", "http://localhost:8080/engine-rest")
@@ -209,10 +224,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     from src.gdpr.erasure_worker import GdprErasureWorker
     from src.pov.orchestrator import PovGenerationWorker
 
+    # Workers share the lifespan's clients; they are closed below on shutdown
+    worker_context = WorkerContext(settings, engine, session_factory, redis_client, neo4j_driver)
+    app.state.worker_context = worker_context
+
     task_queue = TaskQueue(redis_client)
-    task_queue.register_worker(PovGenerationWorker())
-    task_queue.register_worker(EvidenceBatchWorker())
-    task_queue.register_worker(GdprErasureWorker())
+    task_queue.register_worker(PovGenerationWorker(worker_context))
+    task_queue.register_worker(EvidenceBatchWorker(worker_context))
+    task_queue.register_worker(GdprErasureWorker(worker_context))
     await task_queue.ensure_consumer_groups()
     app.state.task_queue = task_queue
 
@@ -238,13 +257,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.info("Started %d monitoring workers", settings.monitoring_worker_count)
 
     # Task mining workers
-    if settings.taskmining_enabled and settings.taskmining_worker_count > 0:
-        from src.taskmining.worker import run_worker as run_tm_worker
+    aggregation_engine = await _start_taskmining_workers(settings, worker_context, shutdown_event, worker_tasks)
+    app.state.taskmining_aggregation = aggregation_engine
 
-        for i in range(settings.taskmining_worker_count):
-            task = asyncio.create_task(run_tm_worker(redis_client, f"tm-worker-{i}", shutdown_event))
-            worker_tasks.append(task)
-        logger.info("Started %d task mining workers", settings.taskmining_worker_count)
+    # Cache invalidation across API processes (PDP policies, principals)
+    from src.api.services.pdp import listen_for_policy_changes
+
+    worker_tasks.append(asyncio.create_task(listen_for_policy_changes(redis_client, shutdown_event)))
+    app.state.principal_cache = _start_principal_cache(settings, redis_client, shutdown_event, worker_tasks)
 
     app.state.worker_tasks = worker_tasks
 
@@ -258,12 +278,103 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await asyncio.gather(*worker_tasks, return_exceptions=True)
         logger.info("All background workers stopped")
 
+    await _stop_aggregation_engine(aggregation_engine)
+    await _stop_audit_sink(audit_sink)
+
+    await close_realtime_hub(app)
+    await close_connector_clients()
+    await close_llm_provider()
     await redis_client.close()
     await neo4j_driver.close()
     await engine.dispose()
     logger.info("All connections closed")
 
 
+async def _start_audit_sink(
+    settings: Settings,
+    session_factory: async_sessionmaker[AsyncSession],
+    redis_client: aioredis.Redis,
+) -> AuditSink | None:
+    """Create and start the write-behind audit sink, or return None if disabled."""
+    if not settings.audit_sink_enabled:
+        return None
+
+    audit_sink = AuditSink(
+        session_factory,
+        redis_client,
+        buffer_size=settings.audit_sink_buffer_size,
+        batch_size=settings.audit_sink_batch_size,
+        flush_interval=settings.audit_sink_flush_interval_ms / 1000,
+    )
+    await audit_sink.start()
+    return audit_sink
+
+
+async def _start_taskmining_workers(
+    settings: Settings,
+    worker_context: WorkerContext,
+    shutdown_event: asyncio.Event,
+    worker_tasks: list[asyncio.Task[None]],
+) -> StreamingAggregationEngine | None:
+    """Start the aggregation engine and the task mining stream consumers that feed it."""
+    if not (settings.taskmining_enabled and settings.taskmining_worker_count > 0):
+        return None
+
+    from src.taskmining.worker import run_worker as run_tm_worker
+
+    aggregation_engine = StreamingAggregationEngine(
+        worker_context.redis_client,
+        worker_context.session_factory,
+        shard_count=settings.taskmining_aggregation_shards,
+        batch_size=settings.taskmining_aggregation_batch_size,
+        flush_interval=settings.taskmining_aggregation_flush_interval_ms / 1000,
+        session_timeout=settings.taskmining_aggregation_session_timeout_seconds,
+    )
+    await aggregation_engine.start()
+    for i in range(settings.taskmining_worker_count):
+        task = asyncio.create_task(
+            run_tm_worker(
+                worker_context.redis_client,
+                f"tm-worker-{i}",
+                shutdown_event,
+                engine=aggregation_engine,
+                context=worker_context,
+            )
+        )
+        worker_tasks.append(task)
+    logger.info("Started %d task mining workers", settings.taskmining_worker_count)
+    return aggregation_engine
+
+
+async def _stop_aggregation_engine(aggregation_engine: StreamingAggregationEngine | None) -> None:
+    """Apply what the task mining engine has queued and stop it (after its consumers)."""
+    if aggregation_engine is not None:
+        await aggregation_engine.stop()
+
+
+async def _stop_audit_sink(audit_sink: AuditSink | None) -> None:
+    """Flush and stop the audit sink if one was started."""
+    if audit_sink is not None:
+        await audit_sink.stop()
+
+
+def _start_principal_cache(
+    settings: Settings,
+    redis_client: aioredis.Redis,
+    shutdown_event: asyncio.Event,
+    worker_tasks: list[asyncio.Task[None]],
+) -> PrincipalCache | None:
+    """Create the authenticated principal cache and its invalidation listener."""
+    if settings.principal_cache_ttl_seconds <= 0:
+        return None
+
+    principal_cache = PrincipalCache(settings.principal_cache_ttl_seconds, settings.principal_cache_max_entries)
+    worker_tasks.append(
+        asyncio.create_task(listen_for_principal_changes(principal_cache, redis_client, shutdown_event))
+    )
+    return principal_cache
+
+
 def _register_middleware(app: FastAPI, settings: object) -> None:
     """Register all middleware on the application.
 
@@ -2,7 +2,9 @@
 
 Automatically logs every HTTP request with user identity, endpoint path,
 IP address, user agent, engagement context, and response status to the
-audit trail. Fires asynchronously to avoid adding latency.
+audit trail. Events are handed to the app's write-behind ``AuditSink`` when
+one is configured, otherwise persisted by a fire-and-forget task; either
+way no database latency is added to the request.
 """
 
 from __future__ import annotations
@@ -10,12 +12,15 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+import uuid
+from datetime import UTC, datetime
 from typing import Any
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 
 from src.core.audit import log_audit_event_async
+from src.core.models import HttpAuditEvent
 
 logger = logging.getLogger(__name__)
 
@@ -69,7 +74,8 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
 
     Captures method, path, user identity (from JWT), response status,
     IP address, user agent, and request duration. Persists to the
-    http_audit_events table via async fire-and-forget.
+    http_audit_events table via the audit sink (batched write-behind) or,
+    without one, via async fire-and-forget.
     """
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
@@ -110,23 +116,28 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
             ip_address,
         )
 
-        # Fire-and-forget: persist audit event asynchronously to avoid
-        # adding database latency to the request path.
-        session_factory = getattr(request.app.state, "db_session_factory", None)
-        asyncio.create_task(
-            _persist_audit_event(
-                session_factory=session_factory,
-                method=request.method,
-                path=request.url.path,
-                user_id=user_id,
-                status_code=response.status_code,
-                engagement_id=engagement_id,
-                duration_ms=duration_ms,
-                ip_address=ip_address,
-                user_agent=user_agent[:512],
-                resource_type=resource_type,
-            )
-        )
+        event: dict[str, Any] = {
+            "method": request.method,
+            "path": request.url.path,
+            "user_id": user_id,
+            "status_code": response.status_code,
+            "engagement_id": engagement_id,
+            "duration_ms": duration_ms,
+            "ip_address": ip_address,
+            "user_agent": user_agent[:512],
+            "resource_type": resource_type,
+        }
+
+        audit_sink = getattr(request.app.state, "audit_sink", None)
+        if audit_sink is not None:
+            # Write-behind: the sink bulk-inserts events off the request path.
+            # The id is fixed here so a spilled event replays idempotently.
+            audit_sink.enqueue(HttpAuditEvent, {**event, "id": uuid.uuid4(), "created_at": datetime.now(UTC)})
+        else:
+            # Fire-and-forget: persist audit event asynchronously to avoid
+            # adding database latency to the request path.
+            session_factory = getattr(request.app.state, "db_session_factory", None)
+            asyncio.create_task(_persist_audit_event(session_factory=session_factory, **event))
 
         response.headers["X-Audit-Logged"] = "true"
         return response
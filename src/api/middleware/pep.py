@@ -233,18 +233,26 @@ class PEPMiddleware(BaseHTTPMiddleware):
         # Use a fallback engagement_id when path doesn't contain one
         eng_id = uuid.UUID(engagement_id_str) if engagement_id_str else uuid.UUID(int=0)
 
+        audit_sink = getattr(request.app.state, "audit_sink", None)
+        evaluate_kwargs: dict[str, Any] = {
+            "engagement_id": eng_id,
+            "actor": actor,
+            "actor_role": actor_role,
+            "resource_id": resource_id,
+            "classification": classification,
+            "operation": operation,
+            "attributes": attributes,
+            "request_id": request_id,
+        }
+
+        if audit_sink is not None:
+            # The decision is audited write-behind, so a session is only
+            # opened if the policy cache has to be refreshed.
+            service = PDPService(None, audit_sink=audit_sink, session_factory=session_factory)
+            return await service.evaluate(**evaluate_kwargs)
+
         async with session_factory() as session:
-            service = PDPService(session)
-            result = await service.evaluate(
-                engagement_id=eng_id,
-                actor=actor,
-                actor_role=actor_role,
-                resource_id=resource_id,
-                classification=classification,
-                operation=operation,
-                attributes=attributes,
-                request_id=request_id,
-            )
+            result = await PDPService(session).evaluate(**evaluate_kwargs)
             await session.commit()
         return result
 
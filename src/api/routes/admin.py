@@ -34,6 +34,7 @@ class RetentionCleanupResponse(BaseModel):
     would_clean_up: int | None = None
     engagements: list[RetentionPreviewItem] | None = None
     cleaned_up: int | None = None
+    extraction_cache_purged: int | None = None
 
 
 class KeyRotationResponse(BaseModel):
@@ -52,7 +53,8 @@ async def run_retention_cleanup(
     """Trigger data retention cleanup for expired engagements.
 
     Finds engagements where created_at + retention_days < now
-    and archives them. Platform admin only.
+    and archives them. A live run also purges entity extraction cache
+    entries written by older extractor versions. Platform admin only.
 
     Use ?dry_run=true (default) to preview which engagements would be affected.
     Set ?dry_run=false AND provide header X-Confirm-Action: retention-cleanup
@@ -75,8 +77,16 @@ async def run_retention_cleanup(
             detail="Must provide header X-Confirm-Action: retention-cleanup to execute cleanup",
         )
 
+    from src.semantic.extraction_cache import purge_stale_entries
+
     count = await cleanup_expired_engagements(session)
-    return RetentionCleanupResponse(dry_run=False, cleaned_up=count, status="completed")
+    purged = await purge_stale_entries(session)
+    return RetentionCleanupResponse(
+        dry_run=False,
+        cleaned_up=count,
+        extraction_cache_purged=purged,
+        status="completed",
+    )
 
 
 @router.post("/rotate-encryption-key", response_model=KeyRotationResponse, status_code=status.HTTP_200_OK)
@@ -2,17 +2,19 @@
 
 Provides aggregated metrics and analytics for engagement dashboards,
 including evidence coverage, confidence distribution, and recent activity.
+
+Counts, coverage and distributions come from the engagement's
+``EngagementDashboardRollup`` row (see ``src.api.services.dashboard_rollup``),
+which is recomputed whenever the underlying rows change.
 """
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
 from uuid import UUID
 
-import redis.asyncio as aioredis
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -37,13 +39,14 @@ from src.api.schemas.dashboard import (
     TOMAlignmentEntry,
     WeakElement,
 )
+from src.api.services.dashboard_rollup import CONFIDENCE_LEVELS, get_dashboard_rollup, rollup_shelf_totals
 from src.core.models import (
     AuditLog,
     ConflictObject,
     DarkRoomSnapshot,
     Engagement,
+    EngagementDashboardRollup,
     EngagementMember,
-    EvidenceGap,
     EvidenceItem,
     GapAnalysisResult,
     ProcessElement,
@@ -52,9 +55,6 @@ from src.core.models import (
     ResolutionStatus,
     ReviewerAction,
     SeedTerm,
-    ShelfDataRequest,
-    ShelfDataRequestItem,
-    ShelfRequestItemStatus,
     TermStatus,
     TOMDimension,
     User,
@@ -67,55 +67,45 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/dashboard", tags=["dashboard"])
 
-# Redis-backed TTL cache for dashboard queries.
-# Dashboard data is aggregated and relatively expensive to recompute;
-# 30-second staleness is acceptable for monitoring use cases.
-_DASHBOARD_CACHE_TTL = 30  # seconds
+# -- Helpers ------------------------------------------------------------------
 
 
-async def _cache_get(request: Request, key: str) -> Any | None:
-    """Return cached value from Redis if present and not expired, else None."""
-    try:
-        redis_client = request.app.state.redis_client
-        raw = await redis_client.get(f"dashboard:{key}")
-        if raw is not None:
-            return json.loads(raw)
-    except aioredis.RedisError:
-        logger.warning("Redis unavailable for dashboard cache get, key=%s", key)
-    return None
+async def _require_rollup(session: AsyncSession, engagement_id: UUID) -> EngagementDashboardRollup:
+    """Return the engagement's dashboard rollup, raising 404 if it does not exist."""
+    rollup = await get_dashboard_rollup(session, engagement_id)
+    if rollup is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Engagement {engagement_id} not found",
+        )
+    return rollup
 
 
-async def _cache_set(request: Request, key: str, value: Any) -> None:
-    """Store value in Redis with the configured TTL."""
-    try:
-        redis_client = request.app.state.redis_client
-        await redis_client.setex(f"dashboard:{key}", _DASHBOARD_CACHE_TTL, json.dumps(value, default=str))
-    except aioredis.RedisError:
-        logger.warning("Redis unavailable for dashboard cache set, key=%s", key)
+def _coverage_pct(requested: int, received: int) -> float:
+    return round(received / requested * 100, 1) if requested > 0 else 0.0
 
 
-# -- Helpers ------------------------------------------------------------------
+def _gap_counts(rollup: EngagementDashboardRollup) -> GapCountBySeverity:
+    counts = rollup.gap_counts or {}
+    return GapCountBySeverity(
+        high=counts.get("high", 0),
+        medium=counts.get("medium", 0),
+        low=counts.get("low", 0),
+    )
 
-CONFIDENCE_LEVELS = [
-    ("VERY_HIGH", 0.90, 1.00),
-    ("HIGH", 0.75, 0.89),
-    ("MEDIUM", 0.50, 0.74),
-    ("LOW", 0.25, 0.49),
-    ("VERY_LOW", 0.00, 0.24),
-]
 
+def _brightness_distribution(rollup: EngagementDashboardRollup) -> BrightnessDistribution:
+    counts = rollup.brightness_counts or {}
+    total = sum(counts.values())
+    if total == 0:
+        return BrightnessDistribution()
 
-def _classify_confidence(score: float) -> str:
-    """Classify a confidence score into a named level."""
-    if score >= 0.90:
-        return "VERY_HIGH"
-    if score >= 0.75:
-        return "HIGH"
-    if score >= 0.50:
-        return "MEDIUM"
-    if score >= 0.25:
-        return "LOW"
-    return "VERY_LOW"
+    return BrightnessDistribution(
+        bright_pct=round(counts.get("bright", 0) / total * 100, 1),
+        dim_pct=round(counts.get("dim", 0) / total * 100, 1),
+        dark_pct=round(counts.get("dark", 0) / total * 100, 1),
+        total_elements=total,
+    )
 
 
 # -- Routes -------------------------------------------------------------------
@@ -124,7 +114,6 @@ def _classify_confidence(score: float) -> str:
 @router.get("/{engagement_id}", response_model=DashboardResponse)
 async def get_dashboard(
     engagement_id: UUID,
-    request: Request,
     session: AsyncSession = Depends(get_session),
     user: User = Depends(require_permission("engagement:read")),
     _engagement_user: User = Depends(require_engagement_access),
@@ -136,78 +125,17 @@ async def get_dashboard(
     """
     eng_uuid = engagement_id
 
-    cache_key = str(eng_uuid)
-    cached = await _cache_get(request, cache_key)
-    if cached is not None:
-        return cached
-
     # Verify engagement exists
-    eng_result = await session.execute(select(Engagement).where(Engagement.id == eng_uuid))
-    engagement = eng_result.scalar_one_or_none()
-    if not engagement:
+    eng_result = await session.execute(select(Engagement.name).where(Engagement.id == eng_uuid))
+    engagement_name = eng_result.scalar_one_or_none()
+    if engagement_name is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Engagement {engagement_id} not found",
         )
 
-    # Evidence item count
-    ev_count_result = await session.execute(
-        select(func.count()).select_from(EvidenceItem).where(EvidenceItem.engagement_id == eng_uuid)
-    )
-    evidence_item_count = ev_count_result.scalar() or 0
-
-    # Process model count
-    pm_count_result = await session.execute(
-        select(func.count()).select_from(ProcessModel).where(ProcessModel.engagement_id == eng_uuid)
-    )
-    process_model_count = pm_count_result.scalar() or 0
-
-    # Overall confidence from latest completed POV
-    latest_model_result = await session.execute(
-        select(ProcessModel)
-        .where(
-            ProcessModel.engagement_id == eng_uuid,
-            ProcessModel.status == ProcessModelStatus.COMPLETED,
-        )
-        .order_by(ProcessModel.created_at.desc())
-        .limit(1)
-    )
-    latest_model = latest_model_result.scalar_one_or_none()
-    overall_confidence = latest_model.confidence_score if latest_model else 0.0
-
-    # Evidence coverage: count requested items vs received per category
-    shelf_items_result = await session.execute(
-        select(
-            ShelfDataRequestItem.category,
-            func.count().label("total"),
-            func.count().filter(ShelfDataRequestItem.status == ShelfRequestItemStatus.RECEIVED).label("received"),
-        )
-        .join(ShelfDataRequest)
-        .where(ShelfDataRequest.engagement_id == eng_uuid)
-        .group_by(ShelfDataRequestItem.category)
-    )
-    shelf_rows = shelf_items_result.all()
-
-    total_requested = sum(row.total for row in shelf_rows)
-    total_received = sum(row.received for row in shelf_rows)
-    evidence_coverage_pct = round(total_received / total_requested * 100, 1) if total_requested > 0 else 0.0
-
-    # Gap counts by severity (from latest model)
-    gap_counts = GapCountBySeverity()
-    if latest_model:
-        gap_result = await session.execute(
-            select(EvidenceGap.severity, func.count().label("cnt"))
-            .where(EvidenceGap.model_id == latest_model.id)
-            .group_by(EvidenceGap.severity)
-        )
-        for row in gap_result.all():
-            severity_str = str(row.severity).lower()
-            if severity_str == "high":
-                gap_counts.high = row.cnt
-            elif severity_str == "medium":
-                gap_counts.medium = row.cnt
-            elif severity_str == "low":
-                gap_counts.low = row.cnt
+    rollup = await _require_rollup(session, eng_uuid)
+    total_requested, total_received = rollup_shelf_totals(rollup)
 
     # Recent activity (last 10 audit entries)
     audit_result = await session.execute(
@@ -226,18 +154,16 @@ async def get_dashboard(
         for log in audit_logs
     ]
 
-    result = {
+    return {
         "engagement_id": str(eng_uuid),
-        "engagement_name": engagement.name,
-        "evidence_coverage_pct": evidence_coverage_pct,
-        "overall_confidence": overall_confidence,
-        "gap_counts": gap_counts,
-        "evidence_item_count": evidence_item_count,
-        "process_model_count": process_model_count,
+        "engagement_name": engagement_name,
+        "evidence_coverage_pct": _coverage_pct(total_requested, total_received),
+        "overall_confidence": rollup.overall_confidence,
+        "gap_counts": _gap_counts(rollup),
+        "evidence_item_count": rollup.evidence_item_count,
+        "process_model_count": rollup.process_model_count,
         "recent_activity": recent_activity,
     }
-    await _cache_set(request, cache_key, result)
-    return result
 
 
 @router.get(
@@ -246,7 +172,6 @@ async def get_dashboard(
 )
 async def get_evidence_coverage(
     engagement_id: UUID,
-    request: Request,
     session: AsyncSession = Depends(get_session),
     user: User = Depends(require_permission("engagement:read")),
     _engagement_user: User = Depends(require_engagement_access),
@@ -257,60 +182,30 @@ async def get_evidence_coverage(
     per evidence category.
     """
     eng_uuid = engagement_id
-
-    cache_key = f"evidence_coverage:{eng_uuid}"
-    cached = await _cache_get(request, cache_key)
-    if cached is not None:
-        return cached
-
-    # Verify engagement exists
-    eng_result = await session.execute(select(Engagement.id).where(Engagement.id == eng_uuid))
-    if not eng_result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Engagement {engagement_id} not found",
-        )
-
-    # Per-category breakdown from shelf data request items
-    shelf_items_result = await session.execute(
-        select(
-            ShelfDataRequestItem.category,
-            func.count().label("total"),
-            func.count().filter(ShelfDataRequestItem.status == ShelfRequestItemStatus.RECEIVED).label("received"),
-        )
-        .join(ShelfDataRequest)
-        .where(ShelfDataRequest.engagement_id == eng_uuid)
-        .group_by(ShelfDataRequestItem.category)
-    )
-    shelf_rows = shelf_items_result.all()
+    rollup = await _require_rollup(session, eng_uuid)
 
     categories = []
-    total_requested = 0
-    total_received = 0
-
-    for row in shelf_rows:
-        coverage = round(row.received / row.total * 100, 1) if row.total > 0 else 0.0
+    for category, counts in (rollup.shelf_coverage or {}).items():
+        requested = counts.get("requested", 0)
+        received = counts.get("received", 0)
+        coverage = _coverage_pct(requested, received)
         categories.append(
             CategoryCoverage(
-                category=str(row.category),
-                requested_count=row.total,
-                received_count=row.received,
+                category=category,
+                requested_count=requested,
+                received_count=received,
                 coverage_pct=coverage,
                 below_threshold=coverage < 50.0,
             )
         )
-        total_requested += row.total
-        total_received += row.received
 
-    overall = round(total_received / total_requested * 100, 1) if total_requested > 0 else 0.0
+    total_requested, total_received = rollup_shelf_totals(rollup)
 
-    result = {
+    return {
         "engagement_id": str(eng_uuid),
-        "overall_coverage_pct": overall,
+        "overall_coverage_pct": _coverage_pct(total_requested, total_received),
         "categories": categories,
     }
-    await _cache_set(request, cache_key, result)
-    return result
 
 
 @router.get(
@@ -319,7 +214,6 @@ async def get_evidence_coverage(
 )
 async def get_confidence_distribution(
     engagement_id: UUID,
-    request: Request,
     session: AsyncSession = Depends(get_session),
     user: User = Depends(require_permission("engagement:read")),
     _engagement_user: User = Depends(require_engagement_access),
@@ -330,82 +224,22 @@ async def get_confidence_distribution(
     and buckets elements by confidence level.
     """
     eng_uuid = engagement_id
+    rollup = await _require_rollup(session, eng_uuid)
 
-    cache_key = f"confidence_distribution:{eng_uuid}"
-    cached = await _cache_get(request, cache_key)
-    if cached is not None:
-        return cached
-
-    # Verify engagement exists
-    eng_result = await session.execute(select(Engagement.id).where(Engagement.id == eng_uuid))
-    if not eng_result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Engagement {engagement_id} not found",
-        )
-
-    # Get latest completed model
-    latest_model_result = await session.execute(
-        select(ProcessModel)
-        .where(
-            ProcessModel.engagement_id == eng_uuid,
-            ProcessModel.status == ProcessModelStatus.COMPLETED,
-        )
-        .order_by(ProcessModel.created_at.desc())
-        .limit(1)
-    )
-    latest_model = latest_model_result.scalar_one_or_none()
-
-    if not latest_model:
-        # No completed model yet -- return empty distribution
-        empty_result = {
-            "engagement_id": str(eng_uuid),
-            "model_id": None,
-            "overall_confidence": 0.0,
-            "distribution": [
-                ConfidenceBucket(level=name, min_score=lo, max_score=hi, count=0) for name, lo, hi in CONFIDENCE_LEVELS
-            ],
-            "weakest_elements": [],
-        }
-        await _cache_set(request, cache_key, empty_result)
-        return empty_result
-
-    # Get all elements for this model
-    elements_result = await session.execute(select(ProcessElement).where(ProcessElement.model_id == latest_model.id))
-    elements = list(elements_result.scalars().all())
-
-    # Bucket by confidence level
-    buckets: dict[str, int] = {name: 0 for name, _, _ in CONFIDENCE_LEVELS}
-    for elem in elements:
-        level = _classify_confidence(elem.confidence_score)
-        buckets[level] += 1
-
+    buckets = rollup.confidence_buckets or {}
     distribution = [
-        ConfidenceBucket(level=name, min_score=lo, max_score=hi, count=buckets[name])
+        ConfidenceBucket(level=name, min_score=lo, max_score=hi, count=buckets.get(name, 0))
         for name, lo, hi in CONFIDENCE_LEVELS
     ]
+    weakest = [WeakElement(**element) for element in rollup.weakest_elements or []]
 
-    # Weakest elements (bottom 5 by confidence)
-    sorted_elements = sorted(elements, key=lambda e: e.confidence_score)
-    weakest = [
-        WeakElement(
-            id=str(e.id),
-            name=e.name,
-            element_type=str(e.element_type),
-            confidence_score=e.confidence_score,
-        )
-        for e in sorted_elements[:5]
-    ]
-
-    result = {
+    return {
         "engagement_id": str(eng_uuid),
-        "model_id": str(latest_model.id),
-        "overall_confidence": latest_model.confidence_score,
+        "model_id": str(rollup.latest_model_id) if rollup.latest_model_id else None,
+        "overall_confidence": rollup.overall_confidence,
         "distribution": distribution,
         "weakest_elements": weakest,
     }
-    await _cache_set(request, cache_key, result)
-    return result
 
 
 # -- Persona Dashboard Constants and Helpers ----------------------------------
@@ -461,57 +295,6 @@ async def _get_user_engagement_role(
     return role
 
 
-async def _get_brightness_distribution(
-    engagement_id: UUID,
-    session: AsyncSession,
-    *,
-    model_id: UUID | None = None,
-) -> BrightnessDistribution:
-    """Compute brightness distribution for the latest completed model.
-
-    If *model_id* is provided the extra model lookup is skipped.
-    """
-    if model_id is None:
-        model_result = await session.execute(
-            select(ProcessModel.id)
-            .where(
-                ProcessModel.engagement_id == engagement_id,
-                ProcessModel.status == ProcessModelStatus.COMPLETED,
-            )
-            .order_by(ProcessModel.created_at.desc())
-            .limit(1)
-        )
-        model_id = model_result.scalar_one_or_none()
-    if model_id is None:
-        return BrightnessDistribution()
-
-    elements_result = await session.execute(
-        select(
-            ProcessElement.brightness_classification,
-            func.count().label("cnt"),
-        )
-        .where(ProcessElement.model_id == model_id)
-        .group_by(ProcessElement.brightness_classification)
-    )
-    rows = elements_result.all()
-    counts: dict[str, int] = {}
-    total = 0
-    for row in rows:
-        key = str(row.brightness_classification).lower() if row.brightness_classification else "unknown"
-        counts[key] = row.cnt
-        total += row.cnt
-
-    if total == 0:
-        return BrightnessDistribution()
-
-    return BrightnessDistribution(
-        bright_pct=round(counts.get("bright", 0) / total * 100, 1),
-        dim_pct=round(counts.get("dim", 0) / total * 100, 1),
-        dark_pct=round(counts.get("dark", 0) / total * 100, 1),
-        total_elements=total,
-    )
-
-
 # -- Persona Dashboard Routes -------------------------------------------------
 
 
@@ -534,37 +317,9 @@ async def get_engagement_lead_dashboard(
 
     eng_uuid = engagement_id
 
-    # Evidence coverage
-    shelf_result = await session.execute(
-        select(
-            func.count().label("total"),
-            func.count().filter(ShelfDataRequestItem.status == ShelfRequestItemStatus.RECEIVED).label("received"),
-        )
-        .join(ShelfDataRequest)
-        .where(ShelfDataRequest.engagement_id == eng_uuid)
-    )
-    shelf_row = shelf_result.one()
-    evidence_coverage_pct = round(shelf_row.received / shelf_row.total * 100, 1) if shelf_row.total > 0 else 0.0
-
-    # Overall confidence from latest completed model
-    latest_model_result = await session.execute(
-        select(ProcessModel)
-        .where(
-            ProcessModel.engagement_id == eng_uuid,
-            ProcessModel.status == ProcessModelStatus.COMPLETED,
-        )
-        .order_by(ProcessModel.created_at.desc())
-        .limit(1)
-    )
-    latest_model = latest_model_result.scalar_one_or_none()
-    overall_confidence = latest_model.confidence_score if latest_model else 0.0
-
-    # Brightness distribution (pass model_id to avoid redundant lookup)
-    brightness = await _get_brightness_distribution(
-        eng_uuid,
-        session,
-        model_id=latest_model.id if latest_model else None,
-    )
+    # Coverage, confidence, brightness and gap counts
+    rollup = await _require_rollup(session, eng_uuid)
+    total_requested, total_received = rollup_shelf_totals(rollup)
 
     # TOM alignment per dimension (1.0 - avg_severity) — project only needed columns
     gaps_result = await session.execute(
@@ -591,23 +346,6 @@ async def get_engagement_lead_dashboard(
             )
         )
 
-    # Gap counts by severity
-    gap_counts = GapCountBySeverity()
-    if latest_model:
-        gap_sev_result = await session.execute(
-            select(EvidenceGap.severity, func.count().label("cnt"))
-            .where(EvidenceGap.model_id == latest_model.id)
-            .group_by(EvidenceGap.severity)
-        )
-        for gap_sev_row in gap_sev_result.all():
-            sev = str(gap_sev_row.severity).lower()
-            if sev == "high":
-                gap_counts.high = gap_sev_row.cnt
-            elif sev == "medium":
-                gap_counts.medium = gap_sev_row.cnt
-            elif sev == "low":
-                gap_counts.low = gap_sev_row.cnt
-
     # Seed list coverage (active terms / total terms)
     seed_result = await session.execute(
         select(
@@ -635,11 +373,11 @@ async def get_engagement_lead_dashboard(
 
     return {
         "engagement_id": str(eng_uuid),
-        "evidence_coverage_pct": evidence_coverage_pct,
-        "overall_confidence": overall_confidence,
-        "brightness_distribution": brightness,
+        "evidence_coverage_pct": _coverage_pct(total_requested, total_received),
+        "overall_confidence": rollup.overall_confidence,
+        "brightness_distribution": _brightness_distribution(rollup),
         "tom_alignment": tom_alignment,
-        "gap_counts": gap_counts,
+        "gap_counts": _gap_counts(rollup),
         "seed_list_coverage_pct": seed_list_coverage_pct,
         "dark_room_shrink_rate": dark_room_shrink_rate,
     }
@@ -870,25 +608,7 @@ async def get_client_dashboard(
 
     eng_uuid = engagement_id
 
-    # Overall confidence
-    latest_model_result = await session.execute(
-        select(ProcessModel)
-        .where(
-            ProcessModel.engagement_id == eng_uuid,
-            ProcessModel.status == ProcessModelStatus.COMPLETED,
-        )
-        .order_by(ProcessModel.created_at.desc())
-        .limit(1)
-    )
-    latest_model = latest_model_result.scalar_one_or_none()
-    overall_confidence = latest_model.confidence_score if latest_model else 0.0
-
-    # Brightness distribution (pass model_id to avoid redundant lookup)
-    brightness = await _get_brightness_distribution(
-        eng_uuid,
-        session,
-        model_id=latest_model.id if latest_model else None,
-    )
+    rollup = await _require_rollup(session, eng_uuid)
 
     # Gap findings (without internal severity scores — client-friendly view)
     gaps_result = await session.execute(
@@ -913,8 +633,8 @@ async def get_client_dashboard(
 
     return {
         "engagement_id": str(eng_uuid),
-        "overall_confidence": overall_confidence,
-        "brightness_distribution": brightness,
+        "overall_confidence": rollup.overall_confidence,
+        "brightness_distribution": _brightness_distribution(rollup),
         "gap_findings": gap_findings,
         "total_recommendations": total_recommendations,
     }
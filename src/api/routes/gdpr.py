@@ -55,6 +55,7 @@ from src.core.models import (
 from src.core.models.llm_audit import LLMAuditLog
 from src.core.models.pipeline_quality import CopilotFeedback
 from src.core.permissions import has_role_level
+from src.core.principal_cache import invalidate_principal
 
 logger = logging.getLogger(__name__)
 
@@ -485,6 +486,7 @@ async def update_consent(
 )
 async def admin_anonymize_user(
     user_id: UUID,
+    request: Request,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> AnonymizeResponse:
@@ -556,6 +558,7 @@ async def admin_anonymize_user(
 
     now = datetime.now(UTC)
     await session.commit()
+    await invalidate_principal(request, user_id=user_id)
 
     await log_security_event(
         session=session,
@@ -8,10 +8,11 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,8 +22,17 @@ from src.core.permissions import check_engagement_access, require_engagement_acc
 from src.semantic.builder import KnowledgeGraphBuilder
 from src.semantic.embeddings import EmbeddingService
 from src.semantic.graph import (
+    GraphNode,
+    GraphRelationship,
     KnowledgeGraphService,
 )
+from src.semantic.graph_export import (
+    ARROW_STREAM_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    arrow_available,
+    arrow_export,
+    ndjson_export,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -105,10 +115,30 @@ class StatsResponse(BaseModel):
 
 
 class SubgraphResponse(BaseModel):
-    """Response for engagement subgraph."""
+    """Response for engagement subgraph.
+
+    A non-null cursor means more elements exist; pass it to
+    ``/subgraph/nodes`` or ``/subgraph/relationships`` to continue.
+    """
+
+    nodes: list[NodeResponse]
+    relationships: list[RelationshipResponse]
+    next_node_cursor: str | None = None
+    next_relationship_cursor: str | None = None
+
+
+class NodePageResponse(BaseModel):
+    """One keyset page of an engagement's nodes."""
 
     nodes: list[NodeResponse]
+    next_cursor: str | None = None
+
+
+class RelationshipPageResponse(BaseModel):
+    """One keyset page of an engagement's relationships."""
+
     relationships: list[RelationshipResponse]
+    next_cursor: str | None = None
 
 
 # -- Dependencies -----------------------------------------------------------
@@ -293,40 +323,114 @@ async def get_graph_stats(
     return result
 
 
+def _node_dict(node: GraphNode) -> dict[str, Any]:
+    return {"id": node.id, "label": node.label, "properties": node.properties}
+
+
+def _relationship_dict(rel: GraphRelationship) -> dict[str, Any]:
+    return {
+        "id": rel.id,
+        "from_id": rel.from_id,
+        "to_id": rel.to_id,
+        "relationship_type": rel.relationship_type,
+        "properties": rel.properties,
+    }
+
+
 @router.get("/{engagement_id}/subgraph", response_model=SubgraphResponse)
 async def get_engagement_subgraph(
     engagement_id: UUID,
+    page_size: int = Query(default=500, ge=1, le=5000),
     graph_service: KnowledgeGraphService = Depends(get_graph_service),
     user: User = Depends(require_permission("engagement:read")),
     _engagement_user: User = Depends(require_engagement_access),
 ) -> dict[str, Any]:
-    """Get the full knowledge graph for an engagement as JSON.
+    """Get the first page of an engagement's knowledge graph as JSON.
 
-    Returns all nodes and relationships scoped to the engagement.
+    Returns up to ``page_size`` nodes and relationships, with cursors for
+    the remainder. Use ``/export/stream`` to export the whole graph.
     """
-    subgraph = await graph_service.get_engagement_subgraph(str(engagement_id))
+    nodes, next_node_cursor = await graph_service.get_engagement_node_page(str(engagement_id), limit=page_size)
+    relationships, next_relationship_cursor = await graph_service.get_engagement_relationship_page(
+        str(engagement_id), limit=page_size
+    )
     return {
-        "nodes": [
-            {
-                "id": node.id,
-                "label": node.label,
-                "properties": node.properties,
-            }
-            for node in subgraph["nodes"]
-        ],
-        "relationships": [
-            {
-                "id": rel.id,
-                "from_id": rel.from_id,
-                "to_id": rel.to_id,
-                "relationship_type": rel.relationship_type,
-                "properties": rel.properties,
-            }
-            for rel in subgraph["relationships"]
-        ],
+        "nodes": [_node_dict(node) for node in nodes],
+        "relationships": [_relationship_dict(rel) for rel in relationships],
+        "next_node_cursor": next_node_cursor,
+        "next_relationship_cursor": next_relationship_cursor,
     }
 
 
+@router.get("/{engagement_id}/subgraph/nodes", response_model=NodePageResponse)
+async def get_engagement_subgraph_nodes(
+    engagement_id: UUID,
+    cursor: str | None = None,
+    page_size: int = Query(default=500, ge=1, le=5000),
+    graph_service: KnowledgeGraphService = Depends(get_graph_service),
+    user: User = Depends(require_permission("engagement:read")),
+    _engagement_user: User = Depends(require_engagement_access),
+) -> dict[str, Any]:
+    """Page through an engagement's nodes with a keyset cursor."""
+    try:
+        nodes, next_cursor = await graph_service.get_engagement_node_page(str(engagement_id), cursor, page_size)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    return {"nodes": [_node_dict(node) for node in nodes], "next_cursor": next_cursor}
+
+
+@router.get("/{engagement_id}/subgraph/relationships", response_model=RelationshipPageResponse)
+async def get_engagement_subgraph_relationships(
+    engagement_id: UUID,
+    cursor: str | None = None,
+    page_size: int = Query(default=500, ge=1, le=5000),
+    graph_service: KnowledgeGraphService = Depends(get_graph_service),
+    user: User = Depends(require_permission("engagement:read")),
+    _engagement_user: User = Depends(require_engagement_access),
+) -> dict[str, Any]:
+    """Page through the relationships between an engagement's nodes with a keyset cursor."""
+    try:
+        relationships, next_cursor = await graph_service.get_engagement_relationship_page(
+            str(engagement_id), cursor, page_size
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    return {"relationships": [_relationship_dict(rel) for rel in relationships], "next_cursor": next_cursor}
+
+
+@router.get("/{engagement_id}/export/stream", response_model=None)
+async def export_subgraph_stream(
+    engagement_id: UUID,
+    format: Literal["ndjson", "arrow"] = "ndjson",
+    page_size: int = Query(default=1000, ge=1, le=10000),
+    graph_service: KnowledgeGraphService = Depends(get_graph_service),
+    user: User = Depends(require_permission("engagement:read")),
+    _engagement_user: User = Depends(require_engagement_access),
+) -> StreamingResponse:
+    """Stream an engagement's whole knowledge graph.
+
+    Nodes are streamed first, then relationships, paging through Neo4j
+    with keyset cursors so memory stays bounded by ``page_size``.
+    ``format=ndjson`` emits one JSON object per line; ``format=arrow``
+    emits an Arrow IPC stream with one record batch per page.
+    """
+    pages = graph_service.iter_engagement_subgraph(str(engagement_id), page_size)
+    if format == "arrow":
+        if not arrow_available():
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail="Arrow export requires pyarrow. Install with: pip install 'kmflow[datalake]'",
+            )
+        body, media_type, suffix = arrow_export(pages), ARROW_STREAM_MEDIA_TYPE, "arrows"
+    else:
+        body, media_type, suffix = ndjson_export(pages), NDJSON_MEDIA_TYPE, "ndjson"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="graph-{engagement_id}.{suffix}"'},
+    )
+
+
 class CytoscapeNode(BaseModel):
     """Cytoscape.js node data."""
 
@@ -353,7 +457,11 @@ async def export_cytoscape(
     user: User = Depends(require_permission("engagement:read")),
     _engagement_user: User = Depends(require_engagement_access),
 ) -> dict[str, Any]:
-    """Export engagement graph in Cytoscape.js compatible format."""
+    """Export the whole engagement graph in Cytoscape.js compatible format.
+
+    The document is built in memory; use ``/export/stream`` for very large
+    engagements.
+    """
     subgraph = await graph_service.get_engagement_subgraph(str(engagement_id))
 
     nodes = []
@@ -8,9 +8,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,6 +24,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/graph-analytics", tags=["graph-analytics"])
 
+DEFAULT_BETWEENNESS_SAMPLES = 64
+MAX_BETWEENNESS_SAMPLES = 5000
+
 
 # -- Request/Response Schemas ------------------------------------------------
 
@@ -37,6 +41,39 @@ class GraphMetricsResponse(BaseModel):
     relationships_by_type: dict[str, int]
     avg_degree: float
     density: float
+    connected_components: int
+    largest_component_size: int
+    orphan_count: int
+    degree_distribution: dict[int, int]
+
+
+class CentralityEntry(BaseModel):
+    """Centrality score for one node."""
+
+    node_id: str
+    label: str
+    score: float
+
+
+class CentralityResponse(BaseModel):
+    """Most central nodes of an engagement graph."""
+
+    engagement_id: str
+    metric: str
+    sampled_sources: int | None
+    nodes: list[CentralityEntry]
+
+
+class ShortestPathResponse(BaseModel):
+    """Shortest path between two nodes of an engagement graph."""
+
+    engagement_id: str
+    from_id: str
+    to_id: str
+    directed: bool
+    found: bool
+    length: int | None
+    path: list[str]
 
 
 class TriangulationResult(BaseModel):
@@ -85,15 +122,17 @@ async def get_graph_metrics(
 ) -> dict[str, Any]:
     """Get graph metrics for an engagement.
 
-    Returns node/relationship counts, average degree, and graph density.
+    Returns node/relationship counts, average degree, graph density,
+    connected components, orphans and the degree distribution, computed
+    from the engagement's cached graph snapshot.
     """
     from src.semantic.graph import KnowledgeGraphService
+    from src.semantic.graph_snapshot import get_graph_snapshot
 
-    graph_service = KnowledgeGraphService(request.app.state.neo4j_driver)
-    stats = await graph_service.get_stats(str(engagement_id))
+    graph = await get_graph_snapshot(KnowledgeGraphService(request.app.state.neo4j_driver), str(engagement_id))
 
-    total_nodes = sum(stats.nodes_by_label.values())
-    total_rels = sum(stats.relationships_by_type.values())
+    total_nodes = graph.node_count
+    total_rels = graph.edge_count
 
     # Compute density: edges / (nodes * (nodes - 1)) for directed graph
     density = 0.0
@@ -103,14 +142,103 @@ async def get_graph_metrics(
     # Average degree: total_rels / total_nodes
     avg_degree = total_rels / total_nodes if total_nodes > 0 else 0.0
 
+    component_sizes = graph.component_sizes()
+
     return {
         "engagement_id": str(engagement_id),
         "total_nodes": total_nodes,
         "total_relationships": total_rels,
-        "nodes_by_label": stats.nodes_by_label,
-        "relationships_by_type": stats.relationships_by_type,
+        "nodes_by_label": graph.nodes_by_label(),
+        "relationships_by_type": graph.relationships_by_type(),
         "avg_degree": round(avg_degree, 2),
         "density": round(density, 6),
+        "connected_components": int(component_sizes.size),
+        "largest_component_size": int(component_sizes[0]) if component_sizes.size else 0,
+        "orphan_count": int((graph.degree == 0).sum()),
+        "degree_distribution": graph.degree_distribution(),
+    }
+
+
+@router.get("/centrality/{engagement_id}", response_model=CentralityResponse)
+async def get_centrality(
+    engagement_id: UUID,
+    request: Request,
+    session: AsyncSession = Depends(get_session),
+    user: User = Depends(require_engagement_access),
+    metric: Literal["pagerank", "betweenness"] = Query("pagerank", description="Centrality measure"),
+    limit: int = Query(default=20, ge=1, le=500, description="Number of top nodes to return"),
+    samples: int | None = Query(
+        default=None,
+        ge=1,
+        le=MAX_BETWEENNESS_SAMPLES,
+        description="Source nodes sampled for approximate betweenness",
+    ),
+) -> dict[str, Any]:
+    """Get the most central nodes of an engagement graph.
+
+    PageRank follows relationship direction. Betweenness treats the graph
+    as undirected and is exact for graphs of up to ``samples`` (default
+    64) nodes, sampled above that.
+    """
+    from src.semantic.graph import KnowledgeGraphService
+    from src.semantic.graph_snapshot import get_graph_snapshot
+
+    graph = await get_graph_snapshot(KnowledgeGraphService(request.app.state.neo4j_driver), str(engagement_id))
+
+    sampled: int | None = None
+    if metric == "pagerank":
+        scores = graph.pagerank()
+    else:
+        sources = samples or DEFAULT_BETWEENNESS_SAMPLES
+        if sources < graph.node_count:
+            sampled = sources
+        # Brandes runs one BFS per source; keep it off the event loop.
+        scores = await asyncio.to_thread(graph.betweenness, sampled)
+
+    top = np.argsort(-scores, kind="stable")[:limit]
+    return {
+        "engagement_id": str(engagement_id),
+        "metric": metric,
+        "sampled_sources": sampled,
+        "nodes": [
+            {
+                "node_id": graph.node_ids[i],
+                "label": graph.label_names[graph.node_labels[i]],
+                "score": round(float(scores[i]), 6),
+            }
+            for i in top
+        ],
+    }
+
+
+@router.get("/shortest-path/{engagement_id}", response_model=ShortestPathResponse)
+async def get_shortest_path(
+    engagement_id: UUID,
+    request: Request,
+    from_id: str = Query(..., description="Start node ID"),
+    to_id: str = Query(..., description="End node ID"),
+    directed: bool = Query(False, description="Follow relationships only in their direction"),
+    session: AsyncSession = Depends(get_session),
+    user: User = Depends(require_engagement_access),
+) -> dict[str, Any]:
+    """Get a shortest path between two nodes of an engagement graph."""
+    from src.semantic.graph import KnowledgeGraphService
+    from src.semantic.graph_snapshot import get_graph_snapshot
+
+    graph = await get_graph_snapshot(KnowledgeGraphService(request.app.state.neo4j_driver), str(engagement_id))
+    try:
+        path = graph.shortest_path(from_id, to_id, directed=directed)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Node not found in engagement graph") from None
+
+    return {
+        "engagement_id": str(engagement_id),
+        "from_id": from_id,
+        "to_id": to_id,
+        "directed": directed,
+        "found": path is not None,
+        "length": len(path) - 1 if path is not None else None,
+        "path": path or [],
     }
 
 
@@ -10,7 +10,7 @@ import logging
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel, Field
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -99,6 +99,7 @@ class HealthResponse(BaseModel):
     decisions_tracked: int
     p99_latency_ms: float
     avg_latency_ms: float | None = None
+    audit_sink: dict[str, Any] | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -134,11 +135,12 @@ async def evaluate(
 @router.post("/rules", response_model=PolicyRuleResponse, status_code=status.HTTP_201_CREATED)
 async def create_rule(
     body: CreateRuleRequest,
+    request: Request,
     session: AsyncSession = Depends(get_session),
     user: User = Depends(require_permission("pdp:admin")),
 ) -> Any:
-    """Create a new policy rule (hot-reloaded on next evaluation)."""
-    from src.api.services.pdp import PDPService
+    """Create a new policy rule (hot-reloaded by every API process)."""
+    from src.api.services.pdp import PDPService, notify_policy_change
 
     service = PDPService(session)
     try:
@@ -161,6 +163,8 @@ async def create_rule(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Policy rule '{body.name}' already exists",
         ) from exc
+    await session.commit()
+    await notify_policy_change(getattr(request.app.state, "redis_client", None))
     return policy
 
 
@@ -178,8 +182,12 @@ async def list_rules(
 
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check() -> dict[str, Any]:
-    """PDP health check with p99 latency metric."""
+async def health_check(request: Request) -> dict[str, Any]:
+    """PDP health check with p99 latency and audit sink metrics."""
     from src.api.services.pdp import PDPService
 
-    return PDPService.get_health_metrics()
+    metrics = PDPService.get_health_metrics()
+    audit_sink = getattr(request.app.state, "audit_sink", None)
+    if audit_sink is not None:
+        metrics["audit_sink"] = audit_sink.get_metrics()
+    return metrics
@@ -190,6 +190,7 @@ async def trigger_pov_generation(
                 "engagement_id": payload.engagement_id,
                 "scope": payload.scope,
                 "generated_by": payload.generated_by,
+                "incremental": payload.incremental,
             },
             max_retries=1,
         )
@@ -238,6 +239,7 @@ async def trigger_pov_generation(
             engagement_id=payload.engagement_id,
             scope=payload.scope,
             generated_by=payload.generated_by,
+            incremental=payload.incremental,
         )
 
         try:
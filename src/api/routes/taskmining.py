@@ -4,7 +4,8 @@ Endpoints:
 - POST /agents/register        — Register a new desktop agent
 - POST /agents/{id}/approve    — Approve/revoke an agent (admin)
 - GET  /agents                 — List agents
-- POST /events                 — Batch event ingestion from agents
+- POST /events                 — Batch event ingestion from agents (gzip/zstd bodies)
+- POST /compression/dictionaries — Register an agent-trained zstd dictionary
 - GET  /config/{agent_id}      — Pull capture configuration
 - POST /heartbeat              — Agent health heartbeat
 - GET  /sessions               — List capture sessions
@@ -20,12 +21,15 @@ Endpoints:
 
 from __future__ import annotations
 
+import hashlib
 import logging
+from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.routing import APIRoute
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -58,6 +62,7 @@ from src.api.schemas.taskmining import (
     VCEListResponse,
     VCEResponse,
     VCETriggerSummaryResponse,
+    ZstdDictionaryResponse,
 )
 from src.core.audit import log_audit
 from src.core.models import AuditAction, User
@@ -79,6 +84,15 @@ from src.core.models.taskmining import (
 )
 from src.core.permissions import check_engagement_access, require_permission
 from src.core.rls import set_engagement_context, set_rls_bypass
+from src.taskmining.compression import (
+    BodyDecodingError,
+    DecodedBodyTooLargeError,
+    DictionaryConflictError,
+    UnknownDictionaryError,
+    UnsupportedContentEncodingError,
+    decode_request_body,
+    register_dictionary,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -100,7 +114,52 @@ async def _apply_rls_context(
         await set_rls_bypass(session, True)
 
 
-router = APIRouter(prefix="/api/v1/taskmining", tags=["taskmining"])
+_DECODING_ERROR_STATUS: dict[type[BodyDecodingError], int] = {
+    UnsupportedContentEncodingError: status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+    UnknownDictionaryError: status.HTTP_409_CONFLICT,
+    DictionaryConflictError: status.HTTP_409_CONFLICT,
+    DecodedBodyTooLargeError: status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+}
+
+
+def _decoding_http_error(error: BodyDecodingError) -> HTTPException:
+    code = _DECODING_ERROR_STATUS.get(type(error), status.HTTP_400_BAD_REQUEST)
+    return HTTPException(status_code=code, detail=str(error))
+
+
+class _DecodedBodyRequest(Request):
+    """Request whose body has its ``Content-Encoding`` removed."""
+
+    async def body(self) -> bytes:
+        if not hasattr(self, "_body"):
+            raw = await super().body()
+            encoding = self.headers.get("content-encoding")
+            if encoding is None:
+                return raw
+            try:
+                decoded = await decode_request_body(raw, encoding, self.app.state.redis_client)
+            except BodyDecodingError as e:
+                raise _decoding_http_error(e) from e
+            checksum = self.headers.get("x-checksum")
+            if checksum and hashlib.sha256(decoded).hexdigest() != checksum:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="X-Checksum mismatch")
+            self._body = decoded
+        return self._body
+
+
+class DecodedBodyRoute(APIRoute):
+    """Route that accepts gzip- or zstd-encoded request bodies from agents."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def decoded_body_handler(request: Request) -> Response:
+            return await handler(_DecodedBodyRequest(request.scope, request.receive))
+
+        return decoded_body_handler
+
+
+router = APIRouter(prefix="/api/v1/taskmining", tags=["taskmining"], route_class=DecodedBodyRoute)
 
 
 # ---------------------------------------------------------------------------
@@ -402,6 +461,33 @@ async def ingest_events(
     return result_counts
 
 
+# ---------------------------------------------------------------------------
+# POST /compression/dictionaries
+# ---------------------------------------------------------------------------
+
+
+@router.post(
+    "/compression/dictionaries",
+    response_model=ZstdDictionaryResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def register_compression_dictionary(
+    request: Request,
+    current_user: User = Depends(require_permission("taskmining:write")),
+) -> dict[str, Any]:
+    """Register a zstd dictionary trained by an agent on its own events.
+
+    The body is the raw dictionary. Event batches compressed with it carry
+    its id in the zstd frame header and are decoded by ``POST /events``.
+    """
+    data = await request.body()
+    try:
+        dictionary_id = await register_dictionary(request.app.state.redis_client, data)
+    except BodyDecodingError as e:
+        raise _decoding_http_error(e) from e
+    return {"dictionary_id": dictionary_id, "size_bytes": len(data)}
+
+
 # ---------------------------------------------------------------------------
 # GET /config/{agent_id}
 # ---------------------------------------------------------------------------
@@ -16,7 +16,7 @@ import logging
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from pydantic import BaseModel, EmailStr, Field
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -25,6 +25,7 @@ from src.api.deps import get_session
 from src.core.auth import get_current_user, hash_password
 from src.core.models import AuditAction, AuditLog, Engagement, EngagementMember, User, UserRole
 from src.core.permissions import has_permission, has_role_level, require_engagement_access
+from src.core.principal_cache import invalidate_principal
 
 logger = logging.getLogger(__name__)
 
@@ -195,6 +196,7 @@ async def get_user(
 async def update_user(
     user_id: UUID,
     payload: UserUpdate,
+    request: Request,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> User:
@@ -231,6 +233,7 @@ async def update_user(
     session.add(audit)
 
     await session.commit()
+    await invalidate_principal(request, user_id=user_id)
     await session.refresh(user)
     return user
 
@@ -248,6 +251,7 @@ async def update_user(
 async def add_engagement_member(
     engagement_id: UUID,
     payload: MemberCreate,
+    request: Request,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
     _engagement_user: User = Depends(require_engagement_access),
@@ -305,6 +309,7 @@ async def add_engagement_member(
     session.add(audit)
 
     await session.commit()
+    await invalidate_principal(request, user_id=payload.user_id)
     await session.refresh(member)
     return member
 
@@ -317,6 +322,7 @@ async def add_engagement_member(
 async def remove_engagement_member(
     engagement_id: UUID,
     user_id: UUID,
+    request: Request,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
     _engagement_user: User = Depends(require_engagement_access),
@@ -352,6 +358,7 @@ async def remove_engagement_member(
     session.add(audit)
 
     await session.commit()
+    await invalidate_principal(request, user_id=user_id)
 
 
 class MemberListResponse(BaseModel):
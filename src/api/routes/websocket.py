@@ -3,6 +3,10 @@
 Provides WebSocket endpoints that subscribe to Redis Pub/Sub channels
 and push events to connected clients. Includes heartbeat and
 connection management.
+
+Engagement sockets (monitoring, alerts) share the worker's
+``RealtimeHub``: one Pub/Sub subscription, with each event queued once
+for each socket of its engagement.
 """
 
 from __future__ import annotations
@@ -12,12 +16,13 @@ import json
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
 from sqlalchemy import select
 
 from src.core.auth import get_current_user, get_websocket_user
 from src.core.config import get_settings
 from src.core.models import EngagementMember, User, UserRole
+from src.core.realtime_hub import get_realtime_hub
 from src.core.redis import (
     CHANNEL_ALERTS,
     CHANNEL_DEVIATIONS,
@@ -117,33 +122,32 @@ async def _check_engagement_membership(
     return True
 
 
-async def _redis_subscriber(
-    request: Request,
+async def _serve_engagement_socket(
+    websocket: WebSocket,
     engagement_id: str,
-    shutdown: asyncio.Event,
+    channels: set[str],
+    heartbeat_seconds: float | None,
 ) -> None:
-    """Subscribe to Redis Pub/Sub and forward events to WebSocket clients."""
-    redis_client = request.app.state.redis_client
-    pubsub = redis_client.pubsub()
-
-    channels = [CHANNEL_DEVIATIONS, CHANNEL_ALERTS, CHANNEL_MONITORING]
-    await pubsub.subscribe(*channels)
+    """Deliver ``channels`` events to a connected socket until it disconnects.
 
+    Events come from the shared hub; this loop only answers pings and, if
+    ``heartbeat_seconds`` is set, sends a heartbeat after that much silence
+    from the client. All frames go through the socket's send queue.
+    """
+    hub = get_realtime_hub(websocket.app)
+    sender = hub.register(websocket, engagement_id, channels)
     try:
-        while not shutdown.is_set():
-            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-            if message and message["type"] == "message":
-                try:
-                    data = json.loads(message["data"])
-                    # Only forward events for this engagement
-                    if data.get("engagement_id") == engagement_id:
-                        await manager.broadcast(engagement_id, data)
-                except (json.JSONDecodeError, TypeError) as e:
-                    logger.debug("Skipping malformed Redis message on channel %s: %s", message.get("channel"), e)
-            await asyncio.sleep(0.1)
+        while True:
+            try:
+                data = await asyncio.wait_for(websocket.receive_text(), timeout=heartbeat_seconds)
+                # Handle client messages (ping/pong)
+                if data == "ping":
+                    sender.send("pong")
+            except TimeoutError:
+                # Send heartbeat
+                sender.send(json.dumps({"type": "heartbeat"}))
     finally:
-        await pubsub.unsubscribe(*channels)
-        await pubsub.close()
+        await hub.unregister(sender)
 
 
 @router.websocket("/ws/monitoring/{engagement_id}")
@@ -190,30 +194,15 @@ async def monitoring_websocket(
         return
 
     await manager.connect(websocket, engagement_id)
-    shutdown = asyncio.Event()
-
-    # Start Redis subscriber in background
-    subscriber_task = asyncio.create_task(
-        _redis_subscriber(websocket, engagement_id, shutdown)  # type: ignore[arg-type]
-    )
-
     try:
-        while True:
-            try:
-                data = await asyncio.wait_for(websocket.receive_text(), timeout=30.0)
-                # Handle client messages (ping/pong)
-                if data == "ping":
-                    await websocket.send_text("pong")
-            except TimeoutError:
-                # Send heartbeat
-                await websocket.send_json({"type": "heartbeat"})
+        await _serve_engagement_socket(
+            websocket, engagement_id, {CHANNEL_DEVIATIONS, CHANNEL_ALERTS, CHANNEL_MONITORING}, heartbeat_seconds=30.0
+        )
     except WebSocketDisconnect:
         logger.debug("WebSocket client disconnected for engagement %s", engagement_id)
     except Exception:  # Intentionally broad: WebSocket event loop must not crash
         logger.exception("WebSocket error for engagement %s", engagement_id)
     finally:
-        shutdown.set()
-        subscriber_task.cancel()
         manager.disconnect(websocket, engagement_id)
 
 
@@ -258,38 +247,13 @@ async def alerts_websocket(
         return
 
     await manager.connect(websocket, engagement_id)
-    shutdown = asyncio.Event()
-
-    redis_client = websocket.app.state.redis_client
-    pubsub = redis_client.pubsub()
-    await pubsub.subscribe(CHANNEL_ALERTS)
-
     try:
-        while True:
-            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-            if message and message["type"] == "message":
-                try:
-                    data = json.loads(message["data"])
-                    if data.get("engagement_id") == engagement_id:
-                        await websocket.send_json(data)
-                except (json.JSONDecodeError, TypeError) as e:
-                    logger.debug("Skipping malformed Redis alert message: %s", e)
-
-            # Check for client disconnect
-            try:
-                data = await asyncio.wait_for(websocket.receive_text(), timeout=0.1)
-                if data == "ping":
-                    await websocket.send_text("pong")
-            except TimeoutError:
-                pass
+        await _serve_engagement_socket(websocket, engagement_id, {CHANNEL_ALERTS}, heartbeat_seconds=None)
     except WebSocketDisconnect:
         logger.debug("Alert WebSocket client disconnected for engagement %s", engagement_id)
     except Exception:  # Intentionally broad: WebSocket event loop must not crash
         logger.exception("Alert WebSocket error")
     finally:
-        shutdown.set()
-        await pubsub.unsubscribe(CHANNEL_ALERTS)
-        await pubsub.close()
         manager.disconnect(websocket, engagement_id)
 
 
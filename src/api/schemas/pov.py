@@ -16,6 +16,10 @@ class POVGenerateRequest(BaseModel):
     engagement_id: str = Field(..., description="Engagement UUID")
     scope: str = Field(default="all", description="Scope filter for evidence")
     generated_by: str = Field(default="consensus_algorithm", description="Generator identifier")
+    incremental: bool = Field(
+        default=False,
+        description="Regenerate from the evidence delta since the latest completed POV for this scope",
+    )
 
 
 class POVGenerateResponse(BaseModel):
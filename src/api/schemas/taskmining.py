@@ -94,6 +94,11 @@ class EventBatchResponse(BaseModel):
     pii_quarantined: int
 
 
+class ZstdDictionaryResponse(BaseModel):
+    dictionary_id: int
+    size_bytes: int
+
+
 # ---------------------------------------------------------------------------
 # Heartbeat
 # ---------------------------------------------------------------------------
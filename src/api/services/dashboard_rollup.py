@@ -0,0 +1,340 @@
+"""Materialised engagement dashboard rollups.
+
+Dashboard endpoints read one ``EngagementDashboardRollup`` row per
+engagement instead of running COUNT/GROUP BY queries per request. The row
+is kept fresh by Session events rather than a TTL:
+
+- ``before_flush`` records which engagements are touched by new, changed
+  or deleted evidence items, shelf requests and items, process models,
+  process elements and evidence gaps;
+- ``before_commit`` flushes, then recomputes the rollup of each touched
+  engagement inside the committing transaction, so the rollup commits
+  atomically with the change that invalidated it.
+
+Recomputation takes a transaction-scoped advisory lock per engagement so
+concurrent writers serialise their refreshes and the last one to commit
+always sees the other's rows. Writes that bypass the ORM unit of work
+(Core ``insert``/``update``/``delete`` statements) must call
+``mark_rollup_stale`` to be picked up. Missing rows are backfilled on first
+read.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import case, event, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.models import (
+    Engagement,
+    EngagementDashboardRollup,
+    EvidenceGap,
+    EvidenceItem,
+    ProcessElement,
+    ProcessModel,
+    ProcessModelStatus,
+    ShelfDataRequest,
+    ShelfDataRequestItem,
+    ShelfRequestItemStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+# (level, min_score, max_score), highest first; a score falls in the first
+# level whose min_score it reaches.
+CONFIDENCE_LEVELS = [
+    ("VERY_HIGH", 0.90, 1.00),
+    ("HIGH", 0.75, 0.89),
+    ("MEDIUM", 0.50, 0.74),
+    ("LOW", 0.25, 0.49),
+    ("VERY_LOW", 0.00, 0.24),
+]
+
+WEAKEST_ELEMENT_LIMIT = 5
+
+_PENDING_KEY = "dashboard_rollup_pending"
+
+
+@dataclass
+class _PendingRollups:
+    """Rollup keys touched by the current transaction, resolved at commit."""
+
+    engagement_ids: set[uuid.UUID] = field(default_factory=set)
+    model_ids: set[uuid.UUID] = field(default_factory=set)
+    shelf_request_ids: set[uuid.UUID] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.engagement_ids or self.model_ids or self.shelf_request_ids)
+
+
+def _pending(session: Session) -> _PendingRollups:
+    pending = session.info.get(_PENDING_KEY)
+    if pending is None:
+        pending = session.info[_PENDING_KEY] = _PendingRollups()
+    return pending
+
+
+def mark_rollup_stale(session: Session | AsyncSession, engagement_id: uuid.UUID) -> None:
+    """Schedule an engagement's rollup for recomputation at commit.
+
+    Needed only after Core statements that the ORM unit of work does not
+    see; ORM adds, changes and deletes are tracked automatically.
+    """
+    sync_session = session.sync_session if isinstance(session, AsyncSession) else session
+    _pending(sync_session).engagement_ids.add(engagement_id)
+
+
+def _track(pending: _PendingRollups, obj: Any) -> None:
+    if isinstance(obj, EvidenceItem | ProcessModel | ShelfDataRequest):
+        target, key = pending.engagement_ids, obj.engagement_id
+    elif isinstance(obj, ProcessElement | EvidenceGap):
+        target, key = pending.model_ids, obj.model_id
+    elif isinstance(obj, ShelfDataRequestItem):
+        target, key = pending.shelf_request_ids, obj.request_id
+    else:
+        return
+    if key is not None:
+        target.add(key)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_touched_engagements(
+    session: Session, flush_context: Any, instances: Any
+) -> None:  # Any because: SQLAlchemy internal UOWTransaction / InstanceState; no public type
+    """Record engagements whose rollup the pending flush invalidates."""
+    pending = _pending(session)
+    for obj in session.new:
+        _track(pending, obj)
+    for obj in session.deleted:
+        _track(pending, obj)
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            _track(pending, obj)
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_touched_rollups(session: Session) -> None:
+    """Recompute the rollups of every engagement touched in this transaction."""
+    if not session.info.get(_PENDING_KEY):
+        return
+    session.flush()
+    pending: _PendingRollups = session.info.pop(_PENDING_KEY)
+    for engagement_id in sorted(_resolve_engagements(session, pending)):
+        refresh_engagement_rollup(session, engagement_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_touched_rollups(session: Session) -> None:
+    """Forget touched engagements when the transaction rolls back."""
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _resolve_engagements(session: Session, pending: _PendingRollups) -> set[uuid.UUID]:
+    """Map touched models and shelf requests to their engagements."""
+    engagement_ids = set(pending.engagement_ids)
+    if pending.model_ids:
+        engagement_ids.update(
+            session.execute(select(ProcessModel.engagement_id).where(ProcessModel.id.in_(pending.model_ids))).scalars()
+        )
+    if pending.shelf_request_ids:
+        engagement_ids.update(
+            session.execute(
+                select(ShelfDataRequest.engagement_id).where(ShelfDataRequest.id.in_(pending.shelf_request_ids))
+            ).scalars()
+        )
+    return engagement_ids
+
+
+def _advisory_lock_key(engagement_id: uuid.UUID) -> int:
+    """Signed 64-bit advisory lock key derived from the engagement UUID."""
+    key = engagement_id.int & 0xFFFF_FFFF_FFFF_FFFF
+    return key - (1 << 64) if key >= 1 << 63 else key
+
+
+def _confidence_level() -> Any:
+    """SQL expression bucketing ``ProcessElement.confidence_score`` by level."""
+    return case(
+        *[(ProcessElement.confidence_score >= lo, name) for name, lo, _ in CONFIDENCE_LEVELS[:-1]],
+        else_=CONFIDENCE_LEVELS[-1][0],
+    )
+
+
+def _latest_model_values(session: Session, model_id: uuid.UUID) -> dict[str, Any]:
+    """Gap, confidence and brightness aggregates of one process model."""
+    gap_counts = {
+        str(severity).lower(): count
+        for severity, count in session.execute(
+            select(EvidenceGap.severity, func.count())
+            .where(EvidenceGap.model_id == model_id)
+            .group_by(EvidenceGap.severity)
+        ).all()
+    }
+
+    level = _confidence_level().label("level")
+    buckets = {name: 0 for name, _, _ in CONFIDENCE_LEVELS}
+    for name, count in session.execute(
+        select(level, func.count()).where(ProcessElement.model_id == model_id).group_by(level)
+    ).all():
+        buckets[name] = count
+
+    brightness_counts = {
+        str(brightness).lower(): count
+        for brightness, count in session.execute(
+            select(ProcessElement.brightness_classification, func.count())
+            .where(ProcessElement.model_id == model_id)
+            .group_by(ProcessElement.brightness_classification)
+        ).all()
+    }
+
+    weakest = [
+        {
+            "id": str(row.id),
+            "name": row.name,
+            "element_type": str(row.element_type),
+            "confidence_score": row.confidence_score,
+        }
+        for row in session.execute(
+            select(ProcessElement.id, ProcessElement.name, ProcessElement.element_type, ProcessElement.confidence_score)
+            .where(ProcessElement.model_id == model_id)
+            .order_by(ProcessElement.confidence_score, ProcessElement.id)
+            .limit(WEAKEST_ELEMENT_LIMIT)
+        ).all()
+    ]
+
+    return {
+        "gap_counts": gap_counts,
+        "confidence_buckets": buckets,
+        "brightness_counts": brightness_counts,
+        "weakest_elements": weakest,
+    }
+
+
+def compute_rollup_values(session: Session, engagement_id: uuid.UUID) -> dict[str, Any]:
+    """Aggregate the dashboard rollup columns for an engagement.
+
+    Args:
+        session: Synchronous session (use ``AsyncSession.run_sync``).
+        engagement_id: Engagement to aggregate.
+
+    Returns:
+        Column values for ``EngagementDashboardRollup``.
+    """
+    evidence_item_count = session.execute(
+        select(func.count()).select_from(EvidenceItem).where(EvidenceItem.engagement_id == engagement_id)
+    ).scalar_one()
+    process_model_count = session.execute(
+        select(func.count()).select_from(ProcessModel).where(ProcessModel.engagement_id == engagement_id)
+    ).scalar_one()
+
+    shelf_coverage = {
+        str(row.category): {
+            "requested": row.total,
+            "received": row.received,
+        }
+        for row in session.execute(
+            select(
+                ShelfDataRequestItem.category,
+                func.count().label("total"),
+                func.count().filter(ShelfDataRequestItem.status == ShelfRequestItemStatus.RECEIVED).label("received"),
+            )
+            .join(ShelfDataRequest)
+            .where(ShelfDataRequest.engagement_id == engagement_id)
+            .group_by(ShelfDataRequestItem.category)
+        ).all()
+    }
+
+    latest = session.execute(
+        select(ProcessModel.id, ProcessModel.confidence_score)
+        .where(
+            ProcessModel.engagement_id == engagement_id,
+            ProcessModel.status == ProcessModelStatus.COMPLETED,
+        )
+        .order_by(ProcessModel.created_at.desc())
+        .limit(1)
+    ).one_or_none()
+
+    values: dict[str, Any] = {
+        "engagement_id": engagement_id,
+        "evidence_item_count": evidence_item_count,
+        "process_model_count": process_model_count,
+        "latest_model_id": latest.id if latest else None,
+        "overall_confidence": latest.confidence_score if latest else 0.0,
+        "shelf_coverage": shelf_coverage,
+        "gap_counts": {},
+        "confidence_buckets": {name: 0 for name, _, _ in CONFIDENCE_LEVELS},
+        "brightness_counts": {},
+        "weakest_elements": [],
+    }
+    if latest is not None:
+        values.update(_latest_model_values(session, latest.id))
+    return values
+
+
+def refresh_engagement_rollup(session: Session, engagement_id: uuid.UUID) -> dict[str, Any] | None:
+    """Recompute and upsert an engagement's rollup in the current transaction.
+
+    Args:
+        session: Synchronous session (use ``AsyncSession.run_sync``).
+        engagement_id: Engagement to refresh.
+
+    Returns:
+        The stored column values, or None if the engagement does not exist.
+    """
+    session.execute(select(func.pg_advisory_xact_lock(_advisory_lock_key(engagement_id))))
+    exists = session.execute(select(Engagement.id).where(Engagement.id == engagement_id)).scalar_one_or_none()
+    if exists is None:
+        return None
+
+    values = compute_rollup_values(session, engagement_id)
+    stmt = insert(EngagementDashboardRollup).values(**values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["engagement_id"],
+        set_={
+            **{key: stmt.excluded[key] for key in values if key != "engagement_id"},
+            "refreshed_at": func.now(),
+        },
+    )
+    session.execute(stmt)
+    return values
+
+
+async def get_dashboard_rollup(session: AsyncSession, engagement_id: uuid.UUID) -> EngagementDashboardRollup | None:
+    """Return an engagement's rollup, backfilling it on first read.
+
+    Args:
+        session: Request session.
+        engagement_id: Engagement to read.
+
+    Returns:
+        The rollup row, or None if the engagement does not exist.
+    """
+    result = await session.execute(
+        select(EngagementDashboardRollup).where(EngagementDashboardRollup.engagement_id == engagement_id)
+    )
+    rollup = result.scalar_one_or_none()
+    if rollup is not None:
+        return rollup
+
+    values = await session.run_sync(refresh_engagement_rollup, engagement_id)
+    if values is None:
+        return None
+    await session.commit()
+    logger.info("Backfilled dashboard rollup for engagement %s", engagement_id)
+    return EngagementDashboardRollup(**values)
+
+
+def rollup_shelf_totals(rollup: EngagementDashboardRollup) -> tuple[int, int]:
+    """Return (requested, received) shelf item totals across categories."""
+    coverage: Iterable[dict[str, int]] = (rollup.shelf_coverage or {}).values()
+    requested = received = 0
+    for counts in coverage:
+        requested += counts.get("requested", 0)
+        received += counts.get("received", 0)
+    return requested, received
@@ -3,6 +3,12 @@
 Evaluates policy rules against request context (user role, data
 classification, engagement scope, operation) and returns structured
 PERMIT/DENY decisions with optional obligations.
+
+Policies are cached per process and compiled into a ``PolicyIndex`` on each
+refresh. The cache expires after a short TTL and is also invalidated across
+processes through the ``CHANNEL_PDP_POLICY`` Redis Pub/Sub channel whenever
+rules change (see ``notify_policy_change`` and
+``listen_for_policy_changes``).
 """
 
 from __future__ import annotations
@@ -13,11 +19,13 @@ import logging
 import time
 import uuid
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import redis.asyncio as aioredis
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.services.pdp_index import PolicyIndex
 from src.core.models import UserRole
 from src.core.models.evidence import DataClassification
 from src.core.models.pdp import (
@@ -26,6 +34,10 @@ from src.core.models.pdp import (
     PDPPolicy,
     PDPPolicyBundle,
 )
+from src.core.redis import CHANNEL_PDP_POLICY, listen_until_shutdown, publish_event
+
+if TYPE_CHECKING:
+    from src.core.audit_sink import AuditSink
 
 logger = logging.getLogger(__name__)
 
@@ -52,12 +64,46 @@ _ABAC_STRING_CONDITION_KEYS: frozenset[str] = frozenset(
     {"department", "cost_center", "data_residency", "evidence_type", "identity_posture", "export_mode"}
 )
 
+# Compiled form of _policy_cache, rebuilt on every refresh
+_policy_index = PolicyIndex([], _ROLE_RANK, _ABAC_STRING_CONDITION_KEYS)
+
+
+def _cache_is_fresh(now: float) -> bool:
+    """Return True if the policy cache was loaded within the TTL.
+
+    An empty policy table is cached like any other, so a deployment without
+    rules does not query the database on every evaluation.
+    """
+    return _cache_loaded_at > 0.0 and now - _cache_loaded_at < _CACHE_TTL_SECONDS
+
 
 class PDPService:
-    """Evaluates access policies and records audit decisions."""
+    """Evaluates access policies and records audit decisions.
 
-    def __init__(self, session: AsyncSession) -> None:
-        self._session = session
+    When an ``AuditSink`` is supplied, audit entries are handed to it for
+    write-behind batch insertion instead of being flushed on the session.
+    Evaluation-only callers (the PEP) may pass ``session=None`` together with
+    a ``session_factory``; a session is then opened only when the policy
+    cache has to be refreshed.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession | None,
+        audit_sink: AuditSink | None = None,
+        *,
+        session_factory: Any = None,  # Any because: async_sessionmaker; avoids circular import
+    ) -> None:
+        self._bound_session = session
+        self._audit_sink = audit_sink
+        self._session_factory = session_factory
+
+    @property
+    def _session(self) -> AsyncSession:
+        """The bound session; evaluation-only instances have none."""
+        if self._bound_session is None:
+            raise RuntimeError("PDPService was created without a session")
+        return self._bound_session
 
     async def evaluate(
         self,
@@ -99,39 +145,39 @@ class PDPService:
         matched_policy_id: uuid.UUID | None = None
         effective_attrs = attributes or {}
 
-        # Evaluate policies in priority order (lowest number first)
-        for policy in _policy_cache:
-            if self._matches(
-                policy,
-                actor_role=actor_role,
-                classification=classification,
-                operation=operation,
-                attributes=effective_attrs,
-            ):
-                decision = PDPDecisionType(policy["decision"])
-                reason = policy.get("reason")
-                obligations = policy.get("obligations_json") or []
-                matched_policy_id = policy.get("id")
-                break
-
-        # Record audit entry
-        now = datetime.now(UTC)
-        audit_entry = PDPAuditEntry(
-            id=uuid.uuid4(),
-            engagement_id=engagement_id,
-            actor=actor,
-            resource_id=resource_id,
-            classification=classification,
+        # First matching policy in priority order (lowest number first)
+        policy = _policy_index.first_match(
             operation=operation,
-            decision=decision,
-            obligations_json=obligations if obligations else None,
-            reason=reason,
-            policy_id=matched_policy_id,
-            request_id=request_id,
-            created_at=now,
+            classification=classification,
+            actor_role=actor_role,
+            attributes=effective_attrs,
         )
-        self._session.add(audit_entry)
-        await self._session.flush()
+        if policy is not None:
+            decision = PDPDecisionType(policy["decision"])
+            reason = policy.get("reason")
+            obligations = policy.get("obligations_json") or []
+            matched_policy_id = policy.get("id")
+
+        # Record audit entry
+        audit_values: dict[str, Any] = {
+            "id": uuid.uuid4(),
+            "engagement_id": engagement_id,
+            "actor": actor,
+            "resource_id": resource_id,
+            "classification": classification,
+            "operation": operation,
+            "decision": decision,
+            "obligations_json": obligations if obligations else None,
+            "reason": reason,
+            "policy_id": matched_policy_id,
+            "request_id": request_id,
+            "created_at": datetime.now(UTC),
+        }
+        if self._audit_sink is not None:
+            self._audit_sink.enqueue(PDPAuditEntry, audit_values)
+        else:
+            self._session.add(PDPAuditEntry(**audit_values))
+            await self._session.flush()
 
         elapsed_ms = (time.monotonic() - start) * 1000
         _recent_latencies.append(elapsed_ms)
@@ -140,7 +186,7 @@ class PDPService:
             "decision": decision,
             "reason": reason,
             "obligations": obligations,
-            "audit_id": str(audit_entry.id),
+            "audit_id": str(audit_values["id"]),
             "latency_ms": round(elapsed_ms, 2),
         }
 
@@ -150,88 +196,30 @@ class PDPService:
 
         return result
 
-    def _matches(
-        self,
-        policy: dict[str, Any],
-        *,
-        actor_role: str,
-        classification: str,
-        operation: str,
-        attributes: dict[str, Any] | None = None,
-    ) -> bool:
-        """Check if a policy's conditions match the request context.
-
-        Supports both RBAC conditions (classification, operation, min_role, max_role)
-        and ABAC conditions (department, cost_center, data_residency, cohort_size,
-        evidence_type, identity_posture, export_mode).
-
-        Note: Policies are currently global (not engagement-scoped). Engagement-scoped
-        policy conditions are deferred to a follow-up issue.
-        """
-        conditions = policy.get("conditions_json", {})
-        attrs = attributes or {}
-
-        # Classification match
-        if "classification" in conditions and conditions["classification"] != classification:
-            return False
-
-        # Operation match
-        if "operation" in conditions and conditions["operation"] != operation:
-            return False
-
-        # Role-based conditions
-        if "max_role" in conditions:
-            max_role = conditions["max_role"]
-            actor_rank = _ROLE_RANK.get(actor_role, 999)
-            max_rank = _ROLE_RANK.get(max_role, 999)
-            if actor_rank < max_rank:
-                return False  # Actor is more privileged than max, so rule doesn't apply
-
-        if "min_role" in conditions:
-            min_role = conditions["min_role"]
-            actor_rank = _ROLE_RANK.get(actor_role, 999)
-            min_rank = _ROLE_RANK.get(min_role, 999)
-            if actor_rank > min_rank:
-                return False  # Actor is less privileged than min
-
-        # ABAC attribute conditions — exact match for string attributes
-        for abac_key in _ABAC_STRING_CONDITION_KEYS:
-            if abac_key in conditions and attrs.get(abac_key) != conditions[abac_key]:
-                return False
-
-        # ABAC numeric threshold conditions
-        if "cohort_size_lt" in conditions:
-            cohort = attrs.get("cohort_size")
-            if cohort is None or cohort >= conditions["cohort_size_lt"]:
-                return False
-
-        if "cohort_size_gte" in conditions:
-            cohort = attrs.get("cohort_size")
-            if cohort is None or cohort < conditions["cohort_size_gte"]:
-                return False
-
-        return True
-
     async def _ensure_cache(self) -> None:
         """Load policies into in-memory cache if TTL expired.
 
         Uses an asyncio.Lock to prevent thundering herd on cache refresh.
         """
-        global _policy_cache, _cache_loaded_at
+        global _policy_cache, _policy_index, _cache_loaded_at
         now = time.monotonic()
-        if now - _cache_loaded_at < _CACHE_TTL_SECONDS and _policy_cache:
+        if _cache_is_fresh(now):
             return
 
         async with _cache_lock:
             # Double-check after acquiring lock (another coroutine may have refreshed)
             now = time.monotonic()
-            if now - _cache_loaded_at < _CACHE_TTL_SECONDS and _policy_cache:
+            if _cache_is_fresh(now):
                 return
 
-            result = await self._session.execute(
-                select(PDPPolicy).where(PDPPolicy.is_active.is_(True)).order_by(PDPPolicy.priority)
-            )
-            policies = result.scalars().all()
+            stmt = select(PDPPolicy).where(PDPPolicy.is_active.is_(True)).order_by(PDPPolicy.priority)
+            if self._bound_session is None and self._session_factory is not None:
+                async with self._session_factory() as session:
+                    result = await session.execute(stmt)
+                    policies = result.scalars().all()
+            else:
+                result = await self._session.execute(stmt)
+                policies = result.scalars().all()
 
             _policy_cache = [
                 {
@@ -245,6 +233,7 @@ class PDPService:
                 }
                 for p in policies
             ]
+            _policy_index = PolicyIndex(_policy_cache, _ROLE_RANK, _ABAC_STRING_CONDITION_KEYS)
             _cache_loaded_at = now
             logger.debug("PDP policy cache refreshed: %d policies loaded", len(_policy_cache))
 
@@ -361,6 +350,8 @@ class PDPService:
         )
         self._session.add(new_bundle)
         await self._session.flush()
+
+        self._invalidate_cache()
         return new_bundle
 
     async def get_active_bundle(self) -> PDPPolicyBundle | None:
@@ -411,3 +402,38 @@ class PDPService:
             "p99_latency_ms": round(latencies[p99_idx], 2),
             "avg_latency_ms": round(sum(latencies) / len(latencies), 2),
         }
+
+
+async def notify_policy_change(redis_client: aioredis.Redis | None) -> None:
+    """Tell every API process to drop its policy cache.
+
+    Call after the transaction that changed policies has committed, so
+    other processes reload committed rules. Publishing is best-effort:
+    if Redis is unavailable, other processes pick up the change when their
+    cache TTL expires.
+
+    Args:
+        redis_client: Redis client, or None when Redis is not configured.
+    """
+    PDPService._invalidate_cache()
+    if redis_client is None:
+        return
+    try:
+        await publish_event(redis_client, CHANNEL_PDP_POLICY, {"event": "policies_changed"})
+    except (aioredis.RedisError, ConnectionError, OSError) as exc:
+        logger.warning("Failed to publish PDP policy invalidation: %s", exc)
+
+
+async def listen_for_policy_changes(redis_client: aioredis.Redis, shutdown_event: asyncio.Event) -> None:
+    """Invalidate the local policy cache on every ``CHANNEL_PDP_POLICY`` message.
+
+    Args:
+        redis_client: Redis client.
+        shutdown_event: Set by the API lifespan on shutdown.
+    """
+    await listen_until_shutdown(
+        redis_client,
+        CHANNEL_PDP_POLICY,
+        lambda _event: PDPService._invalidate_cache(),
+        shutdown_event,
+    )
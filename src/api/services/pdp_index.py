@@ -0,0 +1,201 @@
+"""Compiled decision index for PDP policy evaluation.
+
+``PDPService`` used to walk every cached policy in priority order and
+re-interpret its ``conditions_json`` dict on each request. ``PolicyIndex``
+compiles the policy list once per cache refresh:
+
+- The RBAC conditions (operation, classification, min/max role) are
+  resolved at compile time into candidate lists keyed by
+  ``(operation, classification, role)``. Candidates keep priority order.
+- The ABAC conditions become a tuple of small predicate functions, so a
+  request only checks attribute conditions on policies whose RBAC
+  conditions already match.
+
+The first candidate whose predicates all pass wins, which is the same
+result as the linear priority-ordered walk.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+# Role key used for actor roles that are not in the role hierarchy.
+_UNKNOWN_ROLE: str | None = None
+
+# Rank given to roles missing from the hierarchy (least privileged).
+_UNKNOWN_RANK = 999
+
+# Operation and classification values the PDP API accepts; their candidate
+# lists are built eagerly, other values are built on first use.
+_KNOWN_OPERATIONS: tuple[str, ...] = ("read", "write", "export", "delete")
+_KNOWN_CLASSIFICATIONS: tuple[str, ...] = ("public", "internal", "confidential", "restricted")
+
+# Upper bound on lazily built candidate lists for unexpected values.
+_MAX_LAZY_KEYS = 1024
+
+AttributePredicate = Callable[[dict[str, Any]], bool]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledPolicy:
+    """A policy with its conditions compiled for fast matching.
+
+    Attributes:
+        policy: The cached policy dict (id, decision, reason, obligations).
+        order: Position in priority order; lower is evaluated first.
+        operation: Required operation, or None for any.
+        classification: Required classification, or None for any.
+        roles: Role keys the policy's min/max role conditions admit.
+        predicates: ABAC attribute checks that must all pass.
+    """
+
+    policy: dict[str, Any]
+    order: int
+    operation: str | None
+    classification: str | None
+    roles: frozenset[str | None]
+    predicates: tuple[AttributePredicate, ...]
+
+    def matches_attributes(self, attributes: dict[str, Any]) -> bool:
+        """Return True if every ABAC predicate passes for the attributes."""
+        return all(predicate(attributes) for predicate in self.predicates)
+
+
+def _string_predicate(key: str, expected: Any) -> AttributePredicate:
+    return lambda attrs: attrs.get(key) == expected
+
+
+def _cohort_below(threshold: Any) -> AttributePredicate:
+    def predicate(attrs: dict[str, Any]) -> bool:
+        cohort = attrs.get("cohort_size")
+        return cohort is not None and cohort < threshold
+
+    return predicate
+
+
+def _cohort_at_least(threshold: Any) -> AttributePredicate:
+    def predicate(attrs: dict[str, Any]) -> bool:
+        cohort = attrs.get("cohort_size")
+        return cohort is not None and cohort >= threshold
+
+    return predicate
+
+
+def _admitted_roles(conditions: dict[str, Any], role_rank: dict[str, int]) -> frozenset[str | None]:
+    """Resolve min_role/max_role conditions to the set of admitted role keys."""
+    max_rank = role_rank.get(conditions["max_role"], _UNKNOWN_RANK) if "max_role" in conditions else None
+    min_rank = role_rank.get(conditions["min_role"], _UNKNOWN_RANK) if "min_role" in conditions else None
+
+    admitted: set[str | None] = set()
+    rank_by_key: list[tuple[str | None, int]] = [*role_rank.items(), (_UNKNOWN_ROLE, _UNKNOWN_RANK)]
+    for key, rank in rank_by_key:
+        if max_rank is not None and rank < max_rank:
+            continue  # Actor is more privileged than max, so rule doesn't apply
+        if min_rank is not None and rank > min_rank:
+            continue  # Actor is less privileged than min
+        admitted.add(key)
+    return frozenset(admitted)
+
+
+def compile_policy(
+    policy: dict[str, Any],
+    order: int,
+    role_rank: dict[str, int],
+    string_condition_keys: Iterable[str],
+) -> CompiledPolicy:
+    """Compile one cached policy dict.
+
+    Args:
+        policy: Cached policy dict with ``conditions_json``.
+        order: Position of the policy in priority order.
+        role_rank: Role hierarchy (index 0 = most privileged).
+        string_condition_keys: ABAC keys compared by exact match.
+
+    Returns:
+        The compiled policy.
+    """
+    conditions = policy.get("conditions_json") or {}
+    predicates: list[AttributePredicate] = [
+        _string_predicate(key, conditions[key]) for key in sorted(string_condition_keys) if key in conditions
+    ]
+    if "cohort_size_lt" in conditions:
+        predicates.append(_cohort_below(conditions["cohort_size_lt"]))
+    if "cohort_size_gte" in conditions:
+        predicates.append(_cohort_at_least(conditions["cohort_size_gte"]))
+
+    return CompiledPolicy(
+        policy=policy,
+        order=order,
+        operation=conditions.get("operation"),
+        classification=conditions.get("classification"),
+        roles=_admitted_roles(conditions, role_rank),
+        predicates=tuple(predicates),
+    )
+
+
+class PolicyIndex:
+    """Decision index over compiled policies.
+
+    Args:
+        policies: Cached policy dicts in priority order.
+        role_rank: Role hierarchy (index 0 = most privileged).
+        string_condition_keys: ABAC keys compared by exact match.
+    """
+
+    def __init__(
+        self,
+        policies: list[dict[str, Any]],
+        role_rank: dict[str, int],
+        string_condition_keys: Iterable[str],
+    ) -> None:
+        keys = tuple(string_condition_keys)
+        self._compiled = [compile_policy(p, i, role_rank, keys) for i, p in enumerate(policies)]
+        self._role_keys: frozenset[str] = frozenset(role_rank)
+        self._candidates: dict[tuple[str, str, str | None], tuple[CompiledPolicy, ...]] = {}
+
+        operations = set(_KNOWN_OPERATIONS) | {c.operation for c in self._compiled if c.operation is not None}
+        classifications = set(_KNOWN_CLASSIFICATIONS) | {
+            c.classification for c in self._compiled if c.classification is not None
+        }
+        self._eager_keys = len(operations) * len(classifications) * (len(self._role_keys) + 1)
+        for operation in operations:
+            for classification in classifications:
+                for role in (*self._role_keys, _UNKNOWN_ROLE):
+                    self._candidates[(operation, classification, role)] = self._build(operation, classification, role)
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def candidates(self, operation: str, classification: str, actor_role: str) -> tuple[CompiledPolicy, ...]:
+        """Return the policies whose RBAC conditions admit the request, in priority order."""
+        role = actor_role if actor_role in self._role_keys else _UNKNOWN_ROLE
+        key = (operation, classification, role)
+        found = self._candidates.get(key)
+        if found is None:
+            found = self._build(operation, classification, role)
+            if len(self._candidates) < self._eager_keys + _MAX_LAZY_KEYS:
+                self._candidates[key] = found
+        return found
+
+    def first_match(
+        self,
+        *,
+        operation: str,
+        classification: str,
+        actor_role: str,
+        attributes: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        """Return the highest-priority policy matching the request, if any."""
+        for compiled in self.candidates(operation, classification, actor_role):
+            if compiled.matches_attributes(attributes):
+                return compiled.policy
+        return None
+
+    def _build(self, operation: str, classification: str, role: str | None) -> tuple[CompiledPolicy, ...]:
+        return tuple(
+            c
+            for c in self._compiled
+            if c.operation in (None, operation) and c.classification in (None, classification) and role in c.roles
+        )
@@ -0,0 +1,424 @@
+"""Write-behind batched sink for high-volume audit rows.
+
+PDP decisions (``pdp_audit_entries``) and HTTP request audit events
+(``http_audit_events``) are written on every protected or mutating request.
+Persisting each row inline costs a session, a flush and a commit on the
+request path. ``AuditSink`` instead accepts rows into a bounded in-memory
+buffer and a background task bulk-inserts them in batches.
+
+Durability:
+- When the buffer is full, rows go to a bounded overflow queue that the
+  flush loop spills in batches to the ``AUDIT_SPILL_STREAM`` Redis stream.
+  Rows that also find the overflow queue full are dropped and counted.
+- A batch whose insert fails is spilled to the same stream.
+- Spilled rows are replayed through the ``AUDIT_SPILL_GROUP`` consumer
+  group, so each entry is replayed by one worker and acknowledged only
+  after its insert commits. Entries left pending by a dead worker are
+  reclaimed with XAUTOCLAIM. Every row carries its primary key and replays
+  insert with ``ON CONFLICT DO NOTHING``, so a replay is idempotent.
+- On shutdown the overflow queue and the buffer are flushed before exit.
+
+The app-wide instance lives on ``app.state.audit_sink`` and is created and
+stopped in the API lifespan.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import enum
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import redis.asyncio as aioredis
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DataError, IntegrityError, SQLAlchemyError
+
+from src.core.models import HttpAuditEvent, PDPAuditEntry
+from src.core.redis import AUDIT_SPILL_GROUP, AUDIT_SPILL_STREAM, ensure_consumer_group, stream_ack
+
+logger = logging.getLogger(__name__)
+
+# Models the sink knows how to persist, keyed by table name (the spill key).
+_SINK_MODELS: dict[str, Any] = {
+    PDPAuditEntry.__tablename__: PDPAuditEntry,
+    HttpAuditEvent.__tablename__: HttpAuditEvent,
+}
+
+DEFAULT_BUFFER_SIZE = 10000
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.25
+
+# Cap on the spill stream so a long database outage cannot exhaust Redis memory.
+_SPILL_MAX_LEN = 1_000_000
+
+# Pending spill entries idle this long belong to a dead worker and are reclaimed.
+_SPILL_CLAIM_IDLE_MS = 60_000
+
+
+@dataclass
+class AuditSinkMetrics:
+    """Counters exposed by the audit sink.
+
+    Attributes:
+        enqueued: Rows accepted into the buffer.
+        flushed: Rows bulk-inserted into the database.
+        spilled: Rows written to the Redis spill stream.
+        replayed: Spilled rows later inserted into the database.
+        dropped: Rows lost because the overflow queue was full or neither the
+            database nor Redis accepted them.
+        rejected: Rows refused by the database (e.g. constraint violations).
+        flushes: Number of batch inserts performed.
+        last_flush_latency_ms: Duration of the most recent batch insert.
+    """
+
+    enqueued: int = 0
+    flushed: int = 0
+    spilled: int = 0
+    replayed: int = 0
+    dropped: int = 0
+    rejected: int = 0
+    flushes: int = 0
+    last_flush_latency_ms: float = 0.0
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON-encode helper for spilled rows."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (uuid.UUID, datetime)):
+        return str(value)
+    raise TypeError(f"Unsupported audit value type: {type(value).__name__}")
+
+
+def _insert_stmt(table: str) -> Any:
+    """Bulk insert that skips rows already written (replays are idempotent)."""
+    return insert(_SINK_MODELS[table]).on_conflict_do_nothing(index_elements=["id"])
+
+
+def _coerce_row(model: Any, row: dict[str, Any]) -> dict[str, Any]:
+    """Restore column Python types on a row read back from the spill stream."""
+    columns = model.__table__.c
+    coerced: dict[str, Any] = {}
+    for key, value in row.items():
+        if key not in columns:
+            continue
+        if isinstance(value, str):
+            try:
+                python_type = columns[key].type.python_type
+            except NotImplementedError:
+                python_type = str
+            if python_type is uuid.UUID:
+                value = uuid.UUID(value)
+            elif python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif isinstance(python_type, type) and issubclass(python_type, enum.Enum):
+                value = python_type(value)
+        coerced[key] = value
+    return coerced
+
+
+class AuditSink:
+    """Bounded, batched, write-behind sink for audit rows.
+
+    ``enqueue`` never awaits I/O; callers on the request path hand over a row
+    dict and return immediately. A single background task drains the buffer.
+
+    Args:
+        session_factory: async_sessionmaker used for batch inserts.
+        redis_client: Optional Redis client for spill-over durability.
+        buffer_size: Maximum rows held in memory before spilling.
+        overflow_size: Maximum rows waiting to be spilled once the buffer is
+            full; defaults to ``buffer_size``.
+        batch_size: Maximum rows per bulk insert.
+        flush_interval: Seconds to wait for a batch to fill before flushing.
+    """
+
+    def __init__(
+        self,
+        session_factory: Any,  # Any because: async_sessionmaker; avoids circular import
+        redis_client: aioredis.Redis | None = None,
+        *,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        overflow_size: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        self._session_factory = session_factory
+        self._redis = redis_client
+        self._buffer_size = buffer_size
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._overflow_size = buffer_size if overflow_size is None else overflow_size
+        self._buffer: collections.deque[tuple[str, dict[str, Any]]] = collections.deque()
+        self._overflow: collections.deque[tuple[str, dict[str, Any]]] = collections.deque()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+        self._consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self._group_ready = False
+        self._flush_latencies: collections.deque[float] = collections.deque(maxlen=100)
+        self.metrics = AuditSinkMetrics()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of rows waiting in the in-memory buffer."""
+        return len(self._buffer)
+
+    def enqueue(self, model: Any, values: dict[str, Any]) -> None:
+        """Queue one audit row for write-behind insertion.
+
+        Args:
+            model: ORM model class (PDPAuditEntry or HttpAuditEvent).
+            values: Column values for the row, including its ``id`` so that
+                spilled rows replay idempotently.
+
+        Raises:
+            ValueError: If the model is not an audit model handled by the sink,
+                or the row has no ``id``.
+        """
+        table = model.__tablename__
+        if table not in _SINK_MODELS:
+            raise ValueError(f"AuditSink does not handle table '{table}'")
+        if values.get("id") is None:
+            raise ValueError("AuditSink rows must carry their primary key 'id'")
+
+        self.metrics.enqueued += 1
+        if len(self._buffer) >= self._buffer_size:
+            if len(self._overflow) >= self._overflow_size:
+                self.metrics.dropped += 1
+                return
+            self._overflow.append((table, values))
+            self._wakeup.set()
+            return
+
+        self._buffer.append((table, values))
+        if len(self._buffer) >= self._batch_size:
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        """Start the background flush loop."""
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run(), name="audit-sink")
+            logger.info(
+                "Audit sink started (buffer=%d, batch=%d, interval=%.2fs)",
+                self._buffer_size,
+                self._batch_size,
+                self._flush_interval,
+            )
+
+    async def stop(self) -> None:
+        """Stop the flush loop and flush everything still buffered."""
+        self._stopping = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self._spill_overflow()
+        await self.flush()
+        logger.info("Audit sink stopped (%s)", self.get_metrics())
+
+    async def flush(self) -> int:
+        """Insert everything currently buffered, batch by batch.
+
+        Returns:
+            Number of rows inserted.
+        """
+        inserted = 0
+        while self._buffer:
+            batch = [self._buffer.popleft() for _ in range(min(self._batch_size, len(self._buffer)))]
+            count = await self._insert_batch(batch)
+            if count is None:
+                await self._spill(batch)
+                continue
+            self.metrics.flushed += count
+            inserted += count
+        return inserted
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Return queue depth, throughput counters and flush latency."""
+        latencies = sorted(self._flush_latencies)
+        p99 = latencies[max(0, int(len(latencies) * 0.99) - 1)] if latencies else 0.0
+        return {
+            "queue_depth": self.queue_depth,
+            "overflow_depth": len(self._overflow),
+            "buffer_size": self._buffer_size,
+            "enqueued": self.metrics.enqueued,
+            "flushed": self.metrics.flushed,
+            "spilled": self.metrics.spilled,
+            "replayed": self.metrics.replayed,
+            "dropped": self.metrics.dropped,
+            "rejected": self.metrics.rejected,
+            "flushes": self.metrics.flushes,
+            "last_flush_latency_ms": round(self.metrics.last_flush_latency_ms, 2),
+            "p99_flush_latency_ms": round(p99, 2),
+        }
+
+    async def _run(self) -> None:
+        """Flush loop: wake on a full batch or every flush interval."""
+        while not self._stopping:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            self._wakeup.clear()
+            try:
+                await self._spill_overflow()
+                await self.flush()
+                if not self._buffer:
+                    await self._replay_spilled()
+            except Exception:  # Intentionally broad: the flush loop must survive any batch failure
+                logger.exception("Audit sink flush cycle failed")
+
+    async def _insert_batch(self, batch: list[tuple[str, dict[str, Any]]]) -> int | None:
+        """Bulk-insert a batch grouped by table.
+
+        Returns:
+            Number of rows inserted, or None on a transient failure (the
+            caller spills the batch). Rows rejected by the database are
+            retried individually so one bad row cannot poison a batch.
+        """
+        by_table: dict[str, list[dict[str, Any]]] = collections.defaultdict(list)
+        for table, values in batch:
+            by_table[table].append(values)
+
+        start = time.monotonic()
+        try:
+            async with self._session_factory() as session:
+                for table, rows in by_table.items():
+                    await session.execute(_insert_stmt(table), rows)
+                await session.commit()
+        except (IntegrityError, DataError) as exc:
+            logger.warning("Audit sink batch rejected (%d rows), retrying row by row: %s", len(batch), exc)
+            return await self._insert_rows_individually(batch)
+        except (SQLAlchemyError, ConnectionError, OSError) as exc:
+            logger.warning("Audit sink batch insert failed (%d rows): %s", len(batch), exc)
+            return None
+
+        elapsed_ms = (time.monotonic() - start) * 1000
+        self._flush_latencies.append(elapsed_ms)
+        self.metrics.last_flush_latency_ms = elapsed_ms
+        self.metrics.flushes += 1
+        return len(batch)
+
+    async def _insert_rows_individually(self, batch: list[tuple[str, dict[str, Any]]]) -> int | None:
+        """Insert rows one at a time, counting rows the database rejects."""
+        inserted = 0
+        for table, values in batch:
+            try:
+                async with self._session_factory() as session:
+                    await session.execute(_insert_stmt(table), [values])
+                    await session.commit()
+            except (IntegrityError, DataError) as exc:
+                self.metrics.rejected += 1
+                logger.error("Audit sink rejected %s row %s: %s", table, values.get("id"), exc)
+                continue
+            except (SQLAlchemyError, ConnectionError, OSError):
+                return None
+            inserted += 1
+        return inserted
+
+    async def _spill_overflow(self) -> None:
+        """Spill rows that arrived while the buffer was full, batch by batch."""
+        while self._overflow:
+            batch = [self._overflow.popleft() for _ in range(min(self._batch_size, len(self._overflow)))]
+            await self._spill(batch)
+
+    async def _spill(self, batch: list[tuple[str, dict[str, Any]]]) -> None:
+        """Write rows to the Redis spill stream, dropping them if Redis is unavailable."""
+        if self._redis is None:
+            self.metrics.dropped += len(batch)
+            logger.error("Audit sink dropped %d rows: no database and no Redis spill", len(batch))
+            return
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for table, values in batch:
+                pipe.xadd(
+                    AUDIT_SPILL_STREAM,
+                    {"table": table, "payload": json.dumps(values, default=_encode_value)},
+                    maxlen=_SPILL_MAX_LEN,
+                    approximate=True,
+                )
+            await pipe.execute()
+            self.metrics.spilled += len(batch)
+        except (aioredis.RedisError, ConnectionError, OSError) as exc:
+            self.metrics.dropped += len(batch)
+            logger.error("Audit sink dropped %d rows: Redis spill failed: %s", len(batch), exc)
+
+    async def _replay_spilled(self) -> None:
+        """Move one batch of spilled rows from Redis into the database.
+
+        Entries are read through the spill consumer group: first this
+        worker's own unacknowledged entries (a previous replay whose insert
+        failed), then entries abandoned by dead workers, then new ones. An
+        entry is acknowledged and deleted only after its insert commits.
+        """
+        if self._redis is None:
+            return
+        try:
+            if not self._group_ready:
+                await ensure_consumer_group(self._redis, AUDIT_SPILL_STREAM, AUDIT_SPILL_GROUP)
+                self._group_ready = True
+            entries = await self._read_spilled()
+        except (aioredis.RedisError, ConnectionError, OSError):
+            return
+        if not entries:
+            return
+
+        batch: list[tuple[str, dict[str, Any]]] = []
+        for msg_id, fields in entries:
+            model = _SINK_MODELS.get(fields.get("table", ""))
+            if model is None:
+                continue
+            try:
+                batch.append((model.__tablename__, _coerce_row(model, json.loads(fields["payload"]))))
+            except (KeyError, ValueError, TypeError):
+                logger.warning("Discarding malformed spilled audit row %s", msg_id)
+
+        count = await self._insert_batch(batch) if batch else 0
+        if count is None:
+            return
+        msg_ids = [msg_id for msg_id, _ in entries]
+        try:
+            await stream_ack(self._redis, AUDIT_SPILL_STREAM, AUDIT_SPILL_GROUP, *msg_ids)
+            await self._redis.xdel(AUDIT_SPILL_STREAM, *msg_ids)
+        except (aioredis.RedisError, ConnectionError, OSError):
+            # The rows are committed; a later replay of these entries is a no-op.
+            logger.warning("Failed to acknowledge %d replayed audit rows", len(msg_ids))
+        self.metrics.replayed += count
+
+    async def _read_spilled(self) -> list[tuple[str, dict[str, Any]]]:
+        """Read the next batch of spill entries for this worker."""
+        assert self._redis is not None
+        # Own pending entries first, then abandoned ones, then new ones.
+        entries = await self._read_group("0")
+        if entries:
+            return entries
+        _next_id, claimed, *_ = await self._redis.xautoclaim(
+            AUDIT_SPILL_STREAM,
+            AUDIT_SPILL_GROUP,
+            self._consumer,
+            min_idle_time=_SPILL_CLAIM_IDLE_MS,
+            count=self._batch_size,
+        )
+        if claimed:
+            return list(claimed)
+        return await self._read_group(">")
+
+    async def _read_group(self, start_id: str) -> list[tuple[str, dict[str, Any]]]:
+        """XREADGROUP one batch from the spill stream."""
+        assert self._redis is not None
+        result = await self._redis.xreadgroup(
+            AUDIT_SPILL_GROUP,
+            self._consumer,
+            {AUDIT_SPILL_STREAM: start_id},
+            count=self._batch_size,
+        )
+        return [(msg_id, fields or {}) for _stream, stream_entries in result or [] for msg_id, fields in stream_entries]
@@ -28,6 +28,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import Settings, get_settings
 from src.core.models import User
+from src.core.principal_cache import get_principal_cache, invalidate_principal
 
 logger = logging.getLogger(__name__)
 
@@ -178,10 +179,11 @@ async def blacklist_token(request: Request, token: str, expires_in: int = 1800)
     try:
         redis_client = request.app.state.redis_client
         await redis_client.setex(f"token:blacklist:{token}", expires_in, "1")
-        return True
     except (ConnectionError, OSError, _aioredis.RedisError) as exc:
         logger.warning("Token blacklist write failed — token may remain valid: %s", exc)
         return False
+    await invalidate_principal(request, token=token)
+    return True
 
 
 # ---------------------------------------------------------------------------
@@ -380,6 +382,9 @@ async def get_current_user(
 
     If neither is present a 401 is raised.
 
+    The blacklist check and the user lookup are served from the app's
+    ``PrincipalCache`` when one is configured.
+
     Raises:
         HTTPException 401: If token is missing, invalid, or blacklisted.
         HTTPException 401: If user is not found or inactive.
@@ -423,12 +428,16 @@ async def get_current_user(
         )
 
     # Check blacklist
-    if await is_token_blacklisted(request, token):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token has been revoked",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    principal_cache = get_principal_cache(request)
+    if principal_cache is None or not principal_cache.is_token_checked(token):
+        if await is_token_blacklisted(request, token):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        if principal_cache is not None:
+            principal_cache.mark_token_checked(token)
 
     # Extract subject claim
     user_id_str = payload.get("sub")
@@ -449,10 +458,14 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         ) from exc
 
-    session_factory = request.app.state.db_session_factory
-    async with session_factory() as session:
-        result = await session.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+    user = principal_cache.get_user(user_id) if principal_cache is not None else None
+    if user is None:
+        session_factory = request.app.state.db_session_factory
+        async with session_factory() as session:
+            result = await session.execute(select(User).where(User.id == user_id))
+            user = result.scalar_one_or_none()
+        if user is not None and principal_cache is not None:
+            principal_cache.put_user(user)
 
     if user is None:
         raise HTTPException(
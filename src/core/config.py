@@ -48,6 +48,8 @@ class Settings(BaseSettings):
     neo4j_uri: str = "bolt://localhost:7687"
     neo4j_user: str = "neo4j"
     neo4j_password: SecretStr = SecretStr("neo4j_dev_password")
+    graph_snapshot_ttl_seconds: float = 300.0  # 0 disables caching of in-memory graph snapshots
+    graph_snapshot_max_engagements: int = 8
 
     # ── Redis ────────────────────────────────────────────────────
     redis_host: str = "localhost"
@@ -69,6 +71,8 @@ class Settings(BaseSettings):
     auth_dev_mode: bool = False  # Allow local dev tokens
     encryption_key: SecretStr = SecretStr("CHANGE_ME")
     watermark_signing_key: SecretStr = SecretStr("CHANGE_ME")
+    principal_cache_ttl_seconds: float = 30.0  # 0 disables the authenticated principal cache
+    principal_cache_max_entries: int = 10000
 
     # ── Security Headers ──────────────────────────────────────────
     enable_hsts: bool = False  # Enable HSTS header (requires HTTPS)
@@ -96,6 +100,7 @@ class Settings(BaseSettings):
 
     # ── WebSocket Limits (Phase 4) ────────────────────────────────
     ws_max_connections_per_engagement: int = 10
+    ws_send_queue_size: int = 256  # Messages buffered per socket before it is dropped as a slow consumer
 
     # ── Rate Limiting ─────────────────────────────────────────────
     rate_limit_requests: int = 100
@@ -112,6 +117,12 @@ class Settings(BaseSettings):
     evidence_retention_days: int = 365  # Default: 1 year; override per DPA terms
     audit_retention_days: int = 730  # Default: 2 years; regulatory minimum may vary
 
+    # ── Audit Sink (write-behind audit persistence) ──────────────
+    audit_sink_enabled: bool = True
+    audit_sink_buffer_size: int = 10000
+    audit_sink_batch_size: int = 500
+    audit_sink_flush_interval_ms: int = 250
+
     # ── GDPR (Issue #165) ────────────────────────────────────
     # Grace period before erasure is executed after a subject request.
     # During this window the user can cancel their erasure request.
@@ -138,6 +149,12 @@ class Settings(BaseSettings):
     llm_provider: str = ""  # "anthropic" | "ollama" | "stub" | "" (auto-detect)
     ollama_base_url: str = "http://localhost:11434"
     ollama_model: str = "llama3.1:8b"
+    ollama_timeout_seconds: float = 120.0
+    ollama_max_connections: int = 10  # Pooled connections to the local inference server
+    ollama_max_keepalive_connections: int = 10
+    llm_max_concurrency: int = 8  # Calls in flight per provider for batch generation
+    llm_requests_per_second: float = 0.0  # 0 disables the per-provider request rate limit
+    llm_cache_ttl_seconds: float = 3600.0  # 0 disables the Redis-backed response cache
 
     # ── Data Residency (KMFLOW-7) ─────────────────────────────
     # Platform-level default; per-engagement override in engagements table.
@@ -182,6 +199,10 @@ class Settings(BaseSettings):
     taskmining_action_retention_days: int = 365
     taskmining_pii_quarantine_hours: int = 24
     taskmining_batch_max_size: int = 1000
+    taskmining_aggregation_shards: int = 4
+    taskmining_aggregation_batch_size: int = 500
+    taskmining_aggregation_flush_interval_ms: int = 500
+    taskmining_aggregation_session_timeout_seconds: int = 900
 
     # ── Cohort Suppression (Story #391) ──────────────────────────
     cohort_minimum_size: int = 5
@@ -15,9 +15,12 @@ Usage::
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
+from dataclasses import dataclass
 from enum import StrEnum
 from typing import Any
 
@@ -88,6 +91,38 @@ class LLMProvider(ABC):
     def is_local(self) -> bool:
         """Whether this provider runs locally (no external API calls)."""
 
+    @property
+    def default_model(self) -> str:
+        """Model used when a call does not pass ``model``."""
+        return ""
+
+    async def aclose(self) -> None:  # noqa: B027 — optional hook, no-op by default
+        """Release pooled connections (app shutdown)."""
+
+
+@dataclass
+class HTTPRequestStats:
+    """Running request timings of one HTTP-backed provider."""
+
+    requests: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float, *, error: bool = False) -> None:
+        self.requests += 1
+        self.errors += error
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "mean_ms": round(self.total_seconds / self.requests * 1000, 2) if self.requests else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 2),
+        }
+
 
 class AnthropicProvider(LLMProvider):
     """Cloud provider using Anthropic Claude API."""
@@ -165,6 +200,10 @@ class AnthropicProvider(LLMProvider):
     def is_local(self) -> bool:
         return False
 
+    @property
+    def default_model(self) -> str:
+        return self._default_model
+
 
 class OllamaProvider(LLMProvider):
     """Local LLM provider using Ollama HTTP API.
@@ -172,47 +211,116 @@ class OllamaProvider(LLMProvider):
     Compatible with any OpenAI-compatible local inference server
     (Ollama, vLLM, llama.cpp server) by pointing ``base_url`` to
     the appropriate endpoint.
+
+    Requests share one keep-alive ``httpx.AsyncClient`` per event loop,
+    created on first use and closed by ``aclose()``.
+
+    Args:
+        base_url: Inference server URL.
+        default_model: Model used when a call does not pass ``model``.
+        timeout: Per-request timeout in seconds.
+        max_connections: Connections open to the server at once.
+        max_keepalive_connections: Idle connections kept for reuse.
+        keepalive_expiry: Seconds an idle connection is kept.
     """
 
     def __init__(
         self,
         base_url: str = "http://localhost:11434",
         default_model: str = "llama3.1:8b",
+        *,
+        timeout: float = 120.0,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._default_model = default_model
+        self._timeout = timeout
+        self._max_connections = max_connections
+        self._max_keepalive_connections = max_keepalive_connections
+        self._keepalive_expiry = keepalive_expiry
+        self._client: Any = None  # Any because: httpx.AsyncClient; imported lazily
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self.stats = HTTPRequestStats()
 
-    async def generate(
+    def _get_client(self) -> Any:
+        """Return the pooled client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop or self._client.is_closed:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                base_url=self._base_url,
+                timeout=self._timeout,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_keepalive_connections,
+                    keepalive_expiry=self._keepalive_expiry,
+                ),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client if the running loop owns it."""
+        client, self._client = self._client, None
+        if client is not None and self._client_loop is asyncio.get_running_loop():
+            await client.aclose()
+        self._client_loop = None
+
+    def _record(self, started: float, path: str, *, error: bool) -> None:
+        seconds = time.perf_counter() - started
+        self.stats.record(seconds, error=error)
+        logger.debug("Ollama %s took %.1f ms error=%s", path, seconds * 1000, error)
+
+    def _payload(
         self,
         prompt: str,
+        system: str | None,
+        model: str | None,
+        max_tokens: int,
+        messages: list[dict[str, str]] | None,
         *,
-        system: str | None = None,
-        model: str | None = None,
-        max_tokens: int = 2000,
-        messages: list[dict[str, str]] | None = None,
-    ) -> str:
-        import httpx
-
+        stream: bool,
+    ) -> dict[str, Any]:
         msgs: list[dict[str, str]] = []
         if system:
             msgs.append({"role": "system", "content": system})
         if messages:
             msgs.extend(messages)
         msgs.append({"role": "user", "content": prompt})
+        return {
+            "model": model or self._default_model,
+            "messages": msgs,
+            "stream": stream,
+            "options": {"num_predict": max_tokens},
+        }
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        system: str | None = None,
+        model: str | None = None,
+        max_tokens: int = 2000,
+        messages: list[dict[str, str]] | None = None,
+    ) -> str:
+        client = self._get_client()
+        started = time.perf_counter()
+        error = False
+        try:
             response = await client.post(
                 f"{self._base_url}/api/chat",
-                json={
-                    "model": model or self._default_model,
-                    "messages": msgs,
-                    "stream": False,
-                    "options": {"num_predict": max_tokens},
-                },
+                json=self._payload(prompt, system, model, max_tokens, messages, stream=False),
             )
             response.raise_for_status()
-            data = response.json()
-            return data["message"]["content"]
+            return response.json()["message"]["content"]
+        except Exception:
+            error = True
+            raise
+        finally:
+            self._record(started, "/api/chat", error=error)
 
     async def generate_stream(
         self,
@@ -223,37 +331,29 @@ class OllamaProvider(LLMProvider):
         max_tokens: int = 2000,
         messages: list[dict[str, str]] | None = None,
     ) -> AsyncGenerator[str, None]:
-        import httpx
-
-        msgs: list[dict[str, str]] = []
-        if system:
-            msgs.append({"role": "system", "content": system})
-        if messages:
-            msgs.extend(messages)
-        msgs.append({"role": "user", "content": prompt})
-
         import json
 
-        async with (
-            httpx.AsyncClient(timeout=120.0) as client,
-            client.stream(
+        client = self._get_client()
+        started = time.perf_counter()
+        error = False
+        try:
+            async with client.stream(
                 "POST",
                 f"{self._base_url}/api/chat",
-                json={
-                    "model": model or self._default_model,
-                    "messages": msgs,
-                    "stream": True,
-                    "options": {"num_predict": max_tokens},
-                },
-            ) as response,
-        ):
-            response.raise_for_status()
-            async for line in response.aiter_lines():
-                if line.strip():
-                    data = json.loads(line)
-                    content = data.get("message", {}).get("content", "")
-                    if content:
-                        yield content
+                json=self._payload(prompt, system, model, max_tokens, messages, stream=True),
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if line.strip():
+                        data = json.loads(line)
+                        content = data.get("message", {}).get("content", "")
+                        if content:
+                            yield content
+        except Exception:
+            error = True
+            raise
+        finally:
+            self._record(started, "/api/chat (stream)", error=error)
 
     @property
     def provider_type(self) -> LLMProviderType:
@@ -263,6 +363,10 @@ class OllamaProvider(LLMProvider):
     def is_local(self) -> bool:
         return True
 
+    @property
+    def default_model(self) -> str:
+        return self._default_model
+
 
 class StubProvider(LLMProvider):
     """Fallback provider that returns canned responses.
@@ -334,6 +438,11 @@ def get_llm_provider(
         _provider = OllamaProvider(
             base_url=kwargs.get("base_url", os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434")),
             default_model=kwargs.get("default_model", os.environ.get("OLLAMA_MODEL", "llama3.1:8b")),
+            timeout=float(kwargs.get("timeout", os.environ.get("OLLAMA_TIMEOUT_SECONDS", 120.0))),
+            max_connections=int(kwargs.get("max_connections", os.environ.get("OLLAMA_MAX_CONNECTIONS", 10))),
+            max_keepalive_connections=int(
+                kwargs.get("max_keepalive_connections", os.environ.get("OLLAMA_MAX_KEEPALIVE_CONNECTIONS", 10))
+            ),
         )
         logger.info("LLM provider: Ollama at %s", _provider._base_url)
     elif resolved == "anthropic" or (not resolved and os.environ.get("ANTHROPIC_API_KEY")):
@@ -348,6 +457,12 @@ def get_llm_provider(
     return _provider
 
 
+async def close_llm_provider() -> None:
+    """Close the cached provider's pooled connections (app shutdown)."""
+    if _provider is not None:
+        await _provider.aclose()
+
+
 def reset_provider() -> None:
     """Reset the cached provider (used in tests)."""
     global _provider  # noqa: PLW0603
@@ -0,0 +1,348 @@
+"""Shared execution layer for batch LLM calls.
+
+Wraps an ``LLMProvider`` with what bulk callers (gap rationales, scenario
+suggestions, RAG evaluation) need to fan out safely:
+
+- bounded concurrency per provider (an ``asyncio.Semaphore``);
+- an optional per-provider request rate (a ``TokenBucket``);
+- a response cache keyed by a hash of the provider, model, parameters and
+  prompt, stored in Redis so every API replica shares it;
+- per-call latency and estimated token metrics.
+
+``LLMExecutor`` is itself an ``LLMProvider``, so it can be passed anywhere
+a provider is expected. ``generate_stream`` is rate limited and counted
+but never cached.
+
+Usage::
+
+    from src.core.llm_executor import LLMRequest, get_llm_executor
+
+    executor = get_llm_executor()
+    answers = await executor.generate_many([LLMRequest(p, max_tokens=500) for p in prompts])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import redis.asyncio as aioredis
+
+from src.core.llm import LLMProvider, LLMProviderType, get_llm_provider
+from src.integrations.utils import TokenBucket
+
+if TYPE_CHECKING:
+    from src.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "kmflow:llm:response:"
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_CACHE_TTL_SECONDS = 3600.0
+_RECENT_CALLS = 200
+
+# Module-level singleton
+_executor: LLMExecutor | None = None
+_redis_client: aioredis.Redis | None = None
+
+
+@dataclass(frozen=True)
+class LLMRequest:
+    """One ``generate`` call for ``LLMExecutor.generate_many``."""
+
+    prompt: str
+    system: str | None = None
+    model: str | None = None
+    max_tokens: int = 2000
+    messages: list[dict[str, str]] | None = None
+
+
+@dataclass(frozen=True)
+class LLMCallMetrics:
+    """Latency and size of one executed call.
+
+    Token counts are estimated at four characters per token, as in
+    ``LLMAuditLog`` entries.
+    """
+
+    provider: str
+    model: str
+    latency_ms: float
+    prompt_tokens: int
+    completion_tokens: int
+    cached: bool
+    error: str | None = None
+
+
+@dataclass
+class LLMExecutorStats:
+    """Running totals and the most recent calls of one executor."""
+
+    calls: int = 0
+    cache_hits: int = 0
+    errors: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_latency_ms: float = 0.0
+    recent: deque[LLMCallMetrics] = field(default_factory=lambda: deque(maxlen=_RECENT_CALLS))
+
+    def record(self, metrics: LLMCallMetrics) -> None:
+        self.calls += 1
+        self.cache_hits += metrics.cached
+        self.errors += metrics.error is not None
+        self.prompt_tokens += metrics.prompt_tokens
+        self.completion_tokens += metrics.completion_tokens
+        self.total_latency_ms += metrics.latency_ms
+        self.recent.append(metrics)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "cache_hits": self.cache_hits,
+            "errors": self.errors,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "mean_latency_ms": round(self.total_latency_ms / self.calls, 2) if self.calls else 0.0,
+        }
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // 4
+
+
+class LLMExecutor(LLMProvider):
+    """Concurrency-limited, rate-limited, caching wrapper around a provider.
+
+    Args:
+        provider: The provider that executes calls.
+        max_concurrency: Calls in flight at once.
+        requests_per_second: Request rate limit; 0 disables it.
+        redis_client: Redis for the shared response cache; None disables caching.
+        cache_ttl_seconds: Lifetime of cached responses; 0 disables caching.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        requests_per_second: float = 0.0,
+        redis_client: aioredis.Redis | None = None,
+        cache_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._bucket = (
+            TokenBucket(requests_per_second, burst=max(1, int(requests_per_second)))
+            if requests_per_second > 0
+            else None
+        )
+        self._redis = redis_client if cache_ttl_seconds > 0 else None
+        self._cache_ttl = cache_ttl_seconds
+        self.stats = LLMExecutorStats()
+
+    @property
+    def provider_type(self) -> LLMProviderType:
+        return self.provider.provider_type
+
+    @property
+    def is_local(self) -> bool:
+        return self.provider.is_local
+
+    @property
+    def default_model(self) -> str:
+        return self.provider.default_model
+
+    def cache_key(self, request: LLMRequest) -> str:
+        """Return the cache key for ``request`` on this executor's provider."""
+        payload = json.dumps(
+            [
+                str(self.provider.provider_type),
+                request.model or self.provider.default_model,
+                request.max_tokens,
+                request.system,
+                request.messages,
+                request.prompt,
+            ],
+            sort_keys=True,
+        )
+        return CACHE_KEY_PREFIX + hashlib.sha256(payload.encode()).hexdigest()
+
+    async def _cache_get(self, key: str) -> str | None:
+        if self._redis is None:
+            return None
+        try:
+            return await self._redis.get(key)
+        except aioredis.RedisError:
+            logger.warning("LLM response cache read failed", exc_info=True)
+            return None
+
+    async def _cache_set(self, key: str, value: str) -> None:
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(key, value, ex=max(1, int(self._cache_ttl)))
+        except aioredis.RedisError:
+            logger.warning("LLM response cache write failed", exc_info=True)
+
+    def _record(
+        self, request: LLMRequest, started: float, response: str, *, cached: bool, error: str | None = None
+    ) -> None:
+        metrics = LLMCallMetrics(
+            provider=str(self.provider.provider_type),
+            model=request.model or self.provider.default_model,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            prompt_tokens=_estimate_tokens((request.system or "") + request.prompt),
+            completion_tokens=_estimate_tokens(response),
+            cached=cached,
+            error=error,
+        )
+        self.stats.record(metrics)
+        logger.debug(
+            "LLM call provider=%s model=%s latency_ms=%.1f cached=%s error=%s",
+            metrics.provider,
+            metrics.model,
+            metrics.latency_ms,
+            cached,
+            error,
+        )
+
+    async def _slot(self) -> None:
+        await self._semaphore.acquire()
+        if self._bucket is not None:
+            try:
+                await self._bucket.acquire()
+            except BaseException:
+                self._semaphore.release()
+                raise
+
+    async def execute(self, request: LLMRequest) -> str:
+        """Run one request through the cache, limits and provider.
+
+        Raises:
+            Exception: Whatever the provider raises; errors are not cached.
+        """
+        started = time.perf_counter()
+        key = self.cache_key(request) if self._redis is not None else ""
+        if key:
+            cached = await self._cache_get(key)
+            if cached is not None:
+                self._record(request, started, cached, cached=True)
+                return cached
+
+        await self._slot()
+        try:
+            response = await self.provider.generate(
+                request.prompt,
+                system=request.system,
+                model=request.model,
+                max_tokens=request.max_tokens,
+                messages=request.messages,
+            )
+        except Exception as exc:
+            self._record(request, started, "", cached=False, error=type(exc).__name__)
+            raise
+        finally:
+            self._semaphore.release()
+
+        self._record(request, started, response, cached=False)
+        if key:
+            await self._cache_set(key, response)
+        return response
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        system: str | None = None,
+        model: str | None = None,
+        max_tokens: int = 2000,
+        messages: list[dict[str, str]] | None = None,
+    ) -> str:
+        return await self.execute(LLMRequest(prompt, system, model, max_tokens, messages))
+
+    async def generate_many(
+        self,
+        requests: Sequence[LLMRequest],
+    ) -> list[str | BaseException]:
+        """Run requests concurrently, within this executor's limits.
+
+        Returns:
+            One entry per request, in order: the response text, or the
+            exception the call raised.
+        """
+        return await asyncio.gather(*(self.execute(request) for request in requests), return_exceptions=True)
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        *,
+        system: str | None = None,
+        model: str | None = None,
+        max_tokens: int = 2000,
+        messages: list[dict[str, str]] | None = None,
+    ) -> AsyncGenerator[str, None]:
+        request = LLMRequest(prompt, system, model, max_tokens, messages)
+        started = time.perf_counter()
+        chunks: list[str] = []
+        error: str | None = None
+        await self._slot()
+        try:
+            async for chunk in self.provider.generate_stream(
+                prompt, system=system, model=model, max_tokens=max_tokens, messages=messages
+            ):
+                chunks.append(chunk)
+                yield chunk
+        except Exception as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            self._semaphore.release()
+            self._record(request, started, "".join(chunks), cached=False, error=error)
+
+
+def configure_llm_executor(settings: Settings, redis_client: aioredis.Redis | None) -> None:
+    """Set the Redis client used for the shared response cache (app startup)."""
+    global _executor, _redis_client  # noqa: PLW0603
+    _redis_client = redis_client if settings.llm_cache_ttl_seconds > 0 else None
+    _executor = None
+
+
+def get_llm_executor() -> LLMExecutor:
+    """Return the executor for the current provider.
+
+    The executor is rebuilt whenever ``get_llm_provider()`` returns a
+    different provider, so concurrency and rate limits apply per provider.
+    """
+    global _executor  # noqa: PLW0603
+
+    provider = get_llm_provider()
+    if _executor is None or _executor.provider is not provider:
+        from src.core.config import get_settings
+
+        settings = get_settings()
+        _executor = LLMExecutor(
+            provider,
+            max_concurrency=settings.llm_max_concurrency,
+            requests_per_second=settings.llm_requests_per_second,
+            redis_client=_redis_client,
+            cache_ttl_seconds=settings.llm_cache_ttl_seconds,
+        )
+    return _executor
+
+
+def reset_executor() -> None:
+    """Reset the cached executor and cache client (used in tests)."""
+    global _executor, _redis_client  # noqa: PLW0603
+    _executor = None
+    _redis_client = None
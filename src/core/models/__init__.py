@@ -24,6 +24,7 @@ from src.core.models.conflict import (
 from src.core.models.conformance import ConformanceResult, ReferenceProcessModel
 from src.core.models.cost_volume import RoleRateAssumption, VolumeForecast
 from src.core.models.dark_room import DarkRoomSnapshot
+from src.core.models.dashboard_rollup import EngagementDashboardRollup
 from src.core.models.dual_write_failure import DualWriteFailure
 from src.core.models.engagement import (
     Engagement,
@@ -38,6 +39,7 @@ from src.core.models.engagement import (
     ShelfRequestStatus,
     UploadFileStatus,
 )
+from src.core.models.entity_extraction_cache import EntityExtractionCacheEntry
 from src.core.models.evidence import (
     DataCatalogEntry,
     DataClassification,
@@ -183,6 +185,7 @@ from src.core.models.survey import (
 )
 from src.core.models.survey_claim_history import SurveyClaimHistory
 from src.core.models.survey_session import SurveySession, SurveySessionStatus
+from src.core.models.sync_checkpoint import SyncCheckpoint
 from src.core.models.taskmining import (
     ActionCategory,
     AgentStatus,
@@ -268,6 +271,8 @@ __all__ = [
     "VolumeForecast",
     # dark_room
     "DarkRoomSnapshot",
+    # dashboard_rollup
+    "EngagementDashboardRollup",
     # dual_write_failure
     "DualWriteFailure",
     # engagement
@@ -282,6 +287,8 @@ __all__ = [
     "ShelfRequestItemStatus",
     "ShelfRequestStatus",
     "UploadFileStatus",
+    # entity_extraction_cache
+    "EntityExtractionCacheEntry",
     # evidence
     "DataCatalogEntry",
     "DataClassification",
@@ -414,6 +421,8 @@ __all__ = [
     "SurveyClaimHistory",
     "SurveySession",
     "SurveySessionStatus",
+    # sync_checkpoint
+    "SyncCheckpoint",
     # taskmining
     "ActionCategory",
     "AgentStatus",
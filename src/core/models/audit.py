@@ -120,7 +120,7 @@ class AuditLog(Base):
 
     __tablename__ = "audit_logs"
     __table_args__ = (
-        Index("ix_audit_logs_engagement_id", "engagement_id"),
+        Index("ix_audit_logs_engagement_id_created_at", "engagement_id", "created_at"),
         Index("ix_audit_logs_user_id_created_at", "user_id", "created_at"),
     )
 
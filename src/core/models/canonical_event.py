@@ -29,12 +29,21 @@ class CanonicalActivityEvent(Base):
 
     Events are deduplicated by (case_id, activity_name, timestamp_utc)
     with configurable tolerance, retaining the highest-confidence source.
+    Connector imports are additionally unique on
+    (engagement_id, source_system, source_event_key).
     """
 
     __tablename__ = "canonical_activity_events"
     __table_args__ = (
         Index("ix_canonical_events_case_id_ts", "case_id", "timestamp_utc"),
         Index("ix_canonical_events_engagement_id", "engagement_id"),
+        Index(
+            "uq_canonical_events_source_key",
+            "engagement_id",
+            "source_system",
+            "source_event_key",
+            unique=True,
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -56,6 +65,8 @@ class CanonicalActivityEvent(Base):
     )
     process_element_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
     raw_payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # Source event id (or content hash) used to skip re-imported events
+    source_event_key: Mapped[str | None] = mapped_column(String(255), nullable=True)
     # Correlation engine outputs — denormalised for query convenience
     link_method: Mapped[str | None] = mapped_column(String(50), nullable=True)
     link_confidence: Mapped[float | None] = mapped_column(Float, nullable=True)
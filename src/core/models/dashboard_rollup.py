@@ -0,0 +1,56 @@
+"""EngagementDashboardRollup model for materialised dashboard aggregates.
+
+One row per engagement holds the counts the dashboard endpoints used to
+compute with several COUNT/GROUP BY queries on every request. The row is
+recomputed in the same transaction as any change to evidence items, shelf
+request items, process models, process elements or evidence gaps (see
+``src.api.services.dashboard_rollup``), so reads are a single primary-key
+lookup that is never staler than the last commit.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, func
+from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database import Base
+
+
+class EngagementDashboardRollup(Base):
+    """Materialised dashboard aggregates for one engagement.
+
+    JSON columns:
+        shelf_coverage: ``{category: {"requested": int, "received": int}}``.
+        gap_counts: Evidence gaps of the latest completed model by severity.
+        confidence_buckets: Elements of the latest completed model per
+            confidence level (``VERY_HIGH`` .. ``VERY_LOW``).
+        brightness_counts: Elements of the latest completed model per
+            brightness classification.
+        weakest_elements: The five lowest-confidence elements of the latest
+            completed model (id, name, element_type, confidence_score).
+    """
+
+    __tablename__ = "engagement_dashboard_rollups"
+
+    engagement_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("engagements.id", ondelete="CASCADE"), primary_key=True
+    )
+    evidence_item_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    process_model_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    latest_model_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("process_models.id", ondelete="SET NULL"), nullable=True
+    )
+    overall_confidence: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    shelf_coverage: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+    gap_counts: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+    confidence_buckets: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+    brightness_counts: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+    weakest_elements: Mapped[list] = mapped_column(JSON, default=list, nullable=False)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<EngagementDashboardRollup(engagement_id={self.engagement_id}, refreshed_at={self.refreshed_at})>"
@@ -0,0 +1,36 @@
+"""EntityExtractionCacheEntry model for persisted entity extraction results.
+
+Extraction output depends only on the fragment text, the extractor rules and
+the seed terms applied, so results are keyed by (content hash, extractor
+version, seed-list version) and shared by every caller that extracts the
+same text: the ingest intelligence pipeline, knowledge graph builds and POV
+generation.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, String, func
+from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database import Base
+
+
+class EntityExtractionCacheEntry(Base):
+    """Cached entity extraction output for a piece of fragment text."""
+
+    __tablename__ = "entity_extraction_cache"
+    __table_args__ = (Index("ix_entity_extraction_cache_extractor_version", "extractor_version"),)
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    extractor_version: Mapped[str] = mapped_column(String(64), primary_key=True)
+    seed_version: Mapped[str] = mapped_column(String(64), primary_key=True)
+    entities: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<EntityExtractionCacheEntry(content_hash='{self.content_hash[:12]}', version='{self.extractor_version}')>"
+        )
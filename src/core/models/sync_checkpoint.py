@@ -0,0 +1,47 @@
+"""SyncCheckpoint model for durable connector sync positions.
+
+One row per (connector type, engagement) holds the last successful sync
+time, the watermark of an in-progress streaming sync and the lease of the
+replica currently running it. ``version`` increases on every watermark
+advance so writers can compare-and-set (see
+``src.integrations.sync_checkpoint.DatabaseSyncCheckpointStore``).
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database import Base
+
+
+class SyncCheckpoint(Base):
+    """Durable sync checkpoint, watermark and lease for one connector+engagement."""
+
+    __tablename__ = "sync_checkpoints"
+
+    connector_type: Mapped[str] = mapped_column(String(100), primary_key=True)
+    engagement_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("engagements.id", ondelete="CASCADE"), primary_key=True
+    )
+    last_sync_at: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    last_timestamp: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    last_offset: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    last_cursor: Mapped[str | None] = mapped_column(Text, nullable=True)
+    records_since_reset: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    lease_owner: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<SyncCheckpoint(connector_type={self.connector_type}, engagement_id={self.engagement_id}, "
+            f"version={self.version})>"
+        )
@@ -224,6 +224,13 @@ class TaskMiningEvent(Base):
         Index("ix_task_mining_events_engagement_id", "engagement_id"),
         Index("ix_task_mining_events_event_type", "event_type"),
         Index("ix_task_mining_events_timestamp", "timestamp"),
+        Index(
+            "ix_task_mining_events_engagement_type_session_ts",
+            "engagement_id",
+            "event_type",
+            "session_id",
+            "timestamp",
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
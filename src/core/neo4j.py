@@ -16,6 +16,17 @@ from src.core.config import Settings
 
 logger = logging.getLogger(__name__)
 
+# Super-label carried by every knowledge graph node that has an ``id``. Its
+# unique ``id`` constraint and ``engagement_id`` index let lookups that do
+# not know a node's type use an index seek instead of scanning all nodes.
+KM_NODE_LABEL = "KMNode"
+
+# Graph schema migrations already applied are recorded as
+# ``(:KMSchemaMigration {name})`` nodes.
+_SCHEMA_MIGRATION_LABEL = "KMSchemaMigration"
+_KM_NODE_MIGRATION = "kmnode_super_label"
+_KM_NODE_BACKFILL_BATCH = 10000
+
 
 def create_neo4j_driver(settings: Settings) -> AsyncDriver:
     """Create an async Neo4j driver.
@@ -109,6 +120,8 @@ async def setup_neo4j_constraints(driver: AsyncDriver) -> None:
         # Engagement-scoped indexes for labels added above
         "CREATE INDEX IF NOT EXISTS FOR (sc:SurveyClaim) ON (sc.engagement_id)",
         "CREATE INDEX IF NOT EXISTS FOR (co:ConflictObject) ON (co.engagement_id)",
+        # Keyset pagination of engagement subgraphs (ORDER BY id within an engagement)
+        f"CREATE INDEX IF NOT EXISTS FOR (n:{KM_NODE_LABEL}) ON (n.engagement_id, n.id)",
     ]
 
     async with driver.session() as session:
@@ -118,3 +131,52 @@ async def setup_neo4j_constraints(driver: AsyncDriver) -> None:
             await session.run(index)
 
     logger.info("Neo4j constraints and indexes created")
+
+    await migrate_km_node_label(driver)
+
+
+async def migrate_km_node_label(driver: AsyncDriver, batch_size: int = _KM_NODE_BACKFILL_BATCH) -> bool:
+    """Add the ``KM_NODE_LABEL`` super-label to existing nodes, once.
+
+    Labels every node with an ``id`` property in batches of *batch_size*
+    per transaction, then creates the super-label's ``id`` uniqueness
+    constraint and ``engagement_id`` index and records the migration so
+    later startups skip the full scan.
+
+    Args:
+        driver: Async Neo4j driver.
+        batch_size: Nodes labelled per transaction.
+
+    Returns:
+        True if the migration ran, False if it had already been applied.
+    """
+    async with driver.session() as session:
+        result = await session.run(
+            f"MATCH (m:{_SCHEMA_MIGRATION_LABEL} {{name: $name}}) RETURN count(m) AS applied",
+            {"name": _KM_NODE_MIGRATION},
+        )
+        record = await result.single()
+        if record is not None and record["applied"]:
+            return False
+
+        # CALL ... IN TRANSACTIONS needs an auto-commit transaction (session.run).
+        result = await session.run(
+            f"""
+            MATCH (n) WHERE n.id IS NOT NULL AND NOT n:{KM_NODE_LABEL}
+            CALL (n) {{ SET n:{KM_NODE_LABEL} }} IN TRANSACTIONS OF $batch_size ROWS
+            RETURN count(n) AS labelled
+            """,
+            {"batch_size": batch_size},
+        )
+        record = await result.single()
+        labelled = record["labelled"] if record is not None else 0
+
+        await session.run(f"CREATE CONSTRAINT IF NOT EXISTS FOR (n:{KM_NODE_LABEL}) REQUIRE n.id IS UNIQUE")
+        await session.run(f"CREATE INDEX IF NOT EXISTS FOR (n:{KM_NODE_LABEL}) ON (n.engagement_id)")
+        await session.run(
+            f"MERGE (m:{_SCHEMA_MIGRATION_LABEL} {{name: $name}}) ON CREATE SET m.applied_at = datetime()",
+            {"name": _KM_NODE_MIGRATION},
+        )
+
+    logger.info("Applied Neo4j migration %s: labelled %d nodes", _KM_NODE_MIGRATION, labelled)
+    return True
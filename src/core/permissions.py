@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import get_current_user
 from src.core.models import DataClassification, EngagementMember, User, UserRole
+from src.core.principal_cache import get_principal_cache
 from src.core.rls import set_engagement_context
 
 logger = logging.getLogger(__name__)
@@ -208,7 +209,8 @@ async def require_engagement_access(
 
     Platform admins bypass the membership check. Results are cached on
     ``request.state`` so repeated calls within the same request do not
-    issue additional DB queries.
+    issue additional DB queries, and in the app's ``PrincipalCache`` (when
+    configured) across requests.
 
     Args:
         engagement_id: The engagement to check access for.
@@ -239,18 +241,23 @@ async def require_engagement_access(
             )
         return user
 
-    session_factory = request.app.state.db_session_factory
-    async with session_factory() as session:
-        result = await session.execute(
-            select(EngagementMember).where(
-                EngagementMember.engagement_id == engagement_id,
-                EngagementMember.user_id == user.id,
+    principal_cache = get_principal_cache(request)
+    is_member = principal_cache.get_membership(user.id, engagement_id) if principal_cache is not None else None
+    if is_member is None:
+        session_factory = request.app.state.db_session_factory
+        async with session_factory() as session:
+            result = await session.execute(
+                select(EngagementMember).where(
+                    EngagementMember.engagement_id == engagement_id,
+                    EngagementMember.user_id == user.id,
+                )
             )
-        )
-        member = result.scalar_one_or_none()
+            is_member = result.scalar_one_or_none() is not None
+        if principal_cache is not None:
+            principal_cache.put_membership(user.id, engagement_id, is_member)
 
-    cache[cache_key] = member is not None
-    if member is None:
+    cache[cache_key] = is_member
+    if not is_member:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not have access to this engagement",
@@ -331,18 +338,23 @@ async def check_engagement_access(
             )
         return
 
-    session_factory = request.app.state.db_session_factory
-    async with session_factory() as session:
-        result = await session.execute(
-            select(EngagementMember).where(
-                EngagementMember.engagement_id == engagement_id,
-                EngagementMember.user_id == user.id,
+    principal_cache = get_principal_cache(request)
+    is_member = principal_cache.get_membership(user.id, engagement_id) if principal_cache is not None else None
+    if is_member is None:
+        session_factory = request.app.state.db_session_factory
+        async with session_factory() as session:
+            result = await session.execute(
+                select(EngagementMember).where(
+                    EngagementMember.engagement_id == engagement_id,
+                    EngagementMember.user_id == user.id,
+                )
             )
-        )
-        member = result.scalar_one_or_none()
+            is_member = result.scalar_one_or_none() is not None
+        if principal_cache is not None:
+            principal_cache.put_membership(user.id, engagement_id, is_member)
 
-    cache[cache_key] = member is not None
-    if member is None:
+    cache[cache_key] = is_member
+    if not is_member:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not have access to this engagement",
@@ -0,0 +1,207 @@
+"""Short-TTL cache of authenticated principals.
+
+Every authenticated request used to check the token blacklist in Redis,
+open a session to load the ``User`` row, and, for engagement-scoped routes,
+open another session to check ``EngagementMember``. ``PrincipalCache``
+keeps these answers in process for a few seconds:
+
+- ``User`` column values, rebuilt into a fresh detached instance per hit so
+  requests never share ORM objects;
+- engagement membership verdicts, stored with their user entry;
+- tokens already checked against the blacklist.
+
+Changes are pushed to every API process through the ``CHANNEL_PRINCIPAL``
+Redis Pub/Sub channel: user updates and deactivation, membership changes
+and token revocation call ``invalidate_principal``. If an invalidation is
+missed (Redis down), stale entries expire after the TTL.
+
+The app-wide instance lives on ``app.state.principal_cache`` and is created
+in the API lifespan; without it authentication runs uncached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+import redis.asyncio as aioredis
+from fastapi import Request
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.core.models import User
+from src.core.redis import CHANNEL_PRINCIPAL, listen_until_shutdown, publish_event
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 30.0
+DEFAULT_MAX_ENTRIES = 10000
+
+
+def token_digest(token: str) -> str:
+    """Return the key under which a token is cached and invalidated."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+@dataclass
+class _UserEntry:
+    values: dict[str, Any]
+    expires_at: float
+    memberships: dict[UUID, bool] = field(default_factory=dict)
+
+
+class PrincipalCache:
+    """In-process LRU of users, memberships and checked tokens.
+
+    Args:
+        ttl_seconds: Lifetime of every entry.
+        max_entries: Maximum users (and, separately, tokens) kept.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._users: collections.OrderedDict[UUID, _UserEntry] = collections.OrderedDict()
+        self._tokens: collections.OrderedDict[str, float] = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_user(self, user_id: UUID) -> User | None:
+        """Return a detached copy of the cached user, or None on a miss."""
+        entry = self._user_entry(user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        user = User(**entry.values)
+        make_transient_to_detached(user)
+        return user
+
+    def put_user(self, user: User) -> None:
+        """Cache the loaded column values of a user."""
+        columns = User.__mapper__.column_attrs.keys()
+        values = {key: value for key, value in inspect(user).dict.items() if key in columns}
+        self._users[user.id] = _UserEntry(values=values, expires_at=time.monotonic() + self._ttl)
+        self._users.move_to_end(user.id)
+        while len(self._users) > self._max_entries:
+            self._users.popitem(last=False)
+
+    def get_membership(self, user_id: UUID, engagement_id: UUID) -> bool | None:
+        """Return the cached membership verdict, or None if unknown."""
+        entry = self._user_entry(user_id)
+        if entry is None:
+            return None
+        return entry.memberships.get(engagement_id)
+
+    def put_membership(self, user_id: UUID, engagement_id: UUID, is_member: bool) -> None:
+        """Cache a membership verdict; ignored unless the user is cached."""
+        entry = self._user_entry(user_id)
+        if entry is not None:
+            entry.memberships[engagement_id] = is_member
+
+    def is_token_checked(self, token: str) -> bool:
+        """Return True if the token passed the blacklist check within the TTL."""
+        digest = token_digest(token)
+        expires_at = self._tokens.get(digest)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._tokens[digest]
+            return False
+        return True
+
+    def mark_token_checked(self, token: str) -> None:
+        """Record that the token is not blacklisted."""
+        digest = token_digest(token)
+        self._tokens[digest] = time.monotonic() + self._ttl
+        self._tokens.move_to_end(digest)
+        while len(self._tokens) > self._max_entries:
+            self._tokens.popitem(last=False)
+
+    def invalidate(self, *, user_id: UUID | None = None, token_hash: str | None = None) -> None:
+        """Drop a user (with its memberships) and/or a token."""
+        if user_id is not None:
+            self._users.pop(user_id, None)
+        if token_hash is not None:
+            self._tokens.pop(token_hash, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._users.clear()
+        self._tokens.clear()
+
+    def handle_event(self, event: dict[str, Any]) -> None:
+        """Apply an invalidation event received from ``CHANNEL_PRINCIPAL``."""
+        user_id = event.get("user_id")
+        try:
+            parsed_user_id = UUID(user_id) if user_id else None
+        except ValueError:
+            logger.warning("Ignoring principal invalidation with bad user_id %r", user_id)
+            parsed_user_id = None
+        self.invalidate(user_id=parsed_user_id, token_hash=event.get("token_hash"))
+
+    def _user_entry(self, user_id: UUID) -> _UserEntry | None:
+        entry = self._users.get(user_id)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._users[user_id]
+            return None
+        self._users.move_to_end(user_id)
+        return entry
+
+
+def get_principal_cache(request: Any) -> PrincipalCache | None:
+    """Return the app's principal cache, or None when caching is disabled."""
+    cache = getattr(request.app.state, "principal_cache", None)
+    return cache if isinstance(cache, PrincipalCache) else None
+
+
+async def invalidate_principal(
+    request: Request,
+    *,
+    user_id: UUID | None = None,
+    token: str | None = None,
+) -> None:
+    """Invalidate a user and/or token in this process and all others.
+
+    Call after the change has been committed. Publishing is best-effort;
+    other processes fall back to the cache TTL if Redis is unavailable.
+
+    Args:
+        request: The current request (for app state).
+        user_id: User whose role, status or memberships changed.
+        token: Raw token that was revoked.
+    """
+    token_hash = token_digest(token) if token is not None else None
+    cache = get_principal_cache(request)
+    if cache is not None:
+        cache.invalidate(user_id=user_id, token_hash=token_hash)
+
+    redis_client = getattr(request.app.state, "redis_client", None)
+    if redis_client is None:
+        return
+    event: dict[str, Any] = {}
+    if user_id is not None:
+        event["user_id"] = str(user_id)
+    if token_hash is not None:
+        event["token_hash"] = token_hash
+    try:
+        await publish_event(redis_client, CHANNEL_PRINCIPAL, event)
+    except (aioredis.RedisError, ConnectionError, OSError) as exc:
+        logger.warning("Failed to publish principal invalidation: %s", exc)
+
+
+async def listen_for_principal_changes(
+    cache: PrincipalCache,
+    redis_client: aioredis.Redis,
+    shutdown_event: asyncio.Event,
+) -> None:
+    """Apply ``CHANNEL_PRINCIPAL`` invalidations to the cache until shutdown."""
+    await listen_until_shutdown(redis_client, CHANNEL_PRINCIPAL, cache.handle_event, shutdown_event)
@@ -0,0 +1,232 @@
+"""Process-wide Redis Pub/Sub fan-out for real-time WebSockets.
+
+One ``RealtimeHub`` per API worker holds a single subscription to the
+real-time channels. Each message is decoded once and handed to the
+sockets registered for its ``engagement_id`` that asked for its channel.
+
+Every socket has a ``SocketSender``: a bounded send queue drained by its
+own writer task, so one slow client never delays the others. A client
+whose queue fills up is a slow consumer and is disconnected with close
+code 1013 (try again later); the dashboard reconnects and reloads.
+
+The hub subscribes when its first socket registers and unsubscribes when
+its last socket leaves.
+
+Usage::
+
+    hub = get_realtime_hub(websocket.app)
+    sender = hub.register(websocket, engagement_id, {CHANNEL_ALERTS})
+    try:
+        ...
+    finally:
+        await hub.unregister(sender)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import Iterable
+from typing import Any, Protocol
+
+import redis.asyncio as aioredis
+
+from src.core.redis import (
+    CHANNEL_ALERTS,
+    CHANNEL_DEVIATIONS,
+    CHANNEL_MONITORING,
+    listen_channels_until_shutdown,
+)
+
+logger = logging.getLogger(__name__)
+
+REALTIME_CHANNELS = (CHANNEL_DEVIATIONS, CHANNEL_ALERTS, CHANNEL_MONITORING)
+DEFAULT_SEND_QUEUE_SIZE = 256
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class _TextSocket(Protocol):
+    async def send_text(self, data: str) -> None: ...
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None: ...
+
+
+class SocketSender:
+    """Bounded send queue and writer task for one WebSocket.
+
+    Args:
+        websocket: The accepted socket.
+        engagement_id: Engagement whose events the socket receives.
+        channels: Channels the socket receives.
+        max_queue: Messages buffered before the socket is a slow consumer.
+    """
+
+    def __init__(
+        self,
+        websocket: _TextSocket,
+        engagement_id: str,
+        channels: Iterable[str],
+        max_queue: int = DEFAULT_SEND_QUEUE_SIZE,
+    ) -> None:
+        self.websocket = websocket
+        self.engagement_id = engagement_id
+        self.channels = frozenset(channels)
+        self.sent = 0
+        self.overflowed = False
+        self._queue: asyncio.Queue[str] = asyncio.Queue(max_queue)
+        self._writer = asyncio.create_task(self._write())
+
+    def send(self, text: str) -> bool:
+        """Queue a text frame without waiting.
+
+        Returns:
+            False if the socket is gone or was dropped as a slow consumer.
+        """
+        if self.overflowed or self._writer.done():
+            return False
+        try:
+            self._queue.put_nowait(text)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            logger.warning(
+                "Dropping slow WebSocket consumer for engagement %s (%d messages queued)",
+                self.engagement_id,
+                self._queue.qsize(),
+            )
+            self._writer.cancel()
+            asyncio.get_running_loop().create_task(self._close_slow())
+            return False
+        return True
+
+    async def _write(self) -> None:
+        try:
+            while True:
+                text = await self._queue.get()
+                await self.websocket.send_text(text)
+                self.sent += 1
+        except (RuntimeError, ConnectionError, OSError) as exc:
+            # Starlette raises RuntimeError/WebSocketDisconnect once the client is gone
+            logger.debug("WebSocket writer for engagement %s stopped: %s", self.engagement_id, exc)
+        except Exception:  # Intentionally broad: a writer must not crash the event loop
+            logger.debug("WebSocket writer for engagement %s stopped", self.engagement_id, exc_info=True)
+
+    async def _close_slow(self) -> None:
+        with contextlib.suppress(Exception):  # Intentionally broad: the socket may already be closed
+            await self.websocket.close(code=SLOW_CONSUMER_CLOSE_CODE, reason="Slow consumer")
+
+    async def close(self) -> None:
+        """Stop the writer; queued messages are discarded."""
+        self._writer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._writer
+
+
+class RealtimeHub:
+    """Single Pub/Sub subscriber fanning events out to registered sockets.
+
+    Args:
+        redis_client: Redis client to subscribe with.
+        channels: Channels to subscribe to.
+        queue_size: Per-socket send queue size.
+    """
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        channels: Iterable[str] = REALTIME_CHANNELS,
+        *,
+        queue_size: int = DEFAULT_SEND_QUEUE_SIZE,
+    ) -> None:
+        self._redis = redis_client
+        self._channels = tuple(channels)
+        self._queue_size = queue_size
+        self._senders: dict[str, set[SocketSender]] = {}
+        self._listener: asyncio.Task[None] | None = None
+        self._loop = asyncio.get_running_loop()
+        self.received = 0
+        self.delivered = 0
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    @property
+    def listening(self) -> bool:
+        return self._listener is not None and not self._listener.done()
+
+    def register(self, websocket: _TextSocket, engagement_id: str, channels: Iterable[str]) -> SocketSender:
+        """Start delivering ``channels`` events for ``engagement_id`` to an accepted socket."""
+        sender = SocketSender(websocket, engagement_id, channels, self._queue_size)
+        self._senders.setdefault(engagement_id, set()).add(sender)
+        if not self.listening:
+            self._listener = asyncio.create_task(
+                listen_channels_until_shutdown(self._redis, self._channels, self.dispatch, asyncio.Event())
+            )
+        return sender
+
+    async def unregister(self, sender: SocketSender) -> None:
+        """Stop delivering to a socket; unsubscribes after the last one."""
+        senders = self._senders.get(sender.engagement_id)
+        if senders is not None:
+            senders.discard(sender)
+            if not senders:
+                del self._senders[sender.engagement_id]
+        await sender.close()
+        if not self._senders:
+            await self._stop_listener()
+
+    def dispatch(self, channel: str, payload: Any) -> int:
+        """Queue one Pub/Sub message for every socket it is addressed to.
+
+        Returns:
+            Number of sockets the message was queued for.
+        """
+        self.received += 1
+        try:
+            data = json.loads(payload)
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.debug("Skipping malformed Redis message on channel %s: %s", channel, e)
+            return 0
+        if not isinstance(data, dict):
+            return 0
+        queued = 0
+        for sender in tuple(self._senders.get(str(data.get("engagement_id")), ())):
+            if channel in sender.channels and sender.send(payload):
+                queued += 1
+        self.delivered += queued
+        return queued
+
+    async def _stop_listener(self) -> None:
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await listener
+
+    async def close(self) -> None:
+        """Stop every writer and the subscription (app shutdown)."""
+        senders = [sender for group in self._senders.values() for sender in group]
+        self._senders.clear()
+        for sender in senders:
+            await sender.close()
+        await self._stop_listener()
+
+
+def get_realtime_hub(app: Any) -> RealtimeHub:  # Any because: FastAPI/Starlette app; avoids importing it here
+    """Return the app's hub for the running event loop, creating it on first use."""
+    from src.core.config import get_settings
+
+    hub: RealtimeHub | None = getattr(app.state, "realtime_hub", None)
+    if hub is None or hub.loop is not asyncio.get_running_loop():
+        hub = RealtimeHub(app.state.redis_client, queue_size=get_settings().ws_send_queue_size)
+        app.state.realtime_hub = hub
+    return hub
+
+
+async def close_realtime_hub(app: Any) -> None:  # Any because: FastAPI/Starlette app
+    """Close the app's hub if the running loop owns it."""
+    hub: RealtimeHub | None = getattr(app.state, "realtime_hub", None)
+    if hub is not None and hub.loop is asyncio.get_running_loop():
+        await hub.close()
@@ -7,8 +7,11 @@ real-time WebSocket fan-out.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
 import logging
+from collections.abc import Callable, Sequence
 from typing import Any
 
 import redis.asyncio as aioredis
@@ -22,6 +25,8 @@ logger = logging.getLogger(__name__)
 MONITORING_STREAM = "kmflow:monitoring:tasks"
 ALERT_STREAM = "kmflow:alerts:events"
 TASK_MINING_STREAM = "kmflow:task_mining:events"
+AUDIT_SPILL_STREAM = "kmflow:audit:spill"
+AUDIT_SPILL_GROUP = "audit-sink"
 
 # -- Pub/Sub channels ----------------------------------------------------------
 
@@ -30,6 +35,11 @@ CHANNEL_ALERTS = "kmflow:realtime:alerts"
 CHANNEL_MONITORING = "kmflow:realtime:monitoring"
 CHANNEL_TASK_MINING = "kmflow:realtime:task_mining"
 CHANNEL_TASKS = "kmflow:realtime:tasks"
+CHANNEL_PDP_POLICY = "kmflow:pdp:policy"
+CHANNEL_PRINCIPAL = "kmflow:auth:principal"
+
+# Delay before re-subscribing after a cache invalidation listener loses Redis
+_SUBSCRIBE_RETRY_SECONDS = 5.0
 
 
 def create_redis_client(settings: Settings) -> aioredis.Redis:
@@ -184,3 +194,71 @@ async def publish_event(
     """
     count: int = await client.publish(channel, json.dumps(data))
     return count
+
+
+async def listen_until_shutdown(
+    client: aioredis.Redis,
+    channel: str,
+    on_message: Callable[[dict[str, Any]], None],
+    shutdown_event: asyncio.Event,
+) -> None:
+    """Call ``on_message`` for every event on a channel until shutdown.
+
+    Used by in-process caches that are invalidated across API processes.
+    Re-subscribes after Redis errors, so a Redis outage only delays
+    invalidation.
+
+    Args:
+        client: Redis client.
+        channel: Channel name.
+        on_message: Called with the JSON-decoded event data ({} if the
+            payload is not JSON).
+        shutdown_event: Set by the API lifespan on shutdown.
+    """
+
+    def _decoded(_channel: str, payload: Any) -> None:
+        try:
+            data = json.loads(payload or "{}")
+        except (json.JSONDecodeError, TypeError):
+            data = {}
+        on_message(data if isinstance(data, dict) else {})
+
+    await listen_channels_until_shutdown(client, [channel], _decoded, shutdown_event)
+
+
+async def listen_channels_until_shutdown(
+    client: aioredis.Redis,
+    channels: Sequence[str],
+    on_message: Callable[[str, Any], None],
+    shutdown_event: asyncio.Event,
+) -> None:
+    """Call ``on_message`` for every message on any of ``channels`` until shutdown.
+
+    One subscription serves all channels. Re-subscribes after Redis errors.
+
+    Args:
+        client: Redis client.
+        channels: Channel names.
+        on_message: Called with the channel name and the raw payload.
+        shutdown_event: Set on shutdown.
+    """
+    names = ", ".join(channels)
+    while not shutdown_event.is_set():
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(*channels)
+            while not shutdown_event.is_set():
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message is None:
+                    # get_message can return at once (e.g. nothing subscribed yet); let other tasks run
+                    await asyncio.sleep(0)
+                    continue
+                on_message(message.get("channel", ""), message.get("data"))
+        except (aioredis.RedisError, ConnectionError, OSError) as exc:
+            logger.warning("Listener on %s lost Redis, retrying in %.0fs: %s", names, _SUBSCRIBE_RETRY_SECONDS, exc)
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(shutdown_event.wait(), timeout=_SUBSCRIBE_RETRY_SECONDS)
+        finally:
+            with contextlib.suppress(aioredis.RedisError, ConnectionError, OSError):
+                await pubsub.unsubscribe(*channels)
+                await pubsub.close()
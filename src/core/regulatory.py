@@ -16,6 +16,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.models import ComplianceLevel, Control, Policy, Regulation
+from src.core.neo4j import KM_NODE_LABEL
 from src.semantic.graph import KnowledgeGraphService
 
 logger = logging.getLogger(__name__)
@@ -107,13 +108,14 @@ class RegulatoryOverlayEngine:
             policy_node_id = f"policy-{policy.id}"
             try:
                 await self._graph.run_write_query(
-                    """
-                    MERGE (n:Policy {id: $id})
+                    f"""
+                    MERGE (n:Policy {{id: $id}})
                     ON CREATE SET n.name = $name,
                                   n.engagement_id = $engagement_id,
                                   n.policy_type = $policy_type
                     ON MATCH SET  n.name = $name,
                                   n.policy_type = $policy_type
+                    SET n:{KM_NODE_LABEL}
                     """,
                     {
                         "id": policy_node_id,
@@ -130,13 +132,14 @@ class RegulatoryOverlayEngine:
             control_node_id = f"control-{control.id}"
             try:
                 await self._graph.run_write_query(
-                    """
-                    MERGE (n:Control {id: $id})
+                    f"""
+                    MERGE (n:Control {{id: $id}})
                     ON CREATE SET n.name = $name,
                                   n.engagement_id = $engagement_id,
                                   n.effectiveness = $effectiveness
                     ON MATCH SET  n.name = $name,
                                   n.effectiveness = $effectiveness
+                    SET n:{KM_NODE_LABEL}
                     """,
                     {
                         "id": control_node_id,
@@ -151,8 +154,8 @@ class RegulatoryOverlayEngine:
                     policy_node_id = f"policy-{pid}"
                     with contextlib.suppress(Neo4jError):
                         await self._graph.run_write_query(
-                            """
-                            MATCH (pol {id: $pol_id}), (ctrl {id: $ctrl_id})
+                            f"""
+                            MATCH (pol:{KM_NODE_LABEL} {{id: $pol_id}}), (ctrl:{KM_NODE_LABEL} {{id: $ctrl_id}})
                             MERGE (pol)-[r:GOVERNED_BY]->(ctrl)
                             ON CREATE SET r.source = 'regulatory_overlay'
                             """,
@@ -166,13 +169,14 @@ class RegulatoryOverlayEngine:
             reg_node_id = f"reg-{regulation.id}"
             try:
                 await self._graph.run_write_query(
-                    """
-                    MERGE (n:Regulation {id: $id})
+                    f"""
+                    MERGE (n:Regulation {{id: $id}})
                     ON CREATE SET n.name = $name,
                                   n.engagement_id = $engagement_id,
                                   n.framework = $framework
                     ON MATCH SET  n.name = $name,
                                   n.framework = $framework
+                    SET n:{KM_NODE_LABEL}
                     """,
                     {
                         "id": reg_node_id,
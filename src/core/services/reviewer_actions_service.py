@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.models.conflict import ConflictObject, MismatchType, ResolutionStatus
 from src.core.models.pov import EvidenceGrade
 from src.core.models.validation_decision import ReviewerAction, ValidationDecision
+from src.core.neo4j import KM_NODE_LABEL
 from src.semantic.graph import KnowledgeGraphService
 
 logger = logging.getLogger(__name__)
@@ -202,17 +203,19 @@ class ReviewerActionsService:
 
         # Create new assertion and SUPERSEDES edge, retract original (scoped)
         await self._graph.run_write_query(
-            """
-            MATCH (original {id: $element_id, engagement_id: $engagement_id})
+            f"""
+            MATCH (original:{KM_NODE_LABEL} {{id: $element_id}})
+            WHERE original.engagement_id = $engagement_id
             SET original.retracted_at = datetime(),
                 original.retracted_reason = $correction_note
 
-            CREATE (new_assertion:Assertion {
+            CREATE (new_assertion:Assertion {{
                 id: $new_id,
                 engagement_id: $engagement_id,
                 corrected_from: $element_id,
                 created_at: datetime()
-            })
+            }})
+            SET new_assertion:{KM_NODE_LABEL}
 
             MERGE (new_assertion)-[:SUPERSEDES]->(original)
             """,
@@ -289,16 +292,17 @@ class ReviewerActionsService:
         # Create ConflictObject node in Neo4j
         conflict_node_id = str(conflict.id).replace("-", "")[:16]
         await self._graph.run_write_query(
-            """
-            CREATE (co:ConflictObject {
+            f"""
+            CREATE (co:ConflictObject {{
                 id: $conflict_id,
                 mismatch_type: $mismatch_type,
                 severity: $severity,
                 engagement_id: $engagement_id,
                 created_at: datetime()
-            })
+            }})
+            SET co:{KM_NODE_LABEL}
             WITH co
-            MATCH (a:Assertion {id: $element_id, engagement_id: $engagement_id})
+            MATCH (a:Assertion {{id: $element_id, engagement_id: $engagement_id}})
             MERGE (co)-[:INVOLVES]->(a)
             """,
             {
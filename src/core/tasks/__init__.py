@@ -5,6 +5,7 @@ tracking, retry logic, and result persistence.
 """
 
 from src.core.tasks.base import TaskStatus, TaskWorker
+from src.core.tasks.context import WorkerContext
 from src.core.tasks.queue import TaskProgress, TaskQueue
 from src.core.tasks.runner import run_task_worker
 
@@ -13,5 +14,6 @@ __all__ = [
     "TaskQueue",
     "TaskStatus",
     "TaskWorker",
+    "WorkerContext",
     "run_task_worker",
 ]
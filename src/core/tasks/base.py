@@ -11,6 +11,9 @@ Status lifecycle::
                      ↘ RETRYING → RUNNING  (up to max_retries)
                                 ↘ FAILED
 
+Workers receive the process's shared ``WorkerContext`` when they are
+constructed and use its clients instead of creating their own.
+
 Example subclass::
 
     class PovGenerationWorker(TaskWorker):
@@ -18,7 +21,8 @@ Example subclass::
 
         async def execute(self, payload: dict[str, Any]) -> dict[str, Any]:
             engagement_id = payload["engagement_id"]
-            # ... long-running POV generation ...
+            async with self.context.session_factory() as session:
+                ...  # long-running POV generation
             self.report_progress(5, 10)
             # ... more work ...
             return {"pov_id": "pov-001", "status": "generated"}
@@ -29,7 +33,10 @@ from __future__ import annotations
 import abc
 import enum
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.core.tasks.context import WorkerContext
 
 logger = logging.getLogger(__name__)
 
@@ -60,11 +67,23 @@ class TaskWorker(abc.ABC):
     task_type: str = ""
     max_retries: int = 3
 
-    def __init__(self) -> None:
+    def __init__(self, context: WorkerContext | None = None) -> None:
+        self._context = context
         self._current_step: int = 0
         self._total_steps: int = 0
         self._task_id: str = ""
 
+    @property
+    def context(self) -> WorkerContext:
+        """Shared clients of the worker process.
+
+        Raises:
+            RuntimeError: The worker was constructed without a context.
+        """
+        if self._context is None:
+            raise RuntimeError(f"{type(self).__name__} needs a WorkerContext")
+        return self._context
+
     @abc.abstractmethod
     async def execute(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Execute the task with the given payload.
@@ -0,0 +1,131 @@
+"""Shared client runtime for background workers (KMFLOW-58).
+
+A ``WorkerContext`` holds the long-lived PostgreSQL, Redis and Neo4j
+clients of one process and is injected into every ``TaskWorker`` and
+stream consumer, so tasks reuse pooled connections instead of paying a
+connection (and, for Neo4j, TLS/bolt handshake and routing table fetch)
+per task.
+
+Inside the API process the lifespan already owns the clients and wraps
+them without transferring ownership::
+
+    worker_context = WorkerContext(settings, engine, session_factory, redis_client, neo4j_driver)
+    task_queue.register_worker(EvidenceBatchWorker(worker_context))
+
+A standalone worker process creates and closes its own::
+
+    worker_context = await WorkerContext.open(settings)
+    try:
+        ...
+    finally:
+        await worker_context.close()
+"""
+
+from __future__ import annotations
+
+import logging
+
+import redis.asyncio as aioredis
+from neo4j import AsyncDriver
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.core.config import Settings
+from src.core.database import create_engine
+from src.core.neo4j import create_neo4j_driver, verify_neo4j_connectivity
+from src.core.redis import create_redis_client, verify_redis_connectivity
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerContext:
+    """Long-lived database, cache and graph clients shared by workers.
+
+    Attributes:
+        settings: Application settings the clients were built from.
+        db_engine: Async SQLAlchemy engine (owns the connection pool).
+        session_factory: Session factory bound to ``db_engine``.
+        redis_client: Shared Redis client (connection pooled).
+        neo4j_driver: Shared Neo4j driver (connection pooled).
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        db_engine: AsyncEngine,
+        session_factory: async_sessionmaker[AsyncSession],
+        redis_client: aioredis.Redis,
+        neo4j_driver: AsyncDriver,
+        *,
+        owns_clients: bool = False,
+    ) -> None:
+        self.settings = settings
+        self.db_engine = db_engine
+        self.session_factory = session_factory
+        self.redis_client = redis_client
+        self.neo4j_driver = neo4j_driver
+        self._owns_clients = owns_clients
+        self._closed = False
+
+    @classmethod
+    async def open(cls, settings: Settings) -> WorkerContext:
+        """Create the clients for a worker process and health-check them.
+
+        Unreachable services are logged and the context is still returned,
+        matching the API's degraded-mode startup; the pools reconnect once
+        the service is back.
+
+        Args:
+            settings: Application settings with connection details.
+
+        Returns:
+            A context that owns its clients; call ``close()`` on shutdown.
+        """
+        db_engine, session_factory = create_engine(settings)
+        context = cls(
+            settings,
+            db_engine,
+            session_factory,
+            create_redis_client(settings),
+            create_neo4j_driver(settings),
+            owns_clients=True,
+        )
+        health = await context.health_check()
+        for service, healthy in health.items():
+            if not healthy:
+                logger.warning("Worker context: %s is not reachable; starting in degraded mode", service)
+        return context
+
+    async def health_check(self) -> dict[str, bool]:
+        """Check that each shared client can reach its service.
+
+        Returns:
+            Mapping of service name (postgres, redis, neo4j) to reachability.
+        """
+        try:
+            async with self.session_factory() as session:
+                await session.execute(text("SELECT 1"))
+            postgres = True
+        except (SQLAlchemyError, ConnectionError, OSError):
+            logger.exception("Failed to connect to PostgreSQL")
+            postgres = False
+        return {
+            "postgres": postgres,
+            "redis": await verify_redis_connectivity(self.redis_client),
+            "neo4j": await verify_neo4j_connectivity(self.neo4j_driver),
+        }
+
+    async def close(self) -> None:
+        """Close the clients if this context created them.
+
+        A context wrapping clients owned elsewhere (the API lifespan)
+        leaves them open for their owner to close. Idempotent.
+        """
+        if self._closed or not self._owns_clients:
+            return
+        self._closed = True
+        await self.redis_client.close()
+        await self.neo4j_driver.close()
+        await self.db_engine.dispose()
+        logger.info("Worker context clients closed")
@@ -1,7 +1,8 @@
 """Knowledge graph health analysis.
 
-Runs standard Cypher queries to assess graph connectivity, orphan nodes,
-schema conformance, and entity type coverage — no GDS plugin required.
+Topology metrics (counts, orphans, connected components, label and type
+coverage) come from an in-memory ``GraphSnapshot`` of the engagement;
+property checks run as Cypher queries. No GDS plugin is required.
 """
 
 from __future__ import annotations
@@ -9,14 +10,15 @@ from __future__ import annotations
 import logging
 import time
 import uuid
-from collections.abc import Iterator
-from typing import Any
 
 from neo4j import AsyncDriver
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.models.pipeline_quality import GraphHealthSnapshot
+from src.core.neo4j import KM_NODE_LABEL
+from src.semantic.graph import KnowledgeGraphService
+from src.semantic.graph_snapshot import get_graph_snapshot
 from src.semantic.ontology.loader import get_entity_type_to_label, get_valid_node_labels, get_valid_relationship_types
 
 logger = logging.getLogger(__name__)
@@ -33,106 +35,11 @@ _ALWAYS_VALID_REL_TYPES: frozenset[str] = frozenset(
 )
 
 
-# ---------------------------------------------------------------------------
-# Union-find helpers
-# ---------------------------------------------------------------------------
-
-
-class _UnionFind:
-    """Lightweight union-find (disjoint set union) for component counting."""
-
-    def __init__(self) -> None:
-        self._parent: dict[int, int] = {}
-        self._rank: dict[int, int] = {}
-
-    def _ensure(self, x: int) -> None:
-        if x not in self._parent:
-            self._parent[x] = x
-            self._rank[x] = 0
-
-    def find(self, x: int) -> int:
-        self._ensure(x)
-        if self._parent[x] != x:
-            self._parent[x] = self.find(self._parent[x])  # path compression
-        return self._parent[x]
-
-    def union(self, x: int, y: int) -> None:
-        rx, ry = self.find(x), self.find(y)
-        if rx == ry:
-            return
-        # Union by rank
-        if self._rank[rx] < self._rank[ry]:
-            rx, ry = ry, rx
-        self._parent[ry] = rx
-        if self._rank[rx] == self._rank[ry]:
-            self._rank[rx] += 1
-
-    def components(self) -> Iterator[tuple[int, list[int]]]:
-        """Yield (root, members) for every component."""
-        groups: dict[int, list[int]] = {}
-        for node in self._parent:
-            root = self.find(node)
-            groups.setdefault(root, []).append(node)
-        yield from groups.items()
-
-
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
-async def _count_components(
-    neo4j_session: Any,  # Any because: neo4j.AsyncSession; no exported type alias
-    engagement_id: str,
-) -> tuple[int, int]:
-    """Return (component_count, largest_component_size) using union-find.
-
-    Fetches all edges within the engagement and processes them in Python so
-    that no GDS plugin is required.  Orphan nodes (no edges) are each counted
-    as their own single-node component.
-    """
-    uf = _UnionFind()
-
-    # Collect all edges first (capped at 10 000 to avoid unbounded scans).
-    edge_limit = 10_000
-    edge_result = await neo4j_session.run(
-        "MATCH (a {engagement_id: $eid})--(b {engagement_id: $eid}) RETURN id(a) AS a_id, id(b) AS b_id LIMIT $lim",
-        eid=engagement_id,
-        lim=edge_limit,
-    )
-    edge_count = 0
-    async for record in edge_result:
-        a_id: int = record["a_id"]
-        b_id: int = record["b_id"]
-        uf._ensure(a_id)
-        uf._ensure(b_id)
-        uf.union(a_id, b_id)
-        edge_count += 1
-
-    if edge_count >= edge_limit:
-        logger.warning(
-            "_count_components hit the %d-edge LIMIT for engagement %s; "
-            "component counts may be approximate for large graphs.",
-            edge_limit,
-            engagement_id,
-        )
-
-    # Collect orphan nodes (they will not appear in edge results).
-    orphan_result = await neo4j_session.run(
-        "MATCH (n {engagement_id: $eid}) WHERE NOT (n)--() RETURN id(n) AS nid",
-        eid=engagement_id,
-    )
-    async for record in orphan_result:
-        uf._ensure(record["nid"])
-
-    components = list(uf.components())
-    if not components:
-        return 0, 0
-
-    largest = max(len(members) for _, members in components)
-    return len(components), largest
-
-
 async def _zero_snapshot(engagement_id: str, duration_ms: float) -> GraphHealthSnapshot:
     """Return a fully-zeroed snapshot for when the driver is unavailable."""
     return GraphHealthSnapshot(
@@ -194,67 +101,33 @@ async def analyze_graph_health(
     valid_rel_types = get_valid_relationship_types() | _ALWAYS_VALID_REL_TYPES
     entity_type_to_label = get_entity_type_to_label()  # e.g. {"activity": "Activity", ...}
 
-    async with neo4j_driver.session() as neo4j_session:
-        # 1. Node count
-        res = await neo4j_session.run(
-            "MATCH (n {engagement_id: $eid}) RETURN count(n) AS cnt",
-            eid=engagement_id,
-        )
-        _rec = await res.single()
-        node_count: int = _rec["cnt"] if _rec is not None else 0
-
-        # 2. Relationship count (divide by 2 — each edge appears twice in
-        #    undirected MATCH)
-        res = await neo4j_session.run(
-            "MATCH (n {engagement_id: $eid})-[r]-() RETURN count(r) / 2 AS cnt",
-            eid=engagement_id,
-        )
-        _rec = await res.single()
-        relationship_count: int = _rec["cnt"] if _rec is not None else 0
+    graph = await get_graph_snapshot(KnowledgeGraphService(neo4j_driver), engagement_id)
 
-        # 3. Orphan nodes
-        res = await neo4j_session.run(
-            "MATCH (n {engagement_id: $eid}) WHERE NOT (n)--() RETURN count(n) AS cnt",
-            eid=engagement_id,
-        )
-        _rec = await res.single()
-        orphan_node_count: int = _rec["cnt"] if _rec is not None else 0
+    # 1-4. Counts, orphans and connected components (orphans are
+    #      single-node components)
+    node_count = graph.node_count
+    relationship_count = graph.edge_count
+    orphan_node_count = len(graph.orphans())
+    component_sizes = graph.component_sizes()
+    connected_components = int(component_sizes.size)
+    largest_component_size = int(component_sizes[0]) if component_sizes.size else 0
 
-        # 4. Connected components via union-find (includes orphan collection)
-        connected_components, largest_component_size = await _count_components(neo4j_session, engagement_id)
+    # 5. Nodes by primary label
+    nodes_by_label = graph.nodes_by_label()
+    invalid_label_count = sum(1 for lbl in nodes_by_label if lbl not in valid_labels)
 
-        # 5. Nodes by label
-        res = await neo4j_session.run(
-            "MATCH (n {engagement_id: $eid}) RETURN labels(n) AS lbls, count(n) AS cnt",
-            eid=engagement_id,
-        )
-        nodes_by_label: dict[str, int] = {}
-        invalid_label_count = 0
-        async for record in res:
-            for lbl in record["lbls"]:
-                nodes_by_label[lbl] = nodes_by_label.get(lbl, 0) + record["cnt"]
-                if lbl not in valid_labels:
-                    invalid_label_count += 1
-
-        # 6. Relationships by type
-        res = await neo4j_session.run(
-            "MATCH (n {engagement_id: $eid})-[r]->() RETURN type(r) AS rtype, count(r) AS cnt",
-            eid=engagement_id,
-        )
-        relationships_by_type: dict[str, int] = {}
-        invalid_rel_type_count = 0
-        async for record in res:
-            rtype: str = record["rtype"]
-            relationships_by_type[rtype] = record["cnt"]
-            if rtype not in valid_rel_types:
-                invalid_rel_type_count += 1
+    # 6. Relationships by type
+    relationships_by_type = graph.relationships_by_type()
+    invalid_rel_type_count = sum(1 for rtype in relationships_by_type if rtype not in valid_rel_types)
 
-        # 7. Average degree
-        avg_degree: float = (relationship_count * 2) / node_count if node_count > 0 else 0.0
+    # 7. Average degree
+    avg_degree: float = (relationship_count * 2) / node_count if node_count > 0 else 0.0
 
+    async with neo4j_driver.session() as neo4j_session:
         # 8. Missing required properties (name or confidence NULL)
         res = await neo4j_session.run(
-            "MATCH (n {engagement_id: $eid}) WHERE n.name IS NULL OR n.confidence IS NULL RETURN count(n) AS cnt",
+            f"MATCH (n:{KM_NODE_LABEL} {{engagement_id: $eid}}) WHERE n.name IS NULL OR n.confidence IS NULL "
+            "RETURN count(n) AS cnt",
             eid=engagement_id,
         )
         _rec = await res.single()
@@ -274,7 +147,7 @@ async def analyze_graph_health(
 
         # 10. Confidence stats
         res = await neo4j_session.run(
-            "MATCH (n {engagement_id: $eid}) WHERE n.confidence IS NOT NULL "
+            f"MATCH (n:{KM_NODE_LABEL} {{engagement_id: $eid}}) WHERE n.confidence IS NOT NULL "
             "RETURN avg(n.confidence) AS avg_conf, "
             "sum(CASE WHEN n.confidence < 0.5 THEN 1 ELSE 0 END) AS low_conf",
             eid=engagement_id,
@@ -7,6 +7,7 @@ a single-call combined assessment.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from typing import Any
@@ -265,8 +266,9 @@ async def evaluate_answer(
 ) -> dict[str, Any]:
     """Run all four evaluation dimensions and return a combined result.
 
-    Runs faithfulness, answer_relevance, and hallucination concurrently via
-    separate awaits, then appends the deterministic citation_accuracy check.
+    Runs faithfulness, answer_relevance, and hallucination concurrently
+    (pass an ``LLMExecutor`` to bound concurrency and cache judge calls),
+    then appends the deterministic citation_accuracy check.
 
     Args:
         llm: LLM provider instance.
@@ -286,9 +288,11 @@ async def evaluate_answer(
               four dimensions. None if every score is None.
           prompt_version (str): Version of the prompt templates used.
     """
-    faithfulness_result = await evaluate_faithfulness(llm, context, answer)
-    relevance_result = await evaluate_answer_relevance(llm, query, answer)
-    hallucination_result = await evaluate_hallucination(llm, context, answer)
+    faithfulness_result, relevance_result, hallucination_result = await asyncio.gather(
+        evaluate_faithfulness(llm, context, answer),
+        evaluate_answer_relevance(llm, query, answer),
+        evaluate_hallucination(llm, context, answer),
+    )
     citation_result = evaluate_citation_accuracy(answer, citations, context_by_source)
 
     scores = [
@@ -61,10 +61,7 @@ class EvidenceBatchWorker(TaskWorker):
         failed = 0
         results: list[dict[str, Any]] = []
 
-        # Lazy imports to avoid circular dependencies
-        from src.core.database import async_session_factory  # type: ignore[attr-defined]
-
-        async with async_session_factory() as session:
+        async with self.context.session_factory() as session:
             for i, item_id in enumerate(item_ids):
                 try:
                     result = await self._process_item(session, engagement_id, item_id)
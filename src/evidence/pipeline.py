@@ -16,7 +16,7 @@ import json
 import logging
 import uuid
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import aiofiles
 from neo4j import AsyncDriver
@@ -37,6 +37,9 @@ from src.evidence.parsers.base import ParseResult
 from src.evidence.parsers.factory import classify_by_extension, detect_format, parse_file
 from src.quality.instrumentation import pipeline_stage
 
+if TYPE_CHECKING:
+    from src.semantic.extraction_cache import ExtractionCache
+
 logger = logging.getLogger(__name__)
 
 # Default storage directory (relative to project root)
@@ -286,29 +289,39 @@ async def process_evidence(
 async def extract_fragment_entities(
     fragments: list[EvidenceFragment],
     engagement_id: str,
+    cache: ExtractionCache | None = None,
 ) -> list[dict[str, Any]]:
     """Run entity extraction on fragments and store entities as metadata.
 
     Args:
         fragments: List of EvidenceFragment records with content.
         engagement_id: The engagement ID for scoping.
+        cache: Optional persisted extraction cache. When given, all
+            fragments are looked up in one batch and only unseen text is
+            extracted; the results are reused by later graph builds and
+            POV runs over the same text.
 
     Returns:
         List of extraction results with entity data per fragment.
     """
-    from src.semantic.entity_extraction import extract_entities, resolve_entities
+    from src.semantic.entity_extraction import ExtractionResult, extract_entities, resolve_entities
 
     all_results: list[dict[str, Any]] = []
     all_entities = []
 
-    for fragment in fragments:
-        if not fragment.content:
-            continue
-
-        result = await extract_entities(
-            text=fragment.content,
-            fragment_id=str(fragment.id) if fragment.id else None,
-        )
+    with_content = [f for f in fragments if f.content]
+    cached_results: list[ExtractionResult] | None = None
+    if cache is not None:
+        cached_results = await cache.extract_many([(str(f.id) if f.id else None, f.content) for f in with_content])
+
+    for index, fragment in enumerate(with_content):
+        if cached_results is not None:
+            result = cached_results[index]
+        else:
+            result = await extract_entities(
+                text=fragment.content,
+                fragment_id=str(fragment.id) if fragment.id else None,
+            )
 
         if result.entities:
             # Store entities as fragment metadata
@@ -661,9 +674,13 @@ async def run_intelligence_pipeline(
     if not fragments:
         return results
 
+    from src.semantic.extraction_cache import ExtractionCache
+
     # Step 1: Entity extraction
     try:
-        extraction_results = await extract_fragment_entities(fragments, str(engagement_id))
+        extraction_results = await extract_fragment_entities(
+            fragments, str(engagement_id), cache=ExtractionCache(session)
+        )
         results["entities_extracted"] = sum(r["entity_count"] for r in extraction_results)
         results["entity_details"] = [
             {"type": str(e.entity_type), "name": e.name, "confidence": e.confidence}
@@ -50,10 +50,9 @@ class GdprErasureWorker(TaskWorker):
         # Step 1: Find eligible users
         from sqlalchemy import select
 
-        from src.core.database import async_session_factory  # type: ignore[attr-defined]
         from src.core.models import User
 
-        async with async_session_factory() as session:
+        async with self.context.session_factory() as session:
             from datetime import UTC, datetime
 
             now = datetime.now(UTC)
@@ -77,7 +76,7 @@ class GdprErasureWorker(TaskWorker):
         # Step 2: Anonymise in PostgreSQL
         from src.gdpr.erasure_job import run_erasure_job
 
-        async with async_session_factory() as session:
+        async with self.context.session_factory() as session:
             pg_count = await run_erasure_job(session)
         self.report_progress(2, _TOTAL_STEPS)
 
@@ -135,12 +134,7 @@ class GdprErasureWorker(TaskWorker):
             Number of keys deleted.
         """
         try:
-            from src.core.config import get_settings
-            from src.core.redis import create_redis_client
-
-            settings = get_settings()
-            client = create_redis_client(settings)
-
+            client = self.context.redis_client
             count = 0
             for uid in user_ids:
                 # Remove session and token cache keys
@@ -150,8 +144,6 @@ class GdprErasureWorker(TaskWorker):
                         keys.append(key)
                     if keys:
                         count += await client.delete(*keys)
-
-            await client.close()
             return count
         except (
             Exception
@@ -18,7 +18,7 @@ from typing import Any
 import httpx
 
 from src.integrations.base import BaseConnector, ConnectionConfig, ConnectorRegistry
-from src.integrations.utils import DEFAULT_TIMEOUT, paginate_offset, retry_request
+from src.integrations.utils import connector_client, paginate_offset, retry_request
 
 logger = logging.getLogger(__name__)
 
@@ -69,7 +69,7 @@ class ApexClearingConnector(BaseConnector):
 
         token_url = f"{self._base_url}/oauth/token" if self._base_url else "https://api.apexclearing.com/oauth/token"
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with connector_client("apex_clearing", self._base_url) as client:
                 response = await retry_request(
                     client,
                     "POST",
@@ -102,7 +102,7 @@ class ApexClearingConnector(BaseConnector):
             return False
 
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with connector_client("apex_clearing", self._base_url) as client:
                 response = await retry_request(
                     client,
                     "GET",
@@ -164,7 +164,7 @@ class ApexClearingConnector(BaseConnector):
             ]
 
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with connector_client("apex_clearing", self._base_url) as client:
                 for resource_type, url in sync_targets:
                     try:
                         async for page in paginate_offset(
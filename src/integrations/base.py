@@ -9,8 +9,13 @@ from __future__ import annotations
 import abc
 import enum
 import logging
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.integrations.connector_framework import SyncPage, TransformPipeline
+    from src.integrations.sync_checkpoint import WatermarkState
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +95,35 @@ class BaseConnector(abc.ABC):
         """
         return await self.sync_data(engagement_id, **kwargs)
 
+    async def stream_records(
+        self,
+        engagement_id: str,
+        resume: WatermarkState | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[SyncPage]:
+        """Stream source records page by page for a streaming sync.
+
+        Connectors that support ``run_streaming_sync`` override this as an
+        async generator that starts from ``resume`` when given and tags
+        each page with the position to resume after it.
+
+        Args:
+            engagement_id: The engagement to sync data for.
+            resume: Watermark left by an interrupted sync, if any.
+            **kwargs: Additional sync parameters.
+
+        Raises:
+            NotImplementedError: If the connector does not support streaming.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming sync")
+        yield  # pragma: no cover - makes this an async generator
+
+    def transform_pipeline(self) -> TransformPipeline:
+        """Return the pipeline mapping this connector's records to canonical events."""
+        from src.integrations.connector_framework import TransformPipeline
+
+        return TransformPipeline()
+
     async def disconnect(self) -> None:  # noqa: B027
         """Clean up connection resources."""
 
@@ -0,0 +1,161 @@
+"""Bulk persistence of connector events into ``canonical_activity_events``.
+
+Streaming connector syncs write events in chunks. On PostgreSQL with
+asyncpg each chunk is loaded with ``COPY`` into a session-local staging
+table and moved into ``canonical_activity_events`` with
+``INSERT ... SELECT ... ON CONFLICT DO NOTHING``. Other drivers fall back
+to a multi-row ``INSERT ... ON CONFLICT DO NOTHING``.
+
+Conflicts are detected on ``(engagement_id, source_system,
+source_event_key)``, so re-importing a chunk after a crash, or
+re-running a sync, never duplicates events.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import uuid
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.models.canonical_event import CanonicalActivityEvent as CanonicalEventRow
+from src.integrations.connector_framework import CanonicalActivityEvent
+
+logger = logging.getLogger(__name__)
+
+STAGE_TABLE = "_canonical_event_stage"
+INSERT_BATCH_SIZE = 1000
+
+_COLUMNS = (
+    "id",
+    "engagement_id",
+    "case_id",
+    "activity_name",
+    "timestamp_utc",
+    "source_system",
+    "performer_role_ref",
+    "raw_payload",
+    "source_event_key",
+)
+_CONFLICT_COLUMNS = ("engagement_id", "source_system", "source_event_key")
+
+
+def source_event_key(event: CanonicalActivityEvent) -> str:
+    """Return the event's dedup key: its source id, else a content hash."""
+    if event.event_key:
+        return event.event_key[:255]
+    content = "\x1f".join((event.case_id, event.activity_name, event.timestamp, event.actor, event.resource))
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def parse_event_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp; naive values are taken as UTC.
+
+    Raises:
+        ValueError: If ``value`` is not ISO 8601.
+    """
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _row(engagement_id: uuid.UUID, event: CanonicalActivityEvent) -> dict[str, Any]:
+    payload: dict[str, Any] = dict(event.extended_attributes)
+    if event.resource:
+        payload.setdefault("resource", event.resource)
+    return {
+        "id": uuid.uuid4(),
+        "engagement_id": engagement_id,
+        "case_id": event.case_id,
+        "activity_name": event.activity_name,
+        "timestamp_utc": parse_event_timestamp(event.timestamp),
+        "source_system": event.source_system,
+        "performer_role_ref": event.actor or None,
+        "raw_payload": payload or None,
+        "source_event_key": source_event_key(event),
+    }
+
+
+async def _copy_connection(session: AsyncSession) -> Any | None:
+    """Return the session's asyncpg connection, or None for other drivers."""
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    driver = raw.driver_connection
+    return driver if hasattr(driver, "copy_records_to_table") else None
+
+
+async def _copy_insert(session: AsyncSession, driver: Any, rows: list[dict[str, Any]]) -> int:
+    columns = ", ".join(_COLUMNS)
+    await driver.execute(
+        f"CREATE TEMP TABLE IF NOT EXISTS {STAGE_TABLE} "
+        "(LIKE canonical_activity_events INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+    )
+    await driver.copy_records_to_table(
+        STAGE_TABLE,
+        records=[
+            tuple(
+                json.dumps(row[c], default=str) if c == "raw_payload" and row[c] is not None else row[c]
+                for c in _COLUMNS
+            )
+            for row in rows
+        ],
+        columns=list(_COLUMNS),
+    )
+    result = await session.execute(
+        text(
+            f"INSERT INTO canonical_activity_events ({columns}) SELECT {columns} FROM {STAGE_TABLE} "
+            f"ON CONFLICT ({', '.join(_CONFLICT_COLUMNS)}) DO NOTHING"
+        )
+    )
+    await session.execute(text(f"TRUNCATE {STAGE_TABLE}"))
+    return result.rowcount
+
+
+async def _multirow_insert(session: AsyncSession, rows: list[dict[str, Any]]) -> int:
+    inserted = 0
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        stmt = (
+            pg_insert(CanonicalEventRow)
+            .values(rows[start : start + INSERT_BATCH_SIZE])
+            .on_conflict_do_nothing(index_elements=list(_CONFLICT_COLUMNS))
+        )
+        result = await session.execute(stmt)
+        inserted += result.rowcount
+    return inserted
+
+
+async def bulk_insert_canonical_events(
+    session: AsyncSession,
+    engagement_id: str | uuid.UUID,
+    events: Sequence[CanonicalActivityEvent],
+) -> int:
+    """Insert canonical events, skipping ones already imported.
+
+    The caller owns the transaction and commits.
+
+    Args:
+        session: Async database session.
+        engagement_id: Engagement the events belong to.
+        events: Events to insert.
+
+    Returns:
+        Number of events inserted; the rest were already present.
+
+    Raises:
+        ValueError: If an event timestamp is not ISO 8601.
+    """
+    if not events:
+        return 0
+    eid = engagement_id if isinstance(engagement_id, uuid.UUID) else uuid.UUID(engagement_id)
+    rows = [_row(eid, event) for event in events]
+
+    driver = await _copy_connection(session)
+    if driver is not None:
+        return await _copy_insert(session, driver, rows)
+    return await _multirow_insert(session, rows)
@@ -8,12 +8,16 @@ from __future__ import annotations
 
 import logging
 import uuid
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
 from src.integrations.base import BaseConnector, ConnectionConfig
-from src.integrations.utils import DEFAULT_TIMEOUT, paginate_offset, retry_request
+from src.integrations.celonis_ems import CelonisEventStep
+from src.integrations.connector_framework import SyncPage, TransformPipeline
+from src.integrations.sync_checkpoint import WatermarkState
+from src.integrations.utils import connector_client, paginate_offset, retry_request
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +45,7 @@ class CelonisConnector(BaseConnector):
             return False
 
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with connector_client("celonis", self._base_url) as client:
                 response = await retry_request(
                     client,
                     "GET",
@@ -81,7 +85,7 @@ class CelonisConnector(BaseConnector):
         persisted_items: list[dict[str, Any]] = []
 
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with connector_client("celonis", self._base_url) as client:
                 url = f"{self._base_url}/api/v1/data-pools/{data_pool_id}/events"
 
                 async for page in paginate_offset(
@@ -146,6 +150,52 @@ class CelonisConnector(BaseConnector):
             },
         }
 
+    async def stream_records(
+        self,
+        engagement_id: str,
+        resume: WatermarkState | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[SyncPage]:
+        """Stream a data pool's event log page by page.
+
+        Each page carries the offset of the next event, so a resumed sync
+        continues from ``resume.last_offset``.
+
+        Args:
+            engagement_id: The engagement being synced.
+            resume: Watermark left by an interrupted sync, if any.
+            **kwargs: data_pool_id (required), page_size.
+
+        Raises:
+            ValueError: If the connector or data_pool_id is not configured.
+        """
+        if not self._base_url or not self._api_key:
+            raise ValueError("Celonis not configured")
+        data_pool_id = kwargs.get("data_pool_id")
+        if not data_pool_id:
+            raise ValueError("data_pool_id is required")
+
+        offset = resume.last_offset if resume and resume.last_offset is not None else 0
+        async with connector_client("celonis", self._base_url) as client:
+            async for page in paginate_offset(
+                client,
+                f"{self._base_url}/api/v1/data-pools/{data_pool_id}/events",
+                headers=self._headers(),
+                results_key="data",
+                total_key="totalCount",
+                offset_param="offset",
+                limit_param="limit",
+                page_size=kwargs.get("page_size", 500),
+                start_offset=offset,
+            ):
+                offset += len(page)
+                timestamps = [t for record in page if (t := record.get("timestamp", record.get("eventTime")))]
+                yield SyncPage(records=page, offset=offset, timestamp=max(timestamps, default=None))
+
+    def transform_pipeline(self) -> TransformPipeline:
+        """Map Celonis event records to canonical events keyed by event id."""
+        return TransformPipeline([CelonisEventStep(source="celonis")])
+
     async def get_schema(self) -> list[str]:
         """Return available source fields from Celonis."""
         return [
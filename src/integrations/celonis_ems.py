@@ -5,6 +5,8 @@ Maps Celonis EMS data to KMFlow's knowledge graph:
 - Process model activities → ProcessElement nodes with PRECEDES edges
 - Conformance deviations → ConflictObject candidates (SEQUENCE_MISMATCH, EXISTENCE_MISMATCH)
 - Partial import with checkpoint support for API unavailability
+- CelonisEventStep: transform step for streaming syncs, keyed on the
+  Celonis event id so re-imports are deduplicated in the database
 
 Celonis conformance score mapping to KMFlow severity:
   score < 0.6 → HIGH (0.8), 0.6–0.8 → MEDIUM (0.5), > 0.8 → LOW (0.2)
@@ -16,6 +18,8 @@ import logging
 from dataclasses import dataclass, field
 from typing import Any
 
+from src.integrations.connector_framework import TransformStep
+
 logger = logging.getLogger(__name__)
 
 # Celonis conformance score thresholds for severity mapping
@@ -296,6 +300,26 @@ class CelonisEventMapper:
         }
 
 
+class CelonisEventStep(TransformStep):
+    """Transform step mapping raw Celonis event records to canonical dicts.
+
+    Used by streaming syncs, where dedup happens on the persisted
+    ``event_key`` instead of an in-memory set of seen event ids.
+    Events without a resource are attributed to ``unknown``.
+    """
+
+    def __init__(self, source: str = "celonis_ems") -> None:
+        super().__init__("celonis_event")
+        self._mapper = CelonisEventMapper("", source)
+
+    def transform(self, record: dict[str, Any]) -> dict[str, Any]:
+        event = CelonisEvent.from_api_response(record)
+        canonical = self._mapper.to_canonical(event)
+        canonical["actor"] = event.resource or "unknown"
+        canonical["event_key"] = event.event_id
+        return canonical
+
+
 class CelonisProcessModelMapper:
     """Maps Celonis process model to KMFlow graph operations."""
 
@@ -19,7 +19,7 @@ from typing import Any
 import httpx
 
 from src.integrations.base import BaseConnector, ConnectionConfig, ConnectorRegistry
-from src.integrations.utils import DEFAULT_TIMEOUT, paginate_offset, retry_request
+from src.integrations.utils import connector_client, paginate_offset, retry_request
 
 logger = logging.getLogger(__name__)
 
@@ -71,7 +71,7 @@ class CharlesRiverConnector(BaseConnector):
 
         token_url = f"{self._base_url}/oauth2/token" if self._base_url else "https://api.charlesriver.com/oauth2/token"
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with connector_client("charles_river", self._base_url) as client:
                 response = await retry_request(
                     client,
                     "POST",
@@ -104,7 +104,7 @@ class CharlesRiverConnector(BaseConnector):
             return False
 
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with connector_client("charles_river", self._base_url) as client:
                 response = await retry_request(
                     client,
                     "GET",
@@ -168,7 +168,7 @@ class CharlesRiverConnector(BaseConnector):
             ]
 
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with connector_client("charles_river", self._base_url) as client:
                 for resource_type, url in sync_targets:
                     try:
                         async for page in paginate_offset(
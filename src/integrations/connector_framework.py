@@ -3,7 +3,9 @@
 Provides reusable infrastructure for all integration connectors:
 - CredentialProvider: abstraction for credential sources (env vars, secrets manager)
 - @with_retry: decorator with exponential backoff and jitter
-- TransformPipeline: ordered transform steps for data normalization
+- TransformPipeline: ordered transform steps for data normalization,
+  applied per record or streamed page by page
+- SyncPage: a page of source records plus the position to resume after it
 - Rate limit header parsing for Retry-After and X-RateLimit-Reset
 - Custom exceptions (AuthenticationError, RetryExhaustedError, RateLimitError)
 
@@ -25,7 +27,7 @@ import logging
 import os
 import random
 import time
-from collections.abc import Callable
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from functools import wraps
 from typing import Any
@@ -290,6 +292,7 @@ class CanonicalActivityEvent:
     case_id: str = ""
     resource: str = ""
     extended_attributes: dict[str, Any] = field(default_factory=dict)
+    event_key: str = ""
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -300,9 +303,30 @@ class CanonicalActivityEvent:
             "case_id": self.case_id,
             "resource": self.resource,
             "extended_attributes": self.extended_attributes,
+            "event_key": self.event_key,
         }
 
 
+@dataclass(frozen=True)
+class SyncPage:
+    """A page of source records and the sync position after it.
+
+    Streaming syncs persist the position once the page's events are
+    committed, so an interrupted sync resumes after the last committed page.
+
+    Attributes:
+        records: Raw source records.
+        offset: Offset of the next record, for offset-paginated sources.
+        cursor: Next-page cursor or URL, for cursor-paginated sources.
+        timestamp: Latest source timestamp in the page.
+    """
+
+    records: list[dict[str, Any]]
+    offset: int | None = None
+    cursor: str | None = None
+    timestamp: str | None = None
+
+
 class TransformStep:
     """A single step in a transform pipeline.
 
@@ -391,25 +415,49 @@ class TransformPipeline:
         activity_name, timestamp, actor, source_system.
         Missing required fields raise ValueError.
         """
-        transformed = self.transform_batch(records)
-        events = []
-
-        for i, record in enumerate(transformed):
-            missing = [f for f in ("activity_name", "timestamp", "actor", "source_system") if not record.get(f)]
-            if missing:
-                msg = f"Record {i}: missing required fields: {', '.join(missing)}"
-                raise ValueError(msg)
-
-            events.append(
-                CanonicalActivityEvent(
-                    activity_name=record["activity_name"],
-                    timestamp=record["timestamp"],
-                    actor=record["actor"],
-                    source_system=record["source_system"],
-                    case_id=record.get("case_id", ""),
-                    resource=record.get("resource", ""),
-                    extended_attributes=record.get("extended_attributes", {}),
-                )
-            )
+        return list(self.iter_canonical_events(records))
+
+    def iter_canonical_events(self, records: Iterable[dict[str, Any]]) -> Iterator[CanonicalActivityEvent]:
+        """Lazily transform records into CanonicalActivityEvent objects.
 
-        return events
+        Raises:
+            ValueError: If a transformed record lacks a required field.
+        """
+        for i, record in enumerate(records):
+            yield _canonical_event(i, self.transform_record(record))
+
+    async def stream_canonical_events(
+        self,
+        pages: AsyncIterable[SyncPage],
+    ) -> AsyncIterator[tuple[SyncPage, list[CanonicalActivityEvent]]]:
+        """Transform a stream of source pages, one page at a time.
+
+        Only the current page is held in memory, so arbitrarily large
+        imports run in constant memory.
+
+        Yields:
+            Each source page with its canonical events.
+
+        Raises:
+            ValueError: If a transformed record lacks a required field.
+        """
+        async for page in pages:
+            yield page, list(self.iter_canonical_events(page.records))
+
+
+def _canonical_event(index: int, record: dict[str, Any]) -> CanonicalActivityEvent:
+    missing = [f for f in ("activity_name", "timestamp", "actor", "source_system") if not record.get(f)]
+    if missing:
+        msg = f"Record {index}: missing required fields: {', '.join(missing)}"
+        raise ValueError(msg)
+
+    return CanonicalActivityEvent(
+        activity_name=record["activity_name"],
+        timestamp=record["timestamp"],
+        actor=record["actor"],
+        source_system=record["source_system"],
+        case_id=record.get("case_id", ""),
+        resource=record.get("resource", ""),
+        extended_attributes=record.get("extended_attributes", {}),
+        event_key=str(record.get("event_key") or ""),
+    )
@@ -14,7 +14,7 @@ from typing import Any
 import httpx
 
 from src.integrations.base import BaseConnector, ConnectionConfig
-from src.integrations.utils import DEFAULT_TIMEOUT, paginate_cursor, retry_request
+from src.integrations.utils import connector_client, paginate_cursor, retry_request
 
 logger = logging.getLogger(__name__)
 
@@ -63,7 +63,7 @@ class SalesforceConnector(BaseConnector):
 
         try:
             login_url = self._instance_url or "https://login.salesforce.com"
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with connector_client("salesforce", self._instance_url) as client:
                 response = await retry_request(
                     client,
                     "POST",
@@ -94,7 +94,7 @@ class SalesforceConnector(BaseConnector):
             return False
 
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with connector_client("salesforce", self._instance_url) as client:
                 response = await retry_request(
                     client,
                     "GET",
@@ -132,7 +132,7 @@ class SalesforceConnector(BaseConnector):
         errors: list[str] = []
 
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with connector_client("salesforce", self._instance_url) as client:
                 url = f"{self._instance_url}/services/data/{self._api_version}/query/"
 
                 async for page in paginate_cursor(
@@ -7,12 +7,15 @@ data, transaction logs, and organizational structures.
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
 from src.integrations.base import BaseConnector, ConnectionConfig
-from src.integrations.utils import DEFAULT_TIMEOUT, paginate_cursor, retry_request
+from src.integrations.connector_framework import FieldMappingStep, SyncPage, TransformPipeline
+from src.integrations.sync_checkpoint import WatermarkState
+from src.integrations.utils import connector_client, paginate_cursor, paginate_cursor_pages, retry_request
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +33,7 @@ class SAPConnector(BaseConnector):
         self._api_key = config.api_key or config.extra.get("api_key", "")
         self._client = config.extra.get("client", "100")
         self._system_id = config.extra.get("system_id", "")
+        self._field_map: dict[str, str] = config.extra.get("field_map", {})
 
     def _auth(self) -> httpx.BasicAuth | None:
         """Get Basic authentication for SAP OData."""
@@ -56,12 +60,13 @@ class SAPConnector(BaseConnector):
             return False
 
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, auth=self._auth()) as client:
+            async with connector_client("sap", self._base_url) as client:
                 response = await retry_request(
                     client,
                     "GET",
                     f"{self._base_url}/sap/opu/odata/sap/API_BUSINESS_PARTNER/",
                     headers=self._headers(),
+                    auth=self._auth(),
                     max_retries=1,
                 )
                 return response.status_code == 200
@@ -95,7 +100,7 @@ class SAPConnector(BaseConnector):
             if filter_query:
                 params["$filter"] = filter_query
 
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, auth=self._auth()) as client:
+            async with connector_client("sap", self._base_url) as client:
                 url = f"{self._base_url}/sap/opu/odata/sap/{entity_set}"
 
                 async for page in paginate_cursor(
@@ -103,6 +108,7 @@ class SAPConnector(BaseConnector):
                     url,
                     params=params,
                     headers=self._headers(),
+                    auth=self._auth(),
                     results_key="d",
                     next_url_key="__next",
                 ):
@@ -127,6 +133,56 @@ class SAPConnector(BaseConnector):
             },
         }
 
+    async def stream_records(
+        self,
+        engagement_id: str,
+        resume: WatermarkState | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[SyncPage]:
+        """Stream an OData entity set page by page.
+
+        Each page carries the ``__next`` link, so a resumed sync continues
+        from ``resume.last_cursor``.
+
+        Args:
+            engagement_id: The engagement being synced.
+            resume: Watermark left by an interrupted sync, if any.
+            **kwargs: entity_set, select_fields, filter_query.
+
+        Raises:
+            ValueError: If the connector is not configured.
+        """
+        if not self._base_url:
+            raise ValueError("SAP not configured")
+
+        url = f"{self._base_url}/sap/opu/odata/sap/{kwargs.get('entity_set', 'ZProcessLogs')}"
+        params: dict[str, str] | None = {"$format": "json", "$top": "500"}
+        if kwargs.get("select_fields"):
+            params["$select"] = kwargs["select_fields"]
+        if kwargs.get("filter_query"):
+            params["$filter"] = kwargs["filter_query"]
+        if resume and resume.last_cursor:
+            # The next link already carries the query options.
+            url, params = resume.last_cursor, None
+
+        async with connector_client("sap", self._base_url) as client:
+            async for page, next_url in paginate_cursor_pages(
+                client,
+                url,
+                params=params,
+                headers=self._headers(),
+                auth=self._auth(),
+                results_key="d",
+                next_url_key="__next",
+            ):
+                # SAP OData wraps results in d.results
+                results = page if isinstance(page, list) else page.get("results", [page])
+                yield SyncPage(records=results, cursor=next_url)
+
+    def transform_pipeline(self) -> TransformPipeline:
+        """Map OData fields to canonical event fields via the configured ``field_map``."""
+        return TransformPipeline([FieldMappingStep(self._field_map, source_system="sap")])
+
     async def get_schema(self) -> list[str]:
         """Return available fields."""
         return ["MANDT", "BELNR", "BUKRS", "GJAHR", "ERDAT", "ERNAM", "AEDAT"]
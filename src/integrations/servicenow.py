@@ -13,7 +13,7 @@ from typing import Any
 import httpx
 
 from src.integrations.base import BaseConnector, ConnectionConfig
-from src.integrations.utils import DEFAULT_TIMEOUT, paginate_offset, retry_request
+from src.integrations.utils import connector_client, paginate_offset, retry_request
 
 logger = logging.getLogger(__name__)
 
@@ -57,13 +57,14 @@ class ServiceNowConnector(BaseConnector):
             return False
 
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, auth=self._auth()) as client:
+            async with connector_client("servicenow", self._base_url) as client:
                 response = await retry_request(
                     client,
                     "GET",
                     f"{self._base_url}/api/now/table/sys_properties",
                     headers=self._headers(),
                     params={"sysparm_limit": "1"},
+                    auth=self._auth(),
                     max_retries=1,
                 )
                 return response.status_code == 200
@@ -102,7 +103,7 @@ class ServiceNowConnector(BaseConnector):
             if fields:
                 params["sysparm_fields"] = fields if isinstance(fields, str) else ",".join(fields)
 
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, auth=self._auth()) as client:
+            async with connector_client("servicenow", self._base_url) as client:
                 url = f"{self._base_url}/api/now/table/{table_name}"
 
                 async for page in paginate_offset(
@@ -110,6 +111,7 @@ class ServiceNowConnector(BaseConnector):
                     url,
                     params=params,
                     headers=self._headers(),
+                    auth=self._auth(),
                     results_key="result",
                     total_key=None,  # ServiceNow uses X-Total-Count header
                     offset_param="sysparm_offset",
@@ -13,7 +13,7 @@ from typing import Any
 import httpx
 
 from src.integrations.base import BaseConnector, ConnectionConfig
-from src.integrations.utils import DEFAULT_TIMEOUT, paginate_offset, retry_request
+from src.integrations.utils import connector_client, paginate_offset, retry_request
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +42,7 @@ class SorocoConnector(BaseConnector):
             return False
 
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with connector_client("soroco", self._base_url) as client:
                 response = await retry_request(
                     client,
                     "GET",
@@ -79,7 +79,7 @@ class SorocoConnector(BaseConnector):
         persisted_items: list[dict[str, Any]] = []
 
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with connector_client("soroco", self._base_url) as client:
                 url = f"{self._base_url}/api/workgraph/projects/{project_id}/tasks"
 
                 async for page in paginate_offset(
@@ -4,19 +4,46 @@ Manages per-connector, per-engagement sync checkpoints for tracking
 the last successful sync timestamp. Provides sync log tracking with
 counts of new, updated, and skipped records.
 
-Checkpoint storage is abstracted via a backend dict (in production,
-backed by Redis with key pattern ``sync:checkpoint:{connector_type}:{engagement_id}``).
+``run_streaming_sync`` streams a connector's pages through its transform
+pipeline into ``canonical_activity_events`` in committed chunks,
+advancing the durable watermark with each chunk so a failed import
+resumes after the last committed page.
+
+``SyncCheckpointStore`` keeps checkpoints in a backend dict (key pattern
+``sync:checkpoint:{connector_type}:{engagement_id}``) and suits tests and
+single-process use. ``DatabaseSyncCheckpointStore`` persists them in the
+``sync_checkpoints`` table, shared by all API replicas: a per
+(connector, engagement) lease lets one replica run a sync at a time, and
+watermarks advance by compare-and-set in the same transaction as the
+events they cover, so a restarted or taken-over sync never redoes
+committed pages.
 """
 
 from __future__ import annotations
 
 import logging
+import os
+import socket
+import uuid
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
-from typing import Any
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.exc import IntegrityError
+
+from src.core.models.sync_checkpoint import SyncCheckpoint
+from src.integrations.canonical_sink import bulk_insert_canonical_events
+from src.integrations.connector_framework import CanonicalActivityEvent, SyncPage, TransformPipeline
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SYNC_CHUNK_SIZE = 5000
+DEFAULT_SYNC_LEASE_SECONDS = 300.0
+
 
 @dataclass
 class SyncLog:
@@ -69,6 +96,7 @@ class WatermarkState:
     last_cursor: str | None = None
     records_since_reset: int = 0
     updated_at: str = ""
+    version: int = 0
 
     def __post_init__(self) -> None:
         if not self.updated_at:
@@ -83,14 +111,16 @@ class WatermarkState:
             "last_cursor": self.last_cursor,
             "records_since_reset": self.records_since_reset,
             "updated_at": self.updated_at,
+            "version": self.version,
         }
 
 
 class SyncCheckpointStore:
     """Store for sync checkpoints (last_sync_at per connector+engagement).
 
-    In production this would be backed by Redis. The in-memory dict
-    mirrors the Redis key pattern ``sync:checkpoint:{connector_type}:{engagement_id}``.
+    Process-local; use ``DatabaseSyncCheckpointStore`` when syncs must
+    survive restarts or run on several replicas. The backend dict uses the
+    key pattern ``sync:checkpoint:{connector_type}:{engagement_id}``.
     """
 
     def __init__(self, backend: dict[str, str] | None = None) -> None:
@@ -187,6 +217,7 @@ class SyncCheckpointStore:
             last_offset=offset if offset is not None else (existing.last_offset if existing else None),
             last_cursor=cursor or (existing.last_cursor if existing else None),
             records_since_reset=(existing.records_since_reset if existing else 0) + records_processed,
+            version=(existing.version if existing else 0) + 1,
         )
 
         key = self._watermark_key(connector_type, engagement_id)
@@ -276,3 +307,321 @@ async def run_incremental_sync_async(
 
     log.completed_at = _now_iso()
     return log
+
+
+class WatermarkConflictError(RuntimeError):
+    """Raised when a watermark advance loses its compare-and-set or its lease."""
+
+
+def default_lease_owner() -> str:
+    """Return a lease owner id unique to this process and call."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(tz=UTC)
+
+
+class DatabaseSyncCheckpointStore:
+    """Sync checkpoint store backed by the ``sync_checkpoints`` table.
+
+    Every replica sees the same checkpoints and watermarks. A sync first
+    takes the (connector, engagement) lease; each watermark advance is a
+    compare-and-set on ``version`` that also requires the caller to still
+    hold the lease and extends it, and is executed in the caller's session
+    so it commits or rolls back together with the chunk it covers.
+
+    Args:
+        session_factory: Session factory for the store's own transactions.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self.session_factory = session_factory
+
+    @staticmethod
+    def _where(connector_type: str, engagement_id: str) -> tuple[Any, Any]:
+        eid = engagement_id if isinstance(engagement_id, uuid.UUID) else uuid.UUID(engagement_id)
+        return SyncCheckpoint.connector_type == connector_type, SyncCheckpoint.engagement_id == eid
+
+    async def _ensure_row(self, session: AsyncSession, connector_type: str, engagement_id: str) -> None:
+        exists = await session.execute(
+            select(SyncCheckpoint.version).where(*self._where(connector_type, engagement_id))
+        )
+        if exists.first() is not None:
+            return
+        try:
+            async with session.begin_nested():
+                session.add(SyncCheckpoint(connector_type=connector_type, engagement_id=uuid.UUID(str(engagement_id))))
+        except IntegrityError:
+            pass  # Created concurrently by another replica.
+
+    async def _update(self, connector_type: str, engagement_id: str, *conditions: Any, **values: Any) -> bool:
+        async with self.session_factory() as session:
+            await self._ensure_row(session, connector_type, engagement_id)
+            result = await session.execute(
+                update(SyncCheckpoint).where(*self._where(connector_type, engagement_id), *conditions).values(**values)
+            )
+            await session.commit()
+        return result.rowcount == 1
+
+    async def get_checkpoint(self, connector_type: str, engagement_id: str) -> str | None:
+        """Get the last successful sync timestamp, or None if never synced."""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(SyncCheckpoint.last_sync_at).where(*self._where(connector_type, engagement_id))
+            )
+            return result.scalar_one_or_none()
+
+    async def set_checkpoint(self, connector_type: str, engagement_id: str, timestamp: str) -> None:
+        """Set the sync checkpoint to the given timestamp."""
+        await self._update(connector_type, engagement_id, last_sync_at=timestamp)
+
+    async def get_watermark(self, connector_type: str, engagement_id: str) -> WatermarkState | None:
+        """Get the watermark state, or None if the pair has no row yet."""
+        async with self.session_factory() as session:
+            result = await session.execute(select(SyncCheckpoint).where(*self._where(connector_type, engagement_id)))
+            row = result.scalar_one_or_none()
+        if row is None:
+            return None
+        return WatermarkState(
+            connector_type=connector_type,
+            engagement_id=engagement_id,
+            last_timestamp=row.last_timestamp,
+            last_offset=row.last_offset,
+            last_cursor=row.last_cursor,
+            records_since_reset=row.records_since_reset,
+            updated_at=row.updated_at.isoformat() if row.updated_at else "",
+            version=row.version,
+        )
+
+    async def advance_watermark(
+        self,
+        session: AsyncSession,
+        connector_type: str,
+        engagement_id: str,
+        *,
+        owner: str,
+        expected_version: int,
+        timestamp: str | None = None,
+        offset: int | None = None,
+        cursor: str | None = None,
+        records_processed: int = 0,
+        lease_seconds: float = DEFAULT_SYNC_LEASE_SECONDS,
+    ) -> int:
+        """Compare-and-set the watermark inside the caller's transaction.
+
+        Positions left as None keep their stored value. The caller commits.
+
+        Returns:
+            The new watermark version.
+
+        Raises:
+            WatermarkConflictError: If the version moved on or ``owner`` no
+                longer holds the lease.
+        """
+        values: dict[str, Any] = {
+            "version": expected_version + 1,
+            "records_since_reset": SyncCheckpoint.records_since_reset + records_processed,
+            "lease_expires_at": _utcnow() + timedelta(seconds=lease_seconds),
+        }
+        if timestamp is not None:
+            values["last_timestamp"] = timestamp
+        if offset is not None:
+            values["last_offset"] = offset
+        if cursor is not None:
+            values["last_cursor"] = cursor
+        result = await session.execute(
+            update(SyncCheckpoint)
+            .where(
+                *self._where(connector_type, engagement_id),
+                SyncCheckpoint.version == expected_version,
+                SyncCheckpoint.lease_owner == owner,
+            )
+            .values(**values)
+        )
+        if result.rowcount != 1:
+            raise WatermarkConflictError(
+                f"Watermark for {connector_type}/{engagement_id} moved past version {expected_version} "
+                f"or lease lost by {owner}"
+            )
+        return expected_version + 1
+
+    async def reset_watermark(self, connector_type: str, engagement_id: str) -> None:
+        """Reset watermark state (forces full re-sync)."""
+        await self._update(
+            connector_type,
+            engagement_id,
+            last_timestamp=None,
+            last_offset=None,
+            last_cursor=None,
+            records_since_reset=0,
+            version=SyncCheckpoint.version + 1,
+        )
+
+    async def acquire_lease(
+        self,
+        connector_type: str,
+        engagement_id: str,
+        owner: str,
+        lease_seconds: float = DEFAULT_SYNC_LEASE_SECONDS,
+    ) -> bool:
+        """Take (or renew) the sync lease unless another owner holds it.
+
+        Returns:
+            True if ``owner`` now holds the lease.
+        """
+        now = _utcnow()
+        return await self._update(
+            connector_type,
+            engagement_id,
+            or_(
+                SyncCheckpoint.lease_owner.is_(None),
+                SyncCheckpoint.lease_expires_at < now,
+                SyncCheckpoint.lease_owner == owner,
+            ),
+            lease_owner=owner,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+        )
+
+    async def release_lease(self, connector_type: str, engagement_id: str, owner: str) -> None:
+        """Release the lease if ``owner`` still holds it."""
+        await self._update(
+            connector_type,
+            engagement_id,
+            SyncCheckpoint.lease_owner == owner,
+            lease_owner=None,
+            lease_expires_at=None,
+        )
+
+    async def complete_sync(self, connector_type: str, engagement_id: str, owner: str, timestamp: str) -> bool:
+        """Record a finished sync: set the checkpoint, clear the watermark, release the lease.
+
+        Returns:
+            False if ``owner`` had lost the lease, in which case nothing changes.
+        """
+        return await self._update(
+            connector_type,
+            engagement_id,
+            SyncCheckpoint.lease_owner == owner,
+            last_sync_at=timestamp,
+            last_timestamp=None,
+            last_offset=None,
+            last_cursor=None,
+            records_since_reset=0,
+            version=SyncCheckpoint.version + 1,
+            lease_owner=None,
+            lease_expires_at=None,
+        )
+
+
+async def run_streaming_sync(
+    connector: Any,  # Any because: accepts any connector implementing stream_records()
+    connector_type: str,
+    engagement_id: str,
+    checkpoint_store: DatabaseSyncCheckpointStore,
+    *,
+    pipeline: TransformPipeline | None = None,
+    chunk_size: int = DEFAULT_SYNC_CHUNK_SIZE,
+    lease_seconds: float = DEFAULT_SYNC_LEASE_SECONDS,
+    owner: str | None = None,
+    **kwargs: Any,
+) -> SyncLog:
+    """Stream a connector sync into canonical events in committed chunks.
+
+    1. Takes the (connector, engagement) lease; if another replica holds
+       it, returns a SyncLog with an error and does nothing.
+    2. Reads the watermark left by an interrupted run, if any.
+    3. Streams pages from connector.stream_records(engagement_id, resume=watermark, **kwargs)
+       through the transform pipeline.
+    4. Every ``chunk_size`` events (rounded up to a page boundary), bulk
+       inserts the chunk and advances the watermark to its last page in
+       one transaction, which also renews the lease.
+    5. On success, sets the checkpoint to the sync start time and clears
+       the watermark; on failure the watermark stays at the last
+       committed chunk so the next run resumes there. Either way the
+       lease is released.
+
+    Only one chunk is held in memory at a time. Events already imported
+    are skipped by the dedup key.
+
+    Args:
+        connector: A BaseConnector implementing stream_records().
+        connector_type: Identifier (e.g., "celonis").
+        engagement_id: The engagement being synced.
+        checkpoint_store: Shared store for the lease, watermark and checkpoint.
+        pipeline: Transform pipeline; defaults to connector.transform_pipeline().
+        chunk_size: Events per committed chunk.
+        lease_seconds: Lease lifetime; renewed with every chunk.
+        owner: Lease owner id; defaults to a fresh per-process id.
+        **kwargs: Additional arguments passed to stream_records.
+
+    Returns:
+        SyncLog with inserted (new) and duplicate (skipped) counts.
+    """
+    start_time = _now_iso()
+    log = SyncLog(connector_type=connector_type, engagement_id=engagement_id, started_at=start_time)
+    owner = owner or default_lease_owner()
+    if not await checkpoint_store.acquire_lease(connector_type, engagement_id, owner, lease_seconds):
+        log.errors.append(f"Sync for {connector_type}/{engagement_id} is already running elsewhere")
+        log.completed_at = _now_iso()
+        return log
+
+    pipeline = pipeline or connector.transform_pipeline()
+    chunk: list[CanonicalActivityEvent] = []
+    last_page: SyncPage | None = None
+    pending_records = 0
+
+    async def flush() -> None:
+        nonlocal pending_records, version
+        async with checkpoint_store.session_factory() as session:
+            inserted = await bulk_insert_canonical_events(session, engagement_id, chunk)
+            version = await checkpoint_store.advance_watermark(
+                session,
+                connector_type,
+                engagement_id,
+                owner=owner,
+                expected_version=version,
+                timestamp=last_page.timestamp if last_page else None,
+                offset=last_page.offset if last_page else None,
+                cursor=last_page.cursor if last_page else None,
+                records_processed=pending_records,
+                lease_seconds=lease_seconds,
+            )
+            await session.commit()
+        log.new_records += inserted
+        log.skipped_records += len(chunk) - inserted
+        chunk.clear()
+        pending_records = 0
+
+    try:
+        resume = await checkpoint_store.get_watermark(connector_type, engagement_id)
+        version = resume.version if resume else 0
+        pages = connector.stream_records(engagement_id, resume=resume, **kwargs)
+        async for page, events in pipeline.stream_canonical_events(pages):
+            chunk.extend(events)
+            last_page = page
+            pending_records += len(page.records)
+            if len(chunk) >= chunk_size:
+                await flush()
+        if chunk or pending_records:
+            await flush()
+
+        if not await checkpoint_store.complete_sync(connector_type, engagement_id, owner, start_time):
+            raise WatermarkConflictError(f"Lease for {connector_type}/{engagement_id} lost before completion")
+
+    except Exception as exc:  # Intentionally broad: any sync failure must be recorded in the log, not propagated
+        log.errors.append(str(exc))
+        logger.error(
+            "Streaming sync failed for %s/%s after %d events: %s",
+            connector_type,
+            engagement_id,
+            log.total_processed,
+            exc,
+        )
+        try:
+            await checkpoint_store.release_lease(connector_type, engagement_id, owner)
+        except Exception:  # Intentionally broad: the lease expires on its own
+            logger.warning("Could not release sync lease %s/%s", connector_type, engagement_id, exc_info=True)
+
+    log.completed_at = _now_iso()
+    return log
@@ -1,22 +1,211 @@
 """Shared utilities for integration connectors.
 
-Provides retry logic with exponential backoff and async pagination
-helpers used by all connector implementations.
+Provides retry logic with exponential backoff, async pagination helpers
+that prefetch pages concurrently, and a pooled, rate-limited HTTP client
+per connector, used by all connector implementations.
 """
 
 from __future__ import annotations
 
 import asyncio
+import collections
+import importlib.util
+import itertools
 import logging
-from collections.abc import AsyncIterator
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
 
+from src.integrations.connector_framework import parse_rate_limit_headers
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_RETRY_DELAYS = (1.0, 2.0, 4.0)
 DEFAULT_TIMEOUT = 30.0
+DEFAULT_PREFETCH_PAGES = 4
+DEFAULT_REQUESTS_PER_SECOND = 50.0
+DEFAULT_BURST = 50
+DEFAULT_MAX_CONNECTIONS = 20
+MIN_REQUESTS_PER_SECOND = 0.1
+MAX_RETRY_AFTER = 300.0
+
+_RATE_LIMITED_STATUSES = (429, 503)
+
+
+# -- Rate limiting ---
+
+
+class TokenBucket:
+    """Async token-bucket limiter shared by every request of one connector.
+
+    Tokens refill at ``rate`` per second up to ``burst``; each request
+    takes one. ``observe`` adapts the bucket to the API's rate-limit
+    headers: a 429/503 with ``Retry-After`` (or an exhausted
+    ``X-RateLimit-Remaining``) pauses all callers until the reset, and a
+    known remaining quota lowers the rate so it lasts until the reset.
+
+    Args:
+        rate: Maximum requests per second.
+        burst: Maximum tokens held, i.e. requests allowed back to back.
+    """
+
+    def __init__(self, rate: float = DEFAULT_REQUESTS_PER_SECOND, burst: int = DEFAULT_BURST) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._resume_at:
+                    await asyncio.sleep(self._resume_at - now)
+                    continue
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for ``seconds`` (capped at ``MAX_RETRY_AFTER``)."""
+        self._resume_at = max(self._resume_at, time.monotonic() + min(seconds, MAX_RETRY_AFTER))
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adapt the limiter to a response's status and rate-limit headers."""
+        wait = parse_rate_limit_headers(dict(headers))
+        remaining = _header_float(headers, "x-ratelimit-remaining")
+
+        if wait is not None and (status_code in _RATE_LIMITED_STATUSES or remaining == 0):
+            self.pause(wait)
+        elif wait and remaining is not None:
+            self.rate = min(self.max_rate, max(remaining / wait, MIN_REQUESTS_PER_SECOND))
+        else:
+            self.rate = self.max_rate
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    value = next((v for k, v in headers.items() if k.lower() == name), None)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """httpx transport that routes every request through a ``TokenBucket``."""
+
+    def __init__(self, limiter: TokenBucket, transport: httpx.AsyncBaseTransport) -> None:
+        self.limiter = limiter
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self.limiter.acquire()
+        response = await self._transport.handle_async_request(request)
+        self.limiter.observe(response.status_code, response.headers)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# -- Pooled clients ---
+
+
+def http2_available() -> bool:
+    """Return True if the optional ``h2`` package for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_connector_client(
+    *,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    burst: int = DEFAULT_BURST,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    timeout: float = DEFAULT_TIMEOUT,
+    http2: bool | None = None,
+) -> httpx.AsyncClient:
+    """Create a keep-alive, rate-limited client for one connector.
+
+    HTTP/2 is used when ``http2`` is True, or when it is None and the
+    optional ``h2`` package is installed (``pip install 'kmflow[http2]'``).
+    """
+    if http2 is None:
+        http2 = http2_available()
+    transport = httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+    )
+    return httpx.AsyncClient(
+        timeout=timeout,
+        transport=RateLimitedTransport(TokenBucket(requests_per_second, burst), transport),
+    )
+
+
+_connector_clients: dict[tuple[str, str], tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+def get_connector_client(connector: str, base_url: str, **client_kwargs: Any) -> httpx.AsyncClient:
+    """Return the process-wide client for a connector and base URL.
+
+    The client, its connection pool and its rate limiter are shared by
+    every sync and connectivity check against the same API. Clients are
+    bound to the event loop that created them; a new one is created when
+    called from another loop.
+
+    Args:
+        connector: Connector name, e.g. ``"servicenow"``.
+        base_url: API base URL.
+        **client_kwargs: Passed to ``create_connector_client`` when a new
+            client is created.
+    """
+    loop = asyncio.get_running_loop()
+    key = (connector, base_url)
+    entry = _connector_clients.get(key)
+    if entry is None or entry[0] is not loop or entry[1].is_closed:
+        entry = (loop, create_connector_client(**client_kwargs))
+        _connector_clients[key] = entry
+    return entry[1]
+
+
+@asynccontextmanager
+async def connector_client(connector: str, base_url: str, **client_kwargs: Any) -> AsyncIterator[httpx.AsyncClient]:
+    """Borrow the pooled client for a connector; it stays open afterwards."""
+    yield get_connector_client(connector, base_url, **client_kwargs)
+
+
+async def close_connector_clients() -> None:
+    """Close every pooled connector client owned by the running loop."""
+    loop = asyncio.get_running_loop()
+    for key, (owner, client) in list(_connector_clients.items()):
+        if owner is loop:
+            del _connector_clients[key]
+            await client.aclose()
+
+
+# -- Requests and pagination ---
+
+
+def _retry_delay(response: httpx.Response, retry_delays: tuple[float, ...], attempt: int) -> float:
+    """Honour Retry-After / X-RateLimit-Reset on rate-limit responses, else back off."""
+    if response.status_code in _RATE_LIMITED_STATUSES:
+        wait = parse_rate_limit_headers(dict(response.headers))
+        if wait is not None:
+            return min(wait, MAX_RETRY_AFTER)
+    return retry_delays[min(attempt, len(retry_delays) - 1)]
 
 
 async def retry_request(
@@ -31,6 +220,9 @@ async def retry_request(
 ) -> httpx.Response:
     """Make an HTTP request with exponential backoff retry.
 
+    Rate-limited responses (429/503) wait for the ``Retry-After`` or
+    ``X-RateLimit-Reset`` time when the API sends one.
+
     Args:
         client: The httpx AsyncClient to use.
         method: HTTP method (GET, POST, etc.).
@@ -53,7 +245,7 @@ async def retry_request(
             response = await client.request(method, url, **kwargs)
 
             if response.status_code in retry_on_status and attempt < max_retries:
-                delay = retry_delays[min(attempt, len(retry_delays) - 1)]
+                delay = _retry_delay(response, retry_delays, attempt)
                 logger.warning(
                     "Request to %s returned %d, retrying in %.1fs (attempt %d/%d)",
                     url,
@@ -92,65 +284,120 @@ async def retry_request(
     raise RuntimeError("Unexpected retry loop exit")
 
 
+async def _prefetch_in_order(
+    fetch: Callable[[int], Awaitable[dict[str, Any]]],
+    offsets: list[int],
+    prefetch: int,
+) -> AsyncIterator[dict[str, Any]]:
+    """Fetch ``offsets`` with up to ``prefetch`` requests in flight, yielding in order."""
+    remaining = iter(offsets)
+    pending = collections.deque(asyncio.create_task(fetch(offset)) for offset in itertools.islice(remaining, prefetch))
+    try:
+        while pending:
+            data = await pending.popleft()
+            following = next(remaining, None)
+            if following is not None:
+                pending.append(asyncio.create_task(fetch(following)))
+            yield data
+    finally:
+        for task in pending:
+            task.cancel()
+
+
 async def paginate_offset(
     client: httpx.AsyncClient,
     url: str,
     *,
     params: dict[str, Any] | None = None,
     headers: dict[str, str] | None = None,
+    auth: httpx.Auth | None = None,
     page_size: int = 100,
     results_key: str = "results",
     total_key: str | None = "total",
     offset_param: str = "offset",
     limit_param: str = "limit",
-    max_pages: int = 100,
+    max_pages: int | None = None,
+    prefetch: int = DEFAULT_PREFETCH_PAGES,
+    start_offset: int = 0,
 ) -> AsyncIterator[list[dict[str, Any]]]:
     """Async generator for offset-based pagination.
 
+    When the first page reports a total, the remaining pages are fetched
+    concurrently, ``prefetch`` at a time, and yielded in order. Otherwise
+    the next page is requested while the caller processes the current one.
+
     Args:
         client: The httpx AsyncClient.
         url: Base URL to paginate.
         params: Additional query parameters.
         headers: Additional headers.
+        auth: Per-request authentication.
         page_size: Number of records per page.
         results_key: JSON key containing the results array.
         total_key: JSON key containing total count (None to paginate until empty).
         offset_param: Query parameter name for offset.
         limit_param: Query parameter name for limit.
-        max_pages: Safety limit on number of pages.
+        max_pages: Optional safety limit on number of pages.
+        prefetch: Maximum page requests in flight.
+        start_offset: Offset of the first record to fetch, e.g. to resume
+            an interrupted sync.
 
     Yields:
         Lists of records from each page.
-    """
-    offset = 0
-    request_params = dict(params or {})
-
-    for _ in range(max_pages):
-        request_params[offset_param] = offset
-        request_params[limit_param] = page_size
-
-        response = await retry_request(
-            client,
-            "GET",
-            url,
-            params=request_params,
-            headers=headers,
-        )
-        data = response.json()
-
-        results = data.get(results_key, [])
-        if not results:
-            break
 
+    Raises:
+        ValueError: If ``prefetch`` is less than 1.
+    """
+    if prefetch < 1:
+        raise ValueError("prefetch must be at least 1")
+
+    async def fetch(offset: int) -> dict[str, Any]:
+        page_params = {**(params or {}), offset_param: offset, limit_param: page_size}
+        response = await retry_request(client, "GET", url, params=page_params, headers=headers, auth=auth)
+        return response.json()
+
+    def page_allowed(pages: int) -> bool:
+        return max_pages is None or pages < max_pages
+
+    data = await fetch(start_offset)
+    results = data.get(results_key, [])
+    if not results or not page_allowed(0):
+        return
+    total = data.get(total_key) if total_key else None
+
+    if isinstance(total, int) and len(results) >= page_size:
+        offsets = range(start_offset + len(results), total, page_size)
+        if max_pages is not None:
+            offsets = offsets[: max_pages - 1]
         yield results
-
-        offset += len(results)
-
-        if total_key and total_key in data and offset >= data[total_key]:
-            break
-
-        if len(results) < page_size:
-            break
+        async for data in _prefetch_in_order(fetch, list(offsets), prefetch):
+            results = data.get(results_key, [])
+            if not results:
+                return
+            yield results
+            if len(results) < page_size:
+                return
+        return
+
+    offset, pages = start_offset, 0
+    following: asyncio.Task[dict[str, Any]] | None = None
+    try:
+        while True:
+            pages += 1
+            offset += len(results)
+            done = len(results) < page_size or (isinstance(total, int) and offset >= total) or not page_allowed(pages)
+            following = None if done else asyncio.create_task(fetch(offset))
+            yield results
+            if following is None:
+                return
+            data = await following
+            following = None
+            results = data.get(results_key, [])
+            if not results:
+                return
+    finally:
+        if following is not None:
+            following.cancel()
 
 
 async def paginate_cursor(
@@ -159,45 +406,79 @@ async def paginate_cursor(
     *,
     params: dict[str, Any] | None = None,
     headers: dict[str, str] | None = None,
+    auth: httpx.Auth | None = None,
     results_key: str = "results",
     next_url_key: str = "next",
-    max_pages: int = 100,
+    max_pages: int | None = None,
 ) -> AsyncIterator[list[dict[str, Any]]]:
     """Async generator for cursor/URL-based pagination.
 
+    The next page is requested as soon as its URL is known, while the
+    caller processes the current page.
+
     Args:
         client: The httpx AsyncClient.
         url: Initial URL to fetch.
         params: Query parameters for the first request.
         headers: Additional headers.
+        auth: Per-request authentication.
         results_key: JSON key containing the results array.
         next_url_key: JSON key containing the next page URL.
-        max_pages: Safety limit on number of pages.
+        max_pages: Optional safety limit on number of pages.
 
     Yields:
         Lists of records from each page.
     """
-    current_url: str | None = url
-    is_first = True
-
-    for _ in range(max_pages):
-        if current_url is None:
-            break
-
-        response = await retry_request(
-            client,
-            "GET",
-            current_url,
-            params=params if is_first else None,
-            headers=headers,
-        )
-        is_first = False
-        data = response.json()
-
-        results = data.get(results_key, [])
-        if not results:
-            break
-
+    async for results, _next_url in paginate_cursor_pages(
+        client,
+        url,
+        params=params,
+        headers=headers,
+        auth=auth,
+        results_key=results_key,
+        next_url_key=next_url_key,
+        max_pages=max_pages,
+    ):
         yield results
 
-        current_url = data.get(next_url_key)
+
+async def paginate_cursor_pages(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    params: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
+    auth: httpx.Auth | None = None,
+    results_key: str = "results",
+    next_url_key: str = "next",
+    max_pages: int | None = None,
+) -> AsyncIterator[tuple[list[dict[str, Any]], str | None]]:
+    """Like ``paginate_cursor``, but also yields each page's next URL.
+
+    The next URL is the position to resume from once the page has been
+    processed; it is None on the last page.
+    """
+
+    async def fetch(page_url: str, page_params: dict[str, Any] | None) -> dict[str, Any]:
+        response = await retry_request(client, "GET", page_url, params=page_params, headers=headers, auth=auth)
+        return response.json()
+
+    if max_pages is not None and max_pages < 1:
+        return
+    following: asyncio.Task[dict[str, Any]] | None = asyncio.create_task(fetch(url, params))
+    pages = 0
+    try:
+        while following is not None:
+            data = await following
+            following = None
+            results = data.get(results_key, [])
+            if not results:
+                break
+            pages += 1
+            next_url = data.get(next_url_key)
+            if next_url and (max_pages is None or pages < max_pages):
+                following = asyncio.create_task(fetch(next_url, None))
+            yield results, next_url
+    finally:
+        if following is not None:
+            following.cancel()
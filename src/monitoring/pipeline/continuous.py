@@ -18,6 +18,7 @@ import redis.asyncio as aioredis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.models import EvidenceItem
+from src.core.neo4j import KM_NODE_LABEL
 from src.core.redis import ensure_consumer_group
 from src.monitoring.pipeline.metrics import MetricsCollector
 
@@ -223,9 +224,10 @@ class ContinuousEvidencePipeline:
         async with self._neo4j_driver.session() as session:
             await session.execute_write(
                 lambda tx: tx.run(
-                    """
-                    MERGE (e:Evidence {id: $evidence_id})
-                    SET e.engagement_id = $engagement_id,
+                    f"""
+                    MERGE (e:Evidence {{id: $evidence_id}})
+                    SET e:{KM_NODE_LABEL},
+                        e.engagement_id = $engagement_id,
                         e.updated_at = datetime()
                     """,
                     evidence_id=evidence_id,
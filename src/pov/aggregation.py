@@ -2,14 +2,21 @@
 
 Step 1: Filters evidence by engagement and scope, collects validated items
 and their fragments for downstream processing.
+
+``aggregate_evidence_projected`` is the column-projected variant used by
+incremental generation: it selects only the fields the consensus steps read
+(never the fragment embedding column) into lightweight records.
 """
 
 from __future__ import annotations
 
 import logging
+import uuid
 from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -18,6 +25,56 @@ from src.core.models import EvidenceFragment, EvidenceItem, ValidationStatus
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class FragmentRecord:
+    """Projection of an EvidenceFragment with only the extraction inputs.
+
+    Attributes:
+        id: Fragment ID.
+        evidence_id: Parent evidence item ID.
+        content: Fragment text.
+    """
+
+    id: uuid.UUID
+    evidence_id: uuid.UUID
+    content: str = ""
+
+
+@dataclass
+class EvidenceRecord:
+    """Projection of an EvidenceItem with only the consensus inputs.
+
+    Duck-type compatible with ``EvidenceItem`` for every attribute read by
+    triangulation, consensus, contradiction resolution, scoring and gaps.
+
+    Attributes:
+        id: Evidence item ID.
+        name: Evidence item name.
+        category: Evidence category value.
+        source_date: Date of the evidence source, if known.
+        completeness_score: Completeness quality dimension.
+        reliability_score: Reliability quality dimension.
+        freshness_score: Freshness quality dimension.
+        consistency_score: Consistency quality dimension.
+        fragments: Projected fragments belonging to this item.
+    """
+
+    id: uuid.UUID
+    name: str = ""
+    category: str = ""
+    source_date: date | None = None
+    completeness_score: float = 0.0
+    reliability_score: float = 0.0
+    freshness_score: float = 0.0
+    consistency_score: float = 0.0
+    fragments: list[FragmentRecord] = field(default_factory=list)
+
+    @property
+    def quality_score(self) -> float:
+        """Composite quality score (average of 4 dimensions), as on EvidenceItem."""
+        return (self.completeness_score + self.reliability_score + self.freshness_score + self.consistency_score) / 4.0
+
+
 @dataclass
 class AggregatedEvidence:
     """Collection of evidence items and fragments for POV generation.
@@ -25,20 +82,38 @@ class AggregatedEvidence:
     Attributes:
         engagement_id: The engagement being processed.
         scope: The scope filter applied.
-        evidence_items: List of validated evidence items.
-        fragments: List of evidence fragments from validated items.
+        evidence_items: List of validated evidence items (ORM rows or
+            EvidenceRecord projections).
+        fragments: List of evidence fragments from validated items (ORM rows
+            or FragmentRecord projections).
         evidence_count: Number of evidence items collected.
         fragment_count: Number of fragments collected.
     """
 
     engagement_id: str = ""
     scope: str = ""
-    evidence_items: list[EvidenceItem] = field(default_factory=list)
-    fragments: list[EvidenceFragment] = field(default_factory=list)
+    evidence_items: list[Any] = field(default_factory=list)
+    fragments: list[Any] = field(default_factory=list)
     evidence_count: int = 0
     fragment_count: int = 0
 
 
+def _apply_evidence_filters(query: Select, engagement_id: str, scope: str | None) -> Select:
+    """Restrict a query to validated, non-duplicate evidence in scope."""
+    query = (
+        query.where(EvidenceItem.engagement_id == engagement_id)
+        .where(EvidenceItem.validation_status.in_([ValidationStatus.VALIDATED, ValidationStatus.ACTIVE]))
+        .where(EvidenceItem.duplicate_of_id.is_(None))
+    )
+
+    # Apply scope filter if provided
+    if scope:
+        # Scope filters by category name (case-insensitive partial match)
+        query = query.where(EvidenceItem.category.ilike(f"%{scope}%") | EvidenceItem.name.ilike(f"%{scope}%"))
+
+    return query
+
+
 async def aggregate_evidence(
     session: AsyncSession,
     engagement_id: str,
@@ -58,19 +133,12 @@ async def aggregate_evidence(
     Returns:
         AggregatedEvidence containing items and fragments.
     """
-    query = (
-        select(EvidenceItem)
-        .options(selectinload(EvidenceItem.fragments))
-        .where(EvidenceItem.engagement_id == engagement_id)
-        .where(EvidenceItem.validation_status.in_([ValidationStatus.VALIDATED, ValidationStatus.ACTIVE]))
-        .where(EvidenceItem.duplicate_of_id.is_(None))
+    query = _apply_evidence_filters(
+        select(EvidenceItem).options(selectinload(EvidenceItem.fragments)),
+        engagement_id,
+        scope,
     )
 
-    # Apply scope filter if provided
-    if scope:
-        # Scope filters by category name (case-insensitive partial match)
-        query = query.where(EvidenceItem.category.ilike(f"%{scope}%") | EvidenceItem.name.ilike(f"%{scope}%"))
-
     result = await session.execute(query)
     evidence_items = list(result.scalars().unique().all())
 
@@ -97,3 +165,88 @@ async def aggregate_evidence(
     )
 
     return aggregated
+
+
+async def aggregate_evidence_projected(
+    session: AsyncSession,
+    engagement_id: str,
+    scope: str | None = None,
+) -> AggregatedEvidence:
+    """Aggregate validated evidence as column projections.
+
+    Applies the same filters as ``aggregate_evidence`` but selects only the
+    columns consumed by the consensus pipeline. Fragment rows are fetched
+    with a single follow-up query restricted by an evidence-ID subquery, so
+    fragment embeddings and unused evidence columns are never transferred.
+
+    Args:
+        session: Async database session.
+        engagement_id: The engagement to aggregate evidence for.
+        scope: Optional scope filter (matched against category name).
+
+    Returns:
+        AggregatedEvidence containing EvidenceRecord and FragmentRecord items.
+    """
+    item_query = _apply_evidence_filters(
+        select(
+            EvidenceItem.id,
+            EvidenceItem.name,
+            EvidenceItem.category,
+            EvidenceItem.source_date,
+            EvidenceItem.completeness_score,
+            EvidenceItem.reliability_score,
+            EvidenceItem.freshness_score,
+            EvidenceItem.consistency_score,
+        ),
+        engagement_id,
+        scope,
+    )
+    item_rows = (await session.execute(item_query)).all()
+
+    records: dict[uuid.UUID, EvidenceRecord] = {}
+    for row in item_rows:
+        records[row.id] = EvidenceRecord(
+            id=row.id,
+            name=row.name,
+            category=str(row.category),
+            source_date=row.source_date,
+            completeness_score=row.completeness_score,
+            reliability_score=row.reliability_score,
+            freshness_score=row.freshness_score,
+            consistency_score=row.consistency_score,
+        )
+
+    all_fragments: list[FragmentRecord] = []
+    if records:
+        id_subquery = _apply_evidence_filters(select(EvidenceItem.id), engagement_id, scope)
+        fragment_query = select(
+            EvidenceFragment.id,
+            EvidenceFragment.evidence_id,
+            EvidenceFragment.content,
+        ).where(EvidenceFragment.evidence_id.in_(id_subquery))
+        for row in (await session.execute(fragment_query)).all():
+            parent = records.get(row.evidence_id)
+            if parent is None:
+                continue
+            fragment = FragmentRecord(id=row.id, evidence_id=row.evidence_id, content=row.content)
+            parent.fragments.append(fragment)
+            all_fragments.append(fragment)
+
+    aggregated = AggregatedEvidence(
+        engagement_id=engagement_id,
+        scope=scope or "all",
+        evidence_items=list(records.values()),
+        fragments=all_fragments,
+        evidence_count=len(records),
+        fragment_count=len(all_fragments),
+    )
+
+    logger.info(
+        "Aggregated %d evidence projections (%d fragments) for engagement %s, scope '%s'",
+        aggregated.evidence_count,
+        aggregated.fragment_count,
+        engagement_id,
+        scope or "all",
+    )
+
+    return aggregated
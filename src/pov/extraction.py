@@ -19,6 +19,7 @@ from src.semantic.entity_extraction import (
     extract_entities,
     resolve_entities,
 )
+from src.semantic.extraction_cache import ExtractionCache
 
 logger = logging.getLogger(__name__)
 
@@ -42,27 +43,23 @@ class ExtractionSummary:
     duplicate_candidates: list[DuplicateCandidate] = field(default_factory=list)
 
 
-async def extract_from_evidence(
+async def extract_fragment_results(
     evidence_items: list[EvidenceItem],
     fragments: list[EvidenceFragment],
     seed_terms: list[str] | None = None,
-) -> ExtractionSummary:
-    """Extract and resolve entities from evidence fragments.
-
-    Runs entity extraction on each fragment, tracks which evidence
-    items each entity came from, then resolves (deduplicates) entities.
-
-    If seed_terms are provided, entities matching seed terms receive a
-    confidence boost during extraction.
+    cache: ExtractionCache | None = None,
+) -> list[tuple[str, str, list[ExtractedEntity]]]:
+    """Run entity extraction on each fragment without resolving.
 
     Args:
-        evidence_items: List of evidence items (for metadata).
-        fragments: List of fragments to extract entities from.
+        evidence_items: Evidence items owning the fragments.
+        fragments: Fragments to extract entities from.
         seed_terms: Canonical terms from the engagement seed list.
+        cache: Persisted extraction cache; when given, fragments whose text
+            was already extracted are served from it.
 
     Returns:
-        ExtractionSummary with resolved entities, provenance maps, and
-        duplicate candidate pairs.
+        List of (fragment_id, evidence_id, entities) tuples, one per fragment.
     """
     # Build fragment -> evidence item mapping
     fragment_to_evidence: dict[str, str] = {}
@@ -70,23 +67,48 @@ async def extract_from_evidence(
         for fragment in item.fragments:
             fragment_to_evidence[str(fragment.id)] = str(item.id)
 
-    all_entities: list[ExtractedEntity] = []
-    entity_to_evidence: dict[str, list[str]] = {}
-    entity_to_fragments: dict[str, list[str]] = {}
+    if cache is not None:
+        results = await cache.extract_many([(str(f.id), f.content) for f in fragments], seed_terms=seed_terms)
+        return [
+            (str(f.id), fragment_to_evidence.get(str(f.id), str(f.evidence_id)), r.entities)
+            for f, r in zip(fragments, results, strict=True)
+        ]
 
     _sem = asyncio.Semaphore(10)
 
-    async def _bounded_extract(fragment: EvidenceFragment) -> tuple[str, str, ExtractionResult]:
+    async def _bounded_extract(fragment: EvidenceFragment) -> tuple[str, str, list[ExtractedEntity]]:
         frag_id = str(fragment.id)
         evidence_id = fragment_to_evidence.get(frag_id, str(fragment.evidence_id))
         async with _sem:
-            result = await extract_entities(fragment.content, fragment_id=frag_id, seed_terms=seed_terms)
-        return frag_id, evidence_id, result
+            result: ExtractionResult = await extract_entities(
+                fragment.content, fragment_id=frag_id, seed_terms=seed_terms
+            )
+        return frag_id, evidence_id, result.entities
+
+    return list(await asyncio.gather(*[_bounded_extract(frag) for frag in fragments]))
+
+
+def summarize_extraction(
+    fragment_results: list[tuple[str, str, list[ExtractedEntity]]],
+) -> ExtractionSummary:
+    """Resolve per-fragment extraction results into an ExtractionSummary.
+
+    Tracks which evidence items and fragments each entity came from, then
+    resolves (deduplicates) entities.
 
-    extraction_results = await asyncio.gather(*[_bounded_extract(frag) for frag in fragments])
+    Args:
+        fragment_results: (fragment_id, evidence_id, entities) tuples.
+
+    Returns:
+        ExtractionSummary with resolved entities, provenance maps, and
+        duplicate candidate pairs.
+    """
+    all_entities: list[ExtractedEntity] = []
+    entity_to_evidence: dict[str, list[str]] = {}
+    entity_to_fragments: dict[str, list[str]] = {}
 
-    for frag_id, evidence_id, result in extraction_results:
-        for entity in result.entities:
+    for frag_id, evidence_id, entities in fragment_results:
+        for entity in entities:
             all_entities.append(entity)
 
             # Track evidence provenance
@@ -131,3 +153,31 @@ async def extract_from_evidence(
         entity_to_fragments=merged_to_fragments,
         duplicate_candidates=duplicate_candidates,
     )
+
+
+async def extract_from_evidence(
+    evidence_items: list[EvidenceItem],
+    fragments: list[EvidenceFragment],
+    seed_terms: list[str] | None = None,
+    cache: ExtractionCache | None = None,
+) -> ExtractionSummary:
+    """Extract and resolve entities from evidence fragments.
+
+    Runs entity extraction on each fragment, tracks which evidence
+    items each entity came from, then resolves (deduplicates) entities.
+
+    If seed_terms are provided, entities matching seed terms receive a
+    confidence boost during extraction.
+
+    Args:
+        evidence_items: List of evidence items (for metadata).
+        fragments: List of fragments to extract entities from.
+        seed_terms: Canonical terms from the engagement seed list.
+        cache: Optional persisted extraction cache shared with other callers.
+
+    Returns:
+        ExtractionSummary with resolved entities, provenance maps, and
+        duplicate candidate pairs.
+    """
+    fragment_results = await extract_fragment_results(evidence_items, fragments, seed_terms, cache=cache)
+    return summarize_extraction(fragment_results)
@@ -11,6 +11,9 @@ Orchestrates all steps of the consensus algorithm:
 8. Gap Detection
 
 Returns a ProcessModel with all elements, contradictions, and gaps.
+
+With ``incremental=True`` steps 1-2 reuse the state persisted by the latest
+completed POV for the same engagement and scope (see ``src.pov.incremental``).
 """
 
 from __future__ import annotations
@@ -20,6 +23,7 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.models import (
@@ -30,15 +34,23 @@ from src.core.models import (
     ProcessModel,
     ProcessModelStatus,
 )
-from src.pov.aggregation import aggregate_evidence
+from src.pov.aggregation import aggregate_evidence, aggregate_evidence_projected
 from src.pov.assembly import assemble_bpmn
 from src.pov.consensus import build_consensus
 from src.pov.contradiction import flatten_to_detected_contradictions, resolve_contradictions
 from src.pov.extraction import extract_from_evidence
 from src.pov.gaps import detect_gaps
+from src.pov.incremental import (
+    IncrementalStats,
+    PreviousGeneration,
+    compute_evidence_delta,
+    extract_incremental,
+    load_previous_generation,
+)
 from src.pov.scoring import classify_confidence, score_all_elements
 from src.pov.triangulation import triangulate_elements
 from src.semantic.entity_extraction import EntityType
+from src.semantic.extraction_cache import ExtractionCache
 
 logger = logging.getLogger(__name__)
 
@@ -172,11 +184,24 @@ def _persist_gaps(
     return records
 
 
+async def _next_model_version(session: AsyncSession, engagement_id: str) -> int:
+    """Return the next ProcessModel version number for an engagement.
+
+    Versions increase monotonically per engagement across full and
+    incremental runs, since readers pick the latest model by version.
+    """
+    result = await session.execute(
+        select(func.max(ProcessModel.version)).where(ProcessModel.engagement_id == uuid.UUID(engagement_id))
+    )
+    return (result.scalar() or 0) + 1
+
+
 async def generate_pov(
     session: AsyncSession,
     engagement_id: str,
     scope: str = "all",
     generated_by: str = "consensus_algorithm",
+    incremental: bool = False,
 ) -> GenerationResult:
     """Generate a Process Point of View for an engagement.
 
@@ -191,20 +216,29 @@ async def generate_pov(
     8. Detect evidence gaps
     9. Persist to database
 
+    In incremental mode evidence is loaded as column projections and
+    persisted fragment extractions are reused; the evidence delta against
+    the latest completed model for the same scope is recorded in metadata.
+
     Args:
         session: Async database session.
         engagement_id: The engagement to generate a POV for.
         scope: Scope filter for evidence (default: "all").
         generated_by: Identifier for who/what triggered generation.
+        incremental: Regenerate from the evidence delta since the previous POV.
 
     Returns:
         GenerationResult with the ProcessModel or error details.
     """
+    previous = PreviousGeneration()
+    if incremental:
+        previous = await load_previous_generation(session, engagement_id, scope)
+
     # Create the process model record in GENERATING status
     model = ProcessModel(
         id=uuid.uuid4(),
         engagement_id=uuid.UUID(engagement_id),
-        version=1,
+        version=await _next_model_version(session, engagement_id),
         scope=scope,
         status=ProcessModelStatus.GENERATING,
         generated_by=generated_by,
@@ -214,7 +248,8 @@ async def generate_pov(
 
     try:
         # Step 1: Aggregate evidence
-        aggregated = await aggregate_evidence(session, engagement_id, scope if scope != "all" else None)
+        aggregate = aggregate_evidence_projected if incremental else aggregate_evidence
+        aggregated = await aggregate(session, engagement_id, scope if scope != "all" else None)
 
         if aggregated.evidence_count == 0:
             model.status = ProcessModelStatus.FAILED
@@ -227,7 +262,18 @@ async def generate_pov(
             )
 
         # Step 2: Extract entities
-        extraction = await extract_from_evidence(aggregated.evidence_items, aggregated.fragments)
+        inc_stats = IncrementalStats(base_model_id=str(previous.model.id) if previous.model else None)
+        if incremental:
+            delta = compute_evidence_delta(previous, aggregated)
+            inc_stats.added_evidence = len(delta.added)
+            inc_stats.removed_evidence = len(delta.removed)
+            extraction = await extract_incremental(session, aggregated, inc_stats)
+        else:
+            extraction = await extract_from_evidence(
+                aggregated.evidence_items,
+                aggregated.fragments,
+                cache=ExtractionCache(session),
+            )
 
         if not extraction.entities:
             model.status = ProcessModelStatus.FAILED
@@ -278,7 +324,10 @@ async def generate_pov(
             "fragment_count": aggregated.fragment_count,
             "raw_entity_count": extraction.raw_entity_count,
             "resolved_entity_count": len(extraction.entities),
+            "evidence_ids": [str(item.id) for item in aggregated.evidence_items],
         }
+        if incremental:
+            model.metadata_json["incremental"] = inc_stats.to_dict()
 
         await session.flush()
 
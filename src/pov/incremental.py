@@ -0,0 +1,164 @@
+"""Incremental POV regeneration driven by evidence deltas.
+
+Incremental generation starts from the latest completed process model for
+the same engagement and scope and records the evidence delta against it:
+
+- Evidence is aggregated as column projections (no ORM rows, no embeddings).
+- Fragment extraction goes through the shared ``ExtractionCache``, so only
+  text not yet extracted under the current extractor rules is processed.
+
+Triangulation, consensus, contradiction resolution, scoring, BPMN assembly
+and gap detection still run over the full element set: they are in-memory,
+depend on engagement-wide totals, and must see edits to existing evidence
+(e.g. a changed category) that an evidence-ID delta cannot detect.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.models import ProcessModel, ProcessModelStatus
+from src.pov.aggregation import AggregatedEvidence
+from src.pov.extraction import ExtractionSummary, extract_fragment_results, summarize_extraction
+from src.semantic.extraction_cache import ExtractionCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EvidenceDelta:
+    """Evidence added and removed since the base process model.
+
+    Attributes:
+        added: Evidence IDs present now but not in the base model.
+        removed: Evidence IDs present in the base model but not now.
+    """
+
+    added: set[str] = field(default_factory=set)
+    removed: set[str] = field(default_factory=set)
+
+    @property
+    def touched(self) -> set[str]:
+        """All evidence IDs affected by the delta."""
+        return self.added | self.removed
+
+
+@dataclass
+class PreviousGeneration:
+    """State recorded by the latest completed POV for an engagement/scope.
+
+    Attributes:
+        model: The base ProcessModel, or None when no prior POV exists.
+        evidence_ids: Evidence IDs the base model was generated from.
+    """
+
+    model: ProcessModel | None = None
+    evidence_ids: set[str] = field(default_factory=set)
+
+
+@dataclass
+class IncrementalStats:
+    """Counters describing how much work incremental generation reused.
+
+    Attributes:
+        base_model_id: ID of the process model used as the base, if any.
+        added_evidence: Number of evidence items added since the base.
+        removed_evidence: Number of evidence items removed since the base.
+        reused_fragments: Fragments whose extraction output was reused.
+        extracted_fragments: Fragments extracted during this run.
+    """
+
+    base_model_id: str | None = None
+    added_evidence: int = 0
+    removed_evidence: int = 0
+    reused_fragments: int = 0
+    extracted_fragments: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for ProcessModel.metadata_json."""
+        return {
+            "base_model_id": self.base_model_id,
+            "added_evidence": self.added_evidence,
+            "removed_evidence": self.removed_evidence,
+            "reused_fragments": self.reused_fragments,
+            "extracted_fragments": self.extracted_fragments,
+        }
+
+
+async def load_previous_generation(
+    session: AsyncSession,
+    engagement_id: str,
+    scope: str,
+) -> PreviousGeneration:
+    """Load the most recently created completed POV for the scope.
+
+    Args:
+        session: Async database session.
+        engagement_id: The engagement being regenerated.
+        scope: The POV scope; only models with the same scope are used.
+
+    Returns:
+        PreviousGeneration (empty when no completed model exists).
+    """
+    result = await session.execute(
+        select(ProcessModel)
+        .where(ProcessModel.engagement_id == uuid.UUID(engagement_id))
+        .where(ProcessModel.scope == scope)
+        .where(ProcessModel.status == ProcessModelStatus.COMPLETED)
+        .order_by(ProcessModel.created_at.desc())
+        .limit(1)
+    )
+    model = result.scalar_one_or_none()
+    if model is None:
+        return PreviousGeneration()
+
+    evidence_ids = set((model.metadata_json or {}).get("evidence_ids", []))
+    return PreviousGeneration(model=model, evidence_ids=evidence_ids)
+
+
+def compute_evidence_delta(previous: PreviousGeneration, aggregated: AggregatedEvidence) -> EvidenceDelta:
+    """Diff the current evidence set against the base model's evidence set.
+
+    Args:
+        previous: State of the base model.
+        aggregated: Currently aggregated evidence.
+
+    Returns:
+        EvidenceDelta with added and removed evidence IDs.
+    """
+    current = {str(item.id) for item in aggregated.evidence_items}
+    return EvidenceDelta(added=current - previous.evidence_ids, removed=previous.evidence_ids - current)
+
+
+async def extract_incremental(
+    session: AsyncSession,
+    aggregated: AggregatedEvidence,
+    stats: IncrementalStats,
+) -> ExtractionSummary:
+    """Extract entities, reusing results from the shared extraction cache.
+
+    Fragments whose text was already extracted under the current extractor
+    rules (by a previous POV, a graph build or the ingest pipeline) are
+    served from ``entity_extraction_cache``; only unseen text is extracted.
+    Cache keys include the extractor and seed-list versions, so a rules or
+    seed change re-extracts everything.
+
+    Args:
+        session: Async database session.
+        aggregated: Currently aggregated evidence.
+        stats: Counters updated with reused/extracted fragment totals.
+
+    Returns:
+        ExtractionSummary over all current fragments.
+    """
+    cache = ExtractionCache(session)
+    fragment_results = await extract_fragment_results(aggregated.evidence_items, aggregated.fragments, cache=cache)
+    stats.reused_fragments = cache.hits
+    stats.extracted_fragments = cache.misses
+    return summarize_extraction(fragment_results)
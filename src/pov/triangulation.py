@@ -166,7 +166,7 @@ def compute_evidence_agreement(
     return min(1.0, base + bonus)
 
 
-def _get_available_planes(evidence_items: list[EvidenceItem]) -> set[str]:
+def get_available_planes(evidence_items: list[EvidenceItem]) -> set[str]:
     """Determine which evidence planes are available in the engagement.
 
     Args:
@@ -182,6 +182,92 @@ def _get_available_planes(evidence_items: list[EvidenceItem]) -> set[str]:
     return planes
 
 
+def get_supporting_planes(
+    evidence_ids: list[str],
+    evidence_map: dict[str, EvidenceItem],
+) -> set[str]:
+    """Determine which evidence planes support an element.
+
+    Args:
+        evidence_ids: Evidence item IDs that mention the element.
+        evidence_map: Evidence ID -> EvidenceItem mapping.
+
+    Returns:
+        Set of plane names covered by the element's evidence.
+    """
+    supporting_planes: set[str] = set()
+    for eid in evidence_ids:
+        ev_item = evidence_map.get(eid)
+        if ev_item:
+            supporting_planes.add(get_evidence_plane(str(ev_item.category)))
+    return supporting_planes
+
+
+def triangulate_entity(
+    entity: ExtractedEntity,
+    evidence_ids: list[str],
+    supporting_planes: set[str],
+    total_sources: int,
+    available_planes: set[str],
+) -> TriangulatedElement:
+    """Triangulate a single entity from its evidence IDs and supporting planes.
+
+    Separated from ``triangulate_elements`` so incremental POV generation
+    can rescore an element from persisted state against new engagement
+    totals without re-deriving its planes.
+
+    Args:
+        entity: The resolved entity.
+        evidence_ids: Evidence item IDs that mention the entity.
+        supporting_planes: Evidence planes covered by those items.
+        total_sources: Total number of evidence sources in the engagement.
+        available_planes: Evidence planes present in the engagement.
+
+    Returns:
+        The TriangulatedElement for the entity.
+    """
+    source_count = len(evidence_ids)
+
+    # Compute factors
+    ev_coverage = compute_evidence_coverage(supporting_planes, available_planes)
+    cross_plane = len(supporting_planes) >= 2
+    # Agreement: use source_count vs total_sources (not source_count vs itself)
+    # so agreement reflects how broadly the entity is supported across all sources
+    ev_agreement = compute_evidence_agreement(source_count, total_sources, cross_plane=cross_plane)
+
+    # Compute triangulation score (uses existing formula)
+    score = _compute_triangulation_score(source_count, total_sources)
+    level = _determine_corroboration(score)
+
+    return TriangulatedElement(
+        entity=entity,
+        source_count=source_count,
+        total_sources=total_sources,
+        triangulation_score=score,
+        corroboration_level=level,
+        evidence_ids=evidence_ids,
+        evidence_coverage=ev_coverage,
+        evidence_agreement=ev_agreement,
+        supporting_planes=supporting_planes,
+        # Single-source flag
+        single_source=source_count <= 1,
+        has_conflict=False,
+        conflicting_evidence_ids=[],
+    )
+
+
+def log_triangulation_summary(results: list[TriangulatedElement]) -> None:
+    """Log corroboration-level counts for a triangulation run."""
+    logger.info(
+        "Triangulated %d elements: %d strongly, %d moderately, %d weakly corroborated, %d single-source",
+        len(results),
+        sum(1 for r in results if r.corroboration_level == CorroborationLevel.STRONGLY),
+        sum(1 for r in results if r.corroboration_level == CorroborationLevel.MODERATELY),
+        sum(1 for r in results if r.corroboration_level == CorroborationLevel.WEAKLY),
+        sum(1 for r in results if r.single_source),
+    )
+
+
 def triangulate_elements(
     entities: list[ExtractedEntity],
     entity_to_evidence: dict[str, list[str]],
@@ -215,61 +301,16 @@ def triangulate_elements(
         evidence_map[str(item.id)] = item
 
     # Determine available planes in engagement
-    available_planes = _get_available_planes(evidence_items)
+    available_planes = get_available_planes(evidence_items)
 
     results: list[TriangulatedElement] = []
 
     for entity in entities:
         evidence_ids = entity_to_evidence.get(entity.id, [])
-        source_count = len(evidence_ids)
-
-        # Determine supporting planes
-        supporting_planes: set[str] = set()
-        for eid in evidence_ids:
-            ev_item = evidence_map.get(eid)
-            if ev_item:
-                plane = get_evidence_plane(str(ev_item.category))
-                supporting_planes.add(plane)
-
-        # Compute factors
-        ev_coverage = compute_evidence_coverage(supporting_planes, available_planes)
-        cross_plane = len(supporting_planes) >= 2
-        # Agreement: use source_count vs total_sources (not source_count vs itself)
-        # so agreement reflects how broadly the entity is supported across all sources
-        ev_agreement = compute_evidence_agreement(source_count, total_sources, cross_plane=cross_plane)
-
-        # Compute triangulation score (uses existing formula)
-        score = _compute_triangulation_score(source_count, total_sources)
-        level = _determine_corroboration(score)
-
-        # Single-source flag
-        single_source = source_count <= 1
-
-        results.append(
-            TriangulatedElement(
-                entity=entity,
-                source_count=source_count,
-                total_sources=total_sources,
-                triangulation_score=score,
-                corroboration_level=level,
-                evidence_ids=evidence_ids,
-                evidence_coverage=ev_coverage,
-                evidence_agreement=ev_agreement,
-                supporting_planes=supporting_planes,
-                single_source=single_source,
-                has_conflict=False,
-                conflicting_evidence_ids=[],
-            )
-        )
+        supporting_planes = get_supporting_planes(evidence_ids, evidence_map)
+        results.append(triangulate_entity(entity, evidence_ids, supporting_planes, total_sources, available_planes))
 
-    logger.info(
-        "Triangulated %d elements: %d strongly, %d moderately, %d weakly corroborated, %d single-source",
-        len(results),
-        sum(1 for r in results if r.corroboration_level == CorroborationLevel.STRONGLY),
-        sum(1 for r in results if r.corroboration_level == CorroborationLevel.MODERATELY),
-        sum(1 for r in results if r.corroboration_level == CorroborationLevel.WEAKLY),
-        sum(1 for r in results if r.single_source),
-    )
+    log_triangulation_summary(results)
 
     return results
 
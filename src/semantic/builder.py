@@ -17,7 +17,6 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import uuid
 from collections import defaultdict
 from dataclasses import dataclass, field
 
@@ -30,10 +29,12 @@ from src.semantic.embeddings import EmbeddingService
 from src.semantic.entity_extraction import (
     EntityType,
     ExtractedEntity,
+    ExtractionResult,
     extract_entities,
     resolve_entities,
 )
-from src.semantic.graph import KnowledgeGraphService
+from src.semantic.extraction_cache import ExtractionCache
+from src.semantic.graph import KnowledgeGraphService, stable_node_id
 from src.semantic.ontology.loader import get_entity_type_to_label
 
 logger = logging.getLogger(__name__)
@@ -48,8 +49,8 @@ class BuildResult:
 
     Attributes:
         engagement_id: The engagement this build was for.
-        node_count: Number of nodes created.
-        relationship_count: Number of relationships created.
+        node_count: Number of nodes written (created or updated).
+        relationship_count: Number of relationships written (created or updated).
         nodes_by_label: Breakdown of nodes by label.
         relationships_by_type: Breakdown of relationships by type.
         fragments_processed: Number of fragments processed.
@@ -135,27 +136,41 @@ class KnowledgeGraphBuilder:
     async def _extract_all_entities(
         self,
         fragments: list[tuple[str, str, str]],
+        cache: ExtractionCache | None = None,
     ) -> tuple[list[ExtractedEntity], dict[str, list[str]]]:
         """Run entity extraction on all fragments concurrently.
 
         Uses asyncio.gather with a semaphore (max 10 concurrent) instead of
-        sequential awaiting to reduce total extraction time.
+        sequential awaiting to reduce total extraction time. When a cache is
+        given, fragments whose text was already extracted (by a previous
+        build, POV run or the ingest pipeline) are served from it. In both
+        paths a failing fragment is logged and skipped.
 
         Args:
             fragments: List of (fragment_id, content, evidence_id) tuples.
+            cache: Optional persisted extraction cache.
 
         Returns:
             Tuple of (all_entities, entity_to_evidence_map).
             entity_to_evidence_map maps entity IDs to evidence item IDs.
         """
-        sem = asyncio.Semaphore(10)
+        raw_results: list[ExtractionResult | BaseException]
+        if cache is not None:
+            # Failed fragments come back as exceptions and are skipped below;
+            # cache lookup/store failures degrade to uncached extraction.
+            raw_results = await cache.extract_many(
+                [(fragment_id, content) for fragment_id, content, _ in fragments],
+                return_exceptions=True,
+            )
+        else:
+            sem = asyncio.Semaphore(10)
 
-        async def _extract_with_sem(fragment_id: str, content: str):
-            async with sem:
-                return await extract_entities(content, fragment_id=fragment_id)
+            async def _extract_with_sem(fragment_id: str, content: str):
+                async with sem:
+                    return await extract_entities(content, fragment_id=fragment_id)
 
-        tasks = [_extract_with_sem(fragment_id, content) for fragment_id, content, _ in fragments]
-        raw_results = await asyncio.gather(*tasks, return_exceptions=True)
+            tasks = [_extract_with_sem(fragment_id, content) for fragment_id, content, _ in fragments]
+            raw_results = await asyncio.gather(*tasks, return_exceptions=True)
 
         all_entities: list[ExtractedEntity] = []
         entity_evidence_map: dict[str, list[str]] = {}
@@ -178,10 +193,12 @@ class KnowledgeGraphBuilder:
         entities: list[ExtractedEntity],
         engagement_id: str,
     ) -> dict[str, str]:
-        """Create Neo4j nodes for resolved entities.
+        """Create or update Neo4j nodes for resolved entities.
 
-        Groups entities by label and batch-creates them using UNWIND to
-        avoid N+1 round-trips to Neo4j.
+        Groups entities by label and batch-upserts them using UNWIND to
+        avoid N+1 round-trips to Neo4j. Node ids are derived from the
+        engagement, label and entity name, so rebuilding the graph updates
+        the existing nodes instead of duplicating them.
 
         Args:
             entities: List of resolved entities to create nodes for.
@@ -202,7 +219,7 @@ class KnowledgeGraphBuilder:
             if not label:
                 continue
 
-            node_id = str(uuid.uuid4())
+            node_id = stable_node_id(engagement_id, label, entity.name.strip().lower())
             props: dict = {
                 "id": node_id,
                 "name": entity.name,
@@ -216,15 +233,15 @@ class KnowledgeGraphBuilder:
             nodes_by_label[label].append(props)
             entity_id_to_node_id[entity.id] = node_id
 
-        # Batch create per label — one Cypher round-trip per distinct label
+        # Batch upsert per label — chunked UNWIND MERGE per distinct label
         for label, props_list in nodes_by_label.items():
             try:
-                await self._graph.batch_create_nodes(label, props_list)
+                await self._graph.batch_upsert_nodes(label, props_list)
                 for props in props_list:
                     # Find the entity whose node_id matches and record the mapping
                     entity_to_node[props["id"]] = props["id"]
             except Neo4jError as e:
-                logger.warning("Failed to batch-create nodes for label %s: %s", label, e)
+                logger.warning("Failed to batch-upsert nodes for label %s: %s", label, e)
 
         # Build the entity.id -> node_id mapping for callers
         result: dict[str, str] = {}
@@ -243,10 +260,10 @@ class KnowledgeGraphBuilder:
     ) -> int:
         """Create SUPPORTED_BY relationships from entities to evidence items.
 
-        Batches Evidence node upserts and SUPPORTED_BY edge creation to avoid
-        N+1 round-trips. Evidence nodes for distinct evidence IDs are collected
-        first; those that don't yet exist are batch-created; then all edges are
-        written in a single UNWIND query.
+        Batches Evidence node and SUPPORTED_BY edge upserts to avoid N+1
+        round-trips. Evidence nodes for distinct evidence IDs are collected
+        first and MERGEd by id; then all edges are MERGEd, so rebuilding does
+        not duplicate either.
 
         Args:
             entity_to_node: Mapping from entity ID to node ID.
@@ -254,7 +271,7 @@ class KnowledgeGraphBuilder:
             engagement_id: Engagement ID for scoping.
 
         Returns:
-            Number of relationships created.
+            Number of relationships written (created or matched).
         """
         # Collect every (node_id, ev_node_id) pair we need to link
         pairs: list[tuple[str, str]] = []
@@ -281,19 +298,19 @@ class KnowledgeGraphBuilder:
         # Batch-upsert Evidence nodes (MERGE avoids duplicates without pre-check)
         if evidence_props:
             try:
-                await self._graph.batch_create_nodes("Evidence", list(evidence_props.values()))
+                await self._graph.batch_upsert_nodes("Evidence", list(evidence_props.values()))
             except Neo4jError as e:
-                logger.warning("Failed to batch-create Evidence nodes: %s", e)
+                logger.warning("Failed to batch-upsert Evidence nodes: %s", e)
 
-        # Batch-create all SUPPORTED_BY edges in one UNWIND round-trip
+        # Batch-upsert all SUPPORTED_BY edges
         rels = [
             {"from_id": node_id, "to_id": ev_node_id, "properties": {"source": "extraction"}}
             for node_id, ev_node_id in pairs
         ]
         try:
-            count = await self._graph.batch_create_relationships("SUPPORTED_BY", rels)
+            count = (await self._graph.batch_upsert_relationships("SUPPORTED_BY", rels)).total
         except Neo4jError as e:
-            logger.warning("Failed to batch-create SUPPORTED_BY relationships: %s", e)
+            logger.warning("Failed to batch-upsert SUPPORTED_BY relationships: %s", e)
             count = 0
 
         return count
@@ -315,7 +332,7 @@ class KnowledgeGraphBuilder:
             entity_to_node: Mapping from entity ID to node ID.
 
         Returns:
-            Number of relationships created.
+            Number of relationships written (created or matched).
         """
         # Build reverse map: evidence_id -> set of entity_ids
         evidence_to_entities: dict[str, set[str]] = {}
@@ -355,9 +372,9 @@ class KnowledgeGraphBuilder:
             return 0
 
         try:
-            count = await self._graph.batch_create_relationships("CO_OCCURS_WITH", rels)
+            count = (await self._graph.batch_upsert_relationships("CO_OCCURS_WITH", rels)).total
         except Neo4jError as e:
-            logger.warning("Failed to batch-create CO_OCCURS_WITH relationships: %s", e)
+            logger.warning("Failed to batch-upsert CO_OCCURS_WITH relationships: %s", e)
             count = 0
 
         return count
@@ -380,7 +397,7 @@ class KnowledgeGraphBuilder:
             entity_to_node: Mapping from entity ID to node ID.
 
         Returns:
-            Number of relationships created.
+            Number of relationships written (created or matched).
         """
         # Group entities by type for cross-type relationships
         by_type: dict[str, list[ExtractedEntity]] = {}
@@ -398,7 +415,7 @@ class KnowledgeGraphBuilder:
 
         inferred_props = {"inferred": True}
 
-        # Collect all inferred edges grouped by relationship type, then batch-create
+        # Collect all inferred edges grouped by relationship type, then batch-upsert
         owned_by_rels = [
             {"from_id": entity_to_node[act.id], "to_id": entity_to_node[role.id], "properties": inferred_props}
             for act in activities
@@ -426,10 +443,9 @@ class KnowledgeGraphBuilder:
             if not rels:
                 continue
             try:
-                created = await self._graph.batch_create_relationships(rel_type, rels)
-                count += created
+                count += (await self._graph.batch_upsert_relationships(rel_type, rels)).total
             except Neo4jError as e:
-                logger.debug("Batch relationship creation skipped for %s: %s", rel_type, e)
+                logger.debug("Batch relationship upsert skipped for %s: %s", rel_type, e)
 
         return count
 
@@ -516,7 +532,7 @@ class KnowledgeGraphBuilder:
         result.errors.extend(emb_errors)
 
         # Step 3: Extract entities
-        all_entities, entity_evidence_map = await self._extract_all_entities(fragments)
+        all_entities, entity_evidence_map = await self._extract_all_entities(fragments, cache=ExtractionCache(session))
         result.entities_extracted = len(all_entities)
 
         if not all_entities:
@@ -23,6 +23,7 @@ from src.core.models.conflict import (
 )
 from src.core.models.dual_write_failure import DualWriteFailure
 from src.core.models.survey import CertaintyTier, SurveyClaim
+from src.core.neo4j import KM_NODE_LABEL
 from src.semantic.graph import KnowledgeGraphService
 
 logger = logging.getLogger(__name__)
@@ -80,9 +81,10 @@ class ClaimWriteBackService:
         try:
             # 1. Create SurveyClaim node in Neo4j
             await self._graph.run_write_query(
-                """
-                MERGE (c:SurveyClaim {id: $claim_id})
-                SET c.claim_text = $claim_text,
+                f"""
+                MERGE (c:SurveyClaim {{id: $claim_id}})
+                SET c:{KM_NODE_LABEL},
+                    c.claim_text = $claim_text,
                     c.probe_type = $probe_type,
                     c.certainty_tier = $certainty_tier,
                     c.respondent_role = $respondent_role,
@@ -108,14 +110,15 @@ class ClaimWriteBackService:
                 frame = claim.epistemic_frame
                 frame_node_id = str(frame.id).replace("-", "")[:16]
                 await self._graph.run_write_query(
-                    """
-                    MERGE (f:EpistemicFrame {session_id: $session_id, respondent_role: $respondent_role})
-                    SET f.id = $frame_id,
+                    f"""
+                    MERGE (f:EpistemicFrame {{session_id: $session_id, respondent_role: $respondent_role}})
+                    SET f:{KM_NODE_LABEL},
+                        f.id = $frame_id,
                         f.frame_kind = $frame_kind,
                         f.authority_scope = $authority_scope,
                         f.engagement_id = $engagement_id
                     WITH f
-                    MATCH (c:SurveyClaim {id: $claim_id})
+                    MATCH (c:SurveyClaim {{id: $claim_id}})
                     MERGE (c)-[:HAS_FRAME]->(f)
                     """,
                     {
@@ -323,17 +326,19 @@ class ClaimWriteBackService:
         conflict_node_id = str(conflict.id).replace("-", "")[:16]
         try:
             await self._graph.run_write_query(
-                """
-                CREATE (co:ConflictObject {
+                f"""
+                CREATE (co:ConflictObject {{
                     id: $conflict_id,
                     mismatch_type: $mismatch_type,
                     severity: $severity,
                     engagement_id: $engagement_id,
                     created_at: datetime()
-                })
+                }})
+                SET co:{KM_NODE_LABEL}
                 WITH co
-                MATCH (c:SurveyClaim {id: $claim_id})
-                MATCH (a {id: $activity_id, engagement_id: $engagement_id})
+                MATCH (c:SurveyClaim {{id: $claim_id}})
+                MATCH (a:{KM_NODE_LABEL} {{id: $activity_id}})
+                WHERE a.engagement_id = $engagement_id
                 MERGE (co)-[:INVOLVES]->(c)
                 MERGE (co)-[:INVOLVES]->(a)
                 """,
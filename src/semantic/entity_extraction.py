@@ -11,6 +11,7 @@ Entity resolution detects when different names refer to the same entity.
 from __future__ import annotations
 
 import enum
+import functools
 import hashlib
 import re
 from dataclasses import dataclass, field
@@ -572,6 +573,39 @@ def _extract_gateways(text: str) -> list[ExtractedEntity]:
 SEED_TERM_CONFIDENCE_BOOST: float = 0.15
 """Confidence boost for entities that match an engagement seed term."""
 
+EXTRACTOR_RULES_VERSION: str = "1"
+"""Bump whenever extraction logic outside the regex tables changes.
+
+Regex edits are picked up automatically by ``extractor_version``; changes to
+confidences, name cleaning or filters in the ``_extract_*`` helpers are not,
+and must bump this value so persisted extraction results are invalidated.
+"""
+
+
+@functools.cache
+def extractor_version() -> str:
+    """Return a fingerprint of the current rule-based extractor.
+
+    Combines ``EXTRACTOR_RULES_VERSION`` with a hash of every pattern table
+    and the seed-term boost. Used as part of the key for persisted
+    extraction results (see ``src.semantic.extraction_cache``).
+    """
+    hasher = hashlib.sha256(EXTRACTOR_RULES_VERSION.encode())
+    for patterns in (
+        _ACTIVITY_PATTERNS,
+        _ROLE_PATTERNS,
+        _SYSTEM_PATTERNS,
+        _DECISION_PATTERNS,
+        _DOCUMENT_PATTERNS,
+        _DATA_OBJECT_PATTERNS,
+        _EVENT_PATTERNS,
+        _GATEWAY_PATTERNS,
+    ):
+        for pattern in patterns:
+            hasher.update(f"{pattern.flags}:{pattern.pattern}".encode())
+    hasher.update(repr(SEED_TERM_CONFIDENCE_BOOST).encode())
+    return f"{EXTRACTOR_RULES_VERSION}-{hasher.hexdigest()[:12]}"
+
 
 async def extract_entities(
     text: str,
@@ -0,0 +1,289 @@
+"""Persisted cache for rule-based entity extraction.
+
+``extract_entities`` is deterministic for a given text, extractor rule set
+and seed-term list, yet the same fragment text is extracted again by the
+ingest intelligence pipeline, knowledge graph builds and POV generation.
+``ExtractionCache`` stores results in ``entity_extraction_cache`` keyed by
+(content hash, extractor version, seed-list version) and is shared by all
+of those callers.
+
+Invalidation is by key: editing the extractor rules changes
+``extractor_version()`` and editing a seed list changes
+``seed_list_version()``, so stale rows simply stop matching.
+``purge_stale_entries`` removes rows written by older extractor versions;
+it runs as part of the admin retention cleanup.
+
+The cache is an optimisation only: if a lookup or store fails, the batch is
+extracted (or returned) uncached rather than failing the caller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.models import EntityExtractionCacheEntry
+from src.semantic.entity_extraction import (
+    EntityType,
+    ExtractedEntity,
+    ExtractionResult,
+    extract_entities,
+    extractor_version,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bound on the number of hashes per IN (...) lookup.
+LOOKUP_CHUNK_SIZE = 1000
+
+# Max concurrent extractions for cache misses.
+EXTRACTION_CONCURRENCY = 10
+
+
+def content_hash(text: str) -> str:
+    """Return the SHA-256 hex digest of fragment text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def seed_list_version(seed_terms: list[str] | None) -> str:
+    """Return a stable fingerprint of a seed-term list.
+
+    Order and case do not matter, matching how ``extract_entities`` applies
+    seed terms. An empty or missing list maps to ``"none"``.
+    """
+    if not seed_terms:
+        return "none"
+    normalized = sorted({t.lower().strip() for t in seed_terms if t and t.strip()})
+    if not normalized:
+        return "none"
+    return hashlib.sha256("\n".join(normalized).encode("utf-8")).hexdigest()[:16]
+
+
+def serialize_entity(entity: ExtractedEntity) -> dict[str, Any]:
+    """Convert an ExtractedEntity to a JSON-safe dict."""
+    return {
+        "id": entity.id,
+        "entity_type": str(entity.entity_type),
+        "name": entity.name,
+        "confidence": entity.confidence,
+        "source_span": entity.source_span,
+        "aliases": list(entity.aliases),
+        "metadata": dict(entity.metadata),
+    }
+
+
+def deserialize_entity(data: dict[str, Any]) -> ExtractedEntity:
+    """Rebuild an ExtractedEntity from its serialized dict."""
+    return ExtractedEntity(
+        id=data["id"],
+        entity_type=EntityType(data["entity_type"]),
+        name=data["name"],
+        confidence=float(data.get("confidence", 0.0)),
+        source_span=data.get("source_span", ""),
+        aliases=list(data.get("aliases", [])),
+        metadata=dict(data.get("metadata", {})),
+    )
+
+
+class ExtractionCache:
+    """Session-scoped front end to the persisted extraction cache.
+
+    Results are returned as fresh ``ExtractedEntity`` objects on every call,
+    so callers may mutate them (``resolve_entities`` appends aliases)
+    without corrupting other callers' results.
+
+    Attributes:
+        hits: Number of texts served from the cache.
+        misses: Number of texts that had to be extracted.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self.hits = 0
+        self.misses = 0
+
+    async def extract(
+        self,
+        text: str,
+        fragment_id: str | None = None,
+        seed_terms: list[str] | None = None,
+    ) -> ExtractionResult:
+        """Cached equivalent of ``extract_entities`` for a single text."""
+        results = await self.extract_many([(fragment_id, text)], seed_terms=seed_terms)
+        return results[0]
+
+    async def extract_many(
+        self,
+        texts: list[tuple[str | None, str]],
+        seed_terms: list[str] | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Extract entities for many texts, reusing cached results.
+
+        Looks up all content hashes in bulk, extracts each distinct missing
+        text once (bounded concurrency), and writes new results with a
+        single conflict-tolerant insert.
+
+        Args:
+            texts: (fragment_id, text) pairs.
+            seed_terms: Canonical terms from the engagement seed list.
+            return_exceptions: If True, a failed extraction is returned in
+                place of that text's ExtractionResult (as with
+                ``asyncio.gather``) instead of being raised.
+
+        Returns:
+            One ExtractionResult (or exception) per input pair, in input order.
+        """
+        if not texts:
+            return []
+
+        extractor = extractor_version()
+        seeds = seed_list_version(seed_terms)
+        hashes = [content_hash(text or "") for _, text in texts]
+
+        non_blank = {digest: text for (_, text), digest in zip(texts, hashes, strict=True) if text and text.strip()}
+        cached = await self._load(set(non_blank), extractor, seeds)
+
+        missing = {digest: text for digest, text in non_blank.items() if digest not in cached}
+        failed: dict[str, BaseException] = {}
+
+        if missing:
+            extracted, failed = await self._extract_missing(missing, seed_terms)
+            if failed and not return_exceptions:
+                raise next(iter(failed.values()))
+            await self._store(extracted, extractor, seeds)
+            cached.update(extracted)
+
+        results: list[Any] = []
+        for (fragment_id, text), digest in zip(texts, hashes, strict=True):
+            if not text or not text.strip():
+                results.append(ExtractionResult(entities=[], fragment_id=fragment_id, raw_text_length=0))
+                continue
+            if digest in failed:
+                results.append(failed[digest])
+                continue
+            if digest in missing:
+                self.misses += 1
+            else:
+                self.hits += 1
+            results.append(
+                ExtractionResult(
+                    entities=[deserialize_entity(e) for e in cached.get(digest, [])],
+                    fragment_id=fragment_id,
+                    raw_text_length=len(text),
+                )
+            )
+
+        logger.debug("Extraction cache: %d hits, %d misses (extractor %s)", self.hits, self.misses, extractor)
+        return results
+
+    async def _load(self, hashes: set[str], extractor: str, seeds: str) -> dict[str, list[dict[str, Any]]]:
+        """Fetch cached entity payloads for the given content hashes.
+
+        A failed lookup is logged and treated as a full miss. Queries run in
+        a savepoint so a failure does not abort the caller's transaction.
+        """
+        found: dict[str, list[dict[str, Any]]] = {}
+        ordered = sorted(hashes)
+        try:
+            async with self._session.begin_nested():
+                for start in range(0, len(ordered), LOOKUP_CHUNK_SIZE):
+                    chunk = ordered[start : start + LOOKUP_CHUNK_SIZE]
+                    result = await self._session.execute(
+                        select(EntityExtractionCacheEntry.content_hash, EntityExtractionCacheEntry.entities).where(
+                            EntityExtractionCacheEntry.content_hash.in_(chunk),
+                            EntityExtractionCacheEntry.extractor_version == extractor,
+                            EntityExtractionCacheEntry.seed_version == seeds,
+                        )
+                    )
+                    for row in result.all():
+                        found[row.content_hash] = row.entities or []
+        except SQLAlchemyError as e:
+            logger.warning("Extraction cache lookup failed, extracting uncached: %s", e)
+            return {}
+        return found
+
+    async def _extract_missing(
+        self,
+        missing: dict[str, str],
+        seed_terms: list[str] | None,
+    ) -> tuple[dict[str, list[dict[str, Any]]], dict[str, BaseException]]:
+        """Run extraction for each distinct uncached text.
+
+        Returns:
+            Tuple of (digest -> serialized entities, digest -> exception)
+            for successful and failed extractions respectively.
+        """
+        sem = asyncio.Semaphore(EXTRACTION_CONCURRENCY)
+
+        async def _run(text: str) -> list[dict[str, Any]]:
+            async with sem:
+                result = await extract_entities(text, seed_terms=seed_terms)
+            return [serialize_entity(e) for e in result.entities]
+
+        digests = list(missing)
+        outcomes = await asyncio.gather(*[_run(missing[d]) for d in digests], return_exceptions=True)
+
+        extracted: dict[str, list[dict[str, Any]]] = {}
+        failed: dict[str, BaseException] = {}
+        for digest, outcome in zip(digests, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                failed[digest] = outcome
+            else:
+                extracted[digest] = outcome
+        return extracted, failed
+
+    async def _store(self, extracted: dict[str, list[dict[str, Any]]], extractor: str, seeds: str) -> None:
+        """Insert new cache rows, ignoring rows written concurrently.
+
+        A failed store is logged and skipped; results are still returned.
+        """
+        rows = [
+            {
+                "content_hash": digest,
+                "extractor_version": extractor,
+                "seed_version": seeds,
+                "entities": entities,
+            }
+            for digest, entities in extracted.items()
+        ]
+        if not rows:
+            return
+        try:
+            async with self._session.begin_nested():
+                for start in range(0, len(rows), LOOKUP_CHUNK_SIZE):
+                    stmt = insert(EntityExtractionCacheEntry).values(rows[start : start + LOOKUP_CHUNK_SIZE])
+                    await self._session.execute(stmt.on_conflict_do_nothing())
+        except SQLAlchemyError as e:
+            logger.warning("Extraction cache store failed (%d rows), continuing uncached: %s", len(rows), e)
+
+
+async def purge_stale_entries(session: AsyncSession, older_than_days: int | None = None) -> int:
+    """Delete cache rows written by other extractor versions.
+
+    Args:
+        session: Async database session.
+        older_than_days: If set, also delete current-version rows older than
+            this many days (e.g. entries for seed lists no longer in use).
+
+    Returns:
+        Number of rows deleted.
+    """
+    stale = EntityExtractionCacheEntry.extractor_version != extractor_version()
+    if older_than_days is not None:
+        cutoff = datetime.now(UTC) - timedelta(days=older_than_days)
+        stale = stale | (EntityExtractionCacheEntry.created_at < cutoff)
+    result = await session.execute(delete(EntityExtractionCacheEntry).where(stale))
+    deleted = int(getattr(result, "rowcount", 0) or 0)
+    if deleted:
+        await session.commit()
+        logger.info("Purged %d stale entity extraction cache entries", deleted)
+    return deleted
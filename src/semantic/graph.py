@@ -3,19 +3,28 @@
 Provides typed node and relationship CRUD, graph traversal, and semantic
 search operations. All operations are scoped to engagement_id for data
 isolation between consulting engagements.
+
+Every node the service writes also carries the ``KM_NODE_LABEL``
+super-label, whose unique ``id`` constraint and ``engagement_id`` index
+(see ``src.core.neo4j``) back the lookups that do not know a node's type.
 """
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
 import logging
 import re
 import uuid
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from typing import Any
 
 from neo4j import AsyncDriver
 from neo4j.exceptions import Neo4jError
 
+from src.core.neo4j import KM_NODE_LABEL
 from src.semantic.ontology.loader import (
     get_valid_node_labels as _get_valid_node_labels,
 )
@@ -27,6 +36,27 @@ logger = logging.getLogger(__name__)
 
 _VALID_PROPERTY_KEY = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
+# Rows per transaction and concurrent transactions for the batch upserts.
+UPSERT_CHUNK_SIZE = 1000
+UPSERT_CONCURRENCY = 4
+
+# Nodes or relationships per keyset page of an engagement subgraph.
+SUBGRAPH_PAGE_SIZE = 1000
+
+# Incremented by every write through KnowledgeGraphService; in-process caches
+# derived from the graph compare it to detect that they may be stale.
+_write_generation = 0
+
+
+def graph_write_generation() -> int:
+    """Return the number of graph writes made through this process's services."""
+    return _write_generation
+
+
+def _bump_write_generation() -> None:
+    global _write_generation
+    _write_generation += 1
+
 
 def _validate_property_keys(props: dict[str, Any]) -> None:
     """Validate that property keys are safe Cypher identifiers."""
@@ -35,6 +65,47 @@ def _validate_property_keys(props: dict[str, Any]) -> None:
             raise ValueError(f"Invalid property key: {key!r}")
 
 
+def _primary_label(labels: list[str]) -> str:
+    """Return a node's type label, ignoring the ``KM_NODE_LABEL`` super-label."""
+    for label in labels:
+        if label != KM_NODE_LABEL:
+            return label
+    return "Unknown"
+
+
+def _encode_cursor(*parts: str) -> str:
+    """Encode keyset cursor values as an opaque URL-safe token."""
+    return base64.urlsafe_b64encode(json.dumps(parts).encode()).decode()
+
+
+def _decode_cursor(cursor: str, size: int) -> list[str]:
+    """Decode a cursor produced by ``_encode_cursor`` with ``size`` values.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        parts = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from None
+    if not isinstance(parts, list) or len(parts) != size or not all(isinstance(p, str) for p in parts):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return parts
+
+
+# Namespace for ``stable_node_id``; changing it re-keys every derived id.
+_NODE_ID_NAMESPACE = uuid.UUID("6f1c2d0e-5b7a-4c1e-9a43-2f8d6e0b9c71")
+
+
+def stable_node_id(engagement_id: str, label: str, key: str) -> str:
+    """Derive a deterministic node id from an engagement, label and natural key.
+
+    Writers that upsert with ``batch_upsert_nodes`` use this so rerunning an
+    ingest MERGEs onto the nodes the previous run created.
+    """
+    return str(uuid.uuid5(_NODE_ID_NAMESPACE, f"{engagement_id}:{label}:{key}"))
+
+
 # Valid node labels and relationship types loaded from the YAML ontology.
 # Exported as module-level constants for backward compatibility.
 VALID_NODE_LABELS: frozenset[str] = _get_valid_node_labels()
@@ -92,6 +163,48 @@ class GraphStats:
     relationships_by_type: dict[str, int] = field(default_factory=dict)
 
 
+@dataclass
+class UpsertResult:
+    """Outcome of a batch upsert.
+
+    Attributes:
+        created: Entities that did not exist and were created.
+        matched: Entities that already existed and were updated in place.
+    """
+
+    created: int = 0
+    matched: int = 0
+
+    @property
+    def total(self) -> int:
+        """Number of entities written (created or matched)."""
+        return self.created + self.matched
+
+    def __add__(self, other: UpsertResult) -> UpsertResult:
+        return UpsertResult(created=self.created + other.created, matched=self.matched + other.matched)
+
+
+def _node_from_record(record: dict[str, Any]) -> GraphNode:
+    return GraphNode(
+        id=record["n"].get("id", ""),
+        label=_primary_label(record["labels"]),
+        properties=dict(record["n"]),
+    )
+
+
+def _relationship_from_record(record: dict[str, Any]) -> GraphRelationship:
+    r = record["r"]
+    rel_props = dict(r) if isinstance(r, dict) else {}
+    rel_id = rel_props.pop("id", "") or record.get("rel_element_id", "")
+    return GraphRelationship(
+        id=rel_id,
+        from_id=record["from_id"],
+        to_id=record["to_id"],
+        relationship_type=record["rel_type"],
+        properties=rel_props,
+    )
+
+
 class KnowledgeGraphService:
     """Service for managing the Neo4j knowledge graph.
 
@@ -180,9 +293,59 @@ class KnowledgeGraphService:
             result = await tx.run(query, parameters or {})
             return await result.data()
 
+        _bump_write_generation()
         async with self._driver.session() as session:
             return await session.execute_write(_tx_func)
 
+    async def _run_chunked_upsert(
+        self,
+        query: str,
+        rows: list[dict[str, Any]],
+        created_counter: str,
+        chunk_size: int,
+        concurrency: int,
+    ) -> UpsertResult:
+        """Run an ``UNWIND $rows`` MERGE query over ``rows`` in chunks.
+
+        Each chunk is its own write transaction, so a failure leaves the
+        chunks already committed in place; the MERGE queries make a rerun
+        safe. At most ``concurrency`` chunks are in flight at once.
+
+        Args:
+            query: Cypher query that unwinds ``$rows`` and returns the
+                number of merged entities as ``merged``.
+            rows: Parameter rows.
+            created_counter: Name of the summary counter holding the number
+                of entities created (``nodes_created`` or
+                ``relationships_created``).
+            chunk_size: Rows per transaction.
+            concurrency: Maximum number of concurrent transactions.
+
+        Returns:
+            Created and matched counts summed over all chunks.
+        """
+        if chunk_size < 1 or concurrency < 1:
+            raise ValueError("chunk_size and concurrency must be positive")
+
+        semaphore = asyncio.Semaphore(concurrency)
+        _bump_write_generation()
+
+        async def _tx_func(tx, chunk):
+            result = await tx.run(query, {"rows": chunk})
+            record = await result.single()
+            summary = await result.consume()
+            return (record["merged"] if record else 0), getattr(summary.counters, created_counter)
+
+        async def _write_chunk(chunk: list[dict[str, Any]]) -> UpsertResult:
+            async with semaphore, self._driver.session() as session:
+                merged, created = await session.execute_write(_tx_func, chunk)
+            return UpsertResult(created=created, matched=merged - created)
+
+        results = await asyncio.gather(
+            *(_write_chunk(rows[start : start + chunk_size]) for start in range(0, len(rows), chunk_size))
+        )
+        return sum(results, UpsertResult())
+
     # -----------------------------------------------------------------
     # Node operations
     # -----------------------------------------------------------------
@@ -219,7 +382,7 @@ class KnowledgeGraphService:
 
         # Build SET clause from properties
         set_clauses = ", ".join(f"n.{k} = ${k}" for k in props)
-        query = f"CREATE (n:{label}) SET {set_clauses} RETURN n.id AS id"
+        query = f"CREATE (n:{label}:{KM_NODE_LABEL}) SET {set_clauses} RETURN n.id AS id"
 
         await self._run_write_query(query, props)
         return GraphNode(id=node_id, label=label, properties=props)
@@ -233,8 +396,8 @@ class KnowledgeGraphService:
         Returns:
             The GraphNode if found, None otherwise.
         """
-        query = """
-        MATCH (n {id: $node_id})
+        query = f"""
+        MATCH (n:{KM_NODE_LABEL} {{id: $node_id}})
         RETURN n, labels(n) AS labels
         """
         records = await self._run_query(query, {"node_id": node_id})
@@ -243,12 +406,10 @@ class KnowledgeGraphService:
 
         record = records[0]
         node_data = record["n"]
-        labels = record["labels"]
-        label = labels[0] if labels else "Unknown"
 
         return GraphNode(
             id=node_id,
-            label=label,
+            label=_primary_label(record["labels"]),
             properties=dict(node_data),
         )
 
@@ -324,10 +485,58 @@ class KnowledgeGraphService:
         for props in props_list:
             _validate_property_keys(props)
 
-        query = f"UNWIND $nodes AS props CREATE (n:{label}) SET n = props RETURN n.id AS id"
+        query = f"UNWIND $nodes AS props CREATE (n:{label}:{KM_NODE_LABEL}) SET n = props RETURN n.id AS id"
         records = await self._run_write_query(query, {"nodes": props_list})
         return [r["id"] for r in records]
 
+    async def batch_upsert_nodes(
+        self,
+        label: str,
+        props_list: list[dict[str, Any]],
+        chunk_size: int = UPSERT_CHUNK_SIZE,
+        concurrency: int = UPSERT_CONCURRENCY,
+    ) -> UpsertResult:
+        """Create or update nodes of the same label, keyed by ``id``.
+
+        Unlike ``batch_create_nodes`` this MERGEs on the super-label's unique
+        ``id``, so rerunning an ingest updates the existing nodes instead of
+        duplicating them. Properties are merged into existing nodes. The
+        payload is split into ``chunk_size`` transactions, at most
+        ``concurrency`` of them in flight. When ids repeat in ``props_list``
+        the last entry wins.
+
+        Args:
+            label: Node label (must be in VALID_NODE_LABELS).
+            props_list: List of property dicts. Each dict must include 'name',
+                'engagement_id', and 'id'.
+            chunk_size: Nodes per transaction.
+            concurrency: Maximum number of concurrent transactions.
+
+        Returns:
+            Counts of created and matched nodes.
+
+        Raises:
+            ValueError: If label is invalid, any property key is unsafe, or
+                chunk_size/concurrency is not positive.
+        """
+        if label not in VALID_NODE_LABELS:
+            raise ValueError(f"Invalid node label: {label}")
+        for props in props_list:
+            _validate_property_keys(props)
+
+        # Deduplicate so concurrent chunks never race to create the same id.
+        rows = list({props["id"]: props for props in props_list}.values())
+        if not rows:
+            return UpsertResult()
+
+        query = f"""
+        UNWIND $rows AS props
+        MERGE (n:{KM_NODE_LABEL} {{id: props.id}})
+        SET n += props, n:{label}
+        RETURN count(n) AS merged
+        """
+        return await self._run_chunked_upsert(query, rows, "nodes_created", chunk_size, concurrency)
+
     # -----------------------------------------------------------------
     # Relationship operations
     # -----------------------------------------------------------------
@@ -369,7 +578,7 @@ class KnowledgeGraphService:
         prop_params = {f"prop_{k}": v for k, v in props.items()}
 
         query = f"""
-        MATCH (a {{id: $from_id}}), (b {{id: $to_id}})
+        MATCH (a:{KM_NODE_LABEL} {{id: $from_id}}), (b:{KM_NODE_LABEL} {{id: $to_id}})
         CREATE (a)-[r:{relationship_type}]->(b)
         SET {set_parts}
         RETURN r.id AS id
@@ -429,7 +638,7 @@ class KnowledgeGraphService:
 
         query = f"""
         UNWIND $rels AS rel
-        MATCH (a {{id: rel.from_id}}), (b {{id: rel.to_id}})
+        MATCH (a:{KM_NODE_LABEL} {{id: rel.from_id}}), (b:{KM_NODE_LABEL} {{id: rel.to_id}})
         CREATE (a)-[r:{relationship_type}]->(b)
         SET r = rel.props
         RETURN count(r) AS created
@@ -437,6 +646,67 @@ class KnowledgeGraphService:
         records = await self._run_write_query(query, {"rels": normalised})
         return records[0]["created"] if records else 0
 
+    async def batch_upsert_relationships(
+        self,
+        relationship_type: str,
+        rels: list[dict[str, Any]],
+        chunk_size: int = UPSERT_CHUNK_SIZE,
+        concurrency: int = UPSERT_CONCURRENCY,
+    ) -> UpsertResult:
+        """Create or update relationships of the same type.
+
+        Unlike ``batch_create_relationships`` this MERGEs on
+        (from_id, type, to_id), so at most one relationship of the type joins
+        a pair of nodes and reruns update it in place. Properties are merged
+        into existing relationships; the relationship ``id`` is only set on
+        creation. Pairs where either node does not exist are skipped and not
+        counted. The payload is chunked as in ``batch_upsert_nodes``; when a
+        pair repeats in ``rels`` the last entry wins.
+
+        Args:
+            relationship_type: Edge type (must be in VALID_RELATIONSHIP_TYPES).
+            rels: List of dicts, each with 'from_id', 'to_id', and optional
+                'properties' (a dict of relationship properties).
+            chunk_size: Relationships per transaction.
+            concurrency: Maximum number of concurrent transactions.
+
+        Returns:
+            Counts of created and matched relationships.
+
+        Raises:
+            ValueError: If relationship_type is invalid, any property key is
+                unsafe, or chunk_size/concurrency is not positive.
+        """
+        if relationship_type not in VALID_RELATIONSHIP_TYPES:
+            raise ValueError(
+                f"Invalid relationship type: {relationship_type}. Must be one of {VALID_RELATIONSHIP_TYPES}"
+            )
+
+        by_pair: dict[tuple[str, str], dict[str, Any]] = {}
+        for rel in rels:
+            props = dict(rel.get("properties") or {})
+            _validate_property_keys(props)
+            by_pair[(rel["from_id"], rel["to_id"])] = {
+                "from_id": rel["from_id"],
+                "to_id": rel["to_id"],
+                "id": uuid.uuid4().hex[:16],
+                "props": props,
+            }
+        if not by_pair:
+            return UpsertResult()
+
+        query = f"""
+        UNWIND $rows AS rel
+        MATCH (a:{KM_NODE_LABEL} {{id: rel.from_id}}), (b:{KM_NODE_LABEL} {{id: rel.to_id}})
+        MERGE (a)-[r:{relationship_type}]->(b)
+        ON CREATE SET r.id = rel.id
+        SET r += rel.props
+        RETURN count(r) AS merged
+        """
+        return await self._run_chunked_upsert(
+            query, list(by_pair.values()), "relationships_created", chunk_size, concurrency
+        )
+
     async def get_relationships(
         self,
         node_id: str,
@@ -465,20 +735,19 @@ class KnowledgeGraphService:
 
         if direction == "outgoing":
             query = f"""
-            MATCH (a {{id: $node_id}})-[r{rel_filter}]->(b)
+            MATCH (a:{KM_NODE_LABEL} {{id: $node_id}})-[r{rel_filter}]->(b)
             RETURN r, a.id AS from_id, b.id AS to_id, type(r) AS rel_type
             LIMIT $limit
             """
         elif direction == "incoming":
             query = f"""
-            MATCH (a)-[r{rel_filter}]->(b {{id: $node_id}})
+            MATCH (a)-[r{rel_filter}]->(b:{KM_NODE_LABEL} {{id: $node_id}})
             RETURN r, a.id AS from_id, b.id AS to_id, type(r) AS rel_type
             LIMIT $limit
             """
         else:
             query = f"""
-            MATCH (a)-[r{rel_filter}]-(b)
-            WHERE a.id = $node_id
+            MATCH (a:{KM_NODE_LABEL} {{id: $node_id}})-[r{rel_filter}]-(b)
             RETURN r, a.id AS from_id, b.id AS to_id, type(r) AS rel_type
             LIMIT $limit
             """
@@ -542,7 +811,7 @@ class KnowledgeGraphService:
             rel_filter = ":" + "|".join(relationship_types)
 
         query = f"""
-        MATCH (start {{id: $start_id}})-[r{rel_filter}*1..{depth}]-(connected)
+        MATCH (start:{KM_NODE_LABEL} {{id: $start_id}})-[r{rel_filter}*1..{depth}]-(connected)
         RETURN DISTINCT connected, labels(connected) AS labels
         LIMIT $limit
         """
@@ -551,7 +820,7 @@ class KnowledgeGraphService:
         return [
             GraphNode(
                 id=record["connected"].get("id", ""),
-                label=record["labels"][0] if record["labels"] else "Unknown",
+                label=_primary_label(record["labels"]),
                 properties=dict(record["connected"]),
             )
             for record in records
@@ -619,13 +888,13 @@ class KnowledgeGraphService:
             # Collect all entity IDs for a single batch Neo4j lookup
             entity_ids = [str(row.evidence_id) for row in rows]
             batch_records = await self._run_query(
-                "MATCH (n) WHERE n.id IN $ids RETURN n, labels(n) AS labels",
+                f"MATCH (n:{KM_NODE_LABEL}) WHERE n.id IN $ids RETURN n, labels(n) AS labels",
                 {"ids": entity_ids},
             )
             node_lookup: dict[str, GraphNode] = {
                 record["n"].get("id", ""): GraphNode(
                     id=record["n"].get("id", ""),
-                    label=record["labels"][0] if record["labels"] else "Unknown",
+                    label=_primary_label(record["labels"]),
                     properties=dict(record["n"]),
                 )
                 for record in batch_records
@@ -675,8 +944,9 @@ class KnowledgeGraphService:
         Returns:
             True if a node was deleted, False if not found.
         """
-        query = """
-        MATCH (n {id: $node_id, engagement_id: $engagement_id})
+        query = f"""
+        MATCH (n:{KM_NODE_LABEL} {{id: $node_id}})
+        WHERE n.engagement_id = $engagement_id
         DETACH DELETE n
         RETURN count(n) AS deleted
         """
@@ -695,8 +965,8 @@ class KnowledgeGraphService:
         Returns:
             Count of deleted nodes.
         """
-        query = """
-        MATCH (n {engagement_id: $engagement_id})
+        query = f"""
+        MATCH (n:{KM_NODE_LABEL} {{engagement_id: $engagement_id}})
         DETACH DELETE n
         RETURN count(n) AS deleted
         """
@@ -709,62 +979,195 @@ class KnowledgeGraphService:
     # Engagement subgraph
     # -----------------------------------------------------------------
 
-    async def get_engagement_subgraph(
+    async def get_engagement_node_page(
         self,
         engagement_id: str,
-        limit: int = 500,
-    ) -> dict[str, Any]:
-        """Get the full knowledge graph for an engagement.
+        cursor: str | None = None,
+        limit: int = SUBGRAPH_PAGE_SIZE,
+        label: str | None = None,
+        properties: bool = True,
+    ) -> tuple[list[GraphNode], str | None]:
+        """Get one keyset page of an engagement's nodes, ordered by id.
 
         Args:
-            engagement_id: The engagement to get the subgraph for.
-            limit: Maximum number of nodes and relationships to return
-                (default 500). Guards against unbounded result sets on
-                large engagements.
+            engagement_id: The engagement to page through.
+            cursor: Cursor returned with the previous page, or None for the
+                first page.
+            limit: Maximum number of nodes in the page.
+            label: Optional node label to restrict the page to.
+            properties: If False, nodes carry only their ``id`` property,
+                which is much cheaper for topology-only readers.
 
         Returns:
-            Dict with 'nodes' and 'relationships' lists.
+            The page of nodes and the cursor for the next page, or None
+            when this is the last page.
+
+        Raises:
+            ValueError: If label is invalid or the cursor is malformed.
         """
-        # Get all nodes for engagement
-        node_query = """
-        MATCH (n {engagement_id: $engagement_id})
-        RETURN n, labels(n) AS labels
+        if label is not None and label not in VALID_NODE_LABELS:
+            raise ValueError(f"Invalid node label: {label}")
+        after = _decode_cursor(cursor, 1)[0] if cursor else ""
+        label_filter = f" AND n:{label}" if label else ""
+        node_value = "n" if properties else "n {.id} AS n"
+
+        query = f"""
+        MATCH (n:{KM_NODE_LABEL})
+        WHERE n.engagement_id = $engagement_id AND n.id > $after{label_filter}
+        RETURN {node_value}, labels(n) AS labels
+        ORDER BY n.id
         LIMIT $limit
         """
-        node_records = await self._run_query(node_query, {"engagement_id": engagement_id, "limit": limit})
+        records = await self._run_query(query, {"engagement_id": engagement_id, "after": after, "limit": limit})
 
-        nodes = [
-            GraphNode(
-                id=record["n"].get("id", ""),
-                label=record["labels"][0] if record["labels"] else "Unknown",
-                properties=dict(record["n"]),
-            )
-            for record in node_records
-        ]
+        nodes = [_node_from_record(record) for record in records]
+        next_cursor = _encode_cursor(nodes[-1].id) if len(nodes) == limit else None
+        return nodes, next_cursor
+
+    async def get_engagement_relationship_page(
+        self,
+        engagement_id: str,
+        cursor: str | None = None,
+        limit: int = SUBGRAPH_PAGE_SIZE,
+        properties: bool = True,
+    ) -> tuple[list[GraphRelationship], str | None]:
+        """Get one keyset page of the relationships between an engagement's nodes.
+
+        Relationships are ordered by source node id, then element id.
+
+        Args:
+            engagement_id: The engagement to page through.
+            cursor: Cursor returned with the previous page, or None for the
+                first page.
+            limit: Maximum number of relationships in the page.
+            properties: If False, relationships carry only their ``id``
+                property.
+
+        Returns:
+            The page of relationships and the cursor for the next page, or
+            None when this is the last page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        after_from, after_rel = _decode_cursor(cursor, 2) if cursor else ("", "")
+        rel_value = "r" if properties else "r {.id} AS r"
 
-        # Get all relationships between engagement nodes
-        rel_query = """
-        MATCH (a {engagement_id: $engagement_id})-[r]->(b {engagement_id: $engagement_id})
-        RETURN r, a.id AS from_id, b.id AS to_id, type(r) AS rel_type,
+        query = f"""
+        MATCH (a:{KM_NODE_LABEL})
+        WHERE a.engagement_id = $engagement_id AND a.id >= $after_from
+        MATCH (a)-[r]->(b:{KM_NODE_LABEL})
+        WHERE b.engagement_id = $engagement_id
+          AND (a.id > $after_from OR elementId(r) > $after_rel)
+        RETURN {rel_value}, a.id AS from_id, b.id AS to_id, type(r) AS rel_type,
                elementId(r) AS rel_element_id
+        ORDER BY from_id, rel_element_id
         LIMIT $limit
         """
-        rel_records = await self._run_query(rel_query, {"engagement_id": engagement_id, "limit": limit})
+        records = await self._run_query(
+            query,
+            {"engagement_id": engagement_id, "after_from": after_from, "after_rel": after_rel, "limit": limit},
+        )
 
-        relationships = []
-        for record in rel_records:
-            r = record["r"]
-            rel_props = dict(r) if isinstance(r, dict) else {}
-            rel_id = rel_props.pop("id", "") or record.get("rel_element_id", "")
-            relationships.append(
-                GraphRelationship(
-                    id=rel_id,
-                    from_id=record["from_id"],
-                    to_id=record["to_id"],
-                    relationship_type=record["rel_type"],
-                    properties=rel_props,
-                )
+        relationships = [_relationship_from_record(record) for record in records]
+        next_cursor = None
+        if len(records) == limit:
+            next_cursor = _encode_cursor(records[-1]["from_id"], records[-1]["rel_element_id"])
+        return relationships, next_cursor
+
+    async def _iter_node_pages(
+        self, engagement_id: str, label: str | None, page_size: int, properties: bool = True
+    ) -> AsyncIterator[list[GraphNode]]:
+        cursor = None
+        while True:
+            nodes, cursor = await self.get_engagement_node_page(engagement_id, cursor, page_size, label, properties)
+            if nodes:
+                yield nodes
+            if cursor is None:
+                return
+
+    async def _iter_relationship_pages(
+        self, engagement_id: str, page_size: int, properties: bool = True
+    ) -> AsyncIterator[list[GraphRelationship]]:
+        cursor = None
+        while True:
+            relationships, cursor = await self.get_engagement_relationship_page(
+                engagement_id, cursor, page_size, properties
             )
+            if relationships:
+                yield relationships
+            if cursor is None:
+                return
+
+    async def iter_engagement_subgraph(
+        self,
+        engagement_id: str,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+        properties: bool = True,
+    ) -> AsyncIterator[list[GraphNode] | list[GraphRelationship]]:
+        """Stream an engagement's full subgraph in keyset pages.
+
+        Yields every node page first, then every relationship page, so
+        memory stays bounded by ``page_size`` however large the graph is.
+
+        Args:
+            engagement_id: The engagement to export.
+            page_size: Nodes or relationships per page.
+            properties: If False, elements carry only their ``id`` property.
+
+        Yields:
+            Lists of GraphNode, then lists of GraphRelationship.
+        """
+        async for nodes in self._iter_node_pages(engagement_id, None, page_size, properties):
+            yield nodes
+        async for relationships in self._iter_relationship_pages(engagement_id, page_size, properties):
+            yield relationships
+
+    async def list_engagement_nodes(
+        self,
+        engagement_id: str,
+        label: str | None = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+    ) -> list[GraphNode]:
+        """Get every node of an engagement, optionally of one label.
+
+        Unlike ``find_nodes`` this is not capped; it pages through the
+        engagement with keyset cursors.
+
+        Args:
+            engagement_id: The engagement to read.
+            label: Optional node label to restrict to.
+            page_size: Nodes fetched per query.
+
+        Returns:
+            All matching nodes, ordered by id.
+        """
+        return [node async for page in self._iter_node_pages(engagement_id, label, page_size) for node in page]
+
+    async def get_engagement_subgraph(
+        self,
+        engagement_id: str,
+        limit: int | None = None,
+    ) -> dict[str, Any]:
+        """Get the knowledge graph for an engagement.
+
+        Args:
+            engagement_id: The engagement to get the subgraph for.
+            limit: Maximum number of nodes and of relationships to return,
+                or None for the whole subgraph. Use
+                ``iter_engagement_subgraph`` to stream large engagements.
+
+        Returns:
+            Dict with 'nodes' and 'relationships' lists.
+        """
+        if limit is not None:
+            nodes, _ = await self.get_engagement_node_page(engagement_id, limit=limit)
+            relationships, _ = await self.get_engagement_relationship_page(engagement_id, limit=limit)
+        else:
+            nodes = await self.list_engagement_nodes(engagement_id)
+            relationships = [
+                rel async for page in self._iter_relationship_pages(engagement_id, SUBGRAPH_PAGE_SIZE) for rel in page
+            ]
 
         return {
             "nodes": nodes,
@@ -785,9 +1188,9 @@ class KnowledgeGraphService:
             GraphStats with counts by label and type.
         """
         # Count nodes by label
-        node_query = """
-        MATCH (n {engagement_id: $engagement_id})
-        RETURN labels(n)[0] AS label, count(n) AS count
+        node_query = f"""
+        MATCH (n:{KM_NODE_LABEL} {{engagement_id: $engagement_id}})
+        RETURN [label IN labels(n) WHERE label <> '{KM_NODE_LABEL}'][0] AS label, count(n) AS count
         """
         node_records = await self._run_query(node_query, {"engagement_id": engagement_id})
 
@@ -800,8 +1203,9 @@ class KnowledgeGraphService:
             total_nodes += count
 
         # Count relationships by type — scope both ends to engagement to prevent cross-engagement counting
-        rel_query = """
-        MATCH (a {engagement_id: $engagement_id})-[r]->(b {engagement_id: $engagement_id})
+        rel_query = f"""
+        MATCH (a:{KM_NODE_LABEL} {{engagement_id: $engagement_id}})-[r]->(b:{KM_NODE_LABEL})
+        WHERE b.engagement_id = $engagement_id
         RETURN type(r) AS rel_type, count(r) AS count
         """
         rel_records = await self._run_query(rel_query, {"engagement_id": engagement_id})
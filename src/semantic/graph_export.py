@@ -0,0 +1,101 @@
+"""Streaming encoders for engagement subgraph exports.
+
+Turn the keyset pages yielded by
+``KnowledgeGraphService.iter_engagement_subgraph`` into NDJSON lines or an
+Arrow IPC stream, one record batch per page, so an export never holds more
+than one page in memory.
+
+Every element is encoded as a row with the same fields: ``kind`` ("node"
+or "relationship"), ``id``, ``label`` (node label or relationship type),
+``from_id`` and ``to_id`` (relationships only) and ``properties``.
+
+Arrow output requires the optional ``pyarrow`` package
+(``pip install 'kmflow[datalake]'``).
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from src.semantic.graph import GraphNode, GraphRelationship
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def element_row(element: GraphNode | GraphRelationship) -> dict[str, Any]:
+    """Encode a node or relationship as an export row."""
+    if isinstance(element, GraphNode):
+        return {
+            "kind": "node",
+            "id": element.id,
+            "label": element.label,
+            "from_id": None,
+            "to_id": None,
+            "properties": element.properties,
+        }
+    return {
+        "kind": "relationship",
+        "id": element.id,
+        "label": element.relationship_type,
+        "from_id": element.from_id,
+        "to_id": element.to_id,
+        "properties": element.properties,
+    }
+
+
+def _dumps(value: Any) -> str:
+    # Neo4j temporal and spatial values are not JSON types; export their text form.
+    return json.dumps(value, default=str)
+
+
+async def ndjson_export(pages: AsyncIterator[list[GraphNode] | list[GraphRelationship]]) -> AsyncIterator[bytes]:
+    """Encode subgraph pages as NDJSON, one chunk per page."""
+    async for page in pages:
+        yield "".join(_dumps(element_row(element)) + "\n" for element in page).encode()
+
+
+def arrow_available() -> bool:
+    """Return True if ``pyarrow`` can be imported."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+async def arrow_export(pages: AsyncIterator[list[GraphNode] | list[GraphRelationship]]) -> AsyncIterator[bytes]:
+    """Encode subgraph pages as an Arrow IPC stream, one record batch per page.
+
+    ``properties`` is a JSON-encoded string column because property sets
+    differ between labels.
+
+    Raises:
+        ImportError: If ``pyarrow`` is not installed.
+    """
+    import pyarrow as pa
+
+    schema = pa.schema(
+        [
+            ("kind", pa.string()),
+            ("id", pa.string()),
+            ("label", pa.string()),
+            ("from_id", pa.string()),
+            ("to_id", pa.string()),
+            ("properties", pa.string()),
+        ]
+    )
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        async for page in pages:
+            rows = [element_row(element) for element in page]
+            for row in rows:
+                row["properties"] = _dumps(row["properties"])
+            writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=schema))
+            yield sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+    yield sink.getvalue()
@@ -0,0 +1,471 @@
+"""In-memory CSR snapshots of engagement knowledge graphs.
+
+Graph analytics used to run one ad-hoc Cypher query per metric, and graph
+health counted components by pulling a capped number of edges into a
+Python union-find. ``GraphSnapshot`` instead loads an engagement's topology
+once, through the keyset-paginated subgraph reads, into compact NumPy
+arrays:
+
+- node ids and primary labels, indexed ``0..n-1``;
+- edge source/target/type arrays;
+- a CSR (compressed sparse row) index of outgoing edges, and one of the
+  undirected adjacency with duplicate pairs and self-loops removed.
+
+Components, degree distributions, orphans, PageRank, betweenness and
+shortest paths are then computed with vectorised NumPy operations.
+
+Snapshots are cached per engagement by ``GraphSnapshotCache``. A cached
+snapshot is discarded once any write goes through a
+``KnowledgeGraphService`` in this process (see ``graph_write_generation``)
+or after ``graph_snapshot_ttl_seconds``, which bounds staleness for writes
+made by other processes or by modules that write to Neo4j directly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import cached_property
+
+import numpy as np
+
+from src.semantic.graph import (
+    SUBGRAPH_PAGE_SIZE,
+    GraphNode,
+    KnowledgeGraphService,
+    graph_write_generation,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_MAX_ENGAGEMENTS = 8
+
+PAGERANK_DAMPING = 0.85
+PAGERANK_TOLERANCE = 1e-6
+PAGERANK_MAX_ITERATIONS = 100
+
+
+def _encode(values: list[str]) -> tuple[list[str], np.ndarray]:
+    """Dictionary-encode strings as (distinct values, int32 codes)."""
+    index: dict[str, int] = {}
+    codes = [index.setdefault(value, len(index)) for value in values]
+    return list(index), np.asarray(codes, dtype=np.int32)
+
+
+def _distinct(values: np.ndarray) -> np.ndarray:
+    """Sorted distinct values of an integer array.
+
+    Sort-based; faster than ``np.unique`` for the int64 arrays used here.
+    """
+    values = np.sort(values)
+    if values.size:
+        values = values[np.concatenate(([True], values[1:] != values[:-1]))]
+    return values
+
+
+def _csr(node_count: int, rows: np.ndarray, cols: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Build (indptr, indices) for the edges ``rows[i] -> cols[i]``."""
+    indptr = np.zeros(node_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=node_count), out=indptr[1:])
+    return indptr, cols[np.argsort(rows, kind="stable")]
+
+
+def _expand(indptr: np.ndarray, indices: np.ndarray, frontier: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return (owner, neighbour) pairs for every CSR edge leaving ``frontier``."""
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    owners = np.repeat(frontier, counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owners, indices[np.repeat(starts, counts) + offsets]
+
+
+@dataclass(eq=False)
+class GraphSnapshot:
+    """Immutable topology of one engagement's knowledge graph.
+
+    Build with ``GraphSnapshot.build`` or ``load_graph_snapshot`` rather
+    than directly. Derived results (components, PageRank) are computed on
+    first use and kept with the snapshot.
+
+    Attributes:
+        engagement_id: Engagement the snapshot was loaded for.
+        node_ids: Node ids; a node's position is its index in every array.
+        label_names: Distinct primary node labels.
+        node_labels: Index into ``label_names`` per node.
+        type_names: Distinct relationship types.
+        src: Source node index per relationship.
+        dst: Target node index per relationship.
+        edge_types: Index into ``type_names`` per relationship.
+        generation: ``graph_write_generation()`` when loading started.
+        loaded_at: ``time.monotonic()`` when the snapshot was built.
+    """
+
+    engagement_id: str
+    node_ids: list[str]
+    label_names: list[str]
+    node_labels: np.ndarray
+    type_names: list[str]
+    src: np.ndarray
+    dst: np.ndarray
+    edge_types: np.ndarray
+    generation: int = 0
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def build(
+        cls,
+        engagement_id: str,
+        nodes: Iterable[tuple[str, str]],
+        edges: Iterable[tuple[str, str, str]],
+        generation: int = 0,
+    ) -> GraphSnapshot:
+        """Build a snapshot from (id, label) nodes and (from_id, to_id, type) edges.
+
+        Repeated node ids keep their first label. Edges whose endpoints are
+        not among ``nodes`` are dropped.
+        """
+        index: dict[str, int] = {}
+        labels: list[str] = []
+        for node_id, label in nodes:
+            if node_id not in index:
+                index[node_id] = len(labels)
+                labels.append(label)
+
+        edges = list(edges)
+        src = np.fromiter((index.get(edge[0], -1) for edge in edges), dtype=np.int64, count=len(edges))
+        dst = np.fromiter((index.get(edge[1], -1) for edge in edges), dtype=np.int64, count=len(edges))
+        known = (src >= 0) & (dst >= 0)
+        type_names, edge_types = _encode([edge[2] for edge, keep in zip(edges, known.tolist(), strict=True) if keep])
+
+        label_names, node_labels = _encode(labels)
+        return cls(
+            engagement_id=engagement_id,
+            node_ids=list(index),
+            label_names=label_names,
+            node_labels=node_labels,
+            type_names=type_names,
+            src=src[known],
+            dst=dst[known],
+            edge_types=edge_types,
+            generation=generation,
+        )
+
+    # -- Structure -----------------------------------------------------------
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return int(self.src.size)
+
+    @cached_property
+    def node_index(self) -> dict[str, int]:
+        """Map from node id to array index."""
+        return {node_id: i for i, node_id in enumerate(self.node_ids)}
+
+    @cached_property
+    def _out_csr(self) -> tuple[np.ndarray, np.ndarray]:
+        return _csr(self.node_count, self.src, self.dst)
+
+    @cached_property
+    def _undirected_pairs(self) -> tuple[np.ndarray, np.ndarray]:
+        """Distinct undirected (lo, hi) node pairs, self-loops removed."""
+        lo = np.minimum(self.src, self.dst)
+        hi = np.maximum(self.src, self.dst)
+        keys = _distinct(lo[lo != hi] * self.node_count + hi[lo != hi])
+        return keys // max(self.node_count, 1), keys % max(self.node_count, 1)
+
+    @cached_property
+    def _adjacency_csr(self) -> tuple[np.ndarray, np.ndarray]:
+        lo, hi = self._undirected_pairs
+        return _csr(self.node_count, np.concatenate([lo, hi]), np.concatenate([hi, lo]))
+
+    # -- Degrees -------------------------------------------------------------
+
+    @cached_property
+    def out_degree(self) -> np.ndarray:
+        return np.bincount(self.src, minlength=self.node_count)
+
+    @cached_property
+    def in_degree(self) -> np.ndarray:
+        return np.bincount(self.dst, minlength=self.node_count)
+
+    @property
+    def degree(self) -> np.ndarray:
+        """Total (in + out) relationship count per node."""
+        return self.out_degree + self.in_degree
+
+    def degree_distribution(self) -> dict[int, int]:
+        """Return {degree: number of nodes with that degree}."""
+        counts = np.bincount(self.degree) if self.node_count else np.zeros(0, dtype=np.int64)
+        return {int(d): int(c) for d, c in enumerate(counts) if c}
+
+    def orphans(self) -> list[str]:
+        """Ids of nodes without any relationship in the engagement."""
+        return [self.node_ids[i] for i in np.flatnonzero(self.degree == 0)]
+
+    def nodes_by_label(self) -> dict[str, int]:
+        counts = np.bincount(self.node_labels, minlength=len(self.label_names))
+        return {name: int(count) for name, count in zip(self.label_names, counts, strict=True)}
+
+    def relationships_by_type(self) -> dict[str, int]:
+        counts = np.bincount(self.edge_types, minlength=len(self.type_names))
+        return {name: int(count) for name, count in zip(self.type_names, counts, strict=True)}
+
+    # -- Components ------------------------------------------------------------
+
+    @cached_property
+    def components(self) -> np.ndarray:
+        """Weakly connected component number (``0..k-1``) per node.
+
+        Uses vectorised hooking and pointer jumping: each round links the
+        larger of two adjacent component roots under the smaller one, then
+        flattens every node's pointer to its root, until no edge crosses
+        two components.
+        """
+        parent = np.arange(self.node_count, dtype=np.int64)
+        u, v = self._undirected_pairs
+        while u.size:
+            pu, pv = parent[u], parent[v]
+            crossing = pu != pv
+            if not crossing.any():
+                break
+            u, v, pu, pv = u[crossing], v[crossing], pu[crossing], pv[crossing]
+            np.minimum.at(parent, np.maximum(pu, pv), np.minimum(pu, pv))
+            while True:
+                grandparent = parent[parent]
+                if np.array_equal(grandparent, parent):
+                    break
+                parent = grandparent
+        return np.unique(parent, return_inverse=True)[1].astype(np.int64)
+
+    def component_sizes(self) -> np.ndarray:
+        """Node count per component, largest first."""
+        if not self.node_count:
+            return np.zeros(0, dtype=np.int64)
+        return np.sort(np.bincount(self.components))[::-1]
+
+    # -- Centrality ------------------------------------------------------------
+
+    def pagerank(
+        self,
+        damping: float = PAGERANK_DAMPING,
+        tolerance: float = PAGERANK_TOLERANCE,
+        max_iterations: int = PAGERANK_MAX_ITERATIONS,
+    ) -> np.ndarray:
+        """PageRank per node over the directed relationships.
+
+        Rank held by nodes without outgoing relationships is spread evenly
+        over all nodes. Iteration stops once the L1 change is below
+        ``tolerance``.
+        """
+        n = self.node_count
+        if n == 0:
+            return np.zeros(0)
+        out_degree = self.out_degree.astype(np.float64)
+        dangling = out_degree == 0
+        inverse_out = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+        rank = np.full(n, 1.0 / n)
+        for _ in range(max_iterations):
+            flow = np.bincount(self.dst, weights=(rank * inverse_out)[self.src], minlength=n)
+            updated = (1.0 - damping) / n + damping * (flow + rank[dangling].sum() / n)
+            change = np.abs(updated - rank).sum()
+            rank = updated
+            if change < tolerance:
+                break
+        return rank
+
+    def betweenness(self, samples: int | None = None, seed: int = 0) -> np.ndarray:
+        """Betweenness centrality per node, treating relationships as undirected.
+
+        Runs Brandes' algorithm with one level-synchronous, vectorised BFS
+        per source. Exact when ``samples`` is None; otherwise ``samples``
+        random sources are used and the result is scaled up to estimate the
+        exact value, which keeps large graphs tractable.
+        """
+        n = self.node_count
+        centrality = np.zeros(n)
+        if n == 0:
+            return centrality
+        if samples is None or samples >= n:
+            sources = np.arange(n)
+        else:
+            sources = np.random.default_rng(seed).choice(n, size=samples, replace=False)
+
+        indptr, indices = self._adjacency_csr
+        for source in sources:
+            distance = np.full(n, -1, dtype=np.int64)
+            paths = np.zeros(n)
+            distance[source] = 0
+            paths[source] = 1.0
+            # Shortest-path DAG edges (parent, child), one pair of arrays per level.
+            dag: list[tuple[np.ndarray, np.ndarray]] = []
+            frontier = np.array([source])
+            while frontier.size:
+                owners, neighbours = _expand(indptr, indices, frontier)
+                depth = len(dag) + 1
+                frontier = _distinct(neighbours[distance[neighbours] == -1])
+                distance[frontier] = depth
+                on_path = distance[neighbours] == depth
+                owners, neighbours = owners[on_path], neighbours[on_path]
+                paths += np.bincount(neighbours, weights=paths[owners], minlength=n)
+                dag.append((owners, neighbours))
+
+            dependency = np.zeros(n)
+            for owners, neighbours in reversed(dag):
+                dependency += np.bincount(
+                    owners,
+                    weights=paths[owners] / paths[neighbours] * (1.0 + dependency[neighbours]),
+                    minlength=n,
+                )
+            dependency[source] = 0.0
+            centrality += dependency
+
+        # Each undirected path is counted from both of its ends.
+        return centrality / 2.0 * (n / len(sources))
+
+    # -- Paths -----------------------------------------------------------------
+
+    def shortest_path(self, from_id: str, to_id: str, directed: bool = False) -> list[str] | None:
+        """Return the node ids on a shortest path, or None if unreachable.
+
+        Args:
+            from_id: Start node id.
+            to_id: End node id.
+            directed: Follow relationships only in their direction.
+
+        Raises:
+            KeyError: If either id is not in the snapshot.
+        """
+        source, target = self.node_index[from_id], self.node_index[to_id]
+        indptr, indices = self._out_csr if directed else self._adjacency_csr
+        parent = np.full(self.node_count, -1, dtype=np.int64)
+        parent[source] = source
+        frontier = np.array([source])
+        while frontier.size and parent[target] == -1:
+            owners, neighbours = _expand(indptr, indices, frontier)
+            unseen = parent[neighbours] == -1
+            # Any owner on the previous level is a valid parent.
+            parent[neighbours[unseen]] = owners[unseen]
+            frontier = _distinct(neighbours[unseen])
+        if parent[target] == -1:
+            return None
+
+        path = [target]
+        while path[-1] != source:
+            path.append(int(parent[path[-1]]))
+        return [self.node_ids[i] for i in reversed(path)]
+
+
+async def load_graph_snapshot(
+    graph_service: KnowledgeGraphService,
+    engagement_id: str,
+    page_size: int = SUBGRAPH_PAGE_SIZE,
+) -> GraphSnapshot:
+    """Load an engagement's topology from Neo4j into a ``GraphSnapshot``.
+
+    Pages through ids, labels and relationship endpoints only; properties
+    are not transferred.
+    """
+    generation = graph_write_generation()
+    started = time.perf_counter()
+    nodes: list[tuple[str, str]] = []
+    edges: list[tuple[str, str, str]] = []
+    async for page in graph_service.iter_engagement_subgraph(engagement_id, page_size, properties=False):
+        for element in page:
+            if isinstance(element, GraphNode):
+                nodes.append((element.id, element.label))
+            else:
+                edges.append((element.from_id, element.to_id, element.relationship_type))
+
+    snapshot = GraphSnapshot.build(engagement_id, nodes, edges, generation=generation)
+    logger.info(
+        "Loaded graph snapshot for engagement %s: %d nodes, %d relationships in %.0f ms",
+        engagement_id,
+        snapshot.node_count,
+        snapshot.edge_count,
+        (time.perf_counter() - started) * 1000.0,
+    )
+    return snapshot
+
+
+class GraphSnapshotCache:
+    """Per-engagement LRU of graph snapshots.
+
+    Args:
+        ttl_seconds: Maximum age of a cached snapshot; 0 disables caching.
+        max_engagements: Maximum number of snapshots kept.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_engagements: int = DEFAULT_MAX_ENGAGEMENTS,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._max_engagements = max_engagements
+        self._snapshots: collections.OrderedDict[str, GraphSnapshot] = collections.OrderedDict()
+        self._loading: dict[str, asyncio.Lock] = {}
+
+    def _fresh(self, engagement_id: str) -> GraphSnapshot | None:
+        snapshot = self._snapshots.get(engagement_id)
+        if snapshot is None:
+            return None
+        if snapshot.generation != graph_write_generation() or time.monotonic() - snapshot.loaded_at > self._ttl:
+            del self._snapshots[engagement_id]
+            return None
+        self._snapshots.move_to_end(engagement_id)
+        return snapshot
+
+    async def get(self, graph_service: KnowledgeGraphService, engagement_id: str) -> GraphSnapshot:
+        """Return a fresh snapshot of the engagement, loading it if needed.
+
+        Concurrent callers for the same engagement share a single load.
+        """
+        if self._ttl <= 0:
+            return await load_graph_snapshot(graph_service, engagement_id)
+
+        snapshot = self._fresh(engagement_id)
+        if snapshot is not None:
+            return snapshot
+
+        lock = self._loading.setdefault(engagement_id, asyncio.Lock())
+        async with lock:
+            snapshot = self._fresh(engagement_id)
+            if snapshot is None:
+                snapshot = await load_graph_snapshot(graph_service, engagement_id)
+                self._snapshots[engagement_id] = snapshot
+                while len(self._snapshots) > self._max_engagements:
+                    self._snapshots.popitem(last=False)
+        if not lock.locked():
+            self._loading.pop(engagement_id, None)
+        return snapshot
+
+    def invalidate(self, engagement_id: str | None = None) -> None:
+        """Drop one engagement's snapshot, or all of them."""
+        if engagement_id is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(engagement_id, None)
+
+
+_cache: GraphSnapshotCache | None = None
+
+
+async def get_graph_snapshot(graph_service: KnowledgeGraphService, engagement_id: str) -> GraphSnapshot:
+    """Return a snapshot of the engagement from the process-wide cache."""
+    global _cache
+    if _cache is None:
+        from src.core.config import get_settings
+
+        settings = get_settings()
+        _cache = GraphSnapshotCache(settings.graph_snapshot_ttl_seconds, settings.graph_snapshot_max_engagements)
+    return await _cache.get(graph_service, engagement_id)
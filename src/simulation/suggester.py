@@ -140,14 +140,14 @@ Surface unknowns and areas where evidence is insufficient for confident recommen
     async def _call_llm(self, prompt: str) -> str:
         """Call the configured LLM provider.
 
-        Provider is selected via LLM_PROVIDER env var or auto-detected.
+        Provider is selected via LLM_PROVIDER env var or auto-detected;
+        the call goes through the shared executor's limits and cache.
         Raises on failure (caught by generate_suggestions which returns a fallback).
         """
-        from src.core.llm import get_llm_provider
+        from src.core.llm_executor import get_llm_executor
 
-        llm = get_llm_provider()
         model = self._settings.suggester_model
-        return await llm.generate(prompt, model=model, max_tokens=2000)
+        return await get_llm_executor().generate(prompt, model=model, max_tokens=2000)
 
     _MAX_SUGGESTION_LEN = 2000
 
@@ -0,0 +1,594 @@
+"""Streaming session aggregation for the task mining stream.
+
+``TASK_MINING_STREAM`` carries one ``aggregate`` entry per accepted
+desktop event (see ``processor.py``). ``StreamingAggregationEngine`` turns
+that stream into ``TaskMiningAction`` rows and KM4Work evidence:
+
+    stream entry -> shard (by capture session) -> SessionAggregator
+        -> HybridClassifier.classify_batch -> EvidenceMaterializer
+        -> bulk INSERT ... ON CONFLICT DO NOTHING -> checkpoint -> XACK
+
+Sharding: entries are routed to ``shard_count`` in-process shards by a
+stable hash of their capture ``session_id``. Each shard is a single task,
+so one capture session is always aggregated in order by one owner and
+sessions never need locks. Shards micro-batch entries (up to
+``batch_size`` or ``flush_interval`` seconds) so classification and
+inserts run once per batch rather than once per event.
+
+State and failover: each capture session keeps a ``SessionAggregator`` in
+memory. After every batch its state and the last stream id applied to it
+are checkpointed to Redis, and only then are the batch's entries
+acknowledged. If the process dies, unacknowledged entries are redelivered
+(to this consumer on restart, or claimed by another one) and the session
+resumes from its checkpoint. Redelivered entries at or before the
+checkpointed stream id were already applied and are skipped. Action and
+evidence ids are derived from the session and its start time, so a batch
+replayed after a crash between commit and checkpoint inserts nothing new.
+
+Ordering caveat: affinity is per process. With several API replicas
+consuming the same group, one capture session's entries can be spread
+across replicas; each replica then aggregates the part it receives.
+
+Lag: for every action, the engine records the time from the stream entry
+that completed its session (the entry id's millisecond timestamp) to the
+commit of the action. ``get_metrics`` reports the last, maximum and p95.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import json
+import logging
+import time
+import uuid
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import redis.asyncio as aioredis
+from sqlalchemy import bindparam, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.core.models import EvidenceItem, TaskMiningAction, TaskMiningSession
+from src.core.redis import TASK_MINING_STREAM, stream_ack
+from src.taskmining.aggregation.materializer import EvidenceMaterializer
+from src.taskmining.aggregation.session import AggregatedSession, SessionAggregator, _parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+TASK_MINING_GROUP = "task_mining_workers"
+CHECKPOINT_KEY_PREFIX = "kmflow:taskmining:aggregator:"
+CHECKPOINT_TTL_SECONDS = 7 * 24 * 3600
+
+DEFAULT_SHARD_COUNT = 4
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.5
+DEFAULT_SESSION_TIMEOUT_SECONDS = 900
+DEFAULT_QUEUE_SIZE = 10000
+
+# Retry backoff for batches that hit a database or Redis outage
+_RETRY_BASE_SECONDS = 0.5
+_RETRY_MAX_SECONDS = 30.0
+
+# Namespace for deterministic action/evidence ids (replays are idempotent)
+_ID_NAMESPACE = uuid.UUID("6f1c5d1e-8a43-5b7e-9c0a-7d2f4e6b1a90")
+
+# Columns EvidenceMaterializer sets on the items it builds
+_EVIDENCE_COLUMNS = (
+    "engagement_id",
+    "name",
+    "category",
+    "format",
+    "source_system",
+    "content_hash",
+    "metadata_json",
+    "completeness_score",
+    "reliability_score",
+    "freshness_score",
+    "consistency_score",
+    "validation_status",
+    "classification",
+)
+
+_increment_action_count = (
+    update(TaskMiningSession.__table__)
+    .where(TaskMiningSession.__table__.c.id == bindparam("b_session_id"))
+    .values(action_count=TaskMiningSession.__table__.c.action_count + bindparam("b_actions"))
+)
+
+
+@dataclass
+class AggregationEngineMetrics:
+    """Counters exposed by the aggregation engine.
+
+    Attributes:
+        events: Stream entries applied to a session aggregator.
+        duplicates: Redelivered entries skipped because they were already applied.
+        malformed: Entries that could not be parsed (acknowledged and dropped).
+        actions: Actions inserted.
+        evidence_items: Evidence items inserted.
+        batches: Batches committed.
+        retries: Batch attempts that failed and were retried.
+        expired_sessions: Capture sessions closed after ``session_timeout`` of silence.
+        last_lag_ms: Event-to-action lag of the most recent action.
+        max_lag_ms: Largest event-to-action lag observed.
+    """
+
+    events: int = 0
+    duplicates: int = 0
+    malformed: int = 0
+    actions: int = 0
+    evidence_items: int = 0
+    batches: int = 0
+    retries: int = 0
+    expired_sessions: int = 0
+    last_lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+
+
+@dataclass
+class _Entry:
+    """One stream entry routed to a shard."""
+
+    msg_id: str
+    task: dict[str, Any]
+    redelivered: bool = False
+
+
+@dataclass
+class _CaptureSession:
+    """In-memory aggregation state of one capture session."""
+
+    aggregator: SessionAggregator
+    last_msg_id: str = "0-0"
+    last_event_at: datetime | None = None
+    last_seen: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _Completed:
+    """An app session completed in this batch, with the entry that completed it."""
+
+    session: AggregatedSession
+    msg_id: str | None
+
+
+def _stream_id(msg_id: str) -> tuple[int, int]:
+    ms, _, seq = msg_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+def _checkpoint_key(session_id: str) -> str:
+    return f"{CHECKPOINT_KEY_PREFIX}{session_id}"
+
+
+def action_id_for(session: AggregatedSession) -> uuid.UUID:
+    """Deterministic action id: one action per app session of a capture session."""
+    return uuid.uuid5(_ID_NAMESPACE, f"{session.session_id}:{session.app_bundle_id}:{session.started_at.isoformat()}")
+
+
+class StreamingAggregationEngine:
+    """Sharded, checkpointed aggregation of ``TASK_MINING_STREAM`` entries.
+
+    The stream consumers (``worker.run_worker``) hand entries over with
+    ``submit``; the engine acknowledges them once their effects are
+    committed and checkpointed.
+
+    Args:
+        redis_client: Redis client for checkpoints and XACK.
+        session_factory: async_sessionmaker used for the bulk inserts.
+        shard_count: Number of shards (one task each).
+        batch_size: Maximum entries per shard batch.
+        flush_interval: Seconds a shard waits for a batch to fill.
+        session_timeout: Seconds without entries after which a capture
+            session's open app session is closed and the state dropped.
+        idle_threshold_seconds: ``SessionAggregator`` idle threshold.
+        queue_size: Entries buffered per shard before ``submit`` waits.
+        classifier: Object with ``classify_batch(sessions)``; defaults to
+            ``HybridClassifier``.
+        materializer: Evidence materializer; defaults to ``EvidenceMaterializer``.
+    """
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        session_factory: Any,  # Any because: async_sessionmaker; avoids circular import
+        *,
+        shard_count: int = DEFAULT_SHARD_COUNT,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        session_timeout: float = DEFAULT_SESSION_TIMEOUT_SECONDS,
+        idle_threshold_seconds: int = 300,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        classifier: Any | None = None,  # Any because: HybridClassifier or ActionClassifier
+        materializer: EvidenceMaterializer | None = None,
+    ) -> None:
+        if classifier is None:
+            from src.taskmining.ml.hybrid import HybridClassifier
+
+            classifier = HybridClassifier()
+        self._redis = redis_client
+        self._session_factory = session_factory
+        self._shard_count = max(1, shard_count)
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._session_timeout = session_timeout
+        self._idle_threshold = idle_threshold_seconds
+        self._queue_size = queue_size
+        self._classifier = classifier
+        self._materializer = materializer or EvidenceMaterializer()
+        self._queues: list[asyncio.Queue[_Entry | None]] = []
+        self._sessions: list[dict[str, _CaptureSession]] = []
+        self._tasks: list[asyncio.Task[None]] = []
+        self._stopping = False
+        self._in_flight: set[str] = set()
+        self._lags: collections.deque[float] = collections.deque(maxlen=1000)
+        self.metrics = AggregationEngineMetrics()
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """Start one task per shard."""
+        if self._tasks:
+            return
+        self._stopping = False
+        self._queues = [asyncio.Queue(maxsize=self._queue_size) for _ in range(self._shard_count)]
+        self._sessions = [{} for _ in range(self._shard_count)]
+        self._tasks = [
+            asyncio.create_task(self._run_shard(i), name=f"tm-aggregation-shard-{i}") for i in range(self._shard_count)
+        ]
+        logger.info(
+            "Task mining aggregation engine started (shards=%d, batch=%d, interval=%.2fs)",
+            self._shard_count,
+            self._batch_size,
+            self._flush_interval,
+        )
+
+    async def stop(self) -> None:
+        """Process what is already queued, then stop the shards.
+
+        Open app sessions stay in their checkpoints and resume on the next start.
+        """
+        self._stopping = True
+        for queue in self._queues:
+            await queue.put(None)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Task mining aggregation engine stopped (%s)", self.get_metrics())
+
+    def shard_for(self, session_id: str) -> int:
+        """Shard owning a capture session (stable across processes)."""
+        return zlib.crc32(session_id.encode("utf-8")) % self._shard_count
+
+    async def submit(self, msg_id: str, task: dict[str, Any], *, redelivered: bool = False) -> None:
+        """Queue an ``aggregate`` or ``materialize`` entry; waits while its shard is full.
+
+        Args:
+            msg_id: Stream entry id; acknowledged once the entry is applied.
+            task: Decoded entry payload carrying the capture ``session_id``.
+            redelivered: The entry was read from the pending list or
+                claimed, so it may already have been applied.
+
+        Raises:
+            RuntimeError: If the engine is not running.
+        """
+        if not self._tasks or self._stopping:
+            raise RuntimeError("Aggregation engine is not running")
+        if msg_id in self._in_flight:
+            return  # claimed again while still queued here
+        self._in_flight.add(msg_id)
+        shard = self.shard_for(str(task.get("session_id") or ""))
+        await self._queues[shard].put(_Entry(msg_id, task, redelivered))
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Return counters, queue depth and event-to-action lag percentiles."""
+        lags = sorted(self._lags)
+        p95 = lags[max(0, int(len(lags) * 0.95) - 1)] if lags else 0.0
+        return {
+            "queue_depth": sum(q.qsize() for q in self._queues),
+            "open_sessions": sum(len(s) for s in self._sessions),
+            "events": self.metrics.events,
+            "duplicates": self.metrics.duplicates,
+            "malformed": self.metrics.malformed,
+            "actions": self.metrics.actions,
+            "evidence_items": self.metrics.evidence_items,
+            "batches": self.metrics.batches,
+            "retries": self.metrics.retries,
+            "expired_sessions": self.metrics.expired_sessions,
+            "last_lag_ms": round(self.metrics.last_lag_ms, 1),
+            "max_lag_ms": round(self.metrics.max_lag_ms, 1),
+            "p95_lag_ms": round(p95, 1),
+        }
+
+    # -- Shard loop ----------------------------------------------------------
+
+    async def _run_shard(self, shard: int) -> None:
+        """Collect micro-batches for one shard and apply them in order."""
+        queue = self._queues[shard]
+        loop = asyncio.get_running_loop()
+        done = False
+        while not done:
+            batch: list[_Entry] = []
+            try:
+                entry = await asyncio.wait_for(queue.get(), timeout=self._flush_interval)
+            except TimeoutError:
+                await self._apply_with_retry(shard, [])
+                continue
+            if entry is None:
+                break
+            batch.append(entry)
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._batch_size:
+                remaining = deadline - loop.time()
+                try:
+                    entry = queue.get_nowait() if remaining <= 0 else await asyncio.wait_for(queue.get(), remaining)
+                except (TimeoutError, asyncio.QueueEmpty):
+                    break
+                if entry is None:
+                    done = True
+                    break
+                batch.append(entry)
+            await self._apply_with_retry(shard, batch)
+
+    async def _apply_with_retry(self, shard: int, batch: list[_Entry]) -> None:
+        """Apply a batch, retrying through database or Redis outages.
+
+        A failed attempt evicts the batch's sessions from memory so the
+        retry starts again from their checkpoints (see ``_apply_batch``). The shard keeps retrying
+        (holding back its later entries, which preserves per-session order)
+        until the batch succeeds or the engine stops; entries still
+        unacknowledged at stop are redelivered later.
+        """
+        attempt = 0
+        while True:
+            try:
+                await self._apply_batch(shard, batch)
+                return
+            except (SQLAlchemyError, aioredis.RedisError, ConnectionError, OSError) as exc:
+                self.metrics.retries += 1
+                if self._stopping:
+                    self._in_flight.difference_update(entry.msg_id for entry in batch)
+                    logger.warning("Aggregation batch of %d entries abandoned at shutdown: %s", len(batch), exc)
+                    return
+                delay = min(_RETRY_MAX_SECONDS, _RETRY_BASE_SECONDS * 2**attempt)
+                logger.warning("Aggregation batch failed (shard %d), retrying in %.1fs: %s", shard, delay, exc)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _apply_batch(self, shard: int, batch: list[_Entry]) -> None:
+        """Aggregate, classify, persist, checkpoint and acknowledge one batch."""
+        sessions = self._sessions[shard]
+        by_session: dict[str, list[_Entry]] = collections.defaultdict(list)
+        ack_ids: list[str] = []
+        for entry in batch:
+            session_id = entry.task.get("session_id")
+            if session_id:
+                by_session[str(session_id)].append(entry)
+            else:
+                self.metrics.malformed += 1
+                logger.warning("Task mining entry %s has no session_id, skipping", entry.msg_id)
+                ack_ids.append(entry.msg_id)
+
+        completed: list[_Completed] = []
+        closed: set[str] = set()
+        expired: dict[str, _CaptureSession] = {}
+        try:
+            await self._load_checkpoints(sessions, [sid for sid in by_session if sid not in sessions])
+            for session_id, entries in by_session.items():
+                state = sessions[session_id]
+                completed.extend(self._apply_entries(session_id, state, entries))
+                ack_ids.extend(entry.msg_id for entry in entries)
+                if any(entry.task.get("task_type") == "materialize" for entry in entries):
+                    closed.add(session_id)
+
+            expired = self._expire_sessions(sessions, exclude=by_session.keys())
+            for session_id, state in expired.items():
+                completed.extend(_Completed(s, None) for s in state.aggregator.flush(state.last_event_at))
+                closed.add(session_id)
+
+            if completed:
+                await self._persist(completed)
+            await self._checkpoint(sessions, by_session.keys(), closed, expired)
+            if ack_ids:
+                await stream_ack(self._redis, TASK_MINING_STREAM, TASK_MINING_GROUP, *ack_ids)
+                self._in_flight.difference_update(ack_ids)
+        except Exception:
+            # Drop the partly applied state; the retry reloads the checkpoints and,
+            # since the checkpoint may already include these entries, dedupes them.
+            for session_id in (*by_session, *expired):
+                sessions.pop(session_id, None)
+            for entry in batch:
+                entry.redelivered = True
+            raise
+
+        for session_id in closed:
+            sessions.pop(session_id, None)
+        self.metrics.expired_sessions += len(expired)
+        if batch or completed:
+            self.metrics.batches += 1
+        self._record_lag(completed)
+
+    def _apply_entries(self, session_id: str, state: _CaptureSession, entries: list[_Entry]) -> list[_Completed]:
+        """Feed one capture session's entries to its aggregator in event order."""
+        events: list[tuple[datetime, str, dict[str, Any] | None]] = []
+        materialize_id: str | None = None
+        for entry in entries:
+            if entry.redelivered and _stream_id(entry.msg_id) <= _stream_id(state.last_msg_id):
+                self.metrics.duplicates += 1
+                continue
+            if entry.task.get("task_type") == "materialize":
+                materialize_id = entry.msg_id
+                continue
+            try:
+                timestamp = _parse_timestamp(entry.task.get("timestamp", ""))
+            except (ValueError, TypeError):
+                self.metrics.malformed += 1
+                logger.warning("Task mining entry %s has an invalid timestamp, skipping", entry.msg_id)
+                continue
+            events.append((timestamp, entry.msg_id, {**entry.task, "timestamp": timestamp}))
+
+        completed: list[_Completed] = []
+        # Uploads can arrive out of order (agents pipeline batches); sort within the batch
+        for timestamp, msg_id, event in sorted(events, key=lambda e: (e[0], _stream_id(e[1]))):
+            state.aggregator.process_events([event])
+            completed.extend(_Completed(s, msg_id) for s in state.aggregator.take_completed())
+            if state.last_event_at is None or timestamp > state.last_event_at:
+                state.last_event_at = timestamp
+            self.metrics.events += 1
+        if materialize_id is not None:
+            completed.extend(_Completed(s, materialize_id) for s in state.aggregator.flush(state.last_event_at))
+
+        for entry in entries:
+            if _stream_id(entry.msg_id) > _stream_id(state.last_msg_id):
+                state.last_msg_id = entry.msg_id
+        state.last_seen = time.monotonic()
+        return completed
+
+    def _expire_sessions(self, sessions: dict[str, _CaptureSession], exclude: Any) -> dict[str, _CaptureSession]:
+        """Capture sessions that received nothing for ``session_timeout`` seconds."""
+        cutoff = time.monotonic() - self._session_timeout
+        return {sid: state for sid, state in sessions.items() if state.last_seen < cutoff and sid not in exclude}
+
+    # -- Persistence ---------------------------------------------------------
+
+    async def _persist(self, completed: list[_Completed]) -> None:
+        """Classify completed app sessions in one call and bulk-insert actions and evidence."""
+        app_sessions = [c.session for c in completed]
+        classifications = self._classifier.classify_batch(app_sessions)
+
+        action_rows: list[dict[str, Any]] = []
+        evidence_rows: list[dict[str, Any]] = []
+        for app_session, classification in zip(app_sessions, classifications, strict=True):
+            if not app_session.engagement_id or not app_session.session_id:
+                logger.warning("Completed app session without session/engagement id, skipping")
+                continue
+            action_id = action_id_for(app_session)
+            evidence_id = None
+            item = self._materializer.materialize_action(app_session, classification, action_id)
+            if item is not None:
+                evidence_id = uuid.uuid5(_ID_NAMESPACE, f"evidence:{action_id}")
+                evidence_rows.append(_evidence_row(item, evidence_id))
+            action_rows.append(_action_row(app_session, classification, action_id, evidence_id))
+
+        if not action_rows:
+            return
+        async with self._session_factory() as db:
+            if evidence_rows:
+                result = await db.execute(
+                    insert(EvidenceItem).on_conflict_do_nothing(index_elements=["id"]).returning(EvidenceItem.id),
+                    evidence_rows,
+                )
+                self.metrics.evidence_items += len(result.all())
+            result = await db.execute(
+                insert(TaskMiningAction)
+                .on_conflict_do_nothing(index_elements=["id"])
+                .returning(TaskMiningAction.session_id),
+                action_rows,
+            )
+            inserted = collections.Counter(row[0] for row in result.all())
+            if inserted:
+                await db.execute(
+                    _increment_action_count,
+                    [{"b_session_id": sid, "b_actions": count} for sid, count in inserted.items()],
+                )
+            await db.commit()
+        self.metrics.actions += sum(inserted.values())
+
+    async def _load_checkpoints(self, sessions: dict[str, _CaptureSession], session_ids: list[str]) -> None:
+        """Restore capture sessions not in memory from their Redis checkpoints."""
+        if not session_ids:
+            return
+        raw = await self._redis.mget([_checkpoint_key(sid) for sid in session_ids])
+        for session_id, value in zip(session_ids, raw, strict=True):
+            if value is None:
+                sessions[session_id] = _CaptureSession(SessionAggregator(self._idle_threshold))
+                continue
+            data = json.loads(value)
+            sessions[session_id] = _CaptureSession(
+                aggregator=SessionAggregator.from_state(data["aggregator"]),
+                last_msg_id=data.get("last_msg_id", "0-0"),
+                last_event_at=_parse_timestamp(data["last_event_at"]) if data.get("last_event_at") else None,
+            )
+
+    async def _checkpoint(
+        self,
+        sessions: dict[str, _CaptureSession],
+        touched: Any,
+        closed: set[str],
+        expired: dict[str, _CaptureSession],
+    ) -> None:
+        """Write the state of every touched session; closed sessions keep only their stream position."""
+        if not touched and not expired:
+            return
+        pipe = self._redis.pipeline(transaction=False)
+        for session_id in expired:
+            pipe.delete(_checkpoint_key(session_id))
+        for session_id in touched:
+            state = sessions[session_id]
+            data = {
+                "last_msg_id": state.last_msg_id,
+                "last_event_at": state.last_event_at.isoformat() if state.last_event_at else None,
+                "aggregator": state.aggregator.to_state(),
+            }
+            # A materialized session keeps its position so late redeliveries are still skipped
+            ttl = CHECKPOINT_TTL_SECONDS if session_id not in closed else int(self._session_timeout) + 3600
+            pipe.set(_checkpoint_key(session_id), json.dumps(data), ex=ttl)
+        await pipe.execute()
+
+    def _record_lag(self, completed: list[_Completed]) -> None:
+        now_ms = time.time() * 1000
+        for item in completed:
+            if item.msg_id is None:
+                continue
+            lag = max(0.0, now_ms - _stream_id(item.msg_id)[0])
+            self._lags.append(lag)
+            self.metrics.last_lag_ms = lag
+            self.metrics.max_lag_ms = max(self.metrics.max_lag_ms, lag)
+
+
+def _action_row(
+    session: AggregatedSession,
+    classification: Any,
+    action_id: uuid.UUID,
+    evidence_id: uuid.UUID | None,
+) -> dict[str, Any]:
+    return {
+        "id": action_id,
+        "session_id": uuid.UUID(str(session.session_id)),
+        "engagement_id": uuid.UUID(str(session.engagement_id)),
+        "category": classification.category,
+        "application_name": session.app_bundle_id[:255],
+        "window_title": session.window_title_sample[:512] if session.window_title_sample else None,
+        "description": classification.description,
+        "event_count": session.total_event_count,
+        "duration_seconds": session.duration_ms / 1000,
+        "started_at": session.started_at,
+        "ended_at": session.ended_at or session.started_at,
+        "action_data": {
+            "confidence": classification.confidence,
+            "rule_name": classification.rule_name,
+            "active_duration_ms": session.active_duration_ms,
+            "idle_duration_ms": session.idle_duration_ms,
+            "keyboard_event_count": session.keyboard_event_count,
+            "mouse_event_count": session.mouse_event_count,
+            "copy_paste_count": session.copy_paste_count,
+            "scroll_count": session.scroll_count,
+            "file_operation_count": session.file_operation_count,
+            "url_navigation_count": session.url_navigation_count,
+        },
+        "evidence_item_id": evidence_id,
+    }
+
+
+def _evidence_row(item: EvidenceItem, evidence_id: uuid.UUID) -> dict[str, Any]:
+    row = {column: getattr(item, column) for column in _EVIDENCE_COLUMNS}
+    row["id"] = evidence_id
+    row["engagement_id"] = uuid.UUID(str(row["engagement_id"]))
+    row["name"] = row["name"][:512]
+    return row
@@ -8,7 +8,7 @@ time windows.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from typing import Any
 
@@ -93,14 +93,54 @@ class SessionAggregator:
         # Return only the sessions completed during this batch
         return self._completed_sessions[initial_count:]
 
-    def flush(self) -> list[AggregatedSession]:
-        """Force-complete any active session and return all completed sessions."""
+    def flush(self, end_time: datetime | None = None) -> list[AggregatedSession]:
+        """Force-complete any active session and return all completed sessions.
+
+        Args:
+            end_time: End of the active session; defaults to now.
+        """
         if self._active_session:
-            self._close_session(datetime.now(UTC))
+            self._close_session(end_time or datetime.now(UTC))
+        return self.take_completed()
+
+    def take_completed(self) -> list[AggregatedSession]:
+        """Return the completed sessions and forget them (for long-running aggregators)."""
         result = list(self._completed_sessions)
         self._completed_sessions.clear()
         return result
 
+    def to_state(self) -> dict[str, Any]:
+        """JSON-serialisable state of the open session, for checkpointing.
+
+        Completed sessions are not included; take them first.
+        """
+        active: dict[str, Any] | None = None
+        if self._active_session is not None:
+            active = asdict(self._active_session)
+            for key in ("started_at", "ended_at"):
+                if active[key] is not None:
+                    active[key] = active[key].isoformat()
+        return {
+            "idle_threshold_seconds": self.idle_threshold_seconds,
+            "active_session": active,
+            "idle_start": self._idle_start.isoformat() if self._idle_start else None,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> SessionAggregator:
+        """Restore an aggregator saved with ``to_state``."""
+        aggregator = cls(idle_threshold_seconds=state.get("idle_threshold_seconds", 300))
+        active = state.get("active_session")
+        if active:
+            active = dict(active)
+            for key in ("started_at", "ended_at"):
+                if active.get(key):
+                    active[key] = _parse_timestamp(active[key])
+            aggregator._active_session = AggregatedSession(**active)
+        if state.get("idle_start"):
+            aggregator._idle_start = _parse_timestamp(state["idle_start"])
+        return aggregator
+
     def _process_single_event(self, event: dict[str, Any]) -> None:
         event_type = event.get("event_type", "")
         timestamp_str = event.get("timestamp")
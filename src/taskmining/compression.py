@@ -0,0 +1,166 @@
+"""Request body decoding for desktop agent event uploads.
+
+Agents compress event batches with gzip or, when ``zstandard`` is
+installed on both ends, zstd. Event JSON is highly repetitive, so an
+agent may train a zstd dictionary on its own events and register it once
+via ``POST /api/v1/taskmining/compression/dictionaries``; later frames
+carry the dictionary id in their header. Dictionaries are kept in Redis
+so every API worker can decode every agent's uploads.
+
+Decoded bodies are capped at ``MAX_DECODED_BYTES`` so a small compressed
+upload cannot expand into an unbounded allocation.
+"""
+
+from __future__ import annotations
+
+import base64
+import logging
+import zlib
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Optional zstd import guard
+# ---------------------------------------------------------------------------
+
+try:
+    import zstandard
+
+    _HAS_ZSTD = True
+except ImportError:
+    _HAS_ZSTD = False
+
+MAX_DECODED_BYTES = 32 * 1024 * 1024  # 32 MB; a 1,000-event batch is well under 1 MB
+MAX_DICTIONARY_BYTES = 1024 * 1024
+DICTIONARY_KEY_PREFIX = "kmflow:taskmining:zstd-dict:"
+DICTIONARY_TTL_SECONDS = 30 * 24 * 3600
+
+
+class BodyDecodingError(ValueError):
+    """A request body could not be decoded (corrupt or truncated data)."""
+
+
+class UnsupportedContentEncodingError(BodyDecodingError):
+    """The Content-Encoding is unknown or its codec is not installed."""
+
+
+class UnknownDictionaryError(BodyDecodingError):
+    """A zstd frame references a dictionary that was never registered."""
+
+
+class DecodedBodyTooLargeError(BodyDecodingError):
+    """The decoded body exceeds ``MAX_DECODED_BYTES``."""
+
+
+class DictionaryConflictError(BodyDecodingError):
+    """A different dictionary is already registered under the same id."""
+
+
+def zstd_available() -> bool:
+    """Whether the optional ``zstandard`` package is installed."""
+    return _HAS_ZSTD
+
+
+def _dictionary_key(dict_id: int) -> str:
+    return f"{DICTIONARY_KEY_PREFIX}{dict_id}"
+
+
+def _gunzip(body: bytes, max_bytes: int) -> bytes:
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    try:
+        decoded = decompressor.decompress(body, max_bytes + 1)
+    except zlib.error as e:
+        raise BodyDecodingError(f"Invalid gzip body: {e}") from e
+    if len(decoded) > max_bytes:
+        raise DecodedBodyTooLargeError(f"Decoded body exceeds {max_bytes} bytes")
+    if not decompressor.eof:
+        raise BodyDecodingError("Truncated gzip body")
+    return decoded
+
+
+async def _zstd_dictionary(redis_client: Any, dict_id: int) -> zstandard.ZstdCompressionDict:
+    encoded = await redis_client.get(_dictionary_key(dict_id))
+    if encoded is None:
+        raise UnknownDictionaryError(f"Unknown zstd dictionary {dict_id}")
+    return zstandard.ZstdCompressionDict(base64.b64decode(encoded))
+
+
+async def _unzstd(body: bytes, redis_client: Any, max_bytes: int) -> bytes:
+    try:
+        params = zstandard.get_frame_parameters(body)
+    except zstandard.ZstdError as e:
+        raise BodyDecodingError(f"Invalid zstd body: {e}") from e
+    if params.content_size != zstandard.CONTENTSIZE_UNKNOWN and params.content_size > max_bytes:
+        raise DecodedBodyTooLargeError(f"Decoded body exceeds {max_bytes} bytes")
+    dictionary = await _zstd_dictionary(redis_client, params.dict_id) if params.dict_id else None
+    try:
+        return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(body, max_output_size=max_bytes)
+    except zstandard.ZstdError as e:
+        raise BodyDecodingError(f"Invalid zstd body: {e}") from e
+
+
+async def decode_request_body(
+    body: bytes,
+    content_encoding: str | None,
+    redis_client: Any,
+    *,
+    max_bytes: int = MAX_DECODED_BYTES,
+) -> bytes:
+    """Undo a request's ``Content-Encoding``.
+
+    Args:
+        body: Raw request body.
+        content_encoding: The ``Content-Encoding`` header, if any.
+        redis_client: Redis client holding registered zstd dictionaries.
+        max_bytes: Largest decoded body accepted.
+
+    Returns:
+        The decoded body (``body`` itself for identity encoding).
+
+    Raises:
+        UnsupportedContentEncodingError: Unknown encoding, or zstd without ``zstandard``.
+        UnknownDictionaryError: The zstd frame needs an unregistered dictionary.
+        DecodedBodyTooLargeError: The decoded body is larger than ``max_bytes``.
+        BodyDecodingError: The body is corrupt.
+    """
+    encoding = (content_encoding or "identity").strip().lower()
+    if encoding == "identity":
+        return body
+    if encoding in ("gzip", "x-gzip"):
+        return _gunzip(body, max_bytes)
+    if encoding == "zstd":
+        if not _HAS_ZSTD:
+            raise UnsupportedContentEncodingError("zstd uploads need the zstandard package on the server")
+        return await _unzstd(body, redis_client, max_bytes)
+    raise UnsupportedContentEncodingError(f"Unsupported Content-Encoding: {content_encoding}")
+
+
+async def register_dictionary(redis_client: Any, data: bytes) -> int:
+    """Store an agent-trained zstd dictionary and return its id.
+
+    Registering the same dictionary again is a no-op. A different
+    dictionary with an id already in use is rejected, so one agent cannot
+    break another agent's uploads.
+
+    Raises:
+        UnsupportedContentEncodingError: ``zstandard`` is not installed.
+        DictionaryConflictError: The id is taken by a different dictionary.
+        BodyDecodingError: ``data`` is not a usable dictionary.
+    """
+    if not _HAS_ZSTD:
+        raise UnsupportedContentEncodingError("zstd dictionaries need the zstandard package on the server")
+    if not data or len(data) > MAX_DICTIONARY_BYTES:
+        raise BodyDecodingError(f"Dictionary must be 1 to {MAX_DICTIONARY_BYTES} bytes")
+    dict_id = zstandard.ZstdCompressionDict(data).dict_id()
+    if not dict_id:
+        raise BodyDecodingError("Dictionary has no id; train it with zstandard.train_dictionary")
+    key = _dictionary_key(dict_id)
+    encoded = base64.b64encode(data).decode("ascii")  # the shared client decodes responses as text
+    if not await redis_client.set(key, encoded, ex=DICTIONARY_TTL_SECONDS, nx=True):
+        existing = await redis_client.get(key)
+        if existing is not None and base64.b64decode(existing) != data:
+            raise DictionaryConflictError(f"Dictionary id {dict_id} is already registered with different content")
+        await redis_client.expire(key, DICTIONARY_TTL_SECONDS)
+    logger.info("Registered zstd dictionary %d (%d bytes)", dict_id, len(data))
+    return int(dict_id)
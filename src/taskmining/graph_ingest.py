@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import logging
 import uuid
+from itertools import pairwise
 from typing import Any
 
 from sqlalchemy import select
@@ -19,7 +20,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.models.canonical_event import CanonicalActivityEvent
 from src.core.models.correlation import CaseLinkEdge
 from src.core.models.taskmining import SwitchingTrace, TaskMiningAction, VisualContextEvent
-from src.semantic.graph import KnowledgeGraphService
+from src.semantic.graph import KnowledgeGraphService, stable_node_id
 from src.taskmining.app_categories import detect_app_category as _detect_app_category
 
 logger = logging.getLogger(__name__)
@@ -35,9 +36,10 @@ async def ingest_actions_to_graph(
 ) -> dict[str, int]:
     """Ingest task mining actions into the knowledge graph.
 
-    Creates Application nodes, UserAction nodes, PERFORMED_IN relationships,
-    and PRECEDED_BY temporal chains. Uses MERGE-like idempotency by checking
-    for existing nodes before creation.
+    Upserts Application nodes, UserAction nodes, PERFORMED_IN relationships,
+    and PRECEDED_BY temporal chains. Node ids are derived from the
+    application name and source action id, and every write MERGEs, so
+    rerunning the ingest updates the graph in place instead of duplicating it.
 
     Args:
         db_session: Database session for reading TaskMiningAction records.
@@ -45,7 +47,7 @@ async def ingest_actions_to_graph(
         engagement_id: Engagement to process.
 
     Returns:
-        Summary dict with counts of created nodes and relationships.
+        Summary dict with counts of newly created nodes and relationships.
     """
     # Fetch all actions for the engagement
     stmt = (
@@ -60,121 +62,86 @@ async def ingest_actions_to_graph(
         logger.info("No actions to ingest for engagement %s", engagement_id)
         return {"applications": 0, "user_actions": 0, "performed_in": 0, "preceded_by": 0}
 
-    # Find existing nodes to avoid duplicates
-    existing_apps = await graph_service.find_nodes("Application", {"engagement_id": engagement_id})
-    existing_app_names = {n.properties.get("name") for n in existing_apps}
-
-    existing_user_actions = await graph_service.find_nodes("UserAction", {"engagement_id": engagement_id})
-    existing_action_ids = {n.properties.get("source_action_id") for n in existing_user_actions}
+    # Nodes created before ids were derived deterministically keep their ids
+    existing_apps = await graph_service.list_engagement_nodes(engagement_id, "Application")
+    app_node_map: dict[str, str] = {  # app_name -> node_id
+        n.properties["name"]: n.id for n in existing_apps if n.properties.get("name")
+    }
+    existing_user_actions = await graph_service.list_engagement_nodes(engagement_id, "UserAction")
+    action_node_map: dict[str, str] = {  # action.id -> node_id
+        n.properties["source_action_id"]: n.id for n in existing_user_actions if n.properties.get("source_action_id")
+    }
 
     # -- Application nodes ----------------------------------------------------
-    unique_apps = {a.application_name for a in actions if a.application_name}
-    new_apps = unique_apps - existing_app_names
-
-    app_node_map: dict[str, str] = {}  # app_name -> node_id
-    # Map existing apps
-    for node in existing_apps:
-        name = node.properties.get("name")
-        if name:
-            app_node_map[name] = node.id
-
-    if new_apps:
-        app_props_list = []
-        for app_name in sorted(new_apps):
-            node_id = str(uuid.uuid4())
-            app_node_map[app_name] = node_id
-            app_props_list.append(
-                {
-                    "id": node_id,
-                    "name": app_name,
-                    "engagement_id": engagement_id,
-                    "app_category": _detect_app_category(app_name),
-                    "source": "task_mining",
-                }
-            )
-        await graph_service.batch_create_nodes("Application", app_props_list)
-        logger.info("Created %d Application nodes for engagement %s", len(new_apps), engagement_id)
+    app_props_list = []
+    for app_name in sorted({a.application_name for a in actions if a.application_name}):
+        node_id = app_node_map.setdefault(app_name, stable_node_id(engagement_id, "Application", app_name))
+        app_props_list.append(
+            {
+                "id": node_id,
+                "name": app_name,
+                "engagement_id": engagement_id,
+                "app_category": _detect_app_category(app_name),
+                "source": "task_mining",
+            }
+        )
+    apps = await graph_service.batch_upsert_nodes("Application", app_props_list)
+    logger.info("Upserted Application nodes for engagement %s: %s", engagement_id, apps)
 
     # -- UserAction nodes -----------------------------------------------------
-    new_actions = [a for a in actions if str(a.id) not in existing_action_ids]
-
-    action_node_map: dict[str, str] = {}  # action.id -> node_id
-    # Map existing
-    for node in existing_user_actions:
-        src_id = node.properties.get("source_action_id")
-        if src_id:
-            action_node_map[src_id] = node.id
-
-    if new_actions:
-        ua_props_list = []
-        for action in new_actions:
-            node_id = str(uuid.uuid4())
-            action_node_map[str(action.id)] = node_id
-            ua_props_list.append(
-                {
-                    "id": node_id,
-                    "name": action.description or f"{action.category} in {action.application_name}",
-                    "engagement_id": engagement_id,
-                    "action_category": action.category,
-                    "duration_seconds": action.duration_seconds,
-                    "event_count": action.event_count,
-                    "source_action_id": str(action.id),
-                    "application_name": action.application_name or "",
-                    "started_at": action.started_at.isoformat() if action.started_at else "",
-                    "source": "task_mining",
-                }
-            )
-        await graph_service.batch_create_nodes("UserAction", ua_props_list)
-        logger.info("Created %d UserAction nodes for engagement %s", len(new_actions), engagement_id)
+    ua_props_list = []
+    for action in actions:
+        node_id = action_node_map.setdefault(
+            str(action.id), stable_node_id(engagement_id, "UserAction", str(action.id))
+        )
+        ua_props_list.append(
+            {
+                "id": node_id,
+                "name": action.description or f"{action.category} in {action.application_name}",
+                "engagement_id": engagement_id,
+                "action_category": action.category,
+                "duration_seconds": action.duration_seconds,
+                "event_count": action.event_count,
+                "source_action_id": str(action.id),
+                "application_name": action.application_name or "",
+                "started_at": action.started_at.isoformat() if action.started_at else "",
+                "source": "task_mining",
+            }
+        )
+    user_actions = await graph_service.batch_upsert_nodes("UserAction", ua_props_list)
+    logger.info("Upserted UserAction nodes for engagement %s: %s", engagement_id, user_actions)
 
     # -- PERFORMED_IN relationships -------------------------------------------
-    performed_in_rels = []
-    for action in new_actions:
-        if action.application_name and action.application_name in app_node_map:
-            ua_node_id = action_node_map.get(str(action.id))
-            app_node_id = app_node_map[action.application_name]
-            if ua_node_id:
-                performed_in_rels.append(
-                    {
-                        "from_id": ua_node_id,
-                        "to_id": app_node_id,
-                    }
-                )
-
-    performed_in_count = 0
-    if performed_in_rels:
-        performed_in_count = await graph_service.batch_create_relationships("PERFORMED_IN", performed_in_rels)
+    performed_in_rels = [
+        {"from_id": action_node_map[str(action.id)], "to_id": app_node_map[action.application_name]}
+        for action in actions
+        if action.application_name
+    ]
+    performed_in = await graph_service.batch_upsert_relationships("PERFORMED_IN", performed_in_rels)
 
     # -- PRECEDED_BY temporal chains ------------------------------------------
-    # Group new actions by session, build temporal chains
+    # Group actions by session, build temporal chains
     session_actions: dict[str, list[TaskMiningAction]] = {}
-    for action in new_actions:
-        sid = str(action.session_id)
-        session_actions.setdefault(sid, []).append(action)
+    for action in actions:
+        session_actions.setdefault(str(action.session_id), []).append(action)
 
     preceded_by_rels = []
-    for _session_id, session_acts in session_actions.items():
+    for session_acts in session_actions.values():
         sorted_acts = sorted(session_acts, key=lambda a: a.started_at)
-        for i in range(1, len(sorted_acts)):
-            current_id = action_node_map.get(str(sorted_acts[i].id))
-            prev_id = action_node_map.get(str(sorted_acts[i - 1].id))
-            if current_id and prev_id:
-                preceded_by_rels.append(
-                    {
-                        "from_id": current_id,
-                        "to_id": prev_id,
-                    }
-                )
-
-    preceded_by_count = 0
-    if preceded_by_rels:
-        preceded_by_count = await graph_service.batch_create_relationships("PRECEDED_BY", preceded_by_rels)
+        for prev, current in pairwise(sorted_acts):
+            preceded_by_rels.append(
+                {
+                    "from_id": action_node_map[str(current.id)],
+                    "to_id": action_node_map[str(prev.id)],
+                }
+            )
+    preceded_by = await graph_service.batch_upsert_relationships("PRECEDED_BY", preceded_by_rels)
 
     summary = {
-        "applications": len(new_apps),
-        "user_actions": len(new_actions),
-        "performed_in": performed_in_count,
-        "preceded_by": preceded_by_count,
+        "applications": apps.created,
+        "user_actions": user_actions.created,
+        "performed_in": performed_in.created,
+        "preceded_by": preceded_by.created,
     }
     logger.info("Graph ingestion complete for engagement %s: %s", engagement_id, summary)
     return summary
@@ -190,7 +157,7 @@ async def _sync_screen_state_nodes(
     Returns:
         ({class → node_id}, count_of_newly_created_nodes)
     """
-    existing = await graph_service.find_nodes("ScreenState", {"engagement_id": engagement_id})
+    existing = await graph_service.list_engagement_nodes(engagement_id, "ScreenState")
     node_map: dict[str, str] = {
         node.properties["screen_state_class"]: node.id for node in existing if node.properties.get("screen_state_class")
     }
@@ -279,7 +246,7 @@ async def _create_vce_relationships(
     )
 
     # Session stub nodes
-    existing_sessions = await graph_service.find_nodes("Session", {"engagement_id": engagement_id})
+    existing_sessions = await graph_service.list_engagement_nodes(engagement_id, "Session")
     session_node_map: dict[str, str] = {
         node.properties["session_id"]: node.id for node in existing_sessions if node.properties.get("session_id")
     }
@@ -347,12 +314,12 @@ async def ingest_vce_events(
         logger.info("No VCE events to ingest for engagement %s", engagement_id)
         return {"vce_nodes": 0, "screen_state_nodes": 0, "classified_as": 0, "observed_during": 0, "captured_in": 0}
 
-    existing_vce_nodes = await graph_service.find_nodes("VisualContextEvent", {"engagement_id": engagement_id})
+    existing_vce_nodes = await graph_service.list_engagement_nodes(engagement_id, "VisualContextEvent")
     existing_vce_source_ids = {n.properties.get("source_vce_id") for n in existing_vce_nodes}
 
     screen_state_node_map, new_ss_count = await _sync_screen_state_nodes(graph_service, vce_events, engagement_id)
 
-    existing_apps = await graph_service.find_nodes("Application", {"engagement_id": engagement_id})
+    existing_apps = await graph_service.list_engagement_nodes(engagement_id, "Application")
     app_node_map: dict[str, str] = {str(n.properties["name"]): n.id for n in existing_apps if n.properties.get("name")}
 
     new_vce_events = [v for v in vce_events if str(v.id) not in existing_vce_source_ids]
@@ -414,13 +381,13 @@ async def ingest_case_link_edges(
         return {"case_nodes": 0, "case_has_event": 0}
 
     # Existing Case nodes
-    existing_case_nodes = await graph_service.find_nodes("Case", {"engagement_id": engagement_id})
+    existing_case_nodes = await graph_service.list_engagement_nodes(engagement_id, "Case")
     case_node_map: dict[str, str] = {
         str(n.properties.get("case_id")): n.id for n in existing_case_nodes if n.properties.get("case_id")
     }
 
     # Existing CanonicalEvent graph nodes
-    existing_ce_nodes = await graph_service.find_nodes("CanonicalEvent", {"engagement_id": engagement_id})
+    existing_ce_nodes = await graph_service.list_engagement_nodes(engagement_id, "CanonicalEvent")
     ce_node_map: dict[str, str] = {
         str(n.properties.get("source_event_id")): n.id for n in existing_ce_nodes if n.properties.get("source_event_id")
     }
@@ -535,11 +502,11 @@ async def ingest_switching_traces(
         return {"switching_traces": 0, "observed_in": 0, "involves": 0, "indicates_friction": 0}
 
     # Find existing SwitchingTrace nodes to avoid duplicates
-    existing_trace_nodes = await graph_service.find_nodes("SwitchingTrace", {"engagement_id": engagement_id})
+    existing_trace_nodes = await graph_service.list_engagement_nodes(engagement_id, "SwitchingTrace")
     existing_trace_source_ids = {n.properties.get("source_trace_id") for n in existing_trace_nodes}
 
     # Find existing Application nodes to link INVOLVES edges
-    existing_app_nodes = await graph_service.find_nodes("Application", {"engagement_id": engagement_id})
+    existing_app_nodes = await graph_service.list_engagement_nodes(engagement_id, "Application")
     app_node_map: dict[str, str] = {}
     for node in existing_app_nodes:
         name = node.properties.get("name")
@@ -13,11 +13,14 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from src.core.models.taskmining import ActionCategory
 from src.taskmining.aggregation.session import AggregatedSession
 from src.taskmining.ml.dataset import TrainingDataset
 from src.taskmining.ml.features import (
     FEATURE_SCHEMA_VERSION,
+    extract_feature_matrix,
     extract_features,
 )
 
@@ -168,43 +171,50 @@ class GradientBoostingTaskClassifier:
         return self._predict_from_features(features)
 
     def predict_batch(self, sessions: list[AggregatedSession]) -> list[MLPrediction | None]:
-        """Predict categories for multiple sessions."""
-        if not self.is_trained:
+        """Predict categories for multiple sessions.
+
+        Builds one feature matrix for the batch and scores it with a single
+        model call; results equal ``predict`` for each session.
+        """
+        if not self.is_trained or not self._label_encoder or not sessions:
             return [None] * len(sessions)
 
-        return [self.predict(s) for s in sessions]
+        return self._predictions_from_probas(self._predict_proba(extract_feature_matrix(sessions)))
 
     def _predict_from_features(self, features: list[float]) -> MLPrediction | None:
         """Predict from a pre-extracted feature vector."""
         if not self._model or not self._label_encoder:
             return None
 
-        x_input = [features]
+        return self._predictions_from_probas(self._predict_proba(np.asarray([features], dtype=np.float64)))[0]
 
+    def _predict_proba(self, x_input: np.ndarray) -> np.ndarray:
+        """Class probabilities for each row of a feature matrix."""
         # Get class probabilities
         if hasattr(self._model, "predict_proba"):
-            probas = self._model.predict_proba(x_input)[0]
-        else:
-            # Fallback for non-calibrated model
-            pred_idx = self._model.predict(x_input)[0]
-            probas = [0.0] * len(self._label_encoder.classes_)
-            probas[pred_idx] = 1.0
-
-        # Build probability dict
-        prob_dict = {
-            label: round(float(prob), 4) for label, prob in zip(self._label_encoder.classes_, probas, strict=False)
-        }
-
-        # Find best prediction
-        best_idx = int(probas.argmax())
-        best_label = self._label_encoder.classes_[best_idx]
-        best_confidence = float(probas[best_idx])
-
-        return MLPrediction(
-            category=ActionCategory(best_label),
-            confidence=round(best_confidence, 4),
-            probabilities=prob_dict,
-        )
+            return np.asarray(self._model.predict_proba(x_input), dtype=np.float64)
+
+        # Fallback for non-calibrated model
+        pred_idx = np.asarray(self._model.predict(x_input), dtype=np.intp)
+        probas = np.zeros((len(x_input), len(self._label_encoder.classes_)), dtype=np.float64)
+        probas[np.arange(len(x_input)), pred_idx] = 1.0
+        return probas
+
+    def _predictions_from_probas(self, probas: np.ndarray) -> list[MLPrediction]:
+        """Build one prediction per row of class probabilities."""
+        labels = [str(label) for label in self._label_encoder.classes_]
+        categories = [ActionCategory(label) for label in labels]
+
+        # Find best prediction per row
+        best = probas.argmax(axis=1).tolist()
+        return [
+            MLPrediction(
+                category=categories[best_idx],
+                confidence=round(row[best_idx], 4),
+                probabilities={label: round(prob, 4) for label, prob in zip(labels, row, strict=False)},
+            )
+            for row, best_idx in zip(probas.tolist(), best, strict=True)
+        ]
 
     def save_model(self, path: str | Path) -> None:
         """Persist trained model to disk.
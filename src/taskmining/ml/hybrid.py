@@ -16,7 +16,7 @@ from src.taskmining.aggregation.classifier import (
     ActionClassifier,
 )
 from src.taskmining.aggregation.session import AggregatedSession
-from src.taskmining.ml.classifier import GradientBoostingTaskClassifier
+from src.taskmining.ml.classifier import GradientBoostingTaskClassifier, MLPrediction
 
 logger = logging.getLogger(__name__)
 
@@ -70,9 +70,15 @@ class HybridClassifier:
         Returns:
             HybridResult with source indicator.
         """
-        # Try ML first
-        ml_prediction = self._ml.predict(session)
+        return self._combine(session, self._ml.predict(session))
 
+    def classify_batch(self, sessions: list[AggregatedSession]) -> list[HybridResult]:
+        """Classify multiple sessions with one ML prediction call."""
+        predictions = self._ml.predict_batch(sessions)
+        return [self._combine(s, p) for s, p in zip(sessions, predictions, strict=True)]
+
+    def _combine(self, session: AggregatedSession, ml_prediction: MLPrediction | None) -> HybridResult:
+        """Use the ML prediction if confident enough, otherwise the rules."""
         if ml_prediction and ml_prediction.confidence >= self._ml_threshold:
             return HybridResult(
                 category=ml_prediction.category,
@@ -97,7 +103,3 @@ class HybridClassifier:
             ml_confidence=ml_prediction.confidence if ml_prediction else None,
             ml_category=ml_prediction.category.value if ml_prediction else None,
         )
-
-    def classify_batch(self, sessions: list[AggregatedSession]) -> list[HybridResult]:
-        """Classify multiple sessions."""
-        return [self.classify(s) for s in sessions]
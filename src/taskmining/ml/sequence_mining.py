@@ -3,17 +3,45 @@
 Extracts frequent action category n-grams from session sequences
 to discover common process patterns and feed variant detection.
 
+Action categories are integer-encoded once, and patterns are grown
+level by level (apriori): an n-gram is only counted at positions where
+both its (n-1)-prefix and its (n-1)-suffix were frequent, so infrequent
+branches are never enumerated. Contiguous n-grams are counted over the
+whole encoded corpus with NumPy. ``gapped=True`` mines sequential
+patterns instead (items in order, other actions allowed in between)
+with PrefixSpan.
+
+Large corpora can be split into partitions, optionally mined in a
+process pool. Partitioning follows SON: a pattern frequent overall is
+frequent in at least one partition at the proportionally scaled
+threshold, so the union of the partitions' local results is an exact
+candidate set whose supports are then counted in a second pass.
+
 Story #235 — Part of Epic #231 (ML Task Segmentation).
 """
 
 from __future__ import annotations
 
+import itertools
 import logging
+import math
+import multiprocessing
 from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Encoded pattern: a tuple of action category codes
+_Codes = tuple[int, ...]
+# Encoded partition: flat category codes and the length of each session
+_Partition = tuple[np.ndarray, np.ndarray]
+# Decides whether a pattern with a given support is kept and grown
+_Keep = Callable[[_Codes, int], bool]
+
 
 @dataclass
 class ActionPattern:
@@ -38,6 +66,10 @@ def mine_sequences(
     min_n: int = 2,
     max_n: int = 5,
     min_support: int = 2,
+    *,
+    gapped: bool = False,
+    partitions: int = 1,
+    workers: int = 1,
 ) -> SequenceMiningResult:
     """Extract frequent action category n-grams from session sequences.
 
@@ -48,6 +80,12 @@ def mine_sequences(
         max_n: Maximum n-gram length (default 5).
         min_support: Minimum number of sessions a pattern must appear in
             to be included (default 2).
+        gapped: Mine sequential patterns whose actions occur in order but
+            not necessarily adjacent (PrefixSpan) instead of n-grams.
+        partitions: Split the sessions into this many partitions, mined
+            separately and merged exactly (bounds peak memory).
+        workers: Processes used to mine the partitions; more than one
+            implies at least ``workers`` partitions.
 
     Returns:
         SequenceMiningResult with patterns sorted by frequency descending.
@@ -56,36 +94,35 @@ def mine_sequences(
         return SequenceMiningResult()
 
     total_sessions = len(session_sequences)
-    pattern_counts: Counter[tuple[str, ...]] = Counter()
-
-    for sequence in session_sequences:
-        if len(sequence) < min_n:
-            continue
-
-        # Extract unique n-grams per session (count each pattern once per session)
-        session_patterns: set[tuple[str, ...]] = set()
-        for n in range(min_n, min(max_n + 1, len(sequence) + 1)):
-            for i in range(len(sequence) - n + 1):
-                ngram = tuple(sequence[i : i + n])
-                session_patterns.add(ngram)
-
-        for pattern in session_patterns:
-            pattern_counts[pattern] += 1
-
-    # Filter by min_support and build results
-    patterns = []
-    for pattern, support in pattern_counts.items():
-        if support >= min_support:
-            patterns.append(
-                ActionPattern(
-                    pattern=pattern,
-                    support=support,
-                    frequency=round(support / total_sessions, 4),
-                )
-            )
+    # Sessions shorter than min_n cannot contain a reported pattern
+    sequences = [seq for seq in session_sequences if len(seq) >= min_n]
+    actions = list(itertools.chain.from_iterable(sequences))
+    labels = list(dict.fromkeys(actions))
+
+    supports: dict[_Codes, int] = {}
+    if sequences and max_n >= min_n:
+        vocabulary = {label: code for code, label in enumerate(labels)}
+        tokens = np.fromiter(map(vocabulary.__getitem__, actions), dtype=np.int64, count=len(actions))
+        lengths = np.fromiter(map(len, sequences), dtype=np.int64, count=len(sequences))
+        parts = _partition(tokens, lengths, max(1, partitions, workers))
+        if len(parts) == 1:
+            supports = _mine_partition(parts[0], len(labels), max_n, gapped, min_support, None)
+        else:
+            supports = _mine_partitioned(parts, len(labels), max_n, gapped, min_support, workers)
+
+    # Filter by length and min_support and build results
+    patterns = [
+        ActionPattern(
+            pattern=tuple(labels[c] for c in codes),
+            support=support,
+            frequency=round(support / total_sessions, 4),
+        )
+        for codes, support in supports.items()
+        if min_n <= len(codes) <= max_n and support >= min_support
+    ]
 
     # Sort by support descending, then by pattern length descending
-    patterns.sort(key=lambda p: (-p.support, -len(p.pattern)))
+    patterns.sort(key=lambda p: (-p.support, -len(p.pattern), p.pattern))
 
     result = SequenceMiningResult(
         patterns=patterns,
@@ -93,9 +130,175 @@ def mine_sequences(
         total_patterns_found=len(patterns),
     )
     logger.info(
-        "Sequence mining: %d sessions, %d patterns found (min_support=%d)",
+        "Sequence mining: %d sessions, %d patterns found (min_support=%d, gapped=%s)",
         total_sessions,
         len(patterns),
         min_support,
+        gapped,
     )
     return result
+
+
+def _partition(tokens: np.ndarray, lengths: np.ndarray, count: int) -> list[_Partition]:
+    """Split the encoded sessions into ``count`` contiguous partitions."""
+    size = math.ceil(len(lengths) / count)
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    return [
+        (tokens[offsets[start] : offsets[min(start + size, len(lengths))]], lengths[start : start + size])
+        for start in range(0, len(lengths), size)
+    ]
+
+
+def _mine_partitioned(
+    parts: list[_Partition],
+    vocab_size: int,
+    max_n: int,
+    gapped: bool,
+    min_support: int,
+    workers: int,
+) -> dict[_Codes, int]:
+    """Mine partitions separately (SON) and return exact global supports."""
+    total = sum(len(lengths) for _tokens, lengths in parts)
+    local = [
+        (part, vocab_size, max_n, gapped, max(1, math.ceil(min_support * len(part[1]) / total)), None) for part in parts
+    ]
+
+    if workers > 1:
+        # spawn: the API process runs threads, which fork does not copy safely
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            candidates = frozenset(k for found in pool.map(_mine_partition_args, local) for k in found)
+            counted = list(
+                pool.map(_mine_partition_args, [(p, vocab_size, max_n, gapped, 1, candidates) for p in parts])
+            )
+    else:
+        candidates = frozenset(k for args in local for k in _mine_partition(*args))
+        counted = [_mine_partition(p, vocab_size, max_n, gapped, 1, candidates) for p in parts]
+
+    supports: Counter[_Codes] = Counter()
+    for found in counted:
+        supports.update(found)
+    return {codes: support for codes, support in supports.items() if support >= min_support}
+
+
+def _mine_partition_args(args: tuple) -> dict[_Codes, int]:
+    return _mine_partition(*args)
+
+
+def _mine_partition(
+    part: _Partition,
+    vocab_size: int,
+    max_n: int,
+    gapped: bool,
+    threshold: int,
+    candidates: frozenset[_Codes] | None,
+) -> dict[_Codes, int]:
+    """Supports of the patterns (lengths 1..max_n) of one partition.
+
+    A pattern is kept, and grown further, if its support reaches
+    ``threshold`` and, when ``candidates`` is given, it is a candidate.
+    """
+
+    def keep(codes: _Codes, support: int) -> bool:
+        return support >= threshold and (candidates is None or codes in candidates)
+
+    if gapped:
+        return _prefixspan(part, vocab_size, max_n, keep)
+    return _contiguous(part, vocab_size, max_n, keep)
+
+
+def _contiguous(part: _Partition, vocab_size: int, max_n: int, keep: _Keep) -> dict[_Codes, int]:
+    """Level-wise n-gram supports over a flat token array.
+
+    ``ids[i]`` is the dense id of the kept (n-1)-gram starting at token
+    ``i`` (-1 if it was pruned or runs past its session). Level n codes
+    are ``ids[i] * vocab_size + tokens[i + n - 1]``.
+    """
+    tokens, lengths = part
+    n_tokens = len(tokens)
+    session_of = np.repeat(np.arange(len(lengths), dtype=np.int64), lengths)
+    end_of = np.repeat(np.cumsum(lengths), lengths)
+    positions = np.arange(n_tokens, dtype=np.int64)
+
+    supports: dict[_Codes, int] = {}
+    ids = tokens.copy()
+    patterns: list[_Codes] = [(v,) for v in range(vocab_size)]
+    for n in range(1, max_n + 1):
+        if n > 1:
+            last = n_tokens - n + 1
+            if last <= 0:
+                break
+            start = positions[:last]
+            # The n-gram fits in its session and its prefix and suffix were kept
+            valid = np.flatnonzero((ids[:last] >= 0) & (ids[1 : last + 1] >= 0) & (start + n <= end_of[:last]))
+            codes = ids[valid] * vocab_size + tokens[valid + n - 1]
+        else:
+            valid = positions
+            codes = ids
+        if len(valid) == 0:
+            break
+
+        space = len(patterns) * vocab_size if n > 1 else vocab_size
+        # A session counts once per code: drop repeated (session, code) keys
+        keys = np.sort(session_of[valid] * space + codes)
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+        counts = np.bincount(keys % space, minlength=space)
+
+        mapping = np.full(space, -1, dtype=np.int64)
+        kept: list[_Codes] = []
+        for code in np.flatnonzero(counts).tolist():
+            pattern = patterns[code // vocab_size] + (code % vocab_size,) if n > 1 else (code,)
+            support = int(counts[code])
+            if keep(pattern, support):
+                mapping[code] = len(kept)
+                kept.append(pattern)
+                supports[pattern] = support
+        if not kept:
+            break
+        ids = np.full(n_tokens, -1, dtype=np.int64)
+        ids[valid] = mapping[codes]
+        patterns = kept
+    return supports
+
+
+def _prefixspan(part: _Partition, vocab_size: int, max_n: int, keep: _Keep) -> dict[_Codes, int]:
+    """Sequential pattern supports by PrefixSpan with pseudo-projection.
+
+    A projection holds, for each session containing the prefix, the
+    position just after the prefix's earliest match. ``following[i, v]``
+    is the first position at or after ``i`` holding category ``v`` in the
+    same session (``-1`` if none), so counting and projecting a prefix's
+    extensions is one array lookup per session rather than a scan.
+    """
+    tokens, lengths = part
+    n_tokens = len(tokens)
+    end_of = np.repeat(np.cumsum(lengths), lengths)
+    positions = np.arange(n_tokens, dtype=np.int64)
+    # The table is the miner's largest allocation; partitioning bounds it
+    dtype = np.int32 if n_tokens < np.iinfo(np.int32).max else np.int64
+    following = np.full((n_tokens, vocab_size), -1, dtype=dtype)
+    for code in range(vocab_size):
+        found = np.flatnonzero(tokens == code)
+        nearest = np.searchsorted(found, positions)
+        hit = nearest < len(found)
+        nxt = np.where(hit, found[np.minimum(nearest, len(found) - 1)], -1)
+        following[:, code] = np.where(hit & (nxt < end_of), nxt, -1)
+
+    supports: dict[_Codes, int] = {}
+    starts = np.cumsum(lengths) - lengths
+    stack: list[tuple[_Codes, np.ndarray]] = [((), starts[lengths > 0])]
+    while stack:
+        prefix, projection = stack.pop()
+        matches = following[projection]
+        counts = (matches >= 0).sum(axis=0)
+        for code in np.flatnonzero(counts).tolist():
+            pattern = (*prefix, code)
+            support = int(counts[code])
+            if not keep(pattern, support):
+                continue
+            supports[pattern] = support
+            if len(pattern) < max_n:
+                matched = matches[:, code]
+                matched = matched[matched >= 0]
+                # A match on the session's last action leaves nothing to extend
+                stack.append((pattern, matched[matched + 1 < end_of[matched]] + 1))
+    return supports
@@ -13,7 +13,7 @@ from datetime import datetime, timedelta
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.models.taskmining import (
@@ -248,8 +248,10 @@ async def compute_transition_matrix(
 ) -> TransitionMatrix:
     """Build and persist a transition count matrix for an engagement period.
 
-    Queries APP_SWITCH events in the given period and tallies from→to
-    application pairs. Computes top-N transitions by frequency.
+    Counts from→to application pairs between consecutive APP_SWITCH events
+    of the same capture session in the given period. Pairs are formed and
+    counted in the database with a ``LAG()`` window, so only the aggregated
+    matrix is loaded. Computes top-N transitions by frequency.
 
     Args:
         session: Async database session.
@@ -262,33 +264,43 @@ async def compute_transition_matrix(
     Returns:
         Persisted TransitionMatrix record.
     """
-    stmt = (
-        select(TaskMiningEvent)
+    # Pair each switch with the previous one in the same capture session
+    app_name = func.coalesce(func.nullif(TaskMiningEvent.application_name, ""), "unknown")
+    switches = (
+        select(
+            func.lag(app_name)
+            .over(
+                partition_by=TaskMiningEvent.session_id,
+                order_by=(TaskMiningEvent.timestamp, TaskMiningEvent.id),
+            )
+            .label("from_app"),
+            app_name.label("to_app"),
+        )
         .where(
             TaskMiningEvent.engagement_id == engagement_id,
             TaskMiningEvent.event_type == DesktopEventType.APP_SWITCH,
             TaskMiningEvent.timestamp >= period_start,
             TaskMiningEvent.timestamp <= period_end,
         )
-        .order_by(TaskMiningEvent.timestamp.asc())
+        .subquery()
+    )
+    stmt = (
+        select(switches.c.from_app, switches.c.to_app, func.count().label("count"))
+        .where(switches.c.from_app.is_not(None))
+        .group_by(switches.c.from_app, switches.c.to_app)
     )
     result = await session.execute(stmt)
-    events = list(result.scalars().all())
 
-    # Build from→to count matrix
+    # Build from→to count matrix from the aggregated pairs
     matrix_data: dict[str, dict[str, int]] = {}
     all_apps: set[str] = set()
     total_transitions = 0
 
-    for i in range(len(events) - 1):
-        from_app = events[i].application_name or "unknown"
-        to_app = events[i + 1].application_name or "unknown"
+    for from_app, to_app, count in result.all():
         all_apps.add(from_app)
         all_apps.add(to_app)
-        if from_app not in matrix_data:
-            matrix_data[from_app] = {}
-        matrix_data[from_app][to_app] = matrix_data[from_app].get(to_app, 0) + 1
-        total_transitions += 1
+        matrix_data.setdefault(from_app, {})[to_app] = count
+        total_transitions += count
 
     # Build top-N transitions list
     flat_transitions: list[dict[str, Any]] = []
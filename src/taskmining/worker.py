@@ -1,7 +1,9 @@
 """Redis Stream consumer for task mining action aggregation.
 
 Background worker that reads processed events from the task mining Redis
-stream and aggregates them into higher-level user actions.
+stream. ``aggregate`` and ``materialize`` entries are handed to the shared
+``StreamingAggregationEngine``, which groups them into higher-level user
+actions and acknowledges them once the actions are committed.
 """
 
 from __future__ import annotations
@@ -9,45 +11,74 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 import redis.asyncio as aioredis
 
 from src.core.redis import ensure_consumer_group
+from src.taskmining.aggregation.engine import TASK_MINING_GROUP, StreamingAggregationEngine
 from src.taskmining.processor import TASK_MINING_STREAM
 
+if TYPE_CHECKING:
+    from src.core.tasks.context import WorkerContext
+
 logger = logging.getLogger(__name__)
 
-CONSUMER_GROUP = "task_mining_workers"
+CONSUMER_GROUP = TASK_MINING_GROUP
 
 # Action aggregation window: events within this window for the same
 # app+window are grouped into a single action.
 AGGREGATION_WINDOW_SECONDS = 30
 
+# Entries pending this long belong to a dead consumer and are reclaimed.
+_CLAIM_IDLE_MS = 300_000
+_CLAIM_INTERVAL_SECONDS = 60.0
+
+_ENGINE_TASK_TYPES = ("aggregate", "materialize")
 
-async def process_task(task_data: dict[str, Any]) -> dict[str, Any]:
+
+async def process_task(
+    task_data: dict[str, Any],
+    *,
+    engine: StreamingAggregationEngine | None = None,
+    msg_id: str | None = None,
+    redelivered: bool = False,
+    context: WorkerContext | None = None,
+) -> dict[str, Any]:
     """Process a single task mining stream message.
 
     Currently supports:
-    - aggregate: Group raw events into user actions
+    - aggregate: Group raw events into user actions (via the engine)
+    - materialize: Close a capture session's open action (via the engine)
+    - assemble_switching: Build app-switching traces
 
     Args:
         task_data: The parsed task payload from the stream.
+        engine: Aggregation engine for aggregate/materialize entries.
+        msg_id: Stream entry id, acknowledged by the engine once applied.
+        redelivered: The entry was read again after an earlier delivery.
+        context: Shared worker clients, needed by assemble_switching.
 
     Returns:
-        Processing result dict.
+        Processing result dict; ``{"status": "queued"}`` means the engine
+        acknowledges the entry, so the caller must not.
+
+    Raises:
+        RuntimeError: aggregate/materialize without an engine and msg_id,
+            or a valid assemble_switching task without a context.
+        NotImplementedError: Unknown task type.
     """
     task_type = task_data.get("task_type", "unknown")
     logger.debug("Processing task mining task: type=%s", task_type)
 
-    # DEFERRED: tracked in KMFLOW-206 (aggregation engine wiring)
-    # SessionAggregator -> ActionClassifier -> EvidenceMaterializer
-    if task_type == "aggregate":
-        raise NotImplementedError("Task type 'aggregate' is not yet implemented (KMFLOW-206/207)")
-    if task_type == "materialize":
-        raise NotImplementedError("Task type 'materialize' is not yet implemented (KMFLOW-206/209)")
+    if task_type in _ENGINE_TASK_TYPES:
+        if engine is None or msg_id is None:
+            raise RuntimeError(f"Task type {task_type!r} needs a running aggregation engine")
+        await engine.submit(msg_id, task_data, redelivered=redelivered)
+        return {"status": "queued"}
     if task_type == "assemble_switching":
-        return await _handle_assemble_switching(task_data)
+        return await _handle_assemble_switching(task_data, context)
     raise NotImplementedError(f"Unknown task type: {task_type!r}")
 
 
@@ -55,11 +86,19 @@ async def run_worker(
     redis_client: aioredis.Redis,
     worker_id: str = "tm-worker-1",
     shutdown_event: asyncio.Event | None = None,
+    engine: StreamingAggregationEngine | None = None,
+    context: WorkerContext | None = None,
 ) -> None:
     """Run the task mining worker loop.
 
     Reads events from the Redis Stream and processes them.
     Stops when shutdown_event is set.
+
+    The worker first re-reads its own unacknowledged entries (left by a
+    previous run of this consumer), then new ones, and periodically claims
+    entries left pending by dead consumers. Entries queued to the engine
+    are acknowledged by the engine; others are acknowledged here. Tasks
+    that touch PostgreSQL or Neo4j use the clients of ``context``.
     """
     await ensure_consumer_group(redis_client, TASK_MINING_STREAM, CONSUMER_GROUP)
     logger.info("Task mining worker %s started", worker_id)
@@ -67,26 +106,35 @@ async def run_worker(
     if shutdown_event is None:
         shutdown_event = asyncio.Event()
 
+    pending_from: str | None = "0"  # own pending entries first
+    next_claim = time.monotonic() + _CLAIM_INTERVAL_SECONDS
     while not shutdown_event.is_set():
         try:
+            if pending_from is None and time.monotonic() >= next_claim:
+                next_claim = time.monotonic() + _CLAIM_INTERVAL_SECONDS
+                _next_id, claimed, *_ = await redis_client.xautoclaim(
+                    TASK_MINING_STREAM,
+                    CONSUMER_GROUP,
+                    worker_id,
+                    min_idle_time=_CLAIM_IDLE_MS,
+                    count=10,
+                )
+                await _process_messages(redis_client, claimed, engine, context, redelivered=True)
+
             result = await redis_client.xreadgroup(
                 CONSUMER_GROUP,
                 worker_id,
-                {TASK_MINING_STREAM: ">"},
+                {TASK_MINING_STREAM: pending_from or ">"},
                 count=10,
-                block=2000,
+                block=None if pending_from else 2000,
             )
-            if not result:
-                continue
-
-            for _stream, messages in result:
-                for msg_id, fields in messages:
-                    try:
-                        task_data = json.loads(fields.get("payload", "{}"))
-                        await process_task(task_data)
-                        await redis_client.xack(TASK_MINING_STREAM, CONSUMER_GROUP, msg_id)
-                    except Exception:  # Intentionally broad: worker loop
-                        logger.exception("Failed to process task mining message %s", msg_id)
+            messages = [message for _stream, batch in result or [] for message in batch]
+            if pending_from is not None:
+                if not messages:
+                    pending_from = None
+                    continue
+                pending_from = messages[-1][0]
+            await _process_messages(redis_client, messages, engine, context, redelivered=pending_from is not None)
         except asyncio.CancelledError:
             break
         except Exception:  # Intentionally broad: worker loop
@@ -96,18 +144,47 @@ async def run_worker(
     logger.info("Task mining worker %s stopped", worker_id)
 
 
-async def _handle_assemble_switching(task_data: dict[str, Any]) -> dict[str, Any]:
+async def _process_messages(
+    redis_client: aioredis.Redis,
+    messages: list[tuple[str, dict[str, Any]]],
+    engine: StreamingAggregationEngine | None,
+    context: WorkerContext | None,
+    *,
+    redelivered: bool,
+) -> None:
+    """Process stream entries, acknowledging those the engine does not own."""
+    for msg_id, fields in messages:
+        if not fields:
+            # A pending entry trimmed from the stream; nothing left to process
+            await redis_client.xack(TASK_MINING_STREAM, CONSUMER_GROUP, msg_id)
+            continue
+        try:
+            task_data = json.loads(fields.get("payload", "{}"))
+            result = await process_task(
+                task_data, engine=engine, msg_id=msg_id, redelivered=redelivered, context=context
+            )
+            if result.get("status") != "queued":
+                await redis_client.xack(TASK_MINING_STREAM, CONSUMER_GROUP, msg_id)
+        except Exception:  # Intentionally broad: worker loop
+            logger.exception("Failed to process task mining message %s", msg_id)
+
+
+async def _handle_assemble_switching(task_data: dict[str, Any], context: WorkerContext | None) -> dict[str, Any]:
     """Handle the assemble_switching task type.
 
     Assembles APP_SWITCH events into SwitchingTrace records and ingests
-    them into the knowledge graph. Requires a database session and graph
-    service — these are lazily imported to avoid circular dependencies.
+    them into the knowledge graph, using the worker's shared database
+    session factory and Neo4j driver.
 
     Args:
         task_data: Must contain 'engagement_id'. 'session_id' is optional.
+        context: Shared worker clients.
 
     Returns:
         Dict with traces_created and graph_nodes_created counts.
+
+    Raises:
+        RuntimeError: The task is valid but no context was provided.
     """
     engagement_id_str = task_data.get("engagement_id")
     session_id_str = task_data.get("session_id")
@@ -125,10 +202,10 @@ async def _handle_assemble_switching(task_data: dict[str, Any]) -> dict[str, Any
         logger.warning("assemble_switching: invalid UUID in task_data")
         return {"status": "error", "detail": "invalid UUID"}
 
+    if context is None:
+        raise RuntimeError("assemble_switching needs a WorkerContext")
+
     # Lazy imports to avoid circular dependency at module load time
-    from src.core.config import Settings
-    from src.core.database import async_session_factory  # type: ignore[attr-defined]
-    from src.core.neo4j import create_neo4j_driver
     from src.semantic.graph import KnowledgeGraphService
     from src.taskmining.graph_ingest import ingest_switching_traces
     from src.taskmining.switching import assemble_switching_traces
@@ -136,7 +213,7 @@ async def _handle_assemble_switching(task_data: dict[str, Any]) -> dict[str, Any
     traces_created = 0
     graph_nodes_created = 0
 
-    async with async_session_factory() as db_session:
+    async with context.session_factory() as db_session:
         traces = await assemble_switching_traces(
             session=db_session,
             engagement_id=engagement_id,
@@ -145,9 +222,8 @@ async def _handle_assemble_switching(task_data: dict[str, Any]) -> dict[str, Any
         await db_session.commit()
         traces_created = len(traces)
 
-    driver = create_neo4j_driver(Settings())
-    graph_service = KnowledgeGraphService(driver=driver)
-    async with async_session_factory() as db_session:
+    graph_service = KnowledgeGraphService(driver=context.neo4j_driver)
+    async with context.session_factory() as db_session:
         graph_summary = await ingest_switching_traces(
             db_session=db_session,
             graph_service=graph_service,
@@ -8,17 +8,24 @@ Thresholds (configurable):
   >= 0.85 → NO_GAP
   0.4 <= x < 0.85 → PARTIAL_GAP (deviation_score = 1.0 - similarity)
   < 0.4  → FULL_GAP (deviation_score = 1.0)
+
+A run scores every activity against every dimension at once: one
+normalised activities × dimensions similarity matrix, classified in
+bulk, written with a single multi-row insert.
 """
 
 from __future__ import annotations
 
 import logging
 import math
+import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -43,6 +50,12 @@ logger = logging.getLogger(__name__)
 THRESHOLD_NO_GAP = 0.85
 THRESHOLD_PARTIAL_GAP = 0.40
 
+# Gap type for each code returned by classify_similarities
+GAP_TYPES = (TOMGapType.NO_GAP, TOMGapType.PARTIAL_GAP, TOMGapType.FULL_GAP)
+
+_GRAPH_EVIDENCE = {"method": "graph_alignment", "edge_type": "ALIGNS_TO"}
+_NO_DATA_EVIDENCE = {"method": "no_data", "reason": "No embedding or graph alignment available"}
+
 
 @dataclass
 class ActivityScore:
@@ -79,6 +92,38 @@ def classify_similarity(similarity: float) -> tuple[TOMGapType, float]:
     return TOMGapType.FULL_GAP, 1.0
 
 
+def similarity_matrix(rows: Sequence[Sequence[float]], columns: Sequence[Sequence[float]]) -> np.ndarray:
+    """Cosine similarity of every row vector against every column vector.
+
+    As in ``cosine_similarity``, a zero vector has similarity 0.0 with
+    everything.
+
+    Returns:
+        Array of shape (len(rows), len(columns)).
+    """
+    a = np.asarray(rows, dtype=np.float64)
+    b = np.asarray(columns, dtype=np.float64)
+    a_norm = np.linalg.norm(a, axis=1, keepdims=True)
+    b_norm = np.linalg.norm(b, axis=1, keepdims=True)
+    a = np.divide(a, a_norm, out=np.zeros_like(a), where=a_norm > 0)
+    b = np.divide(b, b_norm, out=np.zeros_like(b), where=b_norm > 0)
+    return a @ b.T
+
+
+def classify_similarities(similarities: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorised ``classify_similarity``.
+
+    Returns:
+        (gap_codes, deviation_scores) arrays shaped like ``similarities``;
+        each code indexes ``GAP_TYPES``.
+    """
+    no_gap = similarities >= THRESHOLD_NO_GAP
+    partial = ~no_gap & (similarities >= THRESHOLD_PARTIAL_GAP)
+    codes = np.where(no_gap, 0, np.where(partial, 1, 2))
+    deviations = np.where(no_gap, 0.0, np.where(partial, np.round(1.0 - similarities, 4), 1.0))
+    return codes, deviations
+
+
 class AlignmentScoringService:
     """Scores process activities against TOM dimensions.
 
@@ -98,7 +143,7 @@ class AlignmentScoringService:
         self,
         session: AsyncSession,
         run: TOMAlignmentRun,
-    ) -> list[TOMAlignmentResult]:
+    ) -> int:
         """Execute alignment scoring for a run.
 
         Fetches activities from the latest POV, TOM dimensions from the TOM,
@@ -109,7 +154,7 @@ class AlignmentScoringService:
             run: The alignment run record (status will be updated).
 
         Returns:
-            List of persisted TOMAlignmentResult records.
+            Number of TOMAlignmentResult rows written.
         """
         run.status = AlignmentRunStatus.RUNNING
         run.started_at = datetime.now(UTC)
@@ -132,7 +177,7 @@ class AlignmentScoringService:
         self,
         session: AsyncSession,
         run: TOMAlignmentRun,
-    ) -> list[TOMAlignmentResult]:
+    ) -> int:
         """Core scoring logic."""
         # Fetch latest completed POV for the engagement
         pov_result = await session.execute(
@@ -147,7 +192,7 @@ class AlignmentScoringService:
         pov = pov_result.scalar_one_or_none()
         if not pov:
             logger.warning("No completed POV for engagement %s", run.engagement_id)
-            return []
+            return 0
 
         # Fetch activities from the POV
         activities_result = await session.execute(
@@ -158,7 +203,7 @@ class AlignmentScoringService:
         )
         activities = list(activities_result.scalars().all())
         if not activities:
-            return []
+            return 0
 
         # Fetch TOM with dimension records
         tom_result = await session.execute(
@@ -168,7 +213,7 @@ class AlignmentScoringService:
         )
         tom = tom_result.scalar_one_or_none()
         if not tom:
-            return []
+            return 0
 
         # Check graph for ALIGNS_TO edges
         aligned_pairs = await self._get_aligned_pairs(str(run.engagement_id))
@@ -194,32 +239,17 @@ class AlignmentScoringService:
                 for i, dim_type in enumerate(dim_descriptions.keys()):
                     dim_embeddings[dim_type] = all_embs[len(activity_texts) + i]
 
-        # Score each activity against each dimension
-        results: list[TOMAlignmentResult] = []
-        for activity in activities:
-            for dimension in TOMDimension:
-                score = self._score_single(
-                    activity=activity,
-                    dimension=dimension,
-                    aligned_pairs=aligned_pairs,
-                    activity_emb=activity_embeddings.get(str(activity.id)),
-                    dim_emb=dim_embeddings.get(dimension),
-                    dim_description=dim_descriptions.get(dimension),
-                )
-
-                result = TOMAlignmentResult(
-                    run_id=run.id,
-                    activity_id=activity.id,
-                    dimension_type=score.dimension_type,
-                    gap_type=score.gap_type,
-                    deviation_score=score.deviation_score,
-                    alignment_evidence=score.alignment_evidence,
-                )
-                session.add(result)
-                results.append(result)
-
-        await session.flush()
-        return results
+        rows = build_result_rows(
+            run.id,
+            activities,
+            aligned_pairs=aligned_pairs,
+            activity_embeddings=activity_embeddings,
+            dim_embeddings=dim_embeddings,
+            dim_descriptions=dim_descriptions,
+        )
+        if rows:
+            await session.execute(insert(TOMAlignmentResult), rows)
+        return len(rows)
 
     def _score_single(
         self,
@@ -231,7 +261,10 @@ class AlignmentScoringService:
         dim_emb: list[float] | None,
         dim_description: str | None,
     ) -> ActivityScore:
-        """Score a single activity against a single dimension."""
+        """Score a single activity against a single dimension.
+
+        Per-pair equivalent of ``build_result_rows``.
+        """
         activity_id_str = str(activity.id)
 
         # Check graph alignment first
@@ -242,7 +275,7 @@ class AlignmentScoringService:
                 dimension_type=dimension,
                 gap_type=TOMGapType.NO_GAP,
                 deviation_score=0.0,
-                alignment_evidence={"method": "graph_alignment", "edge_type": "ALIGNS_TO"},
+                alignment_evidence=dict(_GRAPH_EVIDENCE),
             )
 
         # Fall back to embedding similarity
@@ -270,7 +303,7 @@ class AlignmentScoringService:
             dimension_type=dimension,
             gap_type=TOMGapType.FULL_GAP,
             deviation_score=1.0,
-            alignment_evidence={"method": "no_data", "reason": "No embedding or graph alignment available"},
+            alignment_evidence=dict(_NO_DATA_EVIDENCE),
         )
 
     async def _get_aligned_pairs(self, engagement_id: str) -> set[tuple[str, str]]:
@@ -289,3 +322,65 @@ class AlignmentScoringService:
         except Exception:  # Intentionally broad: Neo4j driver errors vary by version and connection state
             logger.warning("Failed to query ALIGNS_TO edges for engagement %s", engagement_id)
             return set()
+
+
+def build_result_rows(
+    run_id: uuid.UUID,
+    activities: Sequence[ProcessElement],
+    *,
+    aligned_pairs: set[tuple[str, str]],
+    activity_embeddings: dict[str, list[float]],
+    dim_embeddings: dict[str, list[float]],
+    dim_descriptions: dict[str, str],
+) -> list[dict[str, Any]]:
+    """Score every activity against every TOM dimension.
+
+    Graph alignment wins over embedding similarity; pairs with neither
+    are a FULL_GAP. Similarities for all pairs come from one matrix
+    product.
+
+    Returns:
+        ``tom_alignment_results`` insert parameters, one per
+        (activity, dimension), in activity then ``TOMDimension`` order.
+    """
+    dimensions = list(TOMDimension)
+    embedded = [d for d in dimensions if d in dim_embeddings]
+    column = {d: j for j, d in enumerate(embedded)}
+    similarities: list[list[float]] = []
+    codes: list[list[int]] = []
+    deviations: list[list[float]] = []
+    if embedded and activity_embeddings:
+        matrix = similarity_matrix(
+            [activity_embeddings[str(a.id)] for a in activities],
+            [dim_embeddings[d] for d in embedded],
+        )
+        code_matrix, deviation_matrix = classify_similarities(matrix)
+        similarities = np.round(matrix, 4).tolist()
+        codes = code_matrix.tolist()
+        deviations = deviation_matrix.tolist()
+
+    rows: list[dict[str, Any]] = []
+    for i, activity in enumerate(activities):
+        activity_id = str(activity.id)
+        for dimension in dimensions:
+            row: dict[str, Any] = {"run_id": run_id, "activity_id": activity.id, "dimension_type": dimension}
+            j = column.get(dimension)
+            if (activity_id, dimension) in aligned_pairs:
+                row.update(gap_type=TOMGapType.NO_GAP, deviation_score=0.0, alignment_evidence=dict(_GRAPH_EVIDENCE))
+            elif j is not None and similarities:
+                row.update(
+                    gap_type=GAP_TYPES[codes[i][j]],
+                    deviation_score=deviations[i][j],
+                    alignment_evidence={
+                        "method": "embedding_similarity",
+                        "similarity_score": similarities[i][j],
+                        "activity_description": activity.name,
+                        "tom_specification": dim_descriptions.get(dimension, ""),
+                    },
+                )
+            else:
+                row.update(
+                    gap_type=TOMGapType.FULL_GAP, deviation_score=1.0, alignment_evidence=dict(_NO_DATA_EVIDENCE)
+                )
+            rows.append(row)
+    return rows
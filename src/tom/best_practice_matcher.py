@@ -2,12 +2,21 @@
 
 Matches gap analysis results to relevant industry best practices
 using TOM dimension alignment and optional embedding similarity ranking.
+
+Best-practice description embeddings are kept in a process-wide
+``PracticeEmbeddingIndex``: one matrix per TOM dimension, re-embedded only
+when that dimension's practices change. Gap recommendations are embedded
+in one batch and scored against each dimension's matrix with a single
+matrix product.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any, Protocol
 
 import numpy as np
@@ -30,6 +39,82 @@ logger = logging.getLogger(__name__)
 _EMBEDDING_THRESHOLD = 0.5
 
 
+@dataclass(frozen=True)
+class _DimensionMatrix:
+    fingerprint: str
+    rows: dict[str, int]
+    matrix: np.ndarray
+
+
+def _practices_fingerprint(practices: Sequence[BestPractice]) -> str:
+    digest = hashlib.sha256()
+    for bp in practices:
+        digest.update(f"{bp.id}\x1f{bp.description}\x1e".encode())
+    return digest.hexdigest()
+
+
+class PracticeEmbeddingIndex:
+    """Best-practice description embeddings, one matrix per TOM dimension.
+
+    A dimension's matrix is rebuilt when the ids or descriptions of its
+    practices change (detected by fingerprint), or when a different
+    embedding service is used.
+    """
+
+    def __init__(self) -> None:
+        self._service: _EmbeddingServiceProtocol | None = None
+        self._dimensions: dict[str, _DimensionMatrix] = {}
+
+    async def matrix(
+        self,
+        service: _EmbeddingServiceProtocol,
+        dimension: str,
+        practices: Sequence[BestPractice],
+    ) -> tuple[dict[str, int], np.ndarray]:
+        """Return (practice id -> row, embedding matrix) for a dimension's practices.
+
+        Raises:
+            ConnectionError, RuntimeError, ValueError: If embedding fails.
+        """
+        if service is not self._service:
+            self._dimensions.clear()
+            self._service = service
+        ordered = sorted(practices, key=lambda bp: str(bp.id))
+        fingerprint = _practices_fingerprint(ordered)
+        entry = self._dimensions.get(dimension)
+        if entry is None or entry.fingerprint != fingerprint:
+            embeddings = await service.embed_texts_async([bp.description for bp in ordered])
+            entry = _DimensionMatrix(
+                fingerprint=fingerprint,
+                rows={str(bp.id): i for i, bp in enumerate(ordered)},
+                matrix=np.asarray(embeddings, dtype=np.float64),
+            )
+            self._dimensions[dimension] = entry
+            logger.debug("Embedded %d best practices for dimension %s", len(ordered), dimension)
+        return entry.rows, entry.matrix
+
+    def invalidate(self, dimension: str | None = None) -> None:
+        """Drop one dimension's matrix, or all of them."""
+        if dimension is None:
+            self._dimensions.clear()
+        else:
+            self._dimensions.pop(dimension, None)
+
+
+_practice_index = PracticeEmbeddingIndex()
+
+
+def get_practice_index() -> PracticeEmbeddingIndex:
+    """Return the process-wide best-practice embedding index."""
+    return _practice_index
+
+
+def reset_practice_index() -> None:
+    """Reset the best-practice embedding index (used in tests)."""
+    global _practice_index  # noqa: PLW0603
+    _practice_index = PracticeEmbeddingIndex()
+
+
 class BestPracticeMatcher:
     """Matches TOM gaps to relevant industry best practices.
 
@@ -72,52 +157,77 @@ class BestPracticeMatcher:
         if not gaps or not best_practices:
             return {}
 
-        matches: dict[str, list[dict[str, Any]]] = {}
+        by_dimension: dict[str, list[BestPractice]] = {}
+        for bp in best_practices:
+            by_dimension.setdefault(bp.tom_dimension, []).append(bp)
 
+        ranked: dict[str, list[dict[str, Any]]] = {}
+        if self._embedding_service is not None:
+            ranked = await self._rank_by_embedding(
+                [gap for gap in gaps if gap.recommendation and by_dimension.get(gap.dimension)],
+                by_dimension,
+            )
+
+        matches: dict[str, list[dict[str, Any]]] = {}
         for gap in gaps:
             gap_id = str(gap.id)
             # Primary filter: same TOM dimension
-            dimension_matches = [bp for bp in best_practices if bp.tom_dimension == gap.dimension]
-
-            if not dimension_matches:
-                matches[gap_id] = []
-                continue
-
-            if self._embedding_service is not None and gap.recommendation:
-                scored = await self._rank_by_embedding(gap.recommendation, dimension_matches)
+            dimension_matches = by_dimension.get(gap.dimension, [])
+            if gap_id in ranked:
+                matches[gap_id] = ranked[gap_id]
             else:
                 # Assign a default score of 1.0 for dimension-matched practices
-                scored = [self._bp_to_dict(bp, score=1.0) for bp in dimension_matches]
-
-            matches[gap_id] = scored
+                matches[gap_id] = [self._bp_to_dict(bp, score=1.0) for bp in dimension_matches]
 
         return matches
 
     async def _rank_by_embedding(
         self,
-        query_text: str,
-        practices: list[BestPractice],
-    ) -> list[dict[str, Any]]:
-        """Rank best practices by embedding similarity to gap recommendation."""
-        descriptions = [bp.description for bp in practices]
-        if self._embedding_service is None:
-            return [self._bp_to_dict(bp, score=1.0) for bp in practices]
+        gaps: list[GapAnalysisResult],
+        by_dimension: dict[str, list[BestPractice]],
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Rank each gap's dimension practices by embedding similarity to its recommendation.
+
+        Returns:
+            Dict mapping gap_id -> practices scoring at least the threshold,
+            best first. Empty if embedding fails, so callers fall back to
+            default scores.
+        """
+        if self._embedding_service is None or not gaps:
+            return {}
+        index = get_practice_index()
         try:
-            query_emb = await self._embedding_service.embed_text_async(query_text)
-            bp_embs = await self._embedding_service.embed_texts_async(descriptions)
+            gap_embs = np.asarray(
+                await self._embedding_service.embed_texts_async([gap.recommendation for gap in gaps]),
+                dtype=np.float64,
+            )
+            gaps_by_dimension: dict[str, list[int]] = {}
+            for i, gap in enumerate(gaps):
+                gaps_by_dimension.setdefault(gap.dimension, []).append(i)
+            matrices = {
+                dimension: await index.matrix(self._embedding_service, dimension, by_dimension[dimension])
+                for dimension in gaps_by_dimension
+            }
         except (ConnectionError, RuntimeError, ValueError) as e:
             logger.warning("Embedding failed during BP ranking, using default scores: %s", e)
-            return [self._bp_to_dict(bp, score=1.0) for bp in practices]
-
-        scored = []
-        for bp, emb in zip(practices, bp_embs, strict=True):
-            score = float(np.dot(query_emb, emb))
-            if score >= _EMBEDDING_THRESHOLD:
-                scored.append(self._bp_to_dict(bp, score=score))
+            return {}
 
-        # Sort by similarity descending
-        scored.sort(key=lambda x: float(x["score"]), reverse=True)
-        return scored
+        ranked: dict[str, list[dict[str, Any]]] = {}
+        for dimension, gap_rows in gaps_by_dimension.items():
+            rows, matrix = matrices[dimension]
+            scores = gap_embs[gap_rows] @ matrix.T
+            practices = by_dimension[dimension]
+            columns = [rows[str(bp.id)] for bp in practices]
+            for gap_row, gap_scores in zip(gap_rows, scores[:, columns].tolist(), strict=True):
+                scored = [
+                    self._bp_to_dict(bp, score=score)
+                    for bp, score in zip(practices, gap_scores, strict=True)
+                    if score >= _EMBEDDING_THRESHOLD
+                ]
+                # Sort by similarity descending
+                scored.sort(key=lambda x: float(x["score"]), reverse=True)
+                ranked[str(gaps[gap_row].id)] = scored
+        return ranked
 
     def _bp_to_dict(self, bp: BestPractice, score: float) -> dict[str, Any]:
         """Convert a BestPractice ORM object to a serializable dict."""
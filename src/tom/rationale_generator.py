@@ -2,13 +2,16 @@
 
 Generates human-readable rationale for each identified gap using
 structured few-shot prompting. Each rationale includes evidence
-references, plain-language explanation, and recommendations.
+references, plain-language explanation, and recommendations. Bulk
+generation fans out through ``src.core.llm_executor``.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import select
@@ -149,6 +152,16 @@ Respond in JSON format:
 {{"rationale": "...", "recommendation": "..."}}"""
 
 
+@dataclass
+class _RationaleOutcome:
+    """Prompt, raw response and parsed result of one rationale call."""
+
+    prompt: str
+    response_text: str | None = None
+    error_message: str | None = None
+    result: dict[str, str] = field(default_factory=dict)
+
+
 class RationaleGeneratorService:
     """Generates LLM-powered rationale for gap analysis results."""
 
@@ -181,6 +194,22 @@ class RationaleGeneratorService:
         Returns:
             Dict with 'rationale' and 'recommendation' keys.
         """
+        outcome = await self._generate(gap, tom_specification, activity_description)
+        if session is not None:
+            self._add_audit_entry(session, gap, outcome, user_id)
+            try:
+                await session.flush()
+            except Exception:  # Intentionally broad: audit log failure must not mask the original LLM error
+                logger.exception("Failed to persist LLM audit log for TOM rationale gap %s", gap.id)
+        return outcome.result
+
+    async def _generate(
+        self,
+        gap: GapAnalysisResult,
+        tom_specification: str | None = None,
+        activity_description: str | None = None,
+    ) -> _RationaleOutcome:
+        """Call the LLM for one gap; never raises (falls back to a template)."""
         desc = activity_description or getattr(gap, "activity_name", None) or str(gap.gap_type)
         prompt = build_rationale_prompt(
             gap_type=str(gap.gap_type),
@@ -190,40 +219,43 @@ class RationaleGeneratorService:
             severity=gap.severity,
             confidence=gap.confidence,
         )
-
-        model_name = getattr(self._settings, "suggester_model", "claude-sonnet-4-5-20250929")
-        response_text: str | None = None
-        error_message: str | None = None
+        outcome = _RationaleOutcome(prompt=prompt)
 
         try:
-            response_text = await self._call_llm(prompt)
-            result = self._parse_response(response_text)
+            outcome.response_text = await self._call_llm(prompt)
+            outcome.result = self._parse_response(outcome.response_text)
         except (
             Exception
         ) as exc:  # Intentionally broad: LLM client can raise httpx, anthropic, or provider-specific errors
-            error_message = str(exc)
+            outcome.error_message = str(exc)
             logger.exception("Failed to generate rationale for gap %s", gap.id)
-            result = self._fallback_rationale(gap)
+            outcome.result = self._fallback_rationale(gap)
+        return outcome
 
-        if session is not None:
-            try:
-                audit_entry = LLMAuditLog(
+    def _add_audit_entry(
+        self,
+        session: AsyncSession,
+        gap: GapAnalysisResult,
+        outcome: _RationaleOutcome,
+        user_id: str | None = None,
+    ) -> None:
+        """Stage an LLM audit log entry for one generated rationale."""
+        try:
+            session.add(
+                LLMAuditLog(
                     scenario_id=None,
                     user_id=user_id,
-                    prompt_text=prompt[:10000],
-                    response_text=(response_text or "")[:10000],
+                    prompt_text=outcome.prompt[:10000],
+                    response_text=(outcome.response_text or "")[:10000],
                     evidence_ids=None,
-                    prompt_tokens=len(prompt) // 4,
-                    completion_tokens=len(response_text) // 4 if response_text else 0,
-                    model_name=model_name,
-                    error_message=error_message,
+                    prompt_tokens=len(outcome.prompt) // 4,
+                    completion_tokens=len(outcome.response_text) // 4 if outcome.response_text else 0,
+                    model_name=getattr(self._settings, "suggester_model", "claude-sonnet-4-5-20250929"),
+                    error_message=outcome.error_message,
                 )
-                session.add(audit_entry)
-                await session.flush()
-            except Exception:  # Intentionally broad: audit log failure must not mask the original LLM error
-                logger.exception("Failed to persist LLM audit log for TOM rationale gap %s", gap.id)
-
-        return result
+            )
+        except Exception:  # Intentionally broad: audit log failure must not mask the original LLM error
+            logger.exception("Failed to persist LLM audit log for TOM rationale gap %s", gap.id)
 
     async def generate_bulk_rationales(
         self,
@@ -232,6 +264,10 @@ class RationaleGeneratorService:
     ) -> list[dict[str, Any]]:
         """Generate rationales for all gaps in an engagement.
 
+        LLM calls run concurrently through the shared LLM executor, which
+        bounds concurrency and rate per provider; results and audit
+        entries are then applied to the session in gap order.
+
         Args:
             session: Database session.
             engagement_id: The engagement UUID string.
@@ -256,19 +292,19 @@ class RationaleGeneratorService:
         # Fetch TOM specifications for dimension context
         tom_specs = await self._get_tom_specifications(session, gaps)
 
-        results = []
-        for gap in gaps:
-            spec = tom_specs.get(str(gap.dimension), None)
-            rationale_data = await self.generate_rationale(gap, spec, session=session)
+        outcomes = await asyncio.gather(*(self._generate(gap, tom_specs.get(str(gap.dimension))) for gap in gaps))
 
-            gap.rationale = rationale_data["rationale"]
-            gap.recommendation = rationale_data["recommendation"]
+        results = []
+        for gap, outcome in zip(gaps, outcomes, strict=True):
+            self._add_audit_entry(session, gap, outcome)
+            gap.rationale = outcome.result["rationale"]
+            gap.recommendation = outcome.result["recommendation"]
 
             results.append(
                 {
                     "gap_id": str(gap.id),
-                    "rationale": rationale_data["rationale"],
-                    "recommendation": rationale_data["recommendation"],
+                    "rationale": outcome.result["rationale"],
+                    "recommendation": outcome.result["recommendation"],
                 }
             )
 
@@ -276,12 +312,11 @@ class RationaleGeneratorService:
         return results
 
     async def _call_llm(self, prompt: str) -> str:
-        """Call the configured LLM provider."""
-        from src.core.llm import get_llm_provider
+        """Call the configured LLM provider through the shared executor."""
+        from src.core.llm_executor import get_llm_executor
 
-        llm = get_llm_provider()
         model = getattr(self._settings, "suggester_model", "claude-sonnet-4-5-20250929")
-        return await llm.generate(prompt, model=model, max_tokens=1000)
+        return await get_llm_executor().generate(prompt, model=model, max_tokens=1000)
 
     def _parse_response(self, response_text: str) -> dict[str, str]:
         """Parse LLM response into rationale and recommendation."""
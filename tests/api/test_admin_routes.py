@@ -208,9 +208,15 @@ class TestRetentionCleanup:
 
         token = _admin_token(admin)
 
-        with patch(
-            "src.core.retention.cleanup_expired_engagements",
-            new=AsyncMock(return_value=3),
+        with (
+            patch(
+                "src.core.retention.cleanup_expired_engagements",
+                new=AsyncMock(return_value=3),
+            ),
+            patch(
+                "src.semantic.extraction_cache.purge_stale_entries",
+                new=AsyncMock(return_value=7),
+            ),
         ):
             transport = ASGITransport(app=test_app)
             async with AsyncClient(transport=transport, base_url="http://test") as ac:
@@ -226,6 +232,7 @@ class TestRetentionCleanup:
         data = response.json()
         assert data["dry_run"] is False
         assert data["cleaned_up"] == 3
+        assert data["extraction_cache_purged"] == 7
         assert data["status"] == "completed"
 
 
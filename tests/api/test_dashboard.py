@@ -3,16 +3,15 @@
 from __future__ import annotations
 
 import uuid
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.core.models import (
     AuditAction,
+    EngagementDashboardRollup,
     EngagementStatus,
-    EvidenceCategory,
-    GapSeverity,
-    ProcessModelStatus,
 )
 
 
@@ -34,39 +33,49 @@ def engagement_id(mock_engagement):
     return str(mock_engagement.id)
 
 
+def _rollup(engagement_id: str, **overrides: Any) -> EngagementDashboardRollup:
+    """Build a dashboard rollup row with empty aggregates."""
+    values: dict[str, Any] = {
+        "engagement_id": uuid.UUID(engagement_id),
+        "evidence_item_count": 0,
+        "process_model_count": 0,
+        "latest_model_id": None,
+        "overall_confidence": 0.0,
+        "shelf_coverage": {},
+        "gap_counts": {},
+        "confidence_buckets": {},
+        "brightness_counts": {},
+        "weakest_elements": [],
+    }
+    values.update(overrides)
+    return EngagementDashboardRollup(**values)
+
+
+def _results(*values: Any) -> AsyncMock:
+    """Return an execute mock whose successive results yield *values*.
+
+    Lists are returned from ``scalars().all()``, everything else from
+    ``scalar_one_or_none()``.
+    """
+    results = []
+    for value in values:
+        result = MagicMock()
+        if isinstance(value, list):
+            result.scalars.return_value.all.return_value = value
+        else:
+            result.scalar_one_or_none.return_value = value
+        results.append(result)
+    return AsyncMock(side_effect=results)
+
+
 class TestGetDashboard:
     """Tests for GET /api/v1/dashboard/{engagement_id}."""
 
     @pytest.mark.asyncio
     async def test_dashboard_returns_200(self, client, mock_db_session, mock_engagement, engagement_id):
         """Returns dashboard data when engagement exists."""
-        call_count = 0
-
-        async def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            result = MagicMock()
-            if call_count == 1:
-                # Engagement lookup
-                result.scalar_one_or_none.return_value = mock_engagement
-            elif call_count == 2:
-                # Evidence item count
-                result.scalar.return_value = 15
-            elif call_count == 3:
-                # Process model count
-                result.scalar.return_value = 2
-            elif call_count == 4:
-                # Latest completed model
-                result.scalar_one_or_none.return_value = None
-            elif call_count == 5:
-                # Shelf items aggregation (empty)
-                result.all.return_value = []
-            elif call_count == 6:
-                # Audit logs
-                result.scalars.return_value.all.return_value = []
-            return result
-
-        mock_db_session.execute = AsyncMock(side_effect=side_effect)
+        rollup = _rollup(engagement_id, evidence_item_count=15, process_model_count=2)
+        mock_db_session.execute = _results(mock_engagement.name, rollup, [])
 
         response = await client.get(f"/api/v1/dashboard/{engagement_id}")
 
@@ -101,41 +110,16 @@ class TestGetDashboard:
     @pytest.mark.asyncio
     async def test_dashboard_with_model_and_gaps(self, client, mock_db_session, mock_engagement, engagement_id):
         """Returns gap counts when a completed model exists."""
-        mock_model = MagicMock()
-        mock_model.id = uuid.uuid4()
-        mock_model.confidence_score = 0.78
-        mock_model.status = ProcessModelStatus.COMPLETED
-
-        call_count = 0
-
-        async def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            result = MagicMock()
-            if call_count == 1:
-                result.scalar_one_or_none.return_value = mock_engagement
-            elif call_count == 2:
-                result.scalar.return_value = 10
-            elif call_count == 3:
-                result.scalar.return_value = 1
-            elif call_count == 4:
-                result.scalar_one_or_none.return_value = mock_model
-            elif call_count == 5:
-                result.all.return_value = []
-            elif call_count == 6:
-                # Gap counts by severity
-                high_row = MagicMock()
-                high_row.severity = GapSeverity.HIGH
-                high_row.cnt = 2
-                med_row = MagicMock()
-                med_row.severity = GapSeverity.MEDIUM
-                med_row.cnt = 3
-                result.all.return_value = [high_row, med_row]
-            elif call_count == 7:
-                result.scalars.return_value.all.return_value = []
-            return result
-
-        mock_db_session.execute = AsyncMock(side_effect=side_effect)
+        rollup = _rollup(
+            engagement_id,
+            evidence_item_count=10,
+            process_model_count=1,
+            latest_model_id=uuid.uuid4(),
+            overall_confidence=0.78,
+            gap_counts={"high": 2, "medium": 3},
+            shelf_coverage={"documents": {"requested": 4, "received": 3}},
+        )
+        mock_db_session.execute = _results(mock_engagement.name, rollup, [])
 
         response = await client.get(f"/api/v1/dashboard/{engagement_id}")
 
@@ -145,6 +129,7 @@ class TestGetDashboard:
         assert data["gap_counts"]["high"] == 2
         assert data["gap_counts"]["medium"] == 3
         assert data["gap_counts"]["low"] == 0
+        assert data["evidence_coverage_pct"] == 75.0
 
     @pytest.mark.asyncio
     async def test_dashboard_with_audit_logs(self, client, mock_db_session, mock_engagement, engagement_id):
@@ -156,27 +141,9 @@ class TestGetDashboard:
         mock_log.details = "File uploaded"
         mock_log.created_at = "2024-01-01T00:00:00Z"
 
-        call_count = 0
-
-        async def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            result = MagicMock()
-            if call_count == 1:
-                result.scalar_one_or_none.return_value = mock_engagement
-            elif call_count == 2:
-                result.scalar.return_value = 5
-            elif call_count == 3:
-                result.scalar.return_value = 0
-            elif call_count == 4:
-                result.scalar_one_or_none.return_value = None
-            elif call_count == 5:
-                result.all.return_value = []
-            elif call_count == 6:
-                result.scalars.return_value.all.return_value = [mock_log]
-            return result
-
-        mock_db_session.execute = AsyncMock(side_effect=side_effect)
+        mock_db_session.execute = _results(
+            mock_engagement.name, _rollup(engagement_id, evidence_item_count=5), [mock_log]
+        )
 
         response = await client.get(f"/api/v1/dashboard/{engagement_id}")
 
@@ -186,6 +153,31 @@ class TestGetDashboard:
         assert data["recent_activity"][0]["action"] == "evidence_uploaded"
         assert data["recent_activity"][0]["actor"] == "system"
 
+    @pytest.mark.asyncio
+    async def test_missing_rollup_is_backfilled(self, client, mock_db_session, mock_engagement, engagement_id):
+        """A missing rollup row is computed once and committed."""
+        values = {
+            "engagement_id": mock_engagement.id,
+            "evidence_item_count": 7,
+            "process_model_count": 0,
+            "latest_model_id": None,
+            "overall_confidence": 0.0,
+            "shelf_coverage": {},
+            "gap_counts": {},
+            "confidence_buckets": {},
+            "brightness_counts": {},
+            "weakest_elements": [],
+        }
+        mock_db_session.execute = _results(mock_engagement.name, None, [])
+        mock_db_session.run_sync = AsyncMock(return_value=values)
+
+        response = await client.get(f"/api/v1/dashboard/{engagement_id}")
+
+        assert response.status_code == 200
+        assert response.json()["evidence_item_count"] == 7
+        mock_db_session.run_sync.assert_awaited_once()
+        mock_db_session.commit.assert_awaited()
+
 
 class TestGetEvidenceCoverage:
     """Tests for GET /api/v1/dashboard/{engagement_id}/evidence-coverage."""
@@ -193,27 +185,14 @@ class TestGetEvidenceCoverage:
     @pytest.mark.asyncio
     async def test_evidence_coverage_returns_200(self, client, mock_db_session, mock_engagement, engagement_id):
         """Returns evidence coverage breakdown."""
-        call_count = 0
-
-        async def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            result = MagicMock()
-            if call_count == 1:
-                result.scalar_one_or_none.return_value = mock_engagement.id
-            elif call_count == 2:
-                row1 = MagicMock()
-                row1.category = EvidenceCategory.DOCUMENTS
-                row1.total = 10
-                row1.received = 8
-                row2 = MagicMock()
-                row2.category = EvidenceCategory.IMAGES
-                row2.total = 5
-                row2.received = 1
-                result.all.return_value = [row1, row2]
-            return result
-
-        mock_db_session.execute = AsyncMock(side_effect=side_effect)
+        rollup = _rollup(
+            engagement_id,
+            shelf_coverage={
+                "documents": {"requested": 10, "received": 8},
+                "images": {"requested": 5, "received": 1},
+            },
+        )
+        mock_db_session.execute = _results(rollup)
 
         response = await client.get(f"/api/v1/dashboard/{engagement_id}/evidence-coverage")
 
@@ -240,6 +219,7 @@ class TestGetEvidenceCoverage:
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = None
         mock_db_session.execute = AsyncMock(return_value=mock_result)
+        mock_db_session.run_sync = AsyncMock(return_value=None)
 
         eng_id = str(uuid.uuid4())
         response = await client.get(f"/api/v1/dashboard/{eng_id}/evidence-coverage")
@@ -249,19 +229,7 @@ class TestGetEvidenceCoverage:
     @pytest.mark.asyncio
     async def test_evidence_coverage_empty(self, client, mock_db_session, mock_engagement, engagement_id):
         """Returns 0% when no shelf request items exist."""
-        call_count = 0
-
-        async def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            result = MagicMock()
-            if call_count == 1:
-                result.scalar_one_or_none.return_value = mock_engagement.id
-            elif call_count == 2:
-                result.all.return_value = []
-            return result
-
-        mock_db_session.execute = AsyncMock(side_effect=side_effect)
+        mock_db_session.execute = _results(_rollup(engagement_id))
 
         response = await client.get(f"/api/v1/dashboard/{engagement_id}/evidence-coverage")
 
@@ -277,47 +245,25 @@ class TestGetConfidenceDistribution:
     @pytest.mark.asyncio
     async def test_confidence_distribution_returns_200(self, client, mock_db_session, mock_engagement, engagement_id):
         """Returns confidence distribution when a completed model exists."""
-        mock_model = MagicMock()
-        mock_model.id = uuid.uuid4()
-        mock_model.confidence_score = 0.72
-        mock_model.status = ProcessModelStatus.COMPLETED
-
-        mock_elem1 = MagicMock()
-        mock_elem1.id = uuid.uuid4()
-        mock_elem1.name = "Submit Request"
-        mock_elem1.element_type = "activity"
-        mock_elem1.confidence_score = 0.95
-
-        mock_elem2 = MagicMock()
-        mock_elem2.id = uuid.uuid4()
-        mock_elem2.name = "Review Request"
-        mock_elem2.element_type = "activity"
-        mock_elem2.confidence_score = 0.3
-
-        call_count = 0
-
-        async def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            result = MagicMock()
-            if call_count == 1:
-                result.scalar_one_or_none.return_value = mock_engagement.id
-            elif call_count == 2:
-                result.scalar_one_or_none.return_value = mock_model
-            elif call_count == 3:
-                result.scalars.return_value.all.return_value = [
-                    mock_elem1,
-                    mock_elem2,
-                ]
-            return result
-
-        mock_db_session.execute = AsyncMock(side_effect=side_effect)
+        model_id = uuid.uuid4()
+        weakest = [
+            {"id": str(uuid.uuid4()), "name": "Review Request", "element_type": "activity", "confidence_score": 0.3},
+            {"id": str(uuid.uuid4()), "name": "Submit Request", "element_type": "activity", "confidence_score": 0.95},
+        ]
+        rollup = _rollup(
+            engagement_id,
+            latest_model_id=model_id,
+            overall_confidence=0.72,
+            confidence_buckets={"VERY_HIGH": 1, "HIGH": 0, "MEDIUM": 0, "LOW": 1, "VERY_LOW": 0},
+            weakest_elements=weakest,
+        )
+        mock_db_session.execute = _results(rollup)
 
         response = await client.get(f"/api/v1/dashboard/{engagement_id}/confidence-distribution")
 
         assert response.status_code == 200
         data = response.json()
-        assert data["model_id"] == str(mock_model.id)
+        assert data["model_id"] == str(model_id)
         assert data["overall_confidence"] == 0.72
         assert len(data["distribution"]) == 5
 
@@ -336,19 +282,7 @@ class TestGetConfidenceDistribution:
     @pytest.mark.asyncio
     async def test_confidence_distribution_no_model(self, client, mock_db_session, mock_engagement, engagement_id):
         """Returns empty distribution when no completed model exists."""
-        call_count = 0
-
-        async def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            result = MagicMock()
-            if call_count == 1:
-                result.scalar_one_or_none.return_value = mock_engagement.id
-            elif call_count == 2:
-                result.scalar_one_or_none.return_value = None
-            return result
-
-        mock_db_session.execute = AsyncMock(side_effect=side_effect)
+        mock_db_session.execute = _results(_rollup(engagement_id))
 
         response = await client.get(f"/api/v1/dashboard/{engagement_id}/confidence-distribution")
 
@@ -365,6 +299,7 @@ class TestGetConfidenceDistribution:
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = None
         mock_db_session.execute = AsyncMock(return_value=mock_result)
+        mock_db_session.run_sync = AsyncMock(return_value=None)
 
         eng_id = str(uuid.uuid4())
         response = await client.get(f"/api/v1/dashboard/{eng_id}/confidence-distribution")
@@ -0,0 +1,131 @@
+"""Tests for materialised dashboard rollup maintenance."""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.api.services.dashboard_rollup as rollup_mod
+from src.api.services.dashboard_rollup import (
+    _collect_touched_engagements,
+    _confidence_level,
+    _discard_touched_rollups,
+    _refresh_touched_rollups,
+    mark_rollup_stale,
+    refresh_engagement_rollup,
+    rollup_shelf_totals,
+)
+from src.core.models import (
+    EngagementDashboardRollup,
+    EvidenceGap,
+    EvidenceItem,
+    ProcessElement,
+    ShelfDataRequestItem,
+    User,
+)
+
+
+def _session(*, new=(), dirty=(), deleted=()) -> MagicMock:
+    session = MagicMock()
+    session.info = {}
+    session.new = list(new)
+    session.dirty = list(dirty)
+    session.deleted = list(deleted)
+    session.is_modified.return_value = True
+    return session
+
+
+class TestTracking:
+    def test_flush_records_engagements_models_and_shelf_requests(self) -> None:
+        engagement_id, model_id, request_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        session = _session(
+            new=[EvidenceItem(engagement_id=engagement_id), ProcessElement(model_id=model_id)],
+            dirty=[ShelfDataRequestItem(request_id=request_id)],
+            deleted=[EvidenceGap(model_id=model_id), User(email="x@kmflow.dev")],
+        )
+
+        _collect_touched_engagements(session, None, None)
+
+        pending = session.info[rollup_mod._PENDING_KEY]
+        assert pending.engagement_ids == {engagement_id}
+        assert pending.model_ids == {model_id}
+        assert pending.shelf_request_ids == {request_id}
+
+    def test_unmodified_dirty_objects_are_ignored(self) -> None:
+        session = _session(dirty=[EvidenceItem(engagement_id=uuid.uuid4())])
+        session.is_modified.return_value = False
+
+        _collect_touched_engagements(session, None, None)
+
+        assert not session.info[rollup_mod._PENDING_KEY]
+
+    def test_mark_stale_accepts_async_session(self) -> None:
+        engagement_id = uuid.uuid4()
+        session = MagicMock(spec=AsyncSession)
+        session.sync_session = _session()
+
+        mark_rollup_stale(session, engagement_id)
+
+        assert session.sync_session.info[rollup_mod._PENDING_KEY].engagement_ids == {engagement_id}
+
+    def test_rollback_discards_pending(self) -> None:
+        session = _session()
+        mark_rollup_stale(session, uuid.uuid4())
+
+        _discard_touched_rollups(session)
+
+        assert rollup_mod._PENDING_KEY not in session.info
+
+
+class TestCommitRefresh:
+    def test_commit_refreshes_each_resolved_engagement_once(self) -> None:
+        direct, via_model = sorted([uuid.uuid4(), uuid.uuid4()])
+        session = _session()
+        mark_rollup_stale(session, direct)
+        session.info[rollup_mod._PENDING_KEY].model_ids.add(uuid.uuid4())
+        session.execute.return_value.scalars.return_value = [via_model, direct]
+
+        with patch.object(rollup_mod, "refresh_engagement_rollup") as refresh:
+            _refresh_touched_rollups(session)
+
+        session.flush.assert_called_once()
+        assert [call.args[1] for call in refresh.call_args_list] == [direct, via_model]
+        assert rollup_mod._PENDING_KEY not in session.info
+
+    def test_commit_without_changes_does_nothing(self) -> None:
+        session = _session()
+
+        _refresh_touched_rollups(session)
+
+        session.flush.assert_not_called()
+        session.execute.assert_not_called()
+
+    def test_refresh_skips_missing_engagement(self) -> None:
+        session = MagicMock()
+        session.execute.return_value.scalar_one_or_none.return_value = None
+
+        assert refresh_engagement_rollup(session, uuid.uuid4()) is None
+        # advisory lock + existence check only, no upsert
+        assert session.execute.call_count == 2
+
+
+class TestAggregates:
+    def test_confidence_levels_bucket_by_lower_bound(self) -> None:
+        sql = str(_confidence_level().compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+        assert "confidence_score >= 0.9) THEN 'VERY_HIGH'" in sql
+        assert "confidence_score >= 0.25) THEN 'LOW'" in sql
+        assert "ELSE 'VERY_LOW'" in sql
+
+    def test_shelf_totals_sum_categories(self) -> None:
+        rollup = EngagementDashboardRollup(
+            shelf_coverage={
+                "documents": {"requested": 10, "received": 8},
+                "images": {"requested": 5, "received": 1},
+            }
+        )
+
+        assert rollup_shelf_totals(rollup) == (15, 9)
@@ -7,6 +7,7 @@ Scenario 3: Regulatory Gaps Weighted Higher in Prioritization
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from typing import Any
 from unittest import mock
@@ -242,6 +243,38 @@ class TestRationaleGenerator:
         assert "Technology And Data" in result["rationale"]
         assert result["recommendation"] != ""
 
+    @pytest.mark.asyncio
+    async def test_bulk_generation_runs_llm_calls_concurrently(self) -> None:
+        """Bulk generation overlaps LLM calls and audits every gap with one flush."""
+        service = RationaleGeneratorService()
+        gaps = [_make_gap_mock(dimension=f"dim_{i}") for i in range(10)]
+        session = AsyncMock()
+        session.add = MagicMock()
+        scalars = MagicMock()
+        scalars.all.return_value = gaps
+        session.execute.return_value = MagicMock(scalars=MagicMock(return_value=scalars))
+        in_flight = peak = 0
+
+        async def slow_llm(prompt: str) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return '{"rationale": "r", "recommendation": "fix"}'
+
+        with (
+            mock.patch.object(service, "_call_llm", side_effect=slow_llm),
+            mock.patch.object(service, "_get_tom_specifications", new_callable=AsyncMock, return_value={}),
+        ):
+            results = await service.generate_bulk_rationales(session, str(ENGAGEMENT_ID))
+
+        assert peak > 1
+        assert [r["gap_id"] for r in results] == [str(gap.id) for gap in gaps]
+        assert all(gap.rationale == "r" for gap in gaps)
+        assert session.add.call_count == 10
+        session.flush.assert_awaited_once()
+
     def test_parse_response_valid_json(self) -> None:
         """Parses valid JSON response."""
         service = RationaleGeneratorService()
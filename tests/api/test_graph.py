@@ -7,6 +7,7 @@ All graph and database operations are mocked.
 
 from __future__ import annotations
 
+import json
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -328,15 +329,20 @@ class TestEngagementSubgraph:
         client: AsyncClient,
         mock_neo4j_driver: MagicMock,
     ) -> None:
-        """Should return nodes and relationships."""
+        """Should return the first page of nodes and relationships with cursors."""
         mock_service = AsyncMock()
-        mock_service.get_engagement_subgraph = AsyncMock(
-            return_value={
-                "nodes": [
+        mock_service.get_engagement_node_page = AsyncMock(
+            return_value=(
+                [
                     GraphNode(id="n1", label="Activity", properties={"name": "Task A"}),
                     GraphNode(id="n2", label="Role", properties={"name": "Manager"}),
                 ],
-                "relationships": [
+                "node-cursor",
+            )
+        )
+        mock_service.get_engagement_relationship_page = AsyncMock(
+            return_value=(
+                [
                     GraphRelationship(
                         id="r1",
                         from_id="n1",
@@ -345,17 +351,21 @@ class TestEngagementSubgraph:
                         properties={},
                     )
                 ],
-            }
+                None,
+            )
         )
         mock_graph_cls.return_value = mock_service
 
         engagement_id = str(uuid.uuid4())
-        response = await client.get(f"/api/v1/graph/{engagement_id}/subgraph")
+        response = await client.get(f"/api/v1/graph/{engagement_id}/subgraph?page_size=2")
         assert response.status_code == 200
         data = response.json()
         assert len(data["nodes"]) == 2
         assert len(data["relationships"]) == 1
         assert data["relationships"][0]["relationship_type"] == "OWNED_BY"
+        assert data["next_node_cursor"] == "node-cursor"
+        assert data["next_relationship_cursor"] is None
+        assert mock_service.get_engagement_node_page.call_args.kwargs["limit"] == 2
 
     @pytest.mark.asyncio
     @patch("src.api.routes.graph.KnowledgeGraphService")
@@ -367,12 +377,8 @@ class TestEngagementSubgraph:
     ) -> None:
         """Should return empty lists for engagement with no graph."""
         mock_service = AsyncMock()
-        mock_service.get_engagement_subgraph = AsyncMock(
-            return_value={
-                "nodes": [],
-                "relationships": [],
-            }
-        )
+        mock_service.get_engagement_node_page = AsyncMock(return_value=([], None))
+        mock_service.get_engagement_relationship_page = AsyncMock(return_value=([], None))
         mock_graph_cls.return_value = mock_service
 
         engagement_id = str(uuid.uuid4())
@@ -381,3 +387,88 @@ class TestEngagementSubgraph:
         data = response.json()
         assert data["nodes"] == []
         assert data["relationships"] == []
+
+    @pytest.mark.asyncio
+    @patch("src.api.routes.graph.KnowledgeGraphService")
+    async def test_node_page_follows_cursor(
+        self,
+        mock_graph_cls: MagicMock,
+        client: AsyncClient,
+        mock_neo4j_driver: MagicMock,
+    ) -> None:
+        """Should pass the cursor through and return the next one."""
+        mock_service = AsyncMock()
+        mock_service.get_engagement_node_page = AsyncMock(
+            return_value=([GraphNode(id="n3", label="Activity", properties={})], None)
+        )
+        mock_graph_cls.return_value = mock_service
+
+        engagement_id = str(uuid.uuid4())
+        response = await client.get(f"/api/v1/graph/{engagement_id}/subgraph/nodes?cursor=abc&page_size=10")
+        assert response.status_code == 200
+        assert response.json() == {
+            "nodes": [{"id": "n3", "label": "Activity", "properties": {}}],
+            "next_cursor": None,
+        }
+        mock_service.get_engagement_node_page.assert_awaited_once_with(engagement_id, "abc", 10)
+
+    @pytest.mark.asyncio
+    @patch("src.api.routes.graph.KnowledgeGraphService")
+    async def test_invalid_cursor_returns_400(
+        self,
+        mock_graph_cls: MagicMock,
+        client: AsyncClient,
+        mock_neo4j_driver: MagicMock,
+    ) -> None:
+        mock_service = AsyncMock()
+        mock_service.get_engagement_relationship_page = AsyncMock(side_effect=ValueError("Invalid cursor: 'x'"))
+        mock_graph_cls.return_value = mock_service
+
+        response = await client.get(f"/api/v1/graph/{uuid.uuid4()}/subgraph/relationships?cursor=x")
+        assert response.status_code == 400
+
+
+class TestSubgraphStreamExport:
+    """GET /api/v1/graph/{engagement_id}/export/stream"""
+
+    @pytest.mark.asyncio
+    @patch("src.api.routes.graph.KnowledgeGraphService")
+    async def test_streams_ndjson(
+        self,
+        mock_graph_cls: MagicMock,
+        client: AsyncClient,
+        mock_neo4j_driver: MagicMock,
+    ) -> None:
+        """Should emit one JSON line per node and relationship."""
+
+        async def _pages(engagement_id: str, page_size: int):  # noqa: ANN202
+            yield [GraphNode(id="n1", label="Activity", properties={"name": "A"})]
+            yield [GraphRelationship(id="r1", from_id="n1", to_id="n1", relationship_type="FOLLOWED_BY")]
+
+        mock_service = MagicMock()
+        mock_service.iter_engagement_subgraph = _pages
+        mock_graph_cls.return_value = mock_service
+
+        response = await client.get(f"/api/v1/graph/{uuid.uuid4()}/export/stream")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [(line["kind"], line["id"], line["label"]) for line in lines] == [
+            ("node", "n1", "Activity"),
+            ("relationship", "r1", "FOLLOWED_BY"),
+        ]
+
+    @pytest.mark.asyncio
+    @patch("src.api.routes.graph.arrow_available", return_value=False)
+    @patch("src.api.routes.graph.KnowledgeGraphService")
+    async def test_arrow_without_pyarrow_returns_501(
+        self,
+        mock_graph_cls: MagicMock,
+        _arrow_available: MagicMock,
+        client: AsyncClient,
+        mock_neo4j_driver: MagicMock,
+    ) -> None:
+        mock_graph_cls.return_value = MagicMock()
+
+        response = await client.get(f"/api/v1/graph/{uuid.uuid4()}/export/stream?format=arrow")
+        assert response.status_code == 501
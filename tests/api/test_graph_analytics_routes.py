@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import uuid
 from contextlib import asynccontextmanager
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from httpx import ASGITransport, AsyncClient
@@ -93,3 +93,70 @@ class TestGraphAnalyticsRoutes:
         node_id = str(uuid.uuid4())
         response = await graph_analytics_client.get(f"/api/v1/graph-analytics/relationships/{node_id}")
         assert response.status_code in (200, 404, 422, 500)
+
+
+def _snapshot(engagement_id: str):
+    from src.semantic.graph_snapshot import GraphSnapshot
+
+    return GraphSnapshot.build(
+        engagement_id,
+        [("a", "Activity"), ("b", "Activity"), ("c", "Role"), ("d", "Activity")],
+        [("a", "b", "PRECEDES"), ("b", "c", "PERFORMED_BY")],
+    )
+
+
+class TestSnapshotAnalytics:
+    """Snapshot-backed metrics, centrality and shortest-path routes."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_include_components_and_degrees(self, graph_analytics_client: AsyncClient) -> None:
+        engagement_id = str(uuid.uuid4())
+        with patch("src.semantic.graph_snapshot.get_graph_snapshot", AsyncMock(return_value=_snapshot(engagement_id))):
+            response = await graph_analytics_client.get(f"/api/v1/graph-analytics/metrics/{engagement_id}")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total_nodes"] == 4
+        assert body["total_relationships"] == 2
+        assert body["nodes_by_label"] == {"Activity": 3, "Role": 1}
+        assert body["connected_components"] == 2
+        assert body["largest_component_size"] == 3
+        assert body["orphan_count"] == 1
+        assert body["degree_distribution"] == {"0": 1, "1": 2, "2": 1}
+
+    @pytest.mark.asyncio
+    async def test_betweenness_ranks_bridge_node_first(self, graph_analytics_client: AsyncClient) -> None:
+        engagement_id = str(uuid.uuid4())
+        with patch("src.semantic.graph_snapshot.get_graph_snapshot", AsyncMock(return_value=_snapshot(engagement_id))):
+            response = await graph_analytics_client.get(
+                f"/api/v1/graph-analytics/centrality/{engagement_id}",
+                params={"metric": "betweenness", "limit": 2},
+            )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["sampled_sources"] is None
+        assert body["nodes"][0] == {"node_id": "b", "label": "Activity", "score": 1.0}
+        assert len(body["nodes"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_shortest_path(self, graph_analytics_client: AsyncClient) -> None:
+        engagement_id = str(uuid.uuid4())
+        with patch("src.semantic.graph_snapshot.get_graph_snapshot", AsyncMock(return_value=_snapshot(engagement_id))):
+            response = await graph_analytics_client.get(
+                f"/api/v1/graph-analytics/shortest-path/{engagement_id}",
+                params={"from_id": "c", "to_id": "a"},
+            )
+            unreachable = await graph_analytics_client.get(
+                f"/api/v1/graph-analytics/shortest-path/{engagement_id}",
+                params={"from_id": "c", "to_id": "a", "directed": "true"},
+            )
+            missing = await graph_analytics_client.get(
+                f"/api/v1/graph-analytics/shortest-path/{engagement_id}",
+                params={"from_id": "a", "to_id": "zzz"},
+            )
+
+        assert response.json()["path"] == ["c", "b", "a"]
+        assert response.json()["length"] == 2
+        assert unreachable.json()["found"] is False
+        assert missing.status_code == 404
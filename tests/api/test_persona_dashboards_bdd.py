@@ -27,7 +27,7 @@ from src.api.routes.dashboard import (
     get_engagement_lead_dashboard,
     get_sme_dashboard,
 )
-from src.core.models import UserRole
+from src.core.models import EngagementDashboardRollup, UserRole
 
 # -- Fixtures ----------------------------------------------------------------
 
@@ -43,6 +43,20 @@ def _make_mock_user(
     return user
 
 
+def _rollup_result(engagement_id: uuid.UUID, **values: object) -> MagicMock:
+    """Create a query result holding the engagement's dashboard rollup."""
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = EngagementDashboardRollup(
+        engagement_id=engagement_id,
+        overall_confidence=values.pop("overall_confidence", 0.0),
+        shelf_coverage=values.pop("shelf_coverage", {}),
+        gap_counts=values.pop("gap_counts", {}),
+        brightness_counts=values.pop("brightness_counts", {}),
+        **values,
+    )
+    return result
+
+
 def _engagement_exists_result() -> MagicMock:
     """Mock result for engagement existence check (returns a UUID)."""
     result = MagicMock()
@@ -162,41 +176,18 @@ class TestEngagementLeadDashboard:
         # 1. Engagement existence check (inside _get_user_engagement_role)
         eng_exists_result = _engagement_exists_result()
 
-        # 2. Shelf coverage: total=10, received=7
-        shelf_row = MagicMock()
-        shelf_row.total = 10
-        shelf_row.received = 7
-        shelf_result = MagicMock()
-        shelf_result.one.return_value = shelf_row
-
-        # 3. Latest model
-        latest_model = MagicMock()
-        latest_model.id = uuid.uuid4()
-        latest_model.confidence_score = 0.85
-        model_result = MagicMock()
-        model_result.scalar_one_or_none.return_value = latest_model
-
-        # 4. Brightness counts (model_id passed directly, no extra lookup)
-        bright_row = MagicMock()
-        bright_row.brightness_classification = "bright"
-        bright_row.cnt = 6
-        dim_row = MagicMock()
-        dim_row.brightness_classification = "dim"
-        dim_row.cnt = 3
-        dark_row = MagicMock()
-        dark_row.brightness_classification = "dark"
-        dark_row.cnt = 1
-        brightness_result = MagicMock()
-        brightness_result.all.return_value = [bright_row, dim_row, dark_row]
+        # 2. Rollup: 7/10 shelf items received, confidence 0.85, 6/3/1 brightness
+        rollup_result = _rollup_result(
+            eng_id,
+            overall_confidence=0.85,
+            shelf_coverage={"documents": {"requested": 10, "received": 7}},
+            brightness_counts={"bright": 6, "dim": 3, "dark": 1},
+        )
 
         # 5. Gaps for TOM alignment (now returns row tuples, not ORM objects)
         gaps_result = MagicMock()
         gaps_result.all.return_value = []
 
-        # 6. Gap severity counts
-        gap_sev_result = MagicMock()
-        gap_sev_result.all.return_value = []
-
         # 7. Seed term counts
         seed_row = MagicMock()
         seed_row.total = 20
@@ -217,11 +208,8 @@ class TestEngagementLeadDashboard:
         session.execute = AsyncMock(
             side_effect=[
                 eng_exists_result,
-                shelf_result,
-                model_result,
-                brightness_result,
+                rollup_result,
                 gaps_result,
-                gap_sev_result,
                 seed_result,
                 snapshots_result,
             ]
@@ -261,20 +249,8 @@ class TestEngagementLeadDashboard:
         # 1. Engagement existence check
         eng_exists_result = _engagement_exists_result()
 
-        # Shelf: no items
-        shelf_row = MagicMock()
-        shelf_row.total = 0
-        shelf_row.received = 0
-        shelf_result = MagicMock()
-        shelf_result.one.return_value = shelf_row
-
-        # No model
-        model_result = MagicMock()
-        model_result.scalar_one_or_none.return_value = None
-
-        # Brightness: no model (model_id=None triggers internal lookup)
-        brightness_model_result = MagicMock()
-        brightness_model_result.scalar_one_or_none.return_value = None
+        # Empty rollup
+        rollup_result = _rollup_result(eng_id)
 
         # No gaps
         gaps_result = MagicMock()
@@ -294,9 +270,7 @@ class TestEngagementLeadDashboard:
         session.execute = AsyncMock(
             side_effect=[
                 eng_exists_result,
-                shelf_result,
-                model_result,
-                brightness_model_result,
+                rollup_result,
                 gaps_result,
                 seed_result,
                 snapshots_result,
@@ -424,16 +398,8 @@ class TestClientStakeholderDashboard:
         # 1. Engagement existence check
         eng_exists_result = _engagement_exists_result()
 
-        # Latest model
-        latest_model = MagicMock()
-        latest_model.id = uuid.uuid4()
-        latest_model.confidence_score = 0.72
-        model_result = MagicMock()
-        model_result.scalar_one_or_none.return_value = latest_model
-
-        # Brightness counts (model_id passed directly, no extra lookup)
-        brightness_result = MagicMock()
-        brightness_result.all.return_value = []
+        # Rollup with the latest model's confidence
+        rollup_result = _rollup_result(eng_id, overall_confidence=0.72)
 
         # Gap findings
         gap1 = MagicMock()
@@ -451,7 +417,7 @@ class TestClientStakeholderDashboard:
         gaps_result = MagicMock()
         gaps_result.scalars.return_value.all.return_value = [gap1, gap2]
 
-        session.execute = AsyncMock(side_effect=[eng_exists_result, model_result, brightness_result, gaps_result])
+        session.execute = AsyncMock(side_effect=[eng_exists_result, rollup_result, gaps_result])
 
         result = await get_client_dashboard(eng_id, session, user)
 
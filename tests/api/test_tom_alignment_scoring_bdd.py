@@ -12,6 +12,7 @@ from typing import Any
 from unittest import mock
 from unittest.mock import AsyncMock, MagicMock
 
+import numpy as np
 import pytest
 from httpx import ASGITransport, AsyncClient
 
@@ -25,9 +26,13 @@ from src.core.models import (
     UserRole,
 )
 from src.tom.alignment_scoring import (
+    GAP_TYPES,
     AlignmentScoringService,
+    build_result_rows,
+    classify_similarities,
     classify_similarity,
     cosine_similarity,
+    similarity_matrix,
 )
 
 APP = create_app()
@@ -244,6 +249,102 @@ class TestScoreSingle:
         assert score.alignment_evidence["method"] == "no_data"
 
 
+class TestMatrixScoring:
+    """The matrix path gives the same scores as the per-pair functions."""
+
+    def test_similarity_matrix_matches_cosine_similarity(self) -> None:
+        rng = np.random.default_rng(7)
+        rows = rng.normal(size=(5, 16)).tolist() + [[0.0] * 16]
+        columns = rng.normal(size=(3, 16)).tolist()
+
+        matrix = similarity_matrix(rows, columns)
+
+        assert matrix.shape == (6, 3)
+        for i, row in enumerate(rows):
+            for j, column in enumerate(columns):
+                assert matrix[i, j] == pytest.approx(cosine_similarity(row, column), abs=1e-12)
+
+    def test_classify_similarities_matches_classify_similarity(self) -> None:
+        values = np.array([0.0, 0.39, 0.40, 0.62, 0.849, 0.85, 0.9, 1.0])
+
+        codes, deviations = classify_similarities(values)
+
+        for value, code, deviation in zip(values.tolist(), codes.tolist(), deviations.tolist(), strict=True):
+            assert (GAP_TYPES[code], deviation) == classify_similarity(value)
+
+    def test_build_result_rows_matches_score_single(self) -> None:
+        rng = np.random.default_rng(11)
+        service = AlignmentScoringService(graph_service=MagicMock())
+        activities = []
+        for i in range(4):
+            act = _make_plain_mock()
+            act.name = f"Activity {i}"
+            activities.append(act)
+        dims = [TOMDimension.PROCESS_ARCHITECTURE, TOMDimension.TECHNOLOGY_AND_DATA]
+        base = rng.normal(size=8)
+        activity_embeddings = {str(a.id): (base + rng.normal(scale=0.6, size=8)).tolist() for a in activities}
+        dim_embeddings = {d: (base + rng.normal(scale=0.6, size=8)).tolist() for d in dims}
+        dim_descriptions = {d: f"{d} target" for d in dims}
+        aligned_pairs = {(str(activities[0].id), TOMDimension.TECHNOLOGY_AND_DATA)}
+
+        rows = build_result_rows(
+            RUN_ID,
+            activities,
+            aligned_pairs=aligned_pairs,
+            activity_embeddings=activity_embeddings,
+            dim_embeddings=dim_embeddings,
+            dim_descriptions=dim_descriptions,
+        )
+
+        assert len(rows) == len(activities) * len(TOMDimension)
+        row_iter = iter(rows)
+        for activity in activities:
+            for dimension in TOMDimension:
+                row = next(row_iter)
+                expected = service._score_single(
+                    activity=activity,
+                    dimension=dimension,
+                    aligned_pairs=aligned_pairs,
+                    activity_emb=activity_embeddings[str(activity.id)],
+                    dim_emb=dim_embeddings.get(dimension),
+                    dim_description=dim_descriptions.get(dimension),
+                )
+                assert row["run_id"] == RUN_ID
+                assert row["activity_id"] == activity.id
+                assert row["dimension_type"] == dimension
+                assert row["gap_type"] == expected.gap_type
+                assert row["deviation_score"] == pytest.approx(expected.deviation_score, abs=1e-9)
+                assert row["alignment_evidence"].keys() == expected.alignment_evidence.keys()
+                assert row["alignment_evidence"].get("similarity_score") == pytest.approx(
+                    expected.alignment_evidence.get("similarity_score"), abs=1e-9
+                )
+
+    @pytest.mark.asyncio
+    async def test_run_scoring_writes_results_in_one_insert(self) -> None:
+        activities = [_make_plain_mock(name=f"Activity {i}") for i in range(3)]
+        pov_result = MagicMock()
+        pov_result.scalar_one_or_none.return_value = _make_plain_mock()
+        activities_result = MagicMock()
+        activities_result.scalars.return_value.all.return_value = activities
+        tom_result = MagicMock()
+        tom_result.scalar_one_or_none.return_value = _make_plain_mock(dimension_records=[])
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=[pov_result, activities_result, tom_result, MagicMock()])
+        graph = MagicMock()
+        graph.run_query = AsyncMock(return_value=[])
+        run = _make_plain_mock(id=RUN_ID, engagement_id=ENGAGEMENT_ID, tom_id=TOM_ID)
+
+        written = await AlignmentScoringService(graph_service=graph).run_scoring(session, run)
+
+        assert written == len(activities) * len(TOMDimension)
+        assert session.execute.await_count == 4
+        statement, rows = session.execute.await_args_list[-1].args
+        assert statement.is_insert
+        assert len(rows) == written
+        assert all(row["gap_type"] == TOMGapType.FULL_GAP for row in rows)
+        assert run.status == AlignmentRunStatus.COMPLETE
+
+
 # ---------------------------------------------------------------------------
 # API endpoint tests
 # ---------------------------------------------------------------------------
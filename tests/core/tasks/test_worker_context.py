@@ -0,0 +1,111 @@
+"""Tests for the shared worker client context (src/core/tasks/context.py)."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.core.tasks import TaskWorker, WorkerContext
+
+
+def _session_factory(execute: AsyncMock) -> MagicMock:
+    session = MagicMock()
+    session.execute = execute
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=session)
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=session_cm)
+
+
+def _context(*, owns_clients: bool, execute: AsyncMock | None = None) -> WorkerContext:
+    redis_client = MagicMock()
+    redis_client.ping = AsyncMock(return_value=True)
+    redis_client.close = AsyncMock()
+    neo4j_driver = MagicMock()
+    neo4j_driver.verify_connectivity = AsyncMock()
+    neo4j_driver.close = AsyncMock()
+    db_engine = MagicMock()
+    db_engine.dispose = AsyncMock()
+    return WorkerContext(
+        MagicMock(),
+        db_engine,
+        _session_factory(execute or AsyncMock()),
+        redis_client,
+        neo4j_driver,
+        owns_clients=owns_clients,
+    )
+
+
+class _EchoWorker(TaskWorker):
+    task_type = "test_echo"
+
+    async def execute(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return {"redis": self.context.redis_client}
+
+
+class TestWorkerContext:
+    @pytest.mark.asyncio
+    async def test_health_check_reports_each_service(self) -> None:
+        context = _context(owns_clients=False)
+
+        assert await context.health_check() == {"postgres": True, "redis": True, "neo4j": True}
+
+    @pytest.mark.asyncio
+    async def test_health_check_reports_postgres_down(self) -> None:
+        context = _context(owns_clients=False, execute=AsyncMock(side_effect=OperationalError("SELECT 1", {}, None)))
+
+        health = await context.health_check()
+
+        assert health["postgres"] is False
+        assert health["redis"] is True
+
+    @pytest.mark.asyncio
+    async def test_open_creates_owned_clients_once(self) -> None:
+        template = _context(owns_clients=False)
+        with (
+            patch(
+                "src.core.tasks.context.create_engine",
+                return_value=(template.db_engine, template.session_factory),
+            ) as create_engine,
+            patch("src.core.tasks.context.create_redis_client", return_value=template.redis_client),
+            patch("src.core.tasks.context.create_neo4j_driver", return_value=template.neo4j_driver),
+        ):
+            context = await WorkerContext.open(MagicMock())
+
+        create_engine.assert_called_once()
+        template.redis_client.ping.assert_awaited_once()
+        template.neo4j_driver.verify_connectivity.assert_awaited_once()
+
+        await context.close()
+        await context.close()
+
+        template.redis_client.close.assert_awaited_once()
+        template.neo4j_driver.close.assert_awaited_once()
+        template.db_engine.dispose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_borrowed_clients_open(self) -> None:
+        context = _context(owns_clients=False)
+
+        await context.close()
+
+        context.redis_client.close.assert_not_awaited()
+        context.neo4j_driver.close.assert_not_awaited()
+        context.db_engine.dispose.assert_not_awaited()
+
+
+class TestTaskWorkerContext:
+    @pytest.mark.asyncio
+    async def test_worker_uses_injected_context(self) -> None:
+        context = _context(owns_clients=False)
+
+        result = await _EchoWorker(context).execute({})
+
+        assert result["redis"] is context.redis_client
+
+    def test_worker_without_context_raises(self) -> None:
+        with pytest.raises(RuntimeError, match="_EchoWorker needs a WorkerContext"):
+            _ = _EchoWorker().context
@@ -0,0 +1,325 @@
+"""Tests for the write-behind audit sink."""
+
+from __future__ import annotations
+
+import json
+import time
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from src.api.middleware.audit import AuditLoggingMiddleware
+from src.api.services.pdp import PDPService
+from src.core.audit_sink import AuditSink, _coerce_row
+from src.core.models import HttpAuditEvent, PDPAuditEntry, PDPDecisionType
+from src.core.redis import AUDIT_SPILL_GROUP, AUDIT_SPILL_STREAM
+
+
+def _session_factory(session: MagicMock) -> MagicMock:
+    """Return an async_sessionmaker stand-in yielding the given session."""
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=session)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=ctx)
+
+
+def _session() -> MagicMock:
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    return session
+
+
+def _redis() -> MagicMock:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    redis = MagicMock()
+    redis.pipeline.return_value = pipe
+    redis.xgroup_create = AsyncMock()
+    redis.xreadgroup = AsyncMock(return_value=[])
+    redis.xautoclaim = AsyncMock(return_value=["0-0", [], []])
+    redis.xack = AsyncMock(return_value=1)
+    redis.xdel = AsyncMock(return_value=1)
+    return redis
+
+
+def _pdp_row(**overrides: object) -> dict:
+    row = {
+        "id": uuid.uuid4(),
+        "engagement_id": uuid.uuid4(),
+        "actor": "analyst@example.com",
+        "resource_id": "/api/v1/evidence",
+        "classification": "internal",
+        "operation": "read",
+        "decision": PDPDecisionType.PERMIT,
+        "created_at": datetime.now(UTC),
+    }
+    row.update(overrides)
+    return row
+
+
+class TestFlush:
+    @pytest.mark.asyncio
+    async def test_batches_are_inserted_per_table(self) -> None:
+        session = _session()
+        sink = AuditSink(_session_factory(session), batch_size=10)
+        sink.enqueue(PDPAuditEntry, _pdp_row())
+        sink.enqueue(PDPAuditEntry, _pdp_row())
+        sink.enqueue(
+            HttpAuditEvent,
+            {"id": uuid.uuid4(), "method": "POST", "path": "/x", "user_id": "u", "status_code": 200},
+        )
+
+        inserted = await sink.flush()
+
+        assert inserted == 3
+        assert session.execute.await_count == 2
+        session.commit.assert_awaited_once()
+        rows_per_call = sorted(len(call.args[1]) for call in session.execute.await_args_list)
+        assert rows_per_call == [1, 2]
+        metrics = sink.get_metrics()
+        assert metrics["queue_depth"] == 0
+        assert metrics["flushed"] == 3
+        assert metrics["flushes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_size_bounds_each_insert(self) -> None:
+        session = _session()
+        sink = AuditSink(_session_factory(session), batch_size=2)
+        for _ in range(5):
+            sink.enqueue(PDPAuditEntry, _pdp_row())
+
+        await sink.flush()
+
+        assert session.commit.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_rejected_row_does_not_poison_batch(self) -> None:
+        bad = _pdp_row()
+        integrity = IntegrityError("insert", {}, Exception("fk"))
+
+        async def _execute(_stmt: object, rows: list[dict]) -> None:
+            if len(rows) > 1 or rows[0] is bad:
+                raise integrity
+
+        session = _session()
+        session.execute = AsyncMock(side_effect=_execute)
+        redis = _redis()
+        sink = AuditSink(_session_factory(session), redis)
+        sink.enqueue(PDPAuditEntry, _pdp_row())
+        sink.enqueue(PDPAuditEntry, bad)
+
+        inserted = await sink.flush()
+
+        assert inserted == 1
+        assert sink.metrics.rejected == 1
+        redis.pipeline.return_value.xadd.assert_not_called()
+
+    def test_rejects_unknown_model(self) -> None:
+        sink = AuditSink(_session_factory(_session()))
+        with pytest.raises(ValueError, match="does not handle"):
+            sink.enqueue(MagicMock(__tablename__="users"), {})
+
+    def test_rejects_row_without_id(self) -> None:
+        sink = AuditSink(_session_factory(_session()))
+        with pytest.raises(ValueError, match="primary key"):
+            sink.enqueue(PDPAuditEntry, _pdp_row(id=None))
+
+
+class TestSpill:
+    @pytest.mark.asyncio
+    async def test_failed_insert_spills_to_redis(self) -> None:
+        session = _session()
+        session.execute = AsyncMock(side_effect=OperationalError("insert", {}, Exception("down")))
+        redis = _redis()
+        sink = AuditSink(_session_factory(session), redis)
+        sink.enqueue(PDPAuditEntry, _pdp_row())
+
+        await sink.flush()
+
+        pipe = redis.pipeline.return_value
+        assert pipe.xadd.call_count == 1
+        stream, fields = pipe.xadd.call_args.args
+        assert stream == AUDIT_SPILL_STREAM
+        assert fields["table"] == "pdp_audit_entries"
+        assert json.loads(fields["payload"])["decision"] == "permit"
+        assert sink.metrics.spilled == 1
+        assert sink.metrics.flushed == 0
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_spills_instead_of_growing(self) -> None:
+        redis = _redis()
+        sink = AuditSink(_session_factory(_session()), redis, buffer_size=1)
+        sink.enqueue(PDPAuditEntry, _pdp_row())
+        sink.enqueue(PDPAuditEntry, _pdp_row())
+
+        assert sink.get_metrics()["overflow_depth"] == 1
+        redis.pipeline.return_value.xadd.assert_not_called()
+
+        await sink.stop()
+
+        assert sink.metrics.spilled == 1
+        assert sink.metrics.flushed == 1
+
+    @pytest.mark.asyncio
+    async def test_overflow_is_bounded_and_spilled_in_batches(self) -> None:
+        redis = _redis()
+        sink = AuditSink(_session_factory(_session()), redis, buffer_size=1, overflow_size=3, batch_size=2)
+        for _ in range(6):
+            sink.enqueue(PDPAuditEntry, _pdp_row())
+
+        assert sink.metrics.dropped == 2
+
+        await sink._spill_overflow()
+
+        assert redis.pipeline.return_value.execute.await_count == 2
+        assert sink.metrics.spilled == 3
+
+    @pytest.mark.asyncio
+    async def test_dropped_without_redis(self) -> None:
+        session = _session()
+        session.execute = AsyncMock(side_effect=OperationalError("insert", {}, Exception("down")))
+        sink = AuditSink(_session_factory(session))
+        sink.enqueue(PDPAuditEntry, _pdp_row())
+
+        await sink.flush()
+
+        assert sink.metrics.dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_reads_group_and_acks_after_insert(self) -> None:
+        row = _pdp_row()
+        payload = json.dumps(row, default=str).replace('"PDPDecisionType.PERMIT"', '"permit"')
+        redis = _redis()
+        redis.xreadgroup = AsyncMock(
+            side_effect=[[], [(AUDIT_SPILL_STREAM, [("1-0", {"table": "pdp_audit_entries", "payload": payload})])]]
+        )
+        session = _session()
+        sink = AuditSink(_session_factory(session), redis)
+
+        await sink._replay_spilled()
+
+        redis.xgroup_create.assert_awaited_once()
+        # Own pending entries are checked before new ones are read
+        start_ids = [next(iter(call.args[2].values())) for call in redis.xreadgroup.await_args_list]
+        assert start_ids == ["0", ">"]
+        inserted = session.execute.await_args.args[1][0]
+        assert inserted["id"] == row["id"]
+        assert inserted["decision"] is PDPDecisionType.PERMIT
+        redis.xack.assert_awaited_once_with(AUDIT_SPILL_STREAM, AUDIT_SPILL_GROUP, "1-0")
+        redis.xdel.assert_awaited_once_with(AUDIT_SPILL_STREAM, "1-0")
+        assert sink.metrics.replayed == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_replay_leaves_entries_pending(self) -> None:
+        payload = json.dumps(_pdp_row(), default=str).replace('"PDPDecisionType.PERMIT"', '"permit"')
+        redis = _redis()
+        redis.xautoclaim = AsyncMock(
+            return_value=["0-0", [("1-0", {"table": "pdp_audit_entries", "payload": payload})], []]
+        )
+        session = _session()
+        session.execute = AsyncMock(side_effect=OperationalError("insert", {}, Exception("down")))
+        sink = AuditSink(_session_factory(session), redis)
+
+        await sink._replay_spilled()
+
+        redis.xack.assert_not_awaited()
+        redis.xdel.assert_not_awaited()
+        assert sink.metrics.replayed == 0
+
+
+class TestCoerceRow:
+    def test_restores_column_types(self) -> None:
+        row = _pdp_row()
+        encoded = {k: (v.value if isinstance(v, PDPDecisionType) else str(v)) for k, v in row.items()}
+        assert _coerce_row(PDPAuditEntry, encoded) == row
+
+
+class TestCallers:
+    @pytest.mark.asyncio
+    async def test_pdp_evaluate_enqueues_without_flush(self) -> None:
+        session = MagicMock()
+        session.add = MagicMock()
+        session.flush = AsyncMock()
+        sink = MagicMock()
+        service = PDPService(session, audit_sink=sink)
+        service._ensure_cache = AsyncMock()  # type: ignore[method-assign]
+
+        result = await service.evaluate(
+            engagement_id=uuid.uuid4(),
+            actor="a",
+            actor_role="process_analyst",
+            resource_id="r",
+            classification="internal",
+            operation="read",
+        )
+
+        session.add.assert_not_called()
+        session.flush.assert_not_awaited()
+        model, values = sink.enqueue.call_args.args
+        assert model is PDPAuditEntry
+        assert str(values["id"]) == result["audit_id"]
+
+    @pytest.mark.asyncio
+    async def test_pep_opens_session_only_for_cache_refresh(self) -> None:
+        from src.api.middleware.pep import PEPMiddleware
+        from src.api.services import pdp
+
+        session = _session()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        session.execute = AsyncMock(return_value=result)
+        factory = _session_factory(session)
+        request = MagicMock()
+        request.app.state.db_session_factory = factory
+        request.app.state.audit_sink = MagicMock()
+        middleware = PEPMiddleware(MagicMock(), fail_open=False)
+        kwargs = {
+            "request": request,
+            "engagement_id_str": None,
+            "actor": "a",
+            "actor_role": "process_analyst",
+            "resource_id": "/api/v1/evidence",
+            "classification": "internal",
+            "operation": "read",
+            "attributes": {},
+            "request_id": None,
+        }
+
+        PDPService._invalidate_cache()
+        await middleware._call_pdp(**kwargs)
+        assert factory.call_count == 1
+
+        with patch.object(pdp, "_policy_cache", [{"id": None, "conditions_json": {}, "decision": "permit"}]):
+            pdp._cache_loaded_at = time.monotonic()
+            await middleware._call_pdp(**kwargs)
+
+        assert factory.call_count == 1
+        session.commit.assert_not_awaited()
+        assert request.app.state.audit_sink.enqueue.call_count == 2
+        PDPService._invalidate_cache()
+
+    def test_audit_middleware_enqueues_on_sink(self) -> None:
+        app = FastAPI()
+        app.add_middleware(AuditLoggingMiddleware)
+        app.state.audit_sink = MagicMock()
+
+        @app.post("/api/v1/things")
+        async def create() -> JSONResponse:
+            return JSONResponse({"ok": True})
+
+        response = TestClient(app).post("/api/v1/things")
+
+        assert response.status_code == 200
+        model, values = app.state.audit_sink.enqueue.call_args.args
+        assert model is HttpAuditEvent
+        assert values["path"] == "/api/v1/things"
+        assert values["resource_type"] == "things"
+        assert isinstance(values["id"], uuid.UUID)
+        assert "created_at" in values
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -12,6 +13,7 @@ from src.core.llm import (
     LLMProviderType,
     OllamaProvider,
     StubProvider,
+    close_llm_provider,
     get_llm_provider,
     reset_provider,
 )
@@ -134,6 +136,71 @@ class TestOllamaProvider:
         assert body["stream"] is False
         assert len(body["messages"]) == 2  # system + user
 
+    @pytest.mark.asyncio
+    async def test_client_is_pooled_across_calls(self) -> None:
+        import httpx
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"message": {"content": "pooled"}})
+
+        provider = OllamaProvider(base_url="http://test:11434", max_connections=4, max_keepalive_connections=2)
+        real_client = httpx.AsyncClient
+        created: list[httpx.AsyncClient] = []
+
+        def make_client(**kwargs: object) -> httpx.AsyncClient:
+            client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+            created.append(client)
+            return client
+
+        with patch("httpx.AsyncClient", side_effect=make_client) as client_cls:
+            assert await provider.generate("one") == "pooled"
+            assert await provider.generate("two") == "pooled"
+
+        assert len(created) == 1
+        limits = client_cls.call_args.kwargs["limits"]
+        assert limits.max_connections == 4
+        assert limits.max_keepalive_connections == 2
+        assert provider.stats.requests == 2
+        assert provider.stats.errors == 0
+
+        await provider.aclose()
+        assert created[0].is_closed
+
+    @pytest.mark.asyncio
+    async def test_failed_request_is_counted(self) -> None:
+        import httpx
+
+        provider = OllamaProvider(base_url="http://test:11434")
+        provider._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503)),
+        )
+        provider._client_loop = asyncio.get_running_loop()
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await provider.generate("test")
+
+        assert provider.stats.to_dict()["errors"] == 1
+        await provider.aclose()
+
+    @pytest.mark.asyncio
+    async def test_generate_stream_uses_pooled_client(self) -> None:
+        import httpx
+
+        body = b'{"message": {"content": "a"}}\n{"message": {"content": "b"}}\n'
+        provider = OllamaProvider(base_url="http://test:11434")
+        provider._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body)),
+        )
+        provider._client_loop = asyncio.get_running_loop()
+        client = provider._client
+
+        chunks = [chunk async for chunk in provider.generate_stream("test")]
+
+        assert chunks == ["a", "b"]
+        assert provider._client is client
+        assert provider.stats.requests == 1
+        await provider.aclose()
+
 
 class TestGetLLMProvider:
     def setup_method(self) -> None:
@@ -177,3 +244,23 @@ class TestGetLLMProvider:
             provider = get_llm_provider()
             assert isinstance(provider, OllamaProvider)
             assert provider._base_url == "http://gpu-box:11434"
+
+    def test_env_var_ollama_connection_limits(self) -> None:
+        env = {"LLM_PROVIDER": "ollama", "OLLAMA_MAX_CONNECTIONS": "3", "OLLAMA_TIMEOUT_SECONDS": "5"}
+        with patch.dict(os.environ, env):
+            provider = get_llm_provider()
+            assert isinstance(provider, OllamaProvider)
+            assert provider._max_connections == 3
+            assert provider._timeout == 5.0
+
+    @pytest.mark.asyncio
+    async def test_close_llm_provider_closes_ollama_client(self) -> None:
+        with patch.dict(os.environ, {"LLM_PROVIDER": "ollama"}):
+            provider = get_llm_provider()
+        assert isinstance(provider, OllamaProvider)
+        client = provider._get_client()
+
+        await close_llm_provider()
+
+        assert client.is_closed
+        assert provider._client is None
@@ -0,0 +1,225 @@
+"""Tests for the shared LLM execution layer."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import redis.asyncio as aioredis
+
+from src.core.llm import LLMProvider, LLMProviderType, StubProvider, reset_provider
+from src.core.llm_executor import (
+    CACHE_KEY_PREFIX,
+    LLMExecutor,
+    LLMRequest,
+    get_llm_executor,
+    reset_executor,
+)
+
+
+class _SlowProvider(LLMProvider):
+    """Echoes prompts after ``delay`` seconds and tracks calls in flight."""
+
+    def __init__(self, delay: float = 0.02, fail_on: str | None = None) -> None:
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def generate(self, prompt: str, **kwargs: Any) -> str:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if prompt == self.fail_on:
+                raise RuntimeError("provider down")
+            return f"answer:{prompt}"
+        finally:
+            self.in_flight -= 1
+
+    async def generate_stream(self, prompt: str, **kwargs: Any) -> AsyncGenerator[str, None]:
+        for word in prompt.split():
+            yield word
+
+    @property
+    def provider_type(self) -> LLMProviderType:
+        return LLMProviderType.OLLAMA
+
+    @property
+    def is_local(self) -> bool:
+        return True
+
+    @property
+    def default_model(self) -> str:
+        return "llama3.1:8b"
+
+
+def _dict_redis() -> AsyncMock:
+    store: dict[str, str] = {}
+    client = AsyncMock()
+    client.get = AsyncMock(side_effect=lambda key: store.get(key))
+    client.set = AsyncMock(side_effect=lambda key, value, ex=None: store.__setitem__(key, value))
+    client.store = store
+    return client
+
+
+@pytest.mark.asyncio
+class TestConcurrency:
+    async def test_generate_many_bounds_calls_in_flight(self) -> None:
+        provider = _SlowProvider()
+        executor = LLMExecutor(provider, max_concurrency=4, redis_client=None)
+
+        results = await executor.generate_many([LLMRequest(f"p{i}") for i in range(20)])
+
+        assert results == [f"answer:p{i}" for i in range(20)]
+        assert provider.peak == 4
+
+    async def test_generate_many_is_faster_than_sequential(self) -> None:
+        executor = LLMExecutor(_SlowProvider(delay=0.05), max_concurrency=10)
+
+        started = time.perf_counter()
+        await executor.generate_many([LLMRequest(f"p{i}") for i in range(20)])
+
+        # Sequential would take 20 x 50ms = 1s.
+        assert time.perf_counter() - started < 0.5
+
+    async def test_errors_are_returned_in_place(self) -> None:
+        executor = LLMExecutor(_SlowProvider(fail_on="bad"))
+
+        results = await executor.generate_many([LLMRequest("ok"), LLMRequest("bad")])
+
+        assert results[0] == "answer:ok"
+        assert isinstance(results[1], RuntimeError)
+        assert executor.stats.errors == 1
+
+    async def test_rate_limit_spaces_requests(self) -> None:
+        executor = LLMExecutor(_SlowProvider(delay=0), max_concurrency=10, requests_per_second=20)
+
+        started = time.perf_counter()
+        await executor.generate_many([LLMRequest(f"p{i}") for i in range(30)])
+
+        # A burst of 20, then 10 more at 20/s.
+        assert time.perf_counter() - started >= 0.4
+
+    async def test_rejects_non_positive_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="max_concurrency"):
+            LLMExecutor(_SlowProvider(), max_concurrency=0)
+
+
+@pytest.mark.asyncio
+class TestResponseCache:
+    async def test_identical_requests_hit_the_cache(self) -> None:
+        provider = _SlowProvider()
+        redis = _dict_redis()
+        executor = LLMExecutor(provider, redis_client=redis, cache_ttl_seconds=60)
+
+        first = await executor.generate("same", model="m", max_tokens=100)
+        second = await executor.generate("same", model="m", max_tokens=100)
+
+        assert first == second
+        assert provider.calls == 1
+        assert executor.stats.cache_hits == 1
+        [key] = redis.store
+        assert key.startswith(CACHE_KEY_PREFIX)
+        assert redis.set.await_args.kwargs["ex"] == 60
+
+    async def test_key_covers_model_and_parameters(self) -> None:
+        executor = LLMExecutor(_SlowProvider(), redis_client=_dict_redis())
+        base = LLMRequest("same", model="m", max_tokens=100)
+
+        keys = {
+            executor.cache_key(request)
+            for request in (
+                base,
+                LLMRequest("same", model="other", max_tokens=100),
+                LLMRequest("same", model="m", max_tokens=200),
+                LLMRequest("same", system="judge", model="m", max_tokens=100),
+                LLMRequest("different", model="m", max_tokens=100),
+            )
+        }
+
+        assert len(keys) == 5
+        assert executor.cache_key(LLMRequest("same", max_tokens=100)) == executor.cache_key(
+            LLMRequest("same", model="llama3.1:8b", max_tokens=100)
+        )
+
+    async def test_errors_are_not_cached(self) -> None:
+        provider = _SlowProvider(fail_on="bad")
+        redis = _dict_redis()
+        executor = LLMExecutor(provider, redis_client=redis)
+
+        with pytest.raises(RuntimeError):
+            await executor.generate("bad")
+
+        assert redis.store == {}
+
+    async def test_redis_failure_falls_through_to_provider(self) -> None:
+        redis = AsyncMock()
+        redis.get = AsyncMock(side_effect=aioredis.ConnectionError("down"))
+        redis.set = AsyncMock(side_effect=aioredis.ConnectionError("down"))
+        executor = LLMExecutor(_SlowProvider(), redis_client=redis)
+
+        assert await executor.generate("p") == "answer:p"
+
+    async def test_zero_ttl_disables_cache(self) -> None:
+        provider = _SlowProvider()
+        executor = LLMExecutor(provider, redis_client=_dict_redis(), cache_ttl_seconds=0)
+
+        await executor.generate("p")
+        await executor.generate("p")
+
+        assert provider.calls == 2
+
+
+@pytest.mark.asyncio
+class TestMetricsAndStreaming:
+    async def test_records_latency_and_token_estimates(self) -> None:
+        executor = LLMExecutor(_SlowProvider())
+
+        await executor.generate("x" * 400, system="y" * 40)
+
+        [metrics] = executor.stats.recent
+        assert metrics.provider == "ollama"
+        assert metrics.model == "llama3.1:8b"
+        assert metrics.prompt_tokens == 110
+        assert metrics.latency_ms >= 15
+        assert executor.stats.to_dict()["calls"] == 1
+
+    async def test_stream_passes_chunks_through(self) -> None:
+        executor = LLMExecutor(_SlowProvider())
+
+        chunks = [chunk async for chunk in executor.generate_stream("a b c")]
+
+        assert chunks == ["a", "b", "c"]
+        assert executor.stats.recent[-1].completion_tokens == 0
+
+
+class TestGetLLMExecutor:
+    def setup_method(self) -> None:
+        reset_provider()
+        reset_executor()
+
+    def teardown_method(self) -> None:
+        reset_provider()
+        reset_executor()
+
+    def test_reuses_executor_for_the_same_provider(self) -> None:
+        with patch.dict("os.environ", {"LLM_PROVIDER": "stub"}):
+            assert get_llm_executor() is get_llm_executor()
+
+    def test_rebuilds_when_provider_changes(self) -> None:
+        first_provider, second_provider = StubProvider(), StubProvider()
+
+        with patch("src.core.llm_executor.get_llm_provider", return_value=first_provider):
+            first = get_llm_executor()
+        with patch("src.core.llm_executor.get_llm_provider", return_value=second_provider):
+            second = get_llm_executor()
+
+        assert first.provider is first_provider
+        assert second.provider is second_provider
@@ -0,0 +1,48 @@
+"""Tests for the KMNode super-label graph migration."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.neo4j import KM_NODE_LABEL, migrate_km_node_label
+
+
+def _driver(*single_values: dict | None) -> tuple[MagicMock, AsyncMock]:
+    session = AsyncMock()
+    results = []
+    for value in single_values:
+        result = AsyncMock()
+        result.single = AsyncMock(return_value=value)
+        results.append(result)
+    results.extend(AsyncMock() for _ in range(3))
+    session.run = AsyncMock(side_effect=results)
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+    driver = MagicMock()
+    driver.session.return_value = session
+    return driver, session
+
+
+@pytest.mark.asyncio
+async def test_backfills_label_then_creates_constraint_and_records() -> None:
+    driver, session = _driver({"applied": 0}, {"labelled": 1200})
+
+    assert await migrate_km_node_label(driver, batch_size=500) is True
+
+    queries = [call.args[0] for call in session.run.call_args_list]
+    assert f"SET n:{KM_NODE_LABEL}" in queries[1]
+    assert "IN TRANSACTIONS OF $batch_size ROWS" in queries[1]
+    assert session.run.call_args_list[1].args[1] == {"batch_size": 500}
+    assert f"FOR (n:{KM_NODE_LABEL}) REQUIRE n.id IS UNIQUE" in queries[2]
+    assert f"FOR (n:{KM_NODE_LABEL}) ON (n.engagement_id)" in queries[3]
+    assert "MERGE (m:KMSchemaMigration" in queries[4]
+
+
+@pytest.mark.asyncio
+async def test_skips_when_already_applied() -> None:
+    driver, session = _driver({"applied": 1})
+
+    assert await migrate_km_node_label(driver) is False
+    assert session.run.await_count == 1
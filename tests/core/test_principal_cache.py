@@ -0,0 +1,182 @@
+"""Tests for the authenticated principal cache (src/core/principal_cache.py)."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import inspect
+
+from src.core import principal_cache as principal_cache_mod
+from src.core.auth import blacklist_token, create_access_token, get_current_user
+from src.core.config import Settings
+from src.core.models import User, UserRole
+from src.core.permissions import require_engagement_access
+from src.core.principal_cache import PrincipalCache, invalidate_principal, token_digest
+from src.core.redis import CHANNEL_PRINCIPAL
+
+
+@pytest.fixture
+def auth_settings() -> Settings:
+    return Settings(jwt_secret_key="test-secret-key-for-tests", jwt_algorithm="HS256", auth_dev_mode=False)
+
+
+def _user(role: UserRole = UserRole.PROCESS_ANALYST, is_active: bool = True) -> User:
+    return User(
+        id=uuid.uuid4(),
+        email="analyst@kmflow.dev",
+        name="Analyst",
+        role=role,
+        is_active=is_active,
+    )
+
+
+def _request(cache: PrincipalCache | None, session: AsyncMock) -> MagicMock:
+    request = MagicMock()
+    request.cookies = {}
+    request.state = MagicMock(spec=[])
+    request.app.state.principal_cache = cache
+    request.app.state.redis_client = MagicMock()
+    request.app.state.redis_client.get = AsyncMock(return_value=None)
+    request.app.state.redis_client.setex = AsyncMock()
+    request.app.state.redis_client.publish = AsyncMock(return_value=1)
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    request.app.state.db_session_factory = factory
+    return request
+
+
+def _session_returning(value: object) -> AsyncMock:
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = value
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+class TestPrincipalCache:
+    def test_hit_returns_detached_copy(self) -> None:
+        cache = PrincipalCache()
+        user = _user()
+        cache.put_user(user)
+
+        first = cache.get_user(user.id)
+        second = cache.get_user(user.id)
+
+        assert first is not None and second is not None
+        assert first is not second
+        assert (first.id, first.email, first.role) == (user.id, user.email, user.role)
+        assert inspect(first).detached
+        assert cache.hits == 2
+
+    def test_entries_expire(self) -> None:
+        cache = PrincipalCache(ttl_seconds=10)
+        user = _user()
+        with patch.object(principal_cache_mod.time, "monotonic", return_value=100.0):
+            cache.put_user(user)
+            cache.mark_token_checked("tok")
+        with patch.object(principal_cache_mod.time, "monotonic", return_value=111.0):
+            assert cache.get_user(user.id) is None
+            assert not cache.is_token_checked("tok")
+
+    def test_least_recently_used_user_is_evicted(self) -> None:
+        cache = PrincipalCache(max_entries=2)
+        a, b, c = _user(), _user(), _user()
+        cache.put_user(a)
+        cache.put_user(b)
+        cache.get_user(a.id)
+        cache.put_user(c)
+
+        assert cache.get_user(b.id) is None
+        assert cache.get_user(a.id) is not None
+
+    def test_invalidating_user_drops_memberships(self) -> None:
+        cache = PrincipalCache()
+        user = _user()
+        engagement_id = uuid.uuid4()
+        cache.put_user(user)
+        cache.put_membership(user.id, engagement_id, True)
+
+        cache.handle_event({"user_id": str(user.id)})
+
+        assert cache.get_membership(user.id, engagement_id) is None
+        assert cache.get_user(user.id) is None
+
+    def test_token_event_drops_checked_token(self) -> None:
+        cache = PrincipalCache()
+        cache.mark_token_checked("tok")
+
+        cache.handle_event({"token_hash": token_digest("tok"), "user_id": "not-a-uuid"})
+
+        assert not cache.is_token_checked("tok")
+
+
+class TestGetCurrentUser:
+    @pytest.mark.asyncio
+    async def test_second_request_skips_redis_and_database(self, auth_settings: Settings) -> None:
+        user = _user()
+        token = create_access_token({"sub": str(user.id)}, auth_settings)
+        session = _session_returning(user)
+        request = _request(PrincipalCache(), session)
+        credentials = MagicMock(credentials=token)
+
+        await get_current_user(request=request, credentials=credentials, settings=auth_settings)
+        cached = await get_current_user(request=request, credentials=credentials, settings=auth_settings)
+
+        assert cached.id == user.id
+        assert session.execute.await_count == 1
+        assert request.app.state.redis_client.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_revoked_token_is_rejected_despite_cache(self, auth_settings: Settings) -> None:
+        user = _user()
+        token = create_access_token({"sub": str(user.id)}, auth_settings)
+        request = _request(PrincipalCache(), _session_returning(user))
+        credentials = MagicMock(credentials=token)
+        await get_current_user(request=request, credentials=credentials, settings=auth_settings)
+
+        assert await blacklist_token(request, token)
+        request.app.state.redis_client.get = AsyncMock(return_value=b"1")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(request=request, credentials=credentials, settings=auth_settings)
+        assert exc_info.value.detail == "Token has been revoked"
+        channel, payload = request.app.state.redis_client.publish.await_args.args
+        assert channel == CHANNEL_PRINCIPAL
+        assert json.loads(payload) == {"token_hash": token_digest(token)}
+
+    @pytest.mark.asyncio
+    async def test_deactivation_takes_effect_after_invalidation(self, auth_settings: Settings) -> None:
+        user = _user()
+        token = create_access_token({"sub": str(user.id)}, auth_settings)
+        session = _session_returning(user)
+        request = _request(PrincipalCache(), session)
+        credentials = MagicMock(credentials=token)
+        await get_current_user(request=request, credentials=credentials, settings=auth_settings)
+
+        session.execute.return_value.scalar_one_or_none.return_value = _user(is_active=False)
+        await invalidate_principal(request, user_id=user.id)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(request=request, credentials=credentials, settings=auth_settings)
+        assert exc_info.value.detail == "User account is disabled"
+
+
+class TestEngagementAccess:
+    @pytest.mark.asyncio
+    async def test_membership_cached_across_requests(self) -> None:
+        user = _user()
+        engagement_id = uuid.uuid4()
+        cache = PrincipalCache()
+        cache.put_user(user)
+        session = _session_returning(MagicMock())
+
+        for _ in range(2):
+            await require_engagement_access(engagement_id, _request(cache, session), user)
+
+        assert session.execute.await_count == 1
+        assert cache.get_membership(user.id, engagement_id) is True
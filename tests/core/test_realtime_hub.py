@@ -0,0 +1,174 @@
+"""Tests for the shared real-time WebSocket fan-out hub."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.realtime_hub import SLOW_CONSUMER_CLOSE_CODE, RealtimeHub
+from src.core.redis import CHANNEL_ALERTS, CHANNEL_DEVIATIONS, CHANNEL_MONITORING
+
+ALL_CHANNELS = {CHANNEL_DEVIATIONS, CHANNEL_ALERTS, CHANNEL_MONITORING}
+
+
+class _FakePubSub:
+    """In-memory stand-in for ``redis.asyncio`` Pub/Sub."""
+
+    def __init__(self) -> None:
+        self.messages: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self.subscribed: list[str] = []
+        self.closed = False
+
+    async def subscribe(self, *channels: str) -> None:
+        self.subscribed.extend(channels)
+
+    async def unsubscribe(self, *channels: str) -> None:
+        self.subscribed = [c for c in self.subscribed if c not in channels]
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def get_message(self, ignore_subscribe_messages: bool = False, timeout: float = 0.0) -> dict[str, Any] | None:
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout=timeout)
+        except TimeoutError:
+            return None
+
+    def publish(self, channel: str, data: dict[str, Any]) -> None:
+        self.messages.put_nowait({"type": "message", "channel": channel, "data": json.dumps(data)})
+
+
+class _FakeSocket:
+    def __init__(self, *, blocked: bool = False) -> None:
+        self.frames: list[str] = []
+        self.closed_with: int | None = None
+        self._unblocked = asyncio.Event()
+        if not blocked:
+            self._unblocked.set()
+
+    async def send_text(self, data: str) -> None:
+        await self._unblocked.wait()
+        self.frames.append(data)
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        self.closed_with = code
+
+
+def _hub(queue_size: int = 16) -> tuple[RealtimeHub, _FakePubSub, MagicMock]:
+    pubsub = _FakePubSub()
+    redis_client = MagicMock()
+    redis_client.pubsub = MagicMock(return_value=pubsub)
+    return RealtimeHub(redis_client, queue_size=queue_size), pubsub, redis_client
+
+
+async def _drain(pubsub: _FakePubSub, until: Any, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while (pubsub.messages.qsize() or not until()) and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_events_reach_only_matching_engagement_and_channel() -> None:
+    hub, pubsub, _ = _hub()
+    monitoring = _FakeSocket()
+    alerts_only = _FakeSocket()
+    other_engagement = _FakeSocket()
+    senders = [
+        hub.register(monitoring, "eng-1", ALL_CHANNELS),
+        hub.register(alerts_only, "eng-1", {CHANNEL_ALERTS}),
+        hub.register(other_engagement, "eng-2", ALL_CHANNELS),
+    ]
+
+    pubsub.publish(CHANNEL_DEVIATIONS, {"engagement_id": "eng-1", "type": "deviation"})
+    pubsub.publish(CHANNEL_ALERTS, {"engagement_id": "eng-1", "type": "alert"})
+    await _drain(pubsub, lambda: len(monitoring.frames) == 2 and len(alerts_only.frames) == 1)
+
+    assert [json.loads(f)["type"] for f in monitoring.frames] == ["deviation", "alert"]
+    assert [json.loads(f)["type"] for f in alerts_only.frames] == ["alert"]
+    assert other_engagement.frames == []
+    for sender in senders:
+        await hub.unregister(sender)
+
+
+@pytest.mark.asyncio
+async def test_one_subscription_shared_and_released_with_last_socket() -> None:
+    hub, pubsub, redis_client = _hub()
+    first = hub.register(_FakeSocket(), "eng-1", ALL_CHANNELS)
+    second = hub.register(_FakeSocket(), "eng-2", ALL_CHANNELS)
+    await asyncio.sleep(0.01)
+
+    assert redis_client.pubsub.call_count == 1
+    assert set(pubsub.subscribed) == ALL_CHANNELS
+
+    await hub.unregister(first)
+    assert hub.listening
+    await hub.unregister(second)
+    assert not hub.listening
+    assert pubsub.closed
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_dropped_without_delaying_others() -> None:
+    hub, pubsub, _ = _hub(queue_size=2)
+    slow = _FakeSocket(blocked=True)
+    fast = _FakeSocket()
+    slow_sender = hub.register(slow, "eng-1", ALL_CHANNELS)
+    fast_sender = hub.register(fast, "eng-1", ALL_CHANNELS)
+
+    for i in range(5):
+        pubsub.publish(CHANNEL_MONITORING, {"engagement_id": "eng-1", "seq": i})
+    await _drain(pubsub, lambda: len(fast.frames) == 5 and slow.closed_with is not None)
+
+    assert [json.loads(f)["seq"] for f in fast.frames] == list(range(5))
+    assert slow_sender.overflowed
+    assert slow.closed_with == SLOW_CONSUMER_CLOSE_CODE
+    assert slow_sender.send("late") is False
+    await hub.unregister(slow_sender)
+    await hub.unregister(fast_sender)
+
+
+@pytest.mark.asyncio
+async def test_malformed_messages_are_skipped() -> None:
+    hub, _, _ = _hub()
+    socket = _FakeSocket()
+    sender = hub.register(socket, "eng-1", ALL_CHANNELS)
+
+    assert hub.dispatch(CHANNEL_ALERTS, "not json") == 0
+    assert hub.dispatch(CHANNEL_ALERTS, json.dumps(["eng-1"])) == 0
+    assert hub.dispatch(CHANNEL_ALERTS, json.dumps({"engagement_id": "eng-1"})) == 1
+    await hub.unregister(sender)
+
+
+@pytest.mark.asyncio
+async def test_load_1000_sockets_each_event_sent_once_per_socket() -> None:
+    """1,000 sockets over 10 engagements; each event is sent once to each of its engagement's sockets."""
+    hub, pubsub, redis_client = _hub(queue_size=256)
+    engagements = [f"eng-{i}" for i in range(10)]
+    sockets: dict[str, list[_FakeSocket]] = {e: [_FakeSocket() for _ in range(100)] for e in engagements}
+    senders = [hub.register(s, e, ALL_CHANNELS) for e, group in sockets.items() for s in group]
+    events_per_engagement = 50
+
+    start = time.perf_counter()
+    for seq in range(events_per_engagement):
+        for engagement_id in engagements:
+            pubsub.publish(CHANNEL_DEVIATIONS, {"engagement_id": engagement_id, "seq": seq})
+    total = len(engagements) * events_per_engagement
+    await _drain(pubsub, lambda: hub.received == total and sum(s.sent for s in senders) == total * 100, timeout=30)
+    elapsed = time.perf_counter() - start
+
+    assert redis_client.pubsub.call_count == 1
+    assert hub.delivered == total * 100
+    for engagement_id, group in sockets.items():
+        for socket in group:
+            frames = [json.loads(f) for f in socket.frames]
+            assert [f["seq"] for f in frames] == list(range(events_per_engagement))
+            assert {f["engagement_id"] for f in frames} == {engagement_id}
+    assert elapsed < 20
+    for sender in senders:
+        await hub.unregister(sender)
+    assert not hub.listening
@@ -1,21 +1,19 @@
 """Tests for graph health analysis in src.evaluation.graph_health.
 
-The None-driver path is fully tested without any Neo4j connections.
-The _UnionFind component-counting logic is tested directly.
+The None-driver path is fully tested without any Neo4j connections; the
+driver path uses an in-memory GraphSnapshot and a mocked property query.
 """
 
 from __future__ import annotations
 
 import uuid
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.core.models.pipeline_quality import GraphHealthSnapshot
-from src.evaluation.graph_health import (
-    _UnionFind,
-    analyze_graph_health,
-)
+from src.evaluation.graph_health import analyze_graph_health
+from src.semantic.graph_snapshot import GraphSnapshot
 
 
 def _make_session() -> AsyncMock:
@@ -24,92 +22,6 @@ def _make_session() -> AsyncMock:
     return session
 
 
-# ---------------------------------------------------------------------------
-# _UnionFind unit tests
-# ---------------------------------------------------------------------------
-
-
-class TestUnionFind:
-    def test_single_node_is_its_own_component(self) -> None:
-        uf = _UnionFind()
-        uf._ensure(1)
-        components = list(uf.components())
-        assert len(components) == 1
-        root, members = components[0]
-        assert members == [1]
-
-    def test_two_connected_nodes_form_one_component(self) -> None:
-        uf = _UnionFind()
-        uf._ensure(1)
-        uf._ensure(2)
-        uf.union(1, 2)
-        components = list(uf.components())
-        assert len(components) == 1
-        _, members = components[0]
-        assert set(members) == {1, 2}
-
-    def test_two_disconnected_nodes_form_two_components(self) -> None:
-        uf = _UnionFind()
-        uf._ensure(1)
-        uf._ensure(2)
-        components = list(uf.components())
-        assert len(components) == 2
-
-    def test_chain_of_nodes_forms_one_component(self) -> None:
-        uf = _UnionFind()
-        # 1-2-3-4
-        for i in range(1, 5):
-            uf._ensure(i)
-        uf.union(1, 2)
-        uf.union(2, 3)
-        uf.union(3, 4)
-        components = list(uf.components())
-        assert len(components) == 1
-        _, members = components[0]
-        assert set(members) == {1, 2, 3, 4}
-
-    def test_two_separate_clusters(self) -> None:
-        uf = _UnionFind()
-        # cluster A: 1-2
-        uf._ensure(1)
-        uf._ensure(2)
-        uf.union(1, 2)
-        # cluster B: 3-4
-        uf._ensure(3)
-        uf._ensure(4)
-        uf.union(3, 4)
-        components = list(uf.components())
-        assert len(components) == 2
-        sizes = sorted(len(m) for _, m in components)
-        assert sizes == [2, 2]
-
-    def test_find_with_path_compression(self) -> None:
-        uf = _UnionFind()
-        for i in range(1, 6):
-            uf._ensure(i)
-        # Chain: 1→2→3→4→5
-        uf.union(1, 2)
-        uf.union(2, 3)
-        uf.union(3, 4)
-        uf.union(4, 5)
-        # All should have the same root after find
-        root = uf.find(1)
-        for i in range(2, 6):
-            assert uf.find(i) == root
-
-    def test_union_same_node_is_noop(self) -> None:
-        uf = _UnionFind()
-        uf._ensure(1)
-        uf.union(1, 1)
-        components = list(uf.components())
-        assert len(components) == 1
-
-    def test_empty_union_find_has_no_components(self) -> None:
-        uf = _UnionFind()
-        components = list(uf.components())
-        assert components == []
-
-
 # ---------------------------------------------------------------------------
 # analyze_graph_health — None driver path
 # ---------------------------------------------------------------------------
@@ -179,3 +91,68 @@ class TestAnalyzeGraphHealthNoneDriver:
         )
 
         assert snapshot.analysis_duration_ms >= 0.0
+
+
+# ---------------------------------------------------------------------------
+# analyze_graph_health — snapshot-backed topology metrics
+# ---------------------------------------------------------------------------
+
+
+def _make_driver(missing_props: int, avg_conf: float | None, low_conf: int | None) -> MagicMock:
+    missing = AsyncMock()
+    missing.single = AsyncMock(return_value={"cnt": missing_props})
+    confidence = AsyncMock()
+    confidence.single = AsyncMock(return_value={"avg_conf": avg_conf, "low_conf": low_conf})
+    neo4j_session = AsyncMock()
+    neo4j_session.run = AsyncMock(side_effect=[missing, confidence])
+    neo4j_session.__aenter__ = AsyncMock(return_value=neo4j_session)
+    neo4j_session.__aexit__ = AsyncMock(return_value=None)
+    driver = MagicMock()
+    driver.session.return_value = neo4j_session
+    return driver
+
+
+@pytest.mark.asyncio
+class TestAnalyzeGraphHealthSnapshot:
+    async def test_topology_metrics_come_from_snapshot(self) -> None:
+        eid = str(uuid.uuid4())
+        graph = GraphSnapshot.build(
+            eid,
+            [("a", "Activity"), ("b", "Activity"), ("c", "Role"), ("d", "Bogus"), ("e", "Activity")],
+            [("a", "b", "PRECEDES"), ("b", "c", "PERFORMED_BY"), ("d", "e", "NOT_A_TYPE")],
+        )
+        session = _make_session()
+        driver = _make_driver(missing_props=2, avg_conf=0.7, low_conf=1)
+
+        with patch("src.evaluation.graph_health.get_graph_snapshot", AsyncMock(return_value=graph)):
+            snapshot = await analyze_graph_health(driver, session, eid)
+
+        assert snapshot.node_count == 5
+        assert snapshot.relationship_count == 3
+        assert snapshot.orphan_node_count == 0
+        assert snapshot.connected_components == 2
+        assert snapshot.largest_component_size == 3
+        assert snapshot.avg_degree == pytest.approx(1.2)
+        assert snapshot.nodes_by_label == {"Activity": 3, "Bogus": 1, "Role": 1}
+        assert snapshot.invalid_label_count == 1
+        assert snapshot.invalid_rel_type_count == 1
+        assert snapshot.missing_required_props == 2
+        assert snapshot.avg_confidence == 0.7
+        assert snapshot.low_confidence_count == 1
+        assert snapshot.entity_types_present.get("activity") == 3
+        session.add.assert_called_once_with(snapshot)
+
+    async def test_orphans_count_as_single_node_components(self) -> None:
+        eid = str(uuid.uuid4())
+        graph = GraphSnapshot.build(
+            eid, [("a", "Activity"), ("b", "Activity"), ("c", "Activity")], [("a", "b", "PRECEDES")]
+        )
+        driver = _make_driver(missing_props=0, avg_conf=None, low_conf=None)
+
+        with patch("src.evaluation.graph_health.get_graph_snapshot", AsyncMock(return_value=graph)):
+            snapshot = await analyze_graph_health(driver, _make_session(), eid)
+
+        assert snapshot.orphan_node_count == 1
+        assert snapshot.connected_components == 2
+        assert snapshot.avg_confidence == 0.0
+        assert snapshot.low_confidence_count == 0
@@ -17,8 +17,8 @@ from src.gdpr.erasure_worker import GdprErasureWorker
 
 @pytest.fixture
 def worker():
-    """Create a GdprErasureWorker instance."""
-    return GdprErasureWorker()
+    """Create a GdprErasureWorker with a mock worker context."""
+    return GdprErasureWorker(MagicMock())
 
 
 def _make_user(*, active: bool = True) -> MagicMock:
@@ -51,6 +51,13 @@ def _mock_session_factory(*sessions):
     return MagicMock(side_effect=factory)
 
 
+def _failing_redis() -> MagicMock:
+    """Create a mock Redis client whose key scan fails."""
+    client = MagicMock()
+    client.scan_iter = MagicMock(side_effect=ConnectionError("Redis down"))
+    return client
+
+
 class TestGdprErasureWorker:
     """Tests for the erasure worker execute method."""
 
@@ -64,10 +71,9 @@ class TestGdprErasureWorker:
 
         mock_factory = _mock_session_factory(mock_session)
 
-        import src.core.database as db_mod
+        worker.context.session_factory = mock_factory
 
-        with patch.object(db_mod, "async_session_factory", mock_factory, create=True):
-            result = await worker.execute({})
+        result = await worker.execute({})
 
         assert result["users_found"] == 0
         assert result["pg_anonymised"] == 0
@@ -96,10 +102,9 @@ class TestGdprErasureWorker:
 
         mock_factory = _mock_session_factory(find_session, erase_session)
 
-        import src.core.database as db_mod
+        worker.context.session_factory = mock_factory
 
         with (
-            patch.object(db_mod, "async_session_factory", mock_factory, create=True),
             patch.object(worker, "_purge_neo4j", new_callable=AsyncMock, return_value=1),
             patch.object(worker, "_purge_redis", new_callable=AsyncMock, return_value=2),
         ):
@@ -131,10 +136,9 @@ class TestGdprErasureWorker:
 
         mock_factory = _mock_session_factory(find_session, erase_session)
 
-        import src.core.database as db_mod
+        worker.context.session_factory = mock_factory
 
         with (
-            patch.object(db_mod, "async_session_factory", mock_factory, create=True),
             patch.object(worker, "_purge_redis", new_callable=AsyncMock, return_value=1),
         ):
             result = await worker.execute({})
@@ -164,12 +168,29 @@ class TestGdprErasureWorker:
 
         mock_factory = _mock_session_factory(find_session, erase_session)
 
-        import src.core.database as db_mod
+        worker.context.session_factory = mock_factory
+        worker.context.redis_client = _failing_redis()
 
         with (
-            patch.object(db_mod, "async_session_factory", mock_factory, create=True),
             patch.object(worker, "_purge_neo4j", new_callable=AsyncMock, return_value=0),
-            patch("src.core.redis.create_redis_client", side_effect=ConnectionError("Redis down")),
             pytest.raises(RuntimeError, match="Redis GDPR purge failed"),
         ):
             await worker.execute({})
+
+    @pytest.mark.asyncio
+    async def test_redis_purge_uses_shared_client(self, worker) -> None:
+        """Keys are deleted through the context's client, which stays open."""
+        scanned = {"session:u1*": ["session:u1:a"], "token:u1*": [], "user:u1*": ["user:u1"]}
+
+        async def scan_iter(match: str, count: int):
+            for key in scanned[match]:
+                yield key
+
+        client = MagicMock()
+        client.scan_iter = scan_iter
+        client.delete = AsyncMock(return_value=1)
+        client.close = AsyncMock()
+        worker.context.redis_client = client
+
+        assert await worker._purge_redis(["u1"]) == 2
+        client.close.assert_not_awaited()
@@ -0,0 +1,21 @@
+"""Fixtures for integration connector tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.core.models import SyncCheckpoint
+from src.integrations.sync_checkpoint import DatabaseSyncCheckpointStore
+
+
+@pytest.fixture
+async def sync_store() -> AsyncIterator[DatabaseSyncCheckpointStore]:
+    """DatabaseSyncCheckpointStore on an in-memory SQLite database."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: SyncCheckpoint.__table__.create(sync_conn))
+    yield DatabaseSyncCheckpointStore(async_sessionmaker(engine, expire_on_commit=False))
+    await engine.dispose()
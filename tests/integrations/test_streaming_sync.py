@@ -0,0 +1,277 @@
+"""Tests for streaming connector syncs into bulk canonical event inserts."""
+
+from __future__ import annotations
+
+import uuid
+from functools import partial
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+
+from src.core.models import SyncCheckpoint
+from src.integrations.base import ConnectionConfig
+from src.integrations.canonical_sink import STAGE_TABLE, bulk_insert_canonical_events, source_event_key
+from src.integrations.celonis import CelonisConnector
+from src.integrations.celonis_ems import CelonisEventStep
+from src.integrations.connector_framework import CanonicalActivityEvent, SyncPage, TransformPipeline
+from src.integrations.sap import SAPConnector
+from src.integrations.sync_checkpoint import DatabaseSyncCheckpointStore, WatermarkState, run_streaming_sync
+
+ENGAGEMENT_ID = str(uuid.uuid4())
+
+
+def _event(i: int, key: str = "") -> CanonicalActivityEvent:
+    return CanonicalActivityEvent(
+        activity_name=f"step-{i}",
+        timestamp=f"2026-01-01T00:00:{i % 60:02d}",
+        actor="clerk",
+        source_system="celonis",
+        case_id=f"case-{i // 10}",
+        event_key=key,
+    )
+
+
+def _session(driver: Any, rowcount: int) -> MagicMock:
+    raw = MagicMock()
+    raw.driver_connection = driver
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw)
+    session = MagicMock()
+    session.connection = AsyncMock(return_value=connection)
+    session.execute = AsyncMock(return_value=MagicMock(rowcount=rowcount))
+    return session
+
+
+class TestSourceEventKey:
+    def test_prefers_source_event_id(self) -> None:
+        assert source_event_key(_event(1, key="evt-1")) == "evt-1"
+
+    def test_content_hash_is_stable_and_distinct(self) -> None:
+        assert source_event_key(_event(1)) == source_event_key(_event(1))
+        assert source_event_key(_event(1)) != source_event_key(_event(2))
+
+
+@pytest.mark.asyncio
+class TestBulkInsert:
+    async def test_copy_path_stages_then_inserts_on_conflict(self) -> None:
+        driver = MagicMock()
+        driver.execute = AsyncMock()
+        driver.copy_records_to_table = AsyncMock()
+        session = _session(driver, rowcount=2)
+
+        inserted = await bulk_insert_canonical_events(session, ENGAGEMENT_ID, [_event(1, "a"), _event(2, "b")])
+
+        assert inserted == 2
+        assert "CREATE TEMP TABLE IF NOT EXISTS" in driver.execute.await_args.args[0]
+        table, kwargs = driver.copy_records_to_table.await_args.args[0], driver.copy_records_to_table.await_args.kwargs
+        assert table == STAGE_TABLE
+        assert [record[-1] for record in kwargs["records"]] == ["a", "b"]
+        insert_sql = str(session.execute.await_args_list[0].args[0])
+        assert "ON CONFLICT (engagement_id, source_system, source_event_key) DO NOTHING" in insert_sql
+        assert "TRUNCATE" in str(session.execute.await_args_list[1].args[0])
+
+    async def test_falls_back_to_multirow_insert(self) -> None:
+        session = _session(object(), rowcount=1)
+
+        inserted = await bulk_insert_canonical_events(session, ENGAGEMENT_ID, [_event(1), _event(1)])
+
+        assert inserted == 1
+        stmt = session.execute.await_args.args[0]
+        assert "ON CONFLICT" in str(stmt.compile(dialect=postgresql.dialect()))
+
+    async def test_empty_chunk_skips_database(self) -> None:
+        session = _session(object(), rowcount=0)
+
+        assert await bulk_insert_canonical_events(session, ENGAGEMENT_ID, []) == 0
+        session.connection.assert_not_awaited()
+
+
+class _Connector:
+    """Streams ``pages`` offset pages of two records, optionally failing."""
+
+    def __init__(self, pages: int, fail_after: int | None = None) -> None:
+        self.pages = pages
+        self.fail_after = fail_after
+        self.resumed_from: WatermarkState | None = None
+
+    async def stream_records(self, engagement_id: str, resume: WatermarkState | None = None) -> AsyncIterator[SyncPage]:
+        self.resumed_from = resume
+        start = resume.last_offset // 2 if resume and resume.last_offset else 0
+        for page in range(start, self.pages):
+            if self.fail_after is not None and page >= self.fail_after:
+                raise ConnectionError("source went away")
+            records = [{"activity_name": f"a{page}-{i}"} for i in range(2)]
+            yield SyncPage(records=records, offset=(page + 1) * 2)
+
+    def transform_pipeline(self) -> TransformPipeline:
+        return _StaticPipeline()
+
+
+class _StaticPipeline(TransformPipeline):
+    def transform_record(self, record: dict[str, Any]) -> dict[str, Any]:
+        return {
+            **record,
+            "timestamp": "2026-01-01T00:00:00",
+            "actor": "clerk",
+            "source_system": "stub",
+            "event_key": record["activity_name"],
+        }
+
+
+async def _record_chunks(chunks: list[list[str]], *_args: Any) -> int:
+    events: list[CanonicalActivityEvent] = _args[-1]
+    chunks.append([event.event_key for event in events])
+    return len(events)
+
+
+@pytest.mark.asyncio
+class TestRunStreamingSync:
+    async def test_commits_chunks_and_clears_watermark_on_success(
+        self, sync_store: DatabaseSyncCheckpointStore
+    ) -> None:
+        chunks: list[list[str]] = []
+
+        with patch(
+            "src.integrations.sync_checkpoint.bulk_insert_canonical_events",
+            side_effect=partial(_record_chunks, chunks),
+        ):
+            log = await run_streaming_sync(_Connector(pages=5), "stub", ENGAGEMENT_ID, sync_store, chunk_size=4)
+
+        assert log.success
+        assert log.new_records == 10
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        watermark = await sync_store.get_watermark("stub", ENGAGEMENT_ID)
+        assert watermark is not None and watermark.last_offset is None
+        assert await sync_store.get_checkpoint("stub", ENGAGEMENT_ID) == log.started_at
+        # The lease was released, so another replica can sync right away.
+        assert await sync_store.acquire_lease("stub", ENGAGEMENT_ID, "other")
+
+    async def test_failure_keeps_watermark_and_resume_continues_after_it(
+        self, sync_store: DatabaseSyncCheckpointStore
+    ) -> None:
+        chunks: list[list[str]] = []
+
+        with patch(
+            "src.integrations.sync_checkpoint.bulk_insert_canonical_events",
+            side_effect=partial(_record_chunks, chunks),
+        ):
+            failed = await run_streaming_sync(
+                _Connector(pages=5, fail_after=3), "stub", ENGAGEMENT_ID, sync_store, chunk_size=4
+            )
+            watermark = await sync_store.get_watermark("stub", ENGAGEMENT_ID)
+            resumed_connector = _Connector(pages=5)
+            resumed = await run_streaming_sync(resumed_connector, "stub", ENGAGEMENT_ID, sync_store, chunk_size=4)
+
+        assert not failed.success
+        assert "source went away" in failed.errors[0]
+        # Page 2 was read but never committed, so the watermark stops after page 1.
+        assert watermark is not None and watermark.last_offset == 4
+        assert watermark.records_since_reset == 4
+        assert resumed.success
+        assert await sync_store.get_checkpoint("stub", ENGAGEMENT_ID) == resumed.started_at
+        assert resumed_connector.resumed_from is not None
+        assert resumed_connector.resumed_from.last_offset == 4
+        assert chunks[1:] == [["a2-0", "a2-1", "a3-0", "a3-1"], ["a4-0", "a4-1"]]
+
+    async def test_skips_when_another_replica_holds_the_lease(self, sync_store: DatabaseSyncCheckpointStore) -> None:
+        await sync_store.acquire_lease("stub", ENGAGEMENT_ID, "replica-a")
+        connector = _Connector(pages=1)
+
+        log = await run_streaming_sync(connector, "stub", ENGAGEMENT_ID, sync_store, owner="replica-b")
+
+        assert "already running" in log.errors[0]
+        assert connector.resumed_from is None
+
+    async def test_lost_lease_rolls_back_the_chunk(self, sync_store: DatabaseSyncCheckpointStore) -> None:
+        async def steal(*args: Any) -> int:
+            # Another replica takes over after this replica's lease expired.
+            async with sync_store.session_factory() as session:
+                await session.execute(update(SyncCheckpoint).values(lease_owner="replica-b"))
+                await session.commit()
+            return len(args[-1])
+
+        with patch("src.integrations.sync_checkpoint.bulk_insert_canonical_events", side_effect=steal):
+            log = await run_streaming_sync(_Connector(pages=2), "stub", ENGAGEMENT_ID, sync_store, owner="replica-a")
+
+        assert "lease lost" in log.errors[0]
+        watermark = await sync_store.get_watermark("stub", ENGAGEMENT_ID)
+        assert watermark is not None and watermark.last_offset is None
+
+    async def test_connector_without_streaming_reports_error(self, sync_store: DatabaseSyncCheckpointStore) -> None:
+        from src.integrations.servicenow import ServiceNowConnector
+
+        log = await run_streaming_sync(ServiceNowConnector(ConnectionConfig()), "servicenow", ENGAGEMENT_ID, sync_store)
+
+        assert "does not support streaming" in log.errors[0]
+
+
+@pytest.mark.asyncio
+class TestStreamCanonicalEvents:
+    async def test_yields_each_page_with_its_events(self) -> None:
+        async def pages() -> AsyncIterator[SyncPage]:
+            yield SyncPage(records=[{"activity_name": "a"}], offset=1)
+            yield SyncPage(records=[{"activity_name": "b"}, {"activity_name": "c"}], offset=3)
+
+        results = [
+            (page.offset, [e.activity_name for e in events])
+            async for page, events in _StaticPipeline().stream_canonical_events(pages())
+        ]
+
+        assert results == [(1, ["a"]), (3, ["b", "c"])]
+
+
+class TestCelonisEventStep:
+    def test_maps_event_id_to_event_key(self) -> None:
+        record = {"caseId": "c1", "activityName": "Approve", "eventTime": "2026-01-01T00:00:00", "eventId": "e9"}
+
+        [event] = TransformPipeline([CelonisEventStep()]).to_canonical_events([record])
+
+        assert event.event_key == "e9"
+        assert event.actor == "unknown"
+        assert event.case_id == "c1"
+
+
+@pytest.mark.asyncio
+class TestConnectorStreams:
+    async def test_celonis_resumes_from_offset(self) -> None:
+        connector = CelonisConnector(ConnectionConfig(base_url="https://celonis.example.com", api_key="k"))
+        seen: dict[str, Any] = {}
+
+        async def paginate(*_args: Any, **kwargs: Any) -> AsyncIterator[list[dict[str, Any]]]:
+            seen.update(kwargs)
+            yield [{"timestamp": "2026-01-02"}, {"timestamp": "2026-01-03"}]
+
+        resume = WatermarkState(connector_type="celonis", engagement_id=ENGAGEMENT_ID, last_offset=1000)
+        with patch("src.integrations.celonis.paginate_offset", side_effect=paginate):
+            pages = [page async for page in connector.stream_records(ENGAGEMENT_ID, resume=resume, data_pool_id="p1")]
+
+        assert seen["start_offset"] == 1000
+        assert pages[0].offset == 1002
+        assert pages[0].timestamp == "2026-01-03"
+
+    async def test_celonis_requires_data_pool(self) -> None:
+        connector = CelonisConnector(ConnectionConfig(base_url="https://celonis.example.com", api_key="k"))
+
+        with pytest.raises(ValueError, match="data_pool_id"):
+            [page async for page in connector.stream_records(ENGAGEMENT_ID)]
+
+    async def test_sap_resumes_from_next_link(self) -> None:
+        connector = SAPConnector(ConnectionConfig(base_url="https://sap.example.com", api_key="k"))
+        seen: list[tuple[str, Any]] = []
+
+        async def paginate(_client: Any, url: str, **kwargs: Any) -> AsyncIterator[tuple[Any, str | None]]:
+            seen.append((url, kwargs["params"]))
+            yield {"results": [{"BELNR": "1"}]}, "https://sap.example.com/next?skiptoken=2"
+            yield [{"BELNR": "2"}], None
+
+        resume = WatermarkState(connector_type="sap", engagement_id=ENGAGEMENT_ID, last_cursor="https://sap/resume")
+        with patch("src.integrations.sap.paginate_cursor_pages", side_effect=paginate):
+            pages = [page async for page in connector.stream_records(ENGAGEMENT_ID, resume=resume)]
+
+        assert seen == [("https://sap/resume", None)]
+        assert [page.records for page in pages] == [[{"BELNR": "1"}], [{"BELNR": "2"}]]
+        assert [page.cursor for page in pages] == ["https://sap.example.com/next?skiptoken=2", None]
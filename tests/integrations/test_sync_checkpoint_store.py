@@ -0,0 +1,120 @@
+"""Tests for the database-backed sync checkpoint store."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from src.integrations.sync_checkpoint import DatabaseSyncCheckpointStore, WatermarkConflictError
+
+ENGAGEMENT_ID = str(uuid.uuid4())
+
+
+async def _advance(store: DatabaseSyncCheckpointStore, owner: str, expected_version: int, offset: int) -> int:
+    async with store.session_factory() as session:
+        version = await store.advance_watermark(
+            session,
+            "celonis",
+            ENGAGEMENT_ID,
+            owner=owner,
+            expected_version=expected_version,
+            offset=offset,
+            records_processed=100,
+        )
+        await session.commit()
+    return version
+
+
+@pytest.mark.asyncio
+class TestCheckpoints:
+    async def test_checkpoint_round_trip(self, sync_store: DatabaseSyncCheckpointStore) -> None:
+        assert await sync_store.get_checkpoint("celonis", ENGAGEMENT_ID) is None
+
+        await sync_store.set_checkpoint("celonis", ENGAGEMENT_ID, "2026-01-15T10:00:00Z")
+
+        assert await sync_store.get_checkpoint("celonis", ENGAGEMENT_ID) == "2026-01-15T10:00:00Z"
+
+    async def test_state_is_shared_between_store_instances(self, sync_store: DatabaseSyncCheckpointStore) -> None:
+        await sync_store.acquire_lease("celonis", ENGAGEMENT_ID, "a")
+        await _advance(sync_store, "a", 0, offset=500)
+
+        other_replica = DatabaseSyncCheckpointStore(sync_store.session_factory)
+        watermark = await other_replica.get_watermark("celonis", ENGAGEMENT_ID)
+
+        assert watermark is not None
+        assert watermark.last_offset == 500
+        assert watermark.version == 1
+
+
+@pytest.mark.asyncio
+class TestCompareAndSet:
+    async def test_advance_bumps_version_and_accumulates_records(self, sync_store: DatabaseSyncCheckpointStore) -> None:
+        await sync_store.acquire_lease("celonis", ENGAGEMENT_ID, "a")
+
+        version = await _advance(sync_store, "a", 0, offset=100)
+        version = await _advance(sync_store, "a", version, offset=200)
+
+        watermark = await sync_store.get_watermark("celonis", ENGAGEMENT_ID)
+        assert watermark is not None
+        assert (version, watermark.last_offset, watermark.records_since_reset) == (2, 200, 200)
+
+    async def test_stale_version_conflicts(self, sync_store: DatabaseSyncCheckpointStore) -> None:
+        await sync_store.acquire_lease("celonis", ENGAGEMENT_ID, "a")
+        await _advance(sync_store, "a", 0, offset=100)
+
+        with pytest.raises(WatermarkConflictError):
+            await _advance(sync_store, "a", 0, offset=50)
+
+        watermark = await sync_store.get_watermark("celonis", ENGAGEMENT_ID)
+        assert watermark is not None and watermark.last_offset == 100
+
+    async def test_advance_requires_the_lease(self, sync_store: DatabaseSyncCheckpointStore) -> None:
+        await sync_store.acquire_lease("celonis", ENGAGEMENT_ID, "a")
+
+        with pytest.raises(WatermarkConflictError):
+            await _advance(sync_store, "b", 0, offset=100)
+
+    async def test_reset_clears_position_and_bumps_version(self, sync_store: DatabaseSyncCheckpointStore) -> None:
+        await sync_store.acquire_lease("celonis", ENGAGEMENT_ID, "a")
+        await _advance(sync_store, "a", 0, offset=100)
+
+        await sync_store.reset_watermark("celonis", ENGAGEMENT_ID)
+
+        watermark = await sync_store.get_watermark("celonis", ENGAGEMENT_ID)
+        assert watermark is not None
+        assert (watermark.last_offset, watermark.records_since_reset, watermark.version) == (None, 0, 2)
+
+
+@pytest.mark.asyncio
+class TestLease:
+    async def test_lease_is_exclusive_until_released(self, sync_store: DatabaseSyncCheckpointStore) -> None:
+        assert await sync_store.acquire_lease("celonis", ENGAGEMENT_ID, "a")
+        assert not await sync_store.acquire_lease("celonis", ENGAGEMENT_ID, "b")
+        assert await sync_store.acquire_lease("celonis", ENGAGEMENT_ID, "a")
+
+        await sync_store.release_lease("celonis", ENGAGEMENT_ID, "b")
+        assert not await sync_store.acquire_lease("celonis", ENGAGEMENT_ID, "b")
+
+        await sync_store.release_lease("celonis", ENGAGEMENT_ID, "a")
+        assert await sync_store.acquire_lease("celonis", ENGAGEMENT_ID, "b")
+
+    async def test_expired_lease_can_be_taken_over(self, sync_store: DatabaseSyncCheckpointStore) -> None:
+        assert await sync_store.acquire_lease("celonis", ENGAGEMENT_ID, "a", lease_seconds=-1)
+
+        assert await sync_store.acquire_lease("celonis", ENGAGEMENT_ID, "b")
+        with pytest.raises(WatermarkConflictError):
+            await _advance(sync_store, "a", 0, offset=100)
+
+    async def test_leases_are_per_connector_and_engagement(self, sync_store: DatabaseSyncCheckpointStore) -> None:
+        assert await sync_store.acquire_lease("celonis", ENGAGEMENT_ID, "a")
+
+        assert await sync_store.acquire_lease("sap", ENGAGEMENT_ID, "b")
+        assert await sync_store.acquire_lease("celonis", str(uuid.uuid4()), "b")
+
+    async def test_complete_sync_requires_the_lease(self, sync_store: DatabaseSyncCheckpointStore) -> None:
+        await sync_store.acquire_lease("celonis", ENGAGEMENT_ID, "a")
+
+        assert not await sync_store.complete_sync("celonis", ENGAGEMENT_ID, "b", "2026-01-01T00:00:00Z")
+        assert await sync_store.complete_sync("celonis", ENGAGEMENT_ID, "a", "2026-01-01T00:00:00Z")
+        assert await sync_store.get_checkpoint("celonis", ENGAGEMENT_ID) == "2026-01-01T00:00:00Z"
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 
-from src.integrations.utils import paginate_cursor, paginate_offset, retry_request
+from src.integrations.utils import (
+    RateLimitedTransport,
+    TokenBucket,
+    close_connector_clients,
+    get_connector_client,
+    paginate_cursor,
+    paginate_offset,
+    retry_request,
+)
 
 
 def _make_response(status_code: int = 200, json_data: dict | None = None) -> httpx.Response:
@@ -246,3 +256,109 @@ class TestPaginateCursor:
 
         assert len(pages) == 2
         assert len(call_urls) == 2
+
+
+class TestPrefetchingPagination:
+    """Tests for concurrent prefetching and cursor pipelining."""
+
+    @pytest.mark.asyncio
+    async def test_prefetches_pages_concurrently_in_order(self) -> None:
+        """With a known total, up to ``prefetch`` requests are in flight and pages arrive in order."""
+        in_flight = 0
+        peak = 0
+
+        async def mock_request(method, url, **kwargs):
+            nonlocal in_flight, peak
+            offset = kwargs["params"]["offset"]
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later pages answer first to prove ordering is preserved.
+            await asyncio.sleep(0.001 * (20 - offset // 10))
+            in_flight -= 1
+            return _make_response(200, {"results": [{"id": offset + i} for i in range(10)], "total": 200})
+
+        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        mock_client.request = mock_request
+
+        ids = []
+        async for page in paginate_offset(mock_client, "https://api.example.com/data", page_size=10, prefetch=5):
+            ids.extend(record["id"] for record in page)
+
+        assert ids == list(range(200))
+        assert peak == 5
+
+    @pytest.mark.asyncio
+    async def test_without_total_requests_next_page_before_yielding(self) -> None:
+        """Without a total, the next page is already requested while the caller holds the current one."""
+        requested: list[int] = []
+
+        async def mock_request(method, url, **kwargs):
+            offset = kwargs["params"]["offset"]
+            requested.append(offset)
+            results = [{"id": offset}, {"id": offset + 1}] if offset < 4 else []
+            return _make_response(200, {"results": results})
+
+        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        mock_client.request = mock_request
+
+        pages = paginate_offset(mock_client, "https://api.example.com/data", page_size=2, total_key=None)
+        await anext(pages)
+        await asyncio.sleep(0)
+
+        assert requested == [0, 2]
+        assert [page async for page in pages] == [[{"id": 2}, {"id": 3}]]
+
+    @pytest.mark.asyncio
+    async def test_invalid_prefetch_rejected(self) -> None:
+        with pytest.raises(ValueError, match="prefetch"):
+            await anext(paginate_offset(AsyncMock(spec=httpx.AsyncClient), "https://x", prefetch=0))
+
+
+class TestRateLimiting:
+    """Tests for Retry-After handling and the adaptive token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_retry_waits_for_retry_after(self) -> None:
+        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        limited = httpx.Response(429, headers={"Retry-After": "7"}, request=httpx.Request("GET", "https://x"))
+        mock_client.request.side_effect = [limited, _make_response(200)]
+
+        with patch("src.integrations.utils.asyncio.sleep", new=AsyncMock()) as sleep:
+            await retry_request(mock_client, "GET", "https://x", retry_delays=(0.01,))
+
+        sleep.assert_awaited_once_with(7.0)
+
+    def test_bucket_pauses_on_rate_limit_and_adapts_to_remaining_quota(self) -> None:
+        bucket = TokenBucket(rate=50, burst=5)
+
+        bucket.observe(429, {"Retry-After": "2"})
+        assert bucket._resume_at > time.monotonic() + 1
+
+        bucket.observe(200, {"X-RateLimit-Remaining": "30", "Retry-After": "60"})
+        assert bucket.rate == pytest.approx(0.5)
+
+        bucket.observe(200, {})
+        assert bucket.rate == 50
+
+    @pytest.mark.asyncio
+    async def test_bucket_spaces_requests_beyond_burst(self) -> None:
+        bucket = TokenBucket(rate=200, burst=2)
+
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+
+        # Two requests go out immediately, the other two wait 1/200 s each.
+        assert time.monotonic() - start >= 0.009
+
+    @pytest.mark.asyncio
+    async def test_connector_client_is_pooled_and_rate_limited(self) -> None:
+        client = get_connector_client("stub", "https://stub.example.com")
+        try:
+            assert get_connector_client("stub", "https://stub.example.com") is client
+            assert get_connector_client("stub", "https://other.example.com") is not client
+            assert isinstance(client._transport, RateLimitedTransport)
+        finally:
+            await close_connector_clients()
+
+        assert client.is_closed
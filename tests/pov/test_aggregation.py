@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from src.core.models.evidence import EvidenceFragment, EvidenceItem
-from src.pov.aggregation import AggregatedEvidence, aggregate_evidence
+from src.pov.aggregation import AggregatedEvidence, EvidenceRecord, aggregate_evidence, aggregate_evidence_projected
 
 
 @pytest.fixture
@@ -155,3 +155,53 @@ class TestAggregateEvidence:
         result = await aggregate_evidence(mock_session, eng_id)
 
         assert result.scope == "all"
+
+
+class TestAggregateEvidenceProjected:
+    """Tests for the column-projected aggregate_evidence_projected variant."""
+
+    @pytest.mark.asyncio
+    async def test_projects_items_and_fragments(self, mock_session):
+        """Evidence and fragment rows are projected into records and linked."""
+        eng_id = str(uuid.uuid4())
+        item_id = uuid.uuid4()
+        item_row = MagicMock(
+            id=item_id,
+            category="documents",
+            source_date=None,
+            completeness_score=0.5,
+            reliability_score=0.5,
+            freshness_score=0.5,
+            consistency_score=0.5,
+        )
+        item_row.name = "policy.pdf"
+        frag_row = MagicMock(id=uuid.uuid4(), evidence_id=item_id, content="Approve Invoice")
+
+        item_result = MagicMock()
+        item_result.all.return_value = [item_row]
+        frag_result = MagicMock()
+        frag_result.all.return_value = [frag_row]
+        mock_session.execute = AsyncMock(side_effect=[item_result, frag_result])
+
+        result = await aggregate_evidence_projected(mock_session, eng_id)
+
+        assert result.evidence_count == 1
+        assert result.fragment_count == 1
+        record = result.evidence_items[0]
+        assert isinstance(record, EvidenceRecord)
+        assert record.name == "policy.pdf"
+        assert record.quality_score == pytest.approx(0.5)
+        assert record.fragments == result.fragments
+        assert result.fragments[0].content == "Approve Invoice"
+
+    @pytest.mark.asyncio
+    async def test_skips_fragment_query_without_evidence(self, mock_session):
+        """No fragment query is issued when no evidence matches."""
+        empty = MagicMock()
+        empty.all.return_value = []
+        mock_session.execute = AsyncMock(return_value=empty)
+
+        result = await aggregate_evidence_projected(mock_session, str(uuid.uuid4()))
+
+        assert result.evidence_count == 0
+        mock_session.execute.assert_called_once()
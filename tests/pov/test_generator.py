@@ -45,9 +45,17 @@ def _make_fragment(evidence_id=None, content="The Finance Manager must Submit Re
     return frag
 
 
+def _max_version_result(version: int | None) -> MagicMock:
+    """Result of the ``max(ProcessModel.version)`` query."""
+    result = MagicMock()
+    result.scalar.return_value = version
+    return result
+
+
 @pytest.fixture
 def mock_session():
     session = AsyncMock()
+    session.execute = AsyncMock(return_value=_max_version_result(None))
     session.add = MagicMock()
     session.flush = AsyncMock()
     session.commit = AsyncMock()
@@ -244,3 +252,117 @@ class TestGeneratePov:
         assert "overall_confidence_level" in model.metadata_json
         assert "element_count" in model.metadata_json
         assert model.generated_at is not None
+
+    @pytest.mark.asyncio
+    async def test_incremental_generation_versions_after_previous(self, mock_session):
+        """Incremental mode versions after the latest model and records reuse statistics."""
+        eng_id = str(uuid.uuid4())
+        mock_session.execute.return_value = _max_version_result(3)
+        item = _make_evidence_item(eng_id)
+        frag = _make_fragment(item.id)
+        item.fragments = [frag]
+
+        from src.pov.incremental import PreviousGeneration
+        from src.semantic.entity_extraction import EntityType, ExtractedEntity
+
+        entity = ExtractedEntity(
+            id="ent_submit",
+            entity_type=EntityType.ACTIVITY,
+            name="Submit Request",
+            confidence=0.7,
+        )
+        previous_model = MagicMock(id=uuid.uuid4(), version=3)
+
+        with (
+            patch("src.pov.generator.aggregate_evidence") as mock_full_agg,
+            patch("src.pov.generator.aggregate_evidence_projected") as mock_agg,
+            patch("src.pov.generator.load_previous_generation") as mock_prev,
+            patch("src.pov.generator.extract_incremental") as mock_extract,
+        ):
+            mock_prev.return_value = PreviousGeneration(model=previous_model, evidence_ids={str(item.id)})
+            mock_agg.return_value = MagicMock(
+                evidence_count=1,
+                fragment_count=1,
+                evidence_items=[item],
+                fragments=[frag],
+            )
+            mock_extract.return_value = MagicMock(
+                entities=[entity],
+                raw_entity_count=1,
+                entity_to_evidence={entity.id: [str(item.id)]},
+                entity_to_fragments={entity.id: [str(frag.id)]},
+            )
+
+            result = await generate_pov(mock_session, eng_id, incremental=True)
+
+        mock_full_agg.assert_not_called()
+        assert result.success is True
+        model = result.process_model
+        assert model.version == 4
+        assert model.metadata_json["evidence_ids"] == [str(item.id)]
+        assert model.metadata_json["incremental"]["base_model_id"] == str(previous_model.id)
+        assert model.metadata_json["incremental"]["added_evidence"] == 0
+
+    def _extraction_for(self, item, frag):
+        from src.semantic.entity_extraction import EntityType, ExtractedEntity
+
+        entity = ExtractedEntity(
+            id="ent_submit", entity_type=EntityType.ACTIVITY, name="Submit Request", confidence=0.7
+        )
+        return MagicMock(
+            entities=[entity],
+            raw_entity_count=1,
+            entity_to_evidence={entity.id: [str(item.id)]},
+            entity_to_fragments={entity.id: [str(frag.id)]},
+        )
+
+    @pytest.mark.asyncio
+    async def test_full_generation_versions_after_incremental(self, mock_session):
+        """A full run after incremental runs still gets the next version number."""
+        eng_id = str(uuid.uuid4())
+        item = _make_evidence_item(eng_id)
+        frag = _make_fragment(item.id)
+        mock_session.execute.return_value = _max_version_result(3)
+
+        with (
+            patch("src.pov.generator.aggregate_evidence") as mock_agg,
+            patch("src.pov.generator.extract_from_evidence") as mock_extract,
+        ):
+            mock_agg.return_value = MagicMock(
+                evidence_count=1, fragment_count=1, evidence_items=[item], fragments=[frag]
+            )
+            mock_extract.return_value = self._extraction_for(item, frag)
+
+            result = await generate_pov(mock_session, eng_id)
+
+        assert result.process_model.version == 4
+
+    @pytest.mark.asyncio
+    async def test_incremental_sees_category_edit_on_unchanged_evidence(self, mock_session):
+        """Editing an item's category is reflected even though the evidence IDs are unchanged."""
+        from src.pov.incremental import PreviousGeneration
+        from src.pov.triangulation import get_evidence_plane, triangulate_elements
+
+        eng_id = str(uuid.uuid4())
+        item = _make_evidence_item(eng_id, category="bpm_process_models")
+        frag = _make_fragment(item.id)
+        previous = PreviousGeneration(model=MagicMock(id=uuid.uuid4()), evidence_ids={str(item.id)})
+
+        with (
+            patch("src.pov.generator.aggregate_evidence_projected") as mock_agg,
+            patch("src.pov.generator.load_previous_generation", return_value=previous),
+            patch("src.pov.generator.extract_incremental") as mock_extract,
+            patch("src.pov.generator.triangulate_elements", wraps=triangulate_elements) as spy,
+        ):
+            mock_agg.return_value = MagicMock(
+                evidence_count=1, fragment_count=1, evidence_items=[item], fragments=[frag]
+            )
+            mock_extract.return_value = self._extraction_for(item, frag)
+
+            result = await generate_pov(mock_session, eng_id, incremental=True)
+
+        assert result.success is True
+        # Planes are derived from the current evidence rows, not from the previous model
+        assert spy.call_args.args[2] == [item]
+        elements = triangulate_elements(*spy.call_args.args)
+        assert elements[0].supporting_planes == {get_evidence_plane("bpm_process_models")}
@@ -0,0 +1,108 @@
+"""Tests for incremental POV regeneration (evidence-delta driven)."""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.pov.aggregation import AggregatedEvidence, EvidenceRecord, FragmentRecord
+from src.pov.incremental import (
+    IncrementalStats,
+    PreviousGeneration,
+    compute_evidence_delta,
+    extract_incremental,
+)
+from src.semantic import extraction_cache
+from src.semantic.entity_extraction import EntityType, ExtractedEntity
+from src.semantic.extraction_cache import content_hash, deserialize_entity, serialize_entity
+
+
+def _record(category: str = "documents", content: str = "") -> EvidenceRecord:
+    item = EvidenceRecord(id=uuid.uuid4(), name="doc", category=category, reliability_score=0.8)
+    if content:
+        item.fragments.append(FragmentRecord(id=uuid.uuid4(), evidence_id=item.id, content=content))
+    return item
+
+
+def _entity(name: str, entity_type: EntityType = EntityType.ACTIVITY) -> ExtractedEntity:
+    return ExtractedEntity(
+        id=f"ent_{name.lower().replace(' ', '_')}", entity_type=entity_type, name=name, confidence=0.7
+    )
+
+
+class TestEvidenceRecord:
+    def test_quality_score_matches_orm_formula(self):
+        item = EvidenceRecord(
+            id=uuid.uuid4(),
+            completeness_score=0.4,
+            reliability_score=0.8,
+            freshness_score=0.6,
+            consistency_score=0.2,
+        )
+        assert item.quality_score == pytest.approx(0.5)
+
+
+class TestEntitySerialization:
+    def test_round_trip(self):
+        entity = _entity("Submit Request")
+        entity.aliases.append("Submit Requests")
+        entity.metadata["matched_seed_term"] = "submit request"
+
+        restored = deserialize_entity(serialize_entity(entity))
+
+        assert restored == entity
+        assert restored.entity_type is EntityType.ACTIVITY
+
+
+class TestComputeEvidenceDelta:
+    def test_added_and_removed(self):
+        kept, added = _record(), _record()
+        removed_id = str(uuid.uuid4())
+        previous = PreviousGeneration(evidence_ids={str(kept.id), removed_id})
+        aggregated = AggregatedEvidence(evidence_items=[kept, added])
+
+        delta = compute_evidence_delta(previous, aggregated)
+
+        assert delta.added == {str(added.id)}
+        assert delta.removed == {removed_id}
+        assert delta.touched == {str(added.id), removed_id}
+
+    def test_no_previous_marks_everything_added(self):
+        items = [_record(), _record()]
+        delta = compute_evidence_delta(PreviousGeneration(), AggregatedEvidence(evidence_items=items))
+        assert delta.added == {str(i.id) for i in items}
+        assert delta.removed == set()
+
+
+class TestExtractIncremental:
+    @pytest.mark.asyncio
+    async def test_only_uncached_fragments_are_extracted(self):
+        stored_item = _record(content="stored text")
+        new_item = _record(content="The Finance Manager must Submit Request for approval.")
+        stored_frag = stored_item.fragments[0]
+        aggregated = AggregatedEvidence(
+            evidence_items=[stored_item, new_item],
+            fragments=[stored_frag, new_item.fragments[0]],
+        )
+
+        row = MagicMock()
+        row.content_hash = content_hash("stored text")
+        row.entities = [serialize_entity(_entity("Approve Invoice"))]
+        result = MagicMock()
+        result.all.return_value = [row]
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        stats = IncrementalStats()
+
+        with patch.object(extraction_cache, "extract_entities", wraps=extraction_cache.extract_entities) as spy:
+            summary = await extract_incremental(session, aggregated, stats)
+
+        assert spy.call_count == 1
+        assert stats.reused_fragments == 1
+        assert stats.extracted_fragments == 1
+        names = {e.name for e in summary.entities}
+        assert "Approve Invoice" in names
+        assert "Submit Request" in names
+        assert summary.entity_to_evidence["ent_approve_invoice"] == [str(stored_item.id)]
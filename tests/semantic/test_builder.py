@@ -15,7 +15,7 @@ from neo4j.exceptions import Neo4jError
 
 from src.semantic.builder import BuildResult, KnowledgeGraphBuilder
 from src.semantic.embeddings import EmbeddingService
-from src.semantic.graph import GraphNode, KnowledgeGraphService
+from src.semantic.graph import GraphNode, KnowledgeGraphService, UpsertResult
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -37,12 +37,12 @@ def mock_graph_service() -> AsyncMock:
 
     service.create_node = AsyncMock(side_effect=_create_node)
 
-    # batch_create_nodes returns a list of ids matching input props
-    async def _batch_create_nodes(label: str, props_list: list) -> list:
-        return [p.get("id", uuid.uuid4().hex[:16]) for p in props_list]
+    # batch upserts report every row as newly created
+    async def _batch_upsert(kind: str, rows: list) -> UpsertResult:
+        return UpsertResult(created=len(rows))
 
-    service.batch_create_nodes = AsyncMock(side_effect=_batch_create_nodes)
-    service.batch_create_relationships = AsyncMock(return_value=0)
+    service.batch_upsert_nodes = AsyncMock(side_effect=_batch_upsert)
+    service.batch_upsert_relationships = AsyncMock(side_effect=_batch_upsert)
     service.create_relationship = AsyncMock()
     service.get_node = AsyncMock(return_value=None)
     return service
@@ -70,13 +70,20 @@ def builder(
 def _mock_db_session_with_fragments(fragments: list[tuple[str, str, str]]) -> AsyncMock:
     """Create a mock DB session that returns specific fragments.
 
+    The first query returns the fragments; later queries (extraction cache
+    lookups and inserts) return no rows.
+
     Args:
         fragments: List of (fragment_id, content, evidence_id) tuples.
     """
     session = AsyncMock()
     mock_result = MagicMock()
     mock_result.all.return_value = fragments
-    session.execute = AsyncMock(return_value=mock_result)
+    empty_result = MagicMock()
+    empty_result.all.return_value = []
+    results = iter([mock_result])
+    session.execute = AsyncMock(side_effect=lambda *_a, **_kw: next(results, empty_result))
+    session.begin_nested = MagicMock()
     return session
 
 
@@ -238,7 +245,7 @@ class TestNodeCreation:
         builder: KnowledgeGraphBuilder,
         mock_graph_service: AsyncMock,
     ) -> None:
-        """Should create a Neo4j node for each resolved entity via batch_create_nodes."""
+        """Should upsert a Neo4j node for each resolved entity via batch_upsert_nodes."""
         fragments = [
             (str(uuid.uuid4()), "The Operations Manager uses Oracle system", str(uuid.uuid4())),
         ]
@@ -246,9 +253,9 @@ class TestNodeCreation:
 
         result = await builder.build_knowledge_graph(session, "eng-1")
 
-        # batch_create_nodes should have been called at least once when entities were extracted
+        # batch_upsert_nodes should have been called at least once when entities were extracted
         if result.node_count > 0:
-            assert mock_graph_service.batch_create_nodes.call_count >= 1
+            assert mock_graph_service.batch_upsert_nodes.call_count >= 1
 
     @pytest.mark.asyncio
     async def test_nodes_scoped_to_engagement(
@@ -264,13 +271,33 @@ class TestNodeCreation:
 
         await builder.build_knowledge_graph(session, "eng-42")
 
-        # batch_create_nodes receives lists of property dicts — check every dict
-        for call in mock_graph_service.batch_create_nodes.call_args_list:
+        # batch_upsert_nodes receives lists of property dicts — check every dict
+        for call in mock_graph_service.batch_upsert_nodes.call_args_list:
             # args: (label, props_list)
             props_list = call.args[1] if len(call.args) > 1 else call.kwargs.get("props_list", [])
             for props in props_list:
                 assert props.get("engagement_id") == "eng-42"
 
+    @pytest.mark.asyncio
+    async def test_rebuild_reuses_node_ids(
+        self,
+        builder: KnowledgeGraphBuilder,
+        mock_graph_service: AsyncMock,
+    ) -> None:
+        """Rebuilding should upsert the same node ids rather than new ones."""
+        fragments = [
+            (str(uuid.uuid4()), "The Operations Manager uses Oracle system", str(uuid.uuid4())),
+        ]
+
+        await builder.build_knowledge_graph(_mock_db_session_with_fragments(fragments), "eng-1")
+        await builder.build_knowledge_graph(_mock_db_session_with_fragments(fragments), "eng-1")
+
+        calls = mock_graph_service.batch_upsert_nodes.call_args_list
+        assert calls
+        ids = [sorted(p["id"] for p in call.args[1]) for call in calls]
+        half = len(ids) // 2
+        assert ids[:half] == ids[half:]
+
 
 # ---------------------------------------------------------------------------
 # Embedding generation
@@ -335,7 +362,7 @@ class TestErrorHandling:
         """Should continue building even if individual node creation fails."""
         mock_graph = AsyncMock(spec=KnowledgeGraphService)
         mock_graph.create_node = AsyncMock(side_effect=Neo4jError("Neo4j error"))
-        mock_graph.batch_create_nodes = AsyncMock(side_effect=Neo4jError("Neo4j error"))
+        mock_graph.batch_upsert_nodes = AsyncMock(side_effect=Neo4jError("Neo4j error"))
         mock_graph.get_node = AsyncMock(return_value=None)
         mock_graph.create_relationship = AsyncMock()
 
@@ -0,0 +1,134 @@
+"""Tests for the persisted entity extraction cache."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.semantic import entity_extraction, extraction_cache
+from src.semantic.extraction_cache import (
+    ExtractionCache,
+    content_hash,
+    extractor_version,
+    purge_stale_entries,
+    seed_list_version,
+    serialize_entity,
+)
+
+_TEXT = "The Finance Manager must Submit Request for approval."
+
+
+def _session(cached_rows: list | None = None) -> MagicMock:
+    """Mock session whose first execute returns the given cache rows."""
+    lookup = MagicMock()
+    lookup.all.return_value = cached_rows or []
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=lookup)
+    return session
+
+
+class TestVersions:
+    def test_seed_list_version_ignores_order_and_case(self):
+        assert seed_list_version(["Approve", "submit"]) == seed_list_version(["SUBMIT", "approve"])
+
+    def test_seed_list_version_empty(self):
+        assert seed_list_version(None) == "none"
+        assert seed_list_version([]) == "none"
+        assert seed_list_version(["  "]) == "none"
+
+    def test_extractor_version_tracks_rules_version(self):
+        before = extractor_version()
+        try:
+            with patch.object(entity_extraction, "EXTRACTOR_RULES_VERSION", "test"):
+                extractor_version.cache_clear()
+                assert extractor_version() != before
+        finally:
+            extractor_version.cache_clear()
+        assert extractor_version() == before
+
+
+class TestExtractionCache:
+    @pytest.mark.asyncio
+    async def test_hit_skips_extraction(self):
+        result = await entity_extraction.extract_entities(_TEXT)
+        row = MagicMock()
+        row.content_hash = content_hash(_TEXT)
+        row.entities = [serialize_entity(e) for e in result.entities]
+        cache = ExtractionCache(_session([row]))
+
+        with patch.object(extraction_cache, "extract_entities", new=AsyncMock()) as spy:
+            cached = await cache.extract(_TEXT, fragment_id="f1")
+
+        spy.assert_not_called()
+        assert cache.hits == 1
+        assert cache.misses == 0
+        assert cached.fragment_id == "f1"
+        assert [e.name for e in cached.entities] == [e.name for e in result.entities]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_texts_extracted_once(self):
+        session = _session()
+        cache = ExtractionCache(session)
+
+        with patch.object(extraction_cache, "extract_entities", wraps=extraction_cache.extract_entities) as spy:
+            results = await cache.extract_many([("f1", _TEXT), ("f2", _TEXT)])
+
+        assert spy.call_count == 1
+        assert cache.misses == 2
+        assert [r.fragment_id for r in results] == ["f1", "f2"]
+        # One lookup plus one insert
+        assert session.execute.await_count == 2
+        # Each caller gets its own objects
+        assert results[0].entities[0] is not results[1].entities[0]
+
+    @pytest.mark.asyncio
+    async def test_blank_text_is_not_looked_up(self):
+        session = _session()
+        cache = ExtractionCache(session)
+
+        results = await cache.extract_many([("f1", "   "), ("f2", "")])
+
+        assert all(r.entities == [] for r in results)
+        assert cache.hits == cache.misses == 0
+
+    @pytest.mark.asyncio
+    async def test_lookup_failure_extracts_uncached(self):
+        session = _session()
+        session.execute = AsyncMock(side_effect=OperationalError("select", {}, Exception("down")))
+        cache = ExtractionCache(session)
+
+        results = await cache.extract_many([("f1", _TEXT)])
+
+        assert results[0].entities
+        assert cache.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_fragment_returned_as_exception(self):
+        cache = ExtractionCache(_session())
+        real = extraction_cache.extract_entities
+
+        async def _flaky(text, **kwargs):
+            if text == "boom":
+                raise ValueError("bad fragment")
+            return await real(text, **kwargs)
+
+        with patch.object(extraction_cache, "extract_entities", side_effect=_flaky):
+            results = await cache.extract_many([("f1", "boom"), ("f2", _TEXT)], return_exceptions=True)
+            with pytest.raises(ValueError):
+                await cache.extract_many([("f1", "boom")])
+
+        assert isinstance(results[0], ValueError)
+        assert results[1].entities
+
+
+class TestPurgeStaleEntries:
+    @pytest.mark.asyncio
+    async def test_commits_when_rows_deleted(self):
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(rowcount=4))
+        session.commit = AsyncMock()
+
+        assert await purge_stale_entries(session) == 4
+        session.commit.assert_awaited_once()
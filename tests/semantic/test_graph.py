@@ -10,6 +10,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from src.core.neo4j import KM_NODE_LABEL
 from src.semantic.graph import (
     VALID_NODE_LABELS,
     VALID_RELATIONSHIP_TYPES,
@@ -17,6 +18,7 @@ from src.semantic.graph import (
     GraphRelationship,
     GraphStats,
     KnowledgeGraphService,
+    UpsertResult,
 )
 
 # ---------------------------------------------------------------------------
@@ -39,8 +41,8 @@ def _make_mock_driver() -> MagicMock:
     mock_tx_result.data = AsyncMock(return_value=[])
     mock_tx.run = AsyncMock(return_value=mock_tx_result)
 
-    async def _execute_write(tx_func):
-        return await tx_func(mock_tx)
+    async def _execute_write(tx_func, *args):
+        return await tx_func(mock_tx, *args)
 
     mock_session.execute_write = AsyncMock(side_effect=_execute_write)
     mock_session._mock_tx = mock_tx  # expose for test assertions
@@ -161,6 +163,16 @@ class TestCreateNode:
         assert "CREATE" in call_args[0][0]
         assert "Evidence" in call_args[0][0]
 
+    @pytest.mark.asyncio
+    async def test_nodes_get_super_label(self, mock_driver: MagicMock, graph_service: KnowledgeGraphService) -> None:
+        """Single and batch node creation add the indexed super-label."""
+        await graph_service.create_node("Activity", {"name": "A", "engagement_id": "eng-1"})
+        await graph_service.batch_create_nodes("Role", [{"id": "r1", "name": "R", "engagement_id": "eng-1"}])
+
+        queries = [call.args[0] for call in mock_driver.session.return_value._mock_tx.run.call_args_list]
+        assert f"CREATE (n:Activity:{KM_NODE_LABEL})" in queries[0]
+        assert f"CREATE (n:Role:{KM_NODE_LABEL})" in queries[1]
+
 
 class TestGetNode:
     """Test node retrieval."""
@@ -175,6 +187,19 @@ class TestGetNode:
         assert node.label == "Activity"
         assert node.properties["name"] == "Test"
 
+    @pytest.mark.asyncio
+    async def test_get_node_uses_super_label_and_skips_it(
+        self, mock_driver: MagicMock, graph_service: KnowledgeGraphService
+    ) -> None:
+        """Lookup by id seeks the super-label index; the type label is reported."""
+        _set_query_result(mock_driver, [{"n": {"id": "node-1"}, "labels": [KM_NODE_LABEL, "Role"]}])
+
+        node = await graph_service.get_node("node-1")
+
+        query = mock_driver.session.return_value._mock_tx.run.call_args.args[0]
+        assert f"(n:{KM_NODE_LABEL} {{id: $node_id}})" in query
+        assert node is not None and node.label == "Role"
+
     @pytest.mark.asyncio
     async def test_get_node_not_found(self, mock_driver: MagicMock, graph_service: KnowledgeGraphService) -> None:
         """Should return None when node is not found."""
@@ -271,6 +296,100 @@ class TestCreateRelationship:
         query = mock_tx.run.call_args[0][0]
         assert "FOLLOWED_BY" in query
         assert "CREATE" in query
+        assert f"(a:{KM_NODE_LABEL} {{id: $from_id}}), (b:{KM_NODE_LABEL} {{id: $to_id}})" in query
+
+    @pytest.mark.asyncio
+    async def test_batch_relationships_match_by_super_label(
+        self, mock_driver: MagicMock, graph_service: KnowledgeGraphService
+    ) -> None:
+        """Batch creation resolves both endpoints through the super-label index."""
+        await graph_service.batch_create_relationships("USES", [{"from_id": "n1", "to_id": "n2"}])
+
+        query = mock_driver.session.return_value._mock_tx.run.call_args.args[0]
+        assert f"(a:{KM_NODE_LABEL} {{id: rel.from_id}}), (b:{KM_NODE_LABEL} {{id: rel.to_id}})" in query
+
+
+class TestBatchUpsert:
+    """Tests for the MERGE-based chunked batch upserts."""
+
+    @staticmethod
+    def _count_merges(mock_driver: MagicMock, existing: set[str], counter: str) -> list[list[dict]]:
+        """Make each chunk report rows not in ``existing`` as created."""
+        chunks: list[list[dict]] = []
+
+        async def _run(query, params):
+            rows = params["rows"]
+            chunks.append(rows)
+            created = sum(1 for row in rows if row.get("id") not in existing and row.get("from_id") not in existing)
+            result = AsyncMock()
+            result.single = AsyncMock(return_value={"merged": len(rows)})
+            result.consume = AsyncMock(return_value=MagicMock(counters=MagicMock(**{counter: created})))
+            return result
+
+        mock_driver.session.return_value._mock_tx.run = AsyncMock(side_effect=_run)
+        return chunks
+
+    @pytest.mark.asyncio
+    async def test_nodes_merge_on_super_label_id_in_chunks(
+        self, graph_service: KnowledgeGraphService, mock_driver: MagicMock
+    ) -> None:
+        chunks = self._count_merges(mock_driver, {"n1"}, "nodes_created")
+        props = [{"id": f"n{i}", "name": f"A{i}", "engagement_id": "eng-1"} for i in range(5)]
+
+        result = await graph_service.batch_upsert_nodes("Activity", props, chunk_size=2)
+
+        assert result == UpsertResult(created=4, matched=1)
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        query = mock_driver.session.return_value._mock_tx.run.call_args.args[0]
+        assert f"MERGE (n:{KM_NODE_LABEL} {{id: props.id}})" in query
+        assert "SET n += props, n:Activity" in query
+
+    @pytest.mark.asyncio
+    async def test_nodes_deduplicate_ids_last_wins(
+        self, graph_service: KnowledgeGraphService, mock_driver: MagicMock
+    ) -> None:
+        chunks = self._count_merges(mock_driver, set(), "nodes_created")
+        props = [
+            {"id": "n1", "name": "old", "engagement_id": "eng-1"},
+            {"id": "n1", "name": "new", "engagement_id": "eng-1"},
+        ]
+
+        result = await graph_service.batch_upsert_nodes("Activity", props)
+
+        assert result.total == 1
+        assert chunks == [[{"id": "n1", "name": "new", "engagement_id": "eng-1"}]]
+
+    @pytest.mark.asyncio
+    async def test_relationships_merge_on_endpoints_and_type(
+        self, graph_service: KnowledgeGraphService, mock_driver: MagicMock
+    ) -> None:
+        chunks = self._count_merges(mock_driver, {"a"}, "relationships_created")
+        rels = [
+            {"from_id": "a", "to_id": "b", "properties": {"weight": 1}},
+            {"from_id": "b", "to_id": "c"},
+            {"from_id": "b", "to_id": "c", "properties": {"weight": 2}},
+        ]
+
+        result = await graph_service.batch_upsert_relationships("FOLLOWED_BY", rels)
+
+        assert result == UpsertResult(created=1, matched=1)
+        assert [row["props"] for row in chunks[0]] == [{"weight": 1}, {"weight": 2}]
+        query = mock_driver.session.return_value._mock_tx.run.call_args.args[0]
+        assert "MERGE (a)-[r:FOLLOWED_BY]->(b)" in query
+        assert "ON CREATE SET r.id = rel.id" in query
+
+    @pytest.mark.asyncio
+    async def test_empty_payload_skips_neo4j(
+        self, graph_service: KnowledgeGraphService, mock_driver: MagicMock
+    ) -> None:
+        assert await graph_service.batch_upsert_nodes("Activity", []) == UpsertResult()
+        assert await graph_service.batch_upsert_relationships("FOLLOWED_BY", []) == UpsertResult()
+        mock_driver.session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_positive_chunk_size(self, graph_service: KnowledgeGraphService) -> None:
+        with pytest.raises(ValueError, match="chunk_size"):
+            await graph_service.batch_upsert_nodes("Activity", [{"id": "n1"}], chunk_size=0)
 
 
 class TestGetRelationships:
@@ -460,6 +579,89 @@ class TestEngagementSubgraph:
         assert subgraph["relationships"] == []
 
 
+def _data_result(rows: list[dict]) -> AsyncMock:
+    result = AsyncMock()
+    result.data = AsyncMock(return_value=rows)
+    return result
+
+
+def _node_rows(*ids: str) -> list[dict]:
+    return [{"n": {"id": node_id}, "labels": [KM_NODE_LABEL, "Activity"]} for node_id in ids]
+
+
+class TestSubgraphPagination:
+    """Test keyset-paginated subgraph reads."""
+
+    @pytest.mark.asyncio
+    async def test_node_page_cursor_resumes_after_last_id(
+        self, mock_driver: MagicMock, graph_service: KnowledgeGraphService
+    ) -> None:
+        tx = mock_driver.session.return_value._mock_tx
+        tx.run = AsyncMock(side_effect=[_data_result(_node_rows("n1", "n2")), _data_result(_node_rows("n3"))])
+
+        first, cursor = await graph_service.get_engagement_node_page("eng-1", limit=2)
+        second, last_cursor = await graph_service.get_engagement_node_page("eng-1", cursor, limit=2)
+
+        assert [n.id for n in first + second] == ["n1", "n2", "n3"]
+        assert first[0].label == "Activity"
+        assert last_cursor is None
+        first_params, second_params = (call.args[1] for call in tx.run.call_args_list)
+        assert first_params["after"] == ""
+        assert second_params["after"] == "n2"
+        assert "ORDER BY n.id" in tx.run.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_relationship_cursor_carries_source_and_element_id(
+        self, mock_driver: MagicMock, graph_service: KnowledgeGraphService
+    ) -> None:
+        row = {"r": {}, "from_id": "n1", "to_id": "n2", "rel_type": "USES", "rel_element_id": "5:x:7"}
+        tx = mock_driver.session.return_value._mock_tx
+        tx.run = AsyncMock(side_effect=[_data_result([row]), _data_result([])])
+
+        rels, cursor = await graph_service.get_engagement_relationship_page("eng-1", limit=1)
+        await graph_service.get_engagement_relationship_page("eng-1", cursor, limit=1)
+
+        assert rels[0].id == "5:x:7"
+        params = tx.run.call_args.args[1]
+        assert (params["after_from"], params["after_rel"]) == ("n1", "5:x:7")
+
+    @pytest.mark.asyncio
+    async def test_iter_subgraph_pages_nodes_then_relationships(
+        self, mock_driver: MagicMock, graph_service: KnowledgeGraphService
+    ) -> None:
+        rel = {"r": {"id": "r1"}, "from_id": "n1", "to_id": "n2", "rel_type": "USES", "rel_element_id": "e1"}
+        mock_driver.session.return_value._mock_tx.run = AsyncMock(
+            side_effect=[
+                _data_result(_node_rows("n1", "n2")),
+                _data_result(_node_rows("n3")),
+                _data_result([rel]),
+            ]
+        )
+
+        pages = [page async for page in graph_service.iter_engagement_subgraph("eng-1", page_size=2)]
+
+        assert [[element.id for element in page] for page in pages] == [["n1", "n2"], ["n3"], ["r1"]]
+
+    @pytest.mark.asyncio
+    async def test_list_nodes_filters_by_label(
+        self, mock_driver: MagicMock, graph_service: KnowledgeGraphService
+    ) -> None:
+        tx = mock_driver.session.return_value._mock_tx
+        tx.run = AsyncMock(return_value=_data_result(_node_rows("n1")))
+
+        nodes = await graph_service.list_engagement_nodes("eng-1", "Application")
+
+        assert [n.id for n in nodes] == ["n1"]
+        assert "AND n:Application" in tx.run.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_cursor_and_label(self, graph_service: KnowledgeGraphService) -> None:
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await graph_service.get_engagement_node_page("eng-1", "not-a-cursor")
+        with pytest.raises(ValueError, match="Invalid node label"):
+            await graph_service.list_engagement_nodes("eng-1", "Bogus")
+
+
 # ---------------------------------------------------------------------------
 # Statistics
 # ---------------------------------------------------------------------------
@@ -499,6 +701,10 @@ class TestGetStats:
         assert stats.nodes_by_label == {"Activity": 5, "Role": 3}
         assert stats.relationships_by_type == {"SUPPORTED_BY": 8, "OWNED_BY": 4}
 
+        node_query = mock_session._mock_tx.run.call_args_list[0].args[0]
+        assert f"MATCH (n:{KM_NODE_LABEL} {{engagement_id: $engagement_id}})" in node_query
+        assert f"label <> '{KM_NODE_LABEL}'" in node_query
+
     @pytest.mark.asyncio
     async def test_get_stats_empty_graph(self, mock_driver: MagicMock, graph_service: KnowledgeGraphService) -> None:
         """Should return zero counts for empty graph."""
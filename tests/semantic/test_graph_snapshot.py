@@ -0,0 +1,212 @@
+"""Tests for in-memory CSR graph snapshots."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+import src.semantic.graph as graph_mod
+from src.semantic.graph import GraphNode, GraphRelationship
+from src.semantic.graph_snapshot import GraphSnapshot, GraphSnapshotCache, load_graph_snapshot
+
+
+def _nodes(*ids: str, label: str = "Activity") -> list[tuple[str, str]]:
+    return [(node_id, label) for node_id in ids]
+
+
+def _edges(*pairs: str) -> list[tuple[str, str, str]]:
+    return [(pair[0], pair[1], "PRECEDES") for pair in pairs]
+
+
+class TestBuild:
+    def test_encodes_labels_and_types(self) -> None:
+        snapshot = GraphSnapshot.build(
+            "e1",
+            [("a", "Activity"), ("b", "Role"), ("c", "Activity")],
+            [("a", "b", "PERFORMED_BY"), ("c", "b", "PERFORMED_BY"), ("a", "c", "PRECEDES")],
+        )
+
+        assert snapshot.node_count == 3
+        assert snapshot.edge_count == 3
+        assert snapshot.nodes_by_label() == {"Activity": 2, "Role": 1}
+        assert snapshot.relationships_by_type() == {"PERFORMED_BY": 2, "PRECEDES": 1}
+
+    def test_drops_edges_to_unknown_nodes_and_duplicate_nodes(self) -> None:
+        snapshot = GraphSnapshot.build("e1", _nodes("a", "b", "a"), _edges("ab", "ax"))
+
+        assert snapshot.node_ids == ["a", "b"]
+        assert snapshot.edge_count == 1
+
+    def test_empty_graph(self) -> None:
+        snapshot = GraphSnapshot.build("e1", [], [])
+
+        assert snapshot.component_sizes().size == 0
+        assert snapshot.degree_distribution() == {}
+        assert snapshot.pagerank().size == 0
+        assert snapshot.betweenness().size == 0
+
+
+class TestDegreesAndComponents:
+    def test_degrees_and_orphans(self) -> None:
+        snapshot = GraphSnapshot.build("e1", _nodes("a", "b", "c", "d"), _edges("ab", "ac", "cb"))
+
+        assert snapshot.out_degree.tolist() == [2, 0, 1, 0]
+        assert snapshot.in_degree.tolist() == [0, 2, 1, 0]
+        assert snapshot.degree_distribution() == {0: 1, 2: 3}
+        assert snapshot.orphans() == ["d"]
+
+    def test_chain_is_one_component(self) -> None:
+        snapshot = GraphSnapshot.build("e1", _nodes("a", "b", "c", "d"), _edges("ab", "cb", "dc"))
+
+        assert snapshot.component_sizes().tolist() == [4]
+
+    def test_separate_clusters_and_orphans(self) -> None:
+        snapshot = GraphSnapshot.build("e1", _nodes("a", "b", "c", "d", "e", "f"), _edges("ab", "dc", "ec", "ff"))
+
+        assert snapshot.component_sizes().tolist() == [3, 2, 1]
+        assert snapshot.components[0] == snapshot.components[1]
+        assert snapshot.components[0] != snapshot.components[2]
+
+    def test_components_match_union_find_on_random_graph(self) -> None:
+        rng = np.random.default_rng(7)
+        n = 500
+        ids = [str(i) for i in range(n)]
+        pairs = rng.integers(0, n, size=(400, 2))
+        snapshot = GraphSnapshot.build("e1", _nodes(*ids), [(ids[a], ids[b], "R") for a, b in pairs])
+
+        parent = list(range(n))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for a, b in pairs:
+            parent[find(a)] = find(b)
+        expected = {}
+        for node in range(n):
+            expected.setdefault(find(node), []).append(node)
+
+        assert sorted(snapshot.component_sizes().tolist()) == sorted(len(m) for m in expected.values())
+        for members in expected.values():
+            assert len({snapshot.components[m] for m in members}) == 1
+
+
+class TestCentrality:
+    def test_pagerank_sums_to_one_and_favours_sink(self) -> None:
+        snapshot = GraphSnapshot.build(
+            "e1",
+            _nodes("a", "b", "c", "hub"),
+            [("a", "hub", "R"), ("b", "hub", "R"), ("c", "hub", "R")],
+        )
+
+        rank = snapshot.pagerank()
+
+        assert rank.sum() == pytest.approx(1.0)
+        assert int(np.argmax(rank)) == 3
+
+    def test_betweenness_of_star_centre(self) -> None:
+        snapshot = GraphSnapshot.build("e1", _nodes("c", "a", "b", "d", "e"), _edges("ca", "bc", "cd", "ec"))
+
+        scores = snapshot.betweenness()
+
+        # Every pair of the four leaves routes through the centre.
+        assert scores.tolist() == [6.0, 0.0, 0.0, 0.0, 0.0]
+
+    def test_betweenness_counts_parallel_shortest_paths(self) -> None:
+        # Square a-b-d, a-c-d: b and c each carry half of the a-d pair.
+        snapshot = GraphSnapshot.build("e1", _nodes("a", "b", "c", "d"), _edges("ab", "ac", "bd", "cd"))
+
+        assert snapshot.betweenness().tolist() == pytest.approx([0.5, 0.5, 0.5, 0.5])
+
+    def test_sampled_betweenness_scales_to_node_count(self) -> None:
+        snapshot = GraphSnapshot.build("e1", _nodes("c", "a", "b", "d", "e"), _edges("ca", "cb", "cd", "ce"))
+
+        scores = snapshot.betweenness(samples=4, seed=1)
+
+        assert scores[0] > 0
+        assert scores[1:].tolist() == [0.0, 0.0, 0.0, 0.0]
+
+
+class TestShortestPath:
+    def test_undirected_and_directed_paths(self) -> None:
+        snapshot = GraphSnapshot.build("e1", _nodes("a", "b", "c", "d"), _edges("ab", "bc", "ad", "dc"))
+
+        assert snapshot.shortest_path("c", "a") in (["c", "b", "a"], ["c", "d", "a"])
+        assert snapshot.shortest_path("a", "c", directed=True) in (["a", "b", "c"], ["a", "d", "c"])
+        assert snapshot.shortest_path("c", "a", directed=True) is None
+        assert snapshot.shortest_path("a", "a") == ["a"]
+
+    def test_unknown_node_raises_key_error(self) -> None:
+        snapshot = GraphSnapshot.build("e1", _nodes("a"), [])
+
+        with pytest.raises(KeyError):
+            snapshot.shortest_path("a", "zzz")
+
+
+def _graph_service(calls: list[str]) -> MagicMock:
+    async def iter_subgraph(engagement_id: str, page_size: int, properties: bool = True):
+        calls.append(engagement_id)
+        assert properties is False
+        await asyncio.sleep(0)
+        yield [GraphNode(id="a", label="Activity"), GraphNode(id="b", label="Role")]
+        yield [GraphRelationship(id="r1", from_id="a", to_id="b", relationship_type="PERFORMED_BY")]
+
+    service = MagicMock()
+    service.iter_engagement_subgraph = iter_subgraph
+    return service
+
+
+@pytest.mark.asyncio
+class TestLoadAndCache:
+    async def test_load_reads_topology_pages(self) -> None:
+        snapshot = await load_graph_snapshot(_graph_service([]), "e1")
+
+        assert snapshot.node_ids == ["a", "b"]
+        assert snapshot.relationships_by_type() == {"PERFORMED_BY": 1}
+
+    async def test_cache_shares_concurrent_loads(self) -> None:
+        calls: list[str] = []
+        service = _graph_service(calls)
+        cache = GraphSnapshotCache(ttl_seconds=60)
+
+        first, second = await asyncio.gather(cache.get(service, "e1"), cache.get(service, "e1"))
+
+        assert first is second
+        assert calls == ["e1"]
+
+    async def test_graph_write_invalidates_snapshot(self) -> None:
+        calls: list[str] = []
+        service = _graph_service(calls)
+        cache = GraphSnapshotCache(ttl_seconds=60)
+
+        first = await cache.get(service, "e1")
+        graph_mod._bump_write_generation()
+        second = await cache.get(service, "e1")
+
+        assert first is not second
+        assert calls == ["e1", "e1"]
+
+    async def test_zero_ttl_disables_caching(self) -> None:
+        calls: list[str] = []
+        cache = GraphSnapshotCache(ttl_seconds=0)
+
+        await cache.get(_graph_service(calls), "e1")
+        await cache.get(_graph_service(calls), "e1")
+
+        assert calls == ["e1", "e1"]
+
+    async def test_evicts_least_recently_used_engagement(self) -> None:
+        calls: list[str] = []
+        service = _graph_service(calls)
+        cache = GraphSnapshotCache(ttl_seconds=60, max_engagements=1)
+
+        await cache.get(service, "e1")
+        await cache.get(service, "e2")
+        await cache.get(service, "e1")
+
+        assert calls == ["e1", "e2", "e1"]
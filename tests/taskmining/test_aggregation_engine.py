@@ -0,0 +1,340 @@
+"""Tests for the streaming session aggregation engine."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.core.models.taskmining import ActionCategory
+from src.core.redis import TASK_MINING_STREAM
+from src.taskmining.aggregation.classifier import ActionClassifier
+from src.taskmining.aggregation.engine import (
+    CHECKPOINT_KEY_PREFIX,
+    TASK_MINING_GROUP,
+    StreamingAggregationEngine,
+    action_id_for,
+)
+
+SESSION_ID = str(uuid.uuid4())
+ENGAGEMENT_ID = str(uuid.uuid4())
+_BASE = datetime(2026, 2, 25, 10, 0, 0, tzinfo=UTC)
+
+
+class _FakeRedis:
+    """Checkpoint and XACK subset of the async Redis client."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.acked: list[str] = []
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.values.get(key) for key in keys]
+
+    async def xack(self, stream: str, group: str, *msg_ids: str) -> int:
+        assert (stream, group) == (TASK_MINING_STREAM, TASK_MINING_GROUP)
+        self.acked.extend(msg_ids)
+        return len(msg_ids)
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, str, str | None]] = []
+
+    def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self._ops.append(("set", key, value))
+
+    def delete(self, key: str) -> None:
+        self._ops.append(("delete", key, None))
+
+    async def execute(self) -> list[Any]:
+        for op, key, value in self._ops:
+            if op == "set":
+                self._redis.values[key] = value
+            else:
+                self._redis.values.pop(key, None)
+        return []
+
+
+class _FakeDatabase:
+    """async_sessionmaker stand-in recording bulk-inserted rows."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.actions: dict[uuid.UUID, dict[str, Any]] = {}
+        self.evidence: dict[uuid.UUID, dict[str, Any]] = {}
+        self.action_counts: dict[uuid.UUID, int] = {}
+        self.failures = failures
+        self.commits = 0
+
+    def __call__(self) -> MagicMock:
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=self._execute)
+        session.commit = AsyncMock(side_effect=self._commit)
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=session)
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        return ctx
+
+    async def _execute(self, stmt: Any, rows: list[dict[str, Any]]) -> MagicMock:
+        if self.failures:
+            self.failures -= 1
+            raise OperationalError("INSERT", {}, Exception("connection reset"))
+        result = MagicMock()
+        table = stmt.table.name
+        if table == "task_mining_sessions":
+            for row in rows:
+                sid = row["b_session_id"]
+                self.action_counts[sid] = self.action_counts.get(sid, 0) + row["b_actions"]
+            return result
+        store = self.actions if table == "task_mining_actions" else self.evidence
+        new = [row for row in rows if row["id"] not in store]
+        store.update((row["id"], row) for row in new)
+        key = "session_id" if table == "task_mining_actions" else "id"
+        result.all.return_value = [(row[key],) for row in new]
+        return result
+
+    async def _commit(self) -> None:
+        self.commits += 1
+
+
+def _msg_id(i: int) -> str:
+    return f"{int(time.time() * 1000)}-{i}"
+
+
+def _event(event_type: str, app: str, seconds: int) -> dict[str, Any]:
+    return {
+        "task_type": "aggregate",
+        "event_type": event_type,
+        "session_id": SESSION_ID,
+        "engagement_id": ENGAGEMENT_ID,
+        "application_name": app,
+        "window_title": f"{app} window",
+        "timestamp": str(_BASE + timedelta(seconds=seconds)),
+    }
+
+
+def _engine(redis: _FakeRedis, db: _FakeDatabase, **kwargs: Any) -> StreamingAggregationEngine:
+    options: dict[str, Any] = {"shard_count": 2, "flush_interval": 0.01, "classifier": ActionClassifier()}
+    options.update(kwargs)
+    return StreamingAggregationEngine(redis, db, **options)
+
+
+async def _run(engine: StreamingAggregationEngine, entries: list[tuple[str, dict[str, Any]]], **kwargs: Any) -> None:
+    """Start the engine, submit entries and stop it once they are applied."""
+    await engine.start()
+    for msg_id, task in entries:
+        await engine.submit(msg_id, task, **kwargs)
+    await engine.stop()
+
+
+async def _wait_for(condition: Any, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+class TestStreamingAggregation:
+    @pytest.mark.asyncio
+    async def test_app_switch_completes_action_and_acks(self) -> None:
+        redis, db = _FakeRedis(), _FakeDatabase()
+        engine = _engine(redis, db)
+        entries = [
+            (_msg_id(0), _event("app_switch", "Excel", 0)),
+            (_msg_id(1), _event("keyboard_action", "Excel", 5)),
+            (_msg_id(2), _event("keyboard_action", "Excel", 20)),
+            (_msg_id(3), _event("app_switch", "Outlook", 60)),
+        ]
+        await _run(engine, entries)
+
+        (action,) = db.actions.values()
+        assert action["application_name"] == "Excel"
+        assert action["event_count"] == 2
+        assert action["duration_seconds"] == 60
+        assert action["session_id"] == uuid.UUID(SESSION_ID)
+        assert isinstance(action["category"], ActionCategory)
+        assert action["evidence_item_id"] in db.evidence
+        assert db.action_counts == {uuid.UUID(SESSION_ID): 1}
+        assert redis.acked == [msg_id for msg_id, _ in entries]
+
+        metrics = engine.get_metrics()
+        assert metrics["events"] == 4
+        assert metrics["actions"] == 1
+        assert metrics["evidence_items"] == 1
+        assert metrics["last_lag_ms"] >= 0
+        assert metrics["p95_lag_ms"] == metrics["max_lag_ms"]
+
+    @pytest.mark.asyncio
+    async def test_classifies_each_batch_with_one_call(self) -> None:
+        redis, db = _FakeRedis(), _FakeDatabase()
+        classifier = MagicMock(wraps=ActionClassifier())
+        engine = _engine(redis, db, classifier=classifier, flush_interval=1.0)
+        apps = ["Excel", "Outlook", "Chrome", "Excel"]
+        entries = [(_msg_id(i), _event("app_switch", app, i * 30)) for i, app in enumerate(apps)]
+        await _run(engine, entries)
+
+        assert len(db.actions) == 3
+        classifier.classify_batch.assert_called_once()
+        classifier.classify.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_events_are_sorted_within_a_batch(self) -> None:
+        redis, db = _FakeRedis(), _FakeDatabase()
+        engine = _engine(redis, db, flush_interval=1.0)
+        entries = [
+            (_msg_id(0), _event("app_switch", "Outlook", 60)),
+            (_msg_id(1), _event("app_switch", "Excel", 0)),
+            (_msg_id(2), _event("mouse_click", "Excel", 10)),
+        ]
+        await _run(engine, entries)
+
+        (action,) = db.actions.values()
+        assert action["application_name"] == "Excel"
+        assert action["event_count"] == 1
+
+
+class TestCheckpointing:
+    @pytest.mark.asyncio
+    async def test_open_session_resumes_on_another_engine(self) -> None:
+        redis, db = _FakeRedis(), _FakeDatabase()
+        await _run(
+            _engine(redis, db),
+            [(_msg_id(0), _event("app_switch", "Excel", 0)), (_msg_id(1), _event("keyboard_action", "Excel", 5))],
+        )
+        assert not db.actions
+        checkpoint = json.loads(redis.values[f"{CHECKPOINT_KEY_PREFIX}{SESSION_ID}"])
+        assert checkpoint["aggregator"]["active_session"]["app_bundle_id"] == "Excel"
+
+        # A different process picks the session up from its checkpoint
+        await _run(_engine(redis, db), [(_msg_id(2), _event("app_switch", "Outlook", 40))])
+
+        (action,) = db.actions.values()
+        assert action["application_name"] == "Excel"
+        assert action["event_count"] == 1
+        assert action["started_at"] == _BASE
+
+    @pytest.mark.asyncio
+    async def test_redelivered_entries_already_applied_are_skipped(self) -> None:
+        redis, db = _FakeRedis(), _FakeDatabase()
+        first = [(_msg_id(0), _event("app_switch", "Excel", 0)), (_msg_id(1), _event("keyboard_action", "Excel", 5))]
+        await _run(_engine(redis, db), first)
+
+        engine = _engine(redis, db)
+        await _run(engine, first, redelivered=True)
+
+        assert engine.metrics.duplicates == 2
+        assert engine.metrics.events == 0
+        checkpoint = json.loads(redis.values[f"{CHECKPOINT_KEY_PREFIX}{SESSION_ID}"])
+        assert checkpoint["aggregator"]["active_session"]["total_event_count"] == 1
+        assert redis.acked.count(first[0][0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_replayed_actions_are_not_inserted_twice(self) -> None:
+        redis, db = _FakeRedis(), _FakeDatabase()
+        entries = [(_msg_id(0), _event("app_switch", "Excel", 0)), (_msg_id(1), _event("app_switch", "Outlook", 30))]
+        await _run(_engine(redis, db), entries)
+        # Crash between commit and checkpoint: the entries replay from scratch
+        redis.values.clear()
+        engine = _engine(redis, db)
+        await _run(engine, entries, redelivered=True)
+
+        assert len(db.actions) == 1
+        assert engine.metrics.actions == 0
+        assert db.action_counts == {uuid.UUID(SESSION_ID): 1}
+
+
+class TestSessionClosing:
+    @pytest.mark.asyncio
+    async def test_materialize_closes_the_open_session(self) -> None:
+        redis, db = _FakeRedis(), _FakeDatabase()
+        materialize = {"task_type": "materialize", "session_id": SESSION_ID, "engagement_id": ENGAGEMENT_ID}
+        entries = [
+            (_msg_id(0), _event("app_switch", "Excel", 0)),
+            (_msg_id(1), _event("keyboard_action", "Excel", 45)),
+            (_msg_id(2), materialize),
+        ]
+        await _run(_engine(redis, db), entries)
+
+        (action,) = db.actions.values()
+        assert action["ended_at"] == _BASE + timedelta(seconds=45)
+        checkpoint = json.loads(redis.values[f"{CHECKPOINT_KEY_PREFIX}{SESSION_ID}"])
+        assert checkpoint["aggregator"]["active_session"] is None
+
+    @pytest.mark.asyncio
+    async def test_silent_sessions_expire(self) -> None:
+        redis, db = _FakeRedis(), _FakeDatabase()
+        engine = _engine(redis, db, session_timeout=0.05)
+        await engine.start()
+        await engine.submit(_msg_id(0), _event("app_switch", "Excel", 0))
+        await engine.submit(_msg_id(1), _event("keyboard_action", "Excel", 12))
+        await _wait_for(lambda: engine.metrics.expired_sessions == 1)
+        await engine.stop()
+
+        (action,) = db.actions.values()
+        assert action["ended_at"] == _BASE + timedelta(seconds=12)
+        assert f"{CHECKPOINT_KEY_PREFIX}{SESSION_ID}" not in redis.values
+        assert engine.get_metrics()["open_sessions"] == 0
+
+
+class TestFailures:
+    @pytest.mark.asyncio
+    async def test_database_outage_retries_the_batch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("src.taskmining.aggregation.engine._RETRY_BASE_SECONDS", 0.01)
+        redis, db = _FakeRedis(), _FakeDatabase(failures=2)
+        engine = _engine(redis, db)
+        entries = [
+            (_msg_id(0), _event("app_switch", "Excel", 0)),
+            (_msg_id(1), _event("keyboard_action", "Excel", 5)),
+            (_msg_id(2), _event("app_switch", "Outlook", 30)),
+        ]
+        await engine.start()
+        for msg_id, task in entries:
+            await engine.submit(msg_id, task)
+        await _wait_for(lambda: len(redis.acked) == len(entries))
+        await engine.stop()
+
+        (action,) = db.actions.values()
+        assert action["event_count"] == 1
+        assert engine.metrics.retries == 2
+        assert sorted(redis.acked) == sorted(msg_id for msg_id, _ in entries)
+
+    @pytest.mark.asyncio
+    async def test_malformed_entries_are_acked_and_dropped(self) -> None:
+        redis, db = _FakeRedis(), _FakeDatabase()
+        engine = _engine(redis, db)
+        bad_timestamp = {**_event("keyboard_action", "Excel", 0), "timestamp": "yesterday-ish"}
+        await _run(engine, [(_msg_id(0), {"task_type": "aggregate"}), (_msg_id(1), bad_timestamp)])
+
+        assert engine.metrics.malformed == 2
+        assert len(redis.acked) == 2
+
+    @pytest.mark.asyncio
+    async def test_submit_requires_a_running_engine(self) -> None:
+        engine = _engine(_FakeRedis(), _FakeDatabase())
+        with pytest.raises(RuntimeError):
+            await engine.submit(_msg_id(0), _event("app_switch", "Excel", 0))
+
+
+def test_shard_assignment_is_stable() -> None:
+    engine = _engine(_FakeRedis(), _FakeDatabase(), shard_count=8)
+    other = _engine(_FakeRedis(), _FakeDatabase(), shard_count=8)
+    assert engine.shard_for(SESSION_ID) == other.shard_for(SESSION_ID)
+    assert 0 <= engine.shard_for(SESSION_ID) < 8
+
+
+def test_action_id_is_deterministic() -> None:
+    from src.taskmining.aggregation.session import AggregatedSession
+
+    session = AggregatedSession("Excel", None, _BASE, session_id=SESSION_ID)
+    assert action_id_for(session) == action_id_for(AggregatedSession("Excel", "other", _BASE, session_id=SESSION_ID))
@@ -0,0 +1,87 @@
+"""Tests for agent upload body decoding."""
+
+from __future__ import annotations
+
+import gzip
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.taskmining import compression
+from src.taskmining.compression import (
+    BodyDecodingError,
+    DecodedBodyTooLargeError,
+    DictionaryConflictError,
+    UnknownDictionaryError,
+    UnsupportedContentEncodingError,
+    decode_request_body,
+    register_dictionary,
+)
+
+EVENTS = b'{"events": [' + b",".join(b'{"event_type": "app_switch", "seq": %d}' % i for i in range(200)) + b"]}"
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.expire = AsyncMock()
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None, nx: bool = False) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+
+@pytest.mark.asyncio
+async def test_identity_and_gzip() -> None:
+    assert await decode_request_body(EVENTS, None, None) == EVENTS
+    assert await decode_request_body(gzip.compress(EVENTS), "gzip", None) == EVENTS
+
+
+@pytest.mark.asyncio
+async def test_gzip_bomb_capped() -> None:
+    with pytest.raises(DecodedBodyTooLargeError):
+        await decode_request_body(gzip.compress(b"\0" * 100_000), "gzip", None, max_bytes=1000)
+
+
+@pytest.mark.asyncio
+async def test_truncated_gzip_rejected() -> None:
+    with pytest.raises(BodyDecodingError):
+        await decode_request_body(gzip.compress(EVENTS)[:-20], "gzip", None)
+
+
+@pytest.mark.asyncio
+async def test_zstd_without_package_is_unsupported(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(compression, "_HAS_ZSTD", False)
+    with pytest.raises(UnsupportedContentEncodingError):
+        await decode_request_body(b"", "zstd", None)
+    with pytest.raises(UnsupportedContentEncodingError):
+        await register_dictionary(None, b"dictionary")
+
+
+@pytest.mark.asyncio
+async def test_zstd_dictionary_round_trip() -> None:
+    zstandard = pytest.importorskip("zstandard")
+    samples = [
+        b'{"event_type": "app_switch", "application_name": "App %d", "seq": %d}' % (i % 7, i) for i in range(2000)
+    ]
+    dictionary = zstandard.train_dictionary(4096, samples)
+    redis = _FakeRedis()
+    body = zstandard.ZstdCompressor(dict_data=dictionary).compress(EVENTS)
+
+    with pytest.raises(UnknownDictionaryError):
+        await decode_request_body(body, "zstd", redis)
+
+    dict_id = await register_dictionary(redis, dictionary.as_bytes())
+    assert dict_id == dictionary.dict_id()
+    assert await register_dictionary(redis, dictionary.as_bytes()) == dict_id
+    assert await decode_request_body(body, "zstd", redis) == EVENTS
+    assert await decode_request_body(zstandard.ZstdCompressor().compress(EVENTS), "zstd", redis) == EVENTS
+
+    other = zstandard.train_dictionary(4096, [sample.replace(b"App", b"Tool") for sample in samples], dict_id=dict_id)
+    with pytest.raises(DictionaryConflictError):
+        await register_dictionary(redis, other.as_bytes())
@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.semantic.graph import GraphNode
+from src.semantic.graph import GraphNode, UpsertResult, stable_node_id
 from src.taskmining.graph_ingest import _detect_app_category, ingest_actions_to_graph
 
 
@@ -50,15 +50,23 @@ def mock_db_session():
     return session
 
 
+def _created_all(_kind: str, rows: list) -> UpsertResult:
+    return UpsertResult(created=len(rows))
+
+
 @pytest.fixture
 def mock_graph_service():
     service = AsyncMock()
-    service.find_nodes = AsyncMock(return_value=[])
-    service.batch_create_nodes = AsyncMock(return_value=[])
-    service.batch_create_relationships = AsyncMock(return_value=0)
+    service.list_engagement_nodes = AsyncMock(return_value=[])
+    service.batch_upsert_nodes = AsyncMock(side_effect=_created_all)
+    service.batch_upsert_relationships = AsyncMock(side_effect=_created_all)
     return service
 
 
+def _calls(mock: AsyncMock, kind: str) -> list[list[dict]]:
+    return [c.args[1] for c in mock.call_args_list if c.args[0] == kind]
+
+
 class TestIngestActionsToGraph:
     @pytest.mark.asyncio
     async def test_no_actions_returns_zeros(self, mock_db_session, mock_graph_service):
@@ -69,7 +77,7 @@ class TestIngestActionsToGraph:
         summary = await ingest_actions_to_graph(mock_db_session, mock_graph_service, "eng-1")
 
         assert summary == {"applications": 0, "user_actions": 0, "performed_in": 0, "preceded_by": 0}
-        mock_graph_service.batch_create_nodes.assert_not_called()
+        mock_graph_service.batch_upsert_nodes.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_creates_application_nodes(self, mock_db_session, mock_graph_service):
@@ -85,13 +93,9 @@ class TestIngestActionsToGraph:
         summary = await ingest_actions_to_graph(mock_db_session, mock_graph_service, "eng-1")
 
         assert summary["applications"] == 2
-        # batch_create_nodes called for Application and UserAction
-        calls = mock_graph_service.batch_create_nodes.call_args_list
-        app_call = [c for c in calls if c[0][0] == "Application"]
-        assert len(app_call) == 1
-        app_props = app_call[0][0][1]
-        app_names = {p["name"] for p in app_props}
-        assert app_names == {"Chrome", "Excel"}
+        app_calls = _calls(mock_graph_service.batch_upsert_nodes, "Application")
+        assert len(app_calls) == 1
+        assert {p["name"] for p in app_calls[0]} == {"Chrome", "Excel"}
 
     @pytest.mark.asyncio
     async def test_creates_user_action_nodes(self, mock_db_session, mock_graph_service):
@@ -104,9 +108,24 @@ class TestIngestActionsToGraph:
         summary = await ingest_actions_to_graph(mock_db_session, mock_graph_service, "eng-1")
 
         assert summary["user_actions"] == 2
-        ua_calls = [c for c in mock_graph_service.batch_create_nodes.call_args_list if c[0][0] == "UserAction"]
+        ua_calls = _calls(mock_graph_service.batch_upsert_nodes, "UserAction")
         assert len(ua_calls) == 1
-        assert len(ua_calls[0][0][1]) == 2
+        assert len(ua_calls[0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_node_ids_are_stable_across_runs(self, mock_db_session, mock_graph_service):
+        a1 = _make_action(app_name="Excel")
+        result_mock = MagicMock()
+        result_mock.scalars.return_value.all.return_value = [a1]
+        mock_db_session.execute = AsyncMock(return_value=result_mock)
+
+        await ingest_actions_to_graph(mock_db_session, mock_graph_service, "eng-1")
+        await ingest_actions_to_graph(mock_db_session, mock_graph_service, "eng-1")
+
+        first, second = _calls(mock_graph_service.batch_upsert_nodes, "UserAction")
+        assert first[0]["id"] == second[0]["id"] == stable_node_id("eng-1", "UserAction", str(a1.id))
+        first, second = _calls(mock_graph_service.batch_upsert_relationships, "PERFORMED_IN")
+        assert first == second
 
     @pytest.mark.asyncio
     async def test_creates_performed_in_relationships(self, mock_db_session, mock_graph_service):
@@ -114,15 +133,11 @@ class TestIngestActionsToGraph:
         result_mock = MagicMock()
         result_mock.scalars.return_value.all.return_value = [a1]
         mock_db_session.execute = AsyncMock(return_value=result_mock)
-        mock_graph_service.batch_create_relationships = AsyncMock(return_value=1)
 
         summary = await ingest_actions_to_graph(mock_db_session, mock_graph_service, "eng-1")
 
         assert summary["performed_in"] == 1
-        rel_calls = [
-            c for c in mock_graph_service.batch_create_relationships.call_args_list if c[0][0] == "PERFORMED_IN"
-        ]
-        assert len(rel_calls) == 1
+        assert len(_calls(mock_graph_service.batch_upsert_relationships, "PERFORMED_IN")) == 1
 
     @pytest.mark.asyncio
     async def test_creates_preceded_by_chains(self, mock_db_session, mock_graph_service):
@@ -133,26 +148,26 @@ class TestIngestActionsToGraph:
         result_mock = MagicMock()
         result_mock.scalars.return_value.all.return_value = [a1, a2, a3]
         mock_db_session.execute = AsyncMock(return_value=result_mock)
-        mock_graph_service.batch_create_relationships = AsyncMock(return_value=2)
 
         summary = await ingest_actions_to_graph(mock_db_session, mock_graph_service, "eng-1")
 
         assert summary["preceded_by"] == 2
-        prec_calls = [
-            c for c in mock_graph_service.batch_create_relationships.call_args_list if c[0][0] == "PRECEDED_BY"
-        ]
+        prec_calls = _calls(mock_graph_service.batch_upsert_relationships, "PRECEDED_BY")
         assert len(prec_calls) == 1
-        assert len(prec_calls[0][0][1]) == 2  # 2 PRECEDED_BY links for 3 actions
+        assert len(prec_calls[0]) == 2  # 2 PRECEDED_BY links for 3 actions
 
     @pytest.mark.asyncio
-    async def test_idempotent_skips_existing_apps(self, mock_db_session, mock_graph_service):
+    async def test_existing_apps_keep_their_ids(self, mock_db_session, mock_graph_service):
         existing_app = _make_graph_node(node_id="existing-app", props={"name": "Excel"})
-        mock_graph_service.find_nodes = AsyncMock(
+        mock_graph_service.list_engagement_nodes = AsyncMock(
             side_effect=[
                 [existing_app],  # existing Application nodes
                 [],  # existing UserAction nodes
             ]
         )
+        mock_graph_service.batch_upsert_nodes = AsyncMock(
+            side_effect=[UpsertResult(created=1, matched=1), UpsertResult(created=2)]
+        )
 
         a1 = _make_action(app_name="Excel")
         a2 = _make_action(app_name="Chrome")
@@ -162,26 +177,29 @@ class TestIngestActionsToGraph:
 
         summary = await ingest_actions_to_graph(mock_db_session, mock_graph_service, "eng-1")
 
-        # Only Chrome should be new
+        # Only Chrome is new; Excel is merged onto its existing node
         assert summary["applications"] == 1
-        app_calls = [c for c in mock_graph_service.batch_create_nodes.call_args_list if c[0][0] == "Application"]
-        assert len(app_calls) == 1
-        assert app_calls[0][0][1][0]["name"] == "Chrome"
+        app_props = _calls(mock_graph_service.batch_upsert_nodes, "Application")[0]
+        ids = {p["name"]: p["id"] for p in app_props}
+        assert ids == {"Excel": "existing-app", "Chrome": stable_node_id("eng-1", "Application", "Chrome")}
 
     @pytest.mark.asyncio
-    async def test_idempotent_skips_existing_user_actions(self, mock_db_session, mock_graph_service):
+    async def test_existing_user_actions_are_not_counted(self, mock_db_session, mock_graph_service):
         a1 = _make_action()
         existing_ua = _make_graph_node(
             node_id="existing-ua",
             label="UserAction",
             props={"source_action_id": str(a1.id)},
         )
-        mock_graph_service.find_nodes = AsyncMock(
+        mock_graph_service.list_engagement_nodes = AsyncMock(
             side_effect=[
                 [],  # existing Application nodes
                 [existing_ua],  # existing UserAction nodes
             ]
         )
+        mock_graph_service.batch_upsert_nodes = AsyncMock(
+            side_effect=[UpsertResult(created=1), UpsertResult(matched=1)]
+        )
 
         result_mock = MagicMock()
         result_mock.scalars.return_value.all.return_value = [a1]
@@ -189,8 +207,9 @@ class TestIngestActionsToGraph:
 
         summary = await ingest_actions_to_graph(mock_db_session, mock_graph_service, "eng-1")
 
-        # Action already exists, should not create
+        # Action already exists, so it is matched rather than created
         assert summary["user_actions"] == 0
+        assert _calls(mock_graph_service.batch_upsert_nodes, "UserAction")[0][0]["id"] == "existing-ua"
 
     @pytest.mark.asyncio
     async def test_action_without_app_name_skips_performed_in(self, mock_db_session, mock_graph_service):
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import tempfile
 from datetime import UTC, datetime
+from types import SimpleNamespace
 
+import numpy as np
 import pytest
 
 from src.core.models.taskmining import ActionCategory
@@ -169,6 +171,66 @@ class TestClassifierPrediction:
         assert results == [None, None]
 
 
+class _LinearModel:
+    """Deterministic stand-in for a fitted sklearn model (softmax over a fixed projection)."""
+
+    def __init__(self, n_classes: int) -> None:
+        rng = np.random.default_rng(0)
+        self.weights = rng.normal(size=(len(FEATURE_NAMES), n_classes)) / 50
+        self.calls: list[tuple[int, int]] = []
+
+    def predict_proba(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        self.calls.append(x.shape)
+        logits = x @ self.weights
+        exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+        return exp / exp.sum(axis=1, keepdims=True)
+
+
+class _HardModel:
+    """Model without predict_proba (uncalibrated fallback path)."""
+
+    def predict(self, x):
+        return np.asarray(x)[:, 0].astype(int) % 2
+
+
+def _stub_classifier(model: object) -> GradientBoostingTaskClassifier:
+    clf = GradientBoostingTaskClassifier()
+    clf._model = model
+    clf._label_encoder = SimpleNamespace(classes_=np.array(["data_entry", "navigation"]))
+    return clf
+
+
+class TestBatchPrediction:
+    """predict_batch scores one feature matrix and matches per-session predict."""
+
+    def _sessions(self) -> list[AggregatedSession]:
+        return [
+            _make_session(keyboard=60 + i, mouse=i % 7, scroll=i % 5, app=("Excel", "Chrome", "Slack")[i % 3])
+            for i in range(25)
+        ]
+
+    def test_one_model_call_with_identical_results(self):
+        model = _LinearModel(n_classes=2)
+        clf = _stub_classifier(model)
+        sessions = self._sessions()
+
+        batch = clf.predict_batch(sessions)
+        assert model.calls == [(len(sessions), len(FEATURE_NAMES))]
+        assert batch == [clf.predict(s) for s in sessions]
+
+    def test_hard_prediction_fallback(self):
+        clf = _stub_classifier(_HardModel())
+        sessions = self._sessions()
+
+        batch = clf.predict_batch(sessions)
+        assert batch == [clf.predict(s) for s in sessions]
+        assert {p.confidence for p in batch} == {1.0}
+
+    def test_empty_batch(self):
+        assert _stub_classifier(_LinearModel(n_classes=2)).predict_batch([]) == []
+
+
 class TestModelPersistence:
     def test_save_and_load(self):
         ds = _build_training_dataset()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
+import numpy as np
 import pytest
 
 from src.taskmining.aggregation.session import AggregatedSession
@@ -11,6 +12,7 @@ from src.taskmining.ml.features import (
     FEATURE_NAMES,
     FEATURE_SCHEMA_VERSION,
     detect_app_category,
+    extract_feature_matrix,
     extract_features,
     extract_features_batch,
 )
@@ -150,6 +152,29 @@ class TestExtractFeaturesBatch:
         assert extract_features_batch([]) == []
 
 
+class TestExtractFeatureMatrix:
+    def test_rows_equal_per_session_vectors(self):
+        sessions = [
+            _make_session(),
+            _make_session(app="Google Chrome", keyboard=0, mouse=0, scroll=40, url_nav=7),
+            _make_session(app="Slack", keyboard=0, mouse=0, copy_paste=0, scroll=0, file_ops=0),
+            _make_session(app="Salesforce", duration_ms=0, active_ms=0),
+            _make_session(app="PyCharm", duration_ms=3, active_ms=1),
+            _make_session(started_at=datetime(2026, 1, 10, 10, 0, 0, tzinfo=UTC)),  # Saturday
+            _make_session(app="Jira", started_at=datetime(2026, 1, 6, 18, 59, 0, tzinfo=UTC)),
+            _make_session(app="Unknown Tool", keyboard=7, mouse=0),
+        ]
+        matrix = extract_feature_matrix(sessions)
+
+        assert matrix.shape == (len(sessions), len(FEATURE_NAMES))
+        assert matrix.dtype == np.float64
+        for row, session in zip(matrix.tolist(), sessions, strict=True):
+            assert row == extract_features(session)
+
+    def test_empty_batch_has_schema_width(self):
+        assert extract_feature_matrix([]).shape == (0, len(FEATURE_NAMES))
+
+
 class TestDetectAppCategory:
     @pytest.mark.parametrize(
         "app,expected",
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import itertools
+import random
+from collections import Counter
 from datetime import UTC, datetime
 from unittest.mock import MagicMock
 
@@ -134,17 +137,20 @@ class TestHybridClassifier:
     def test_classify_batch(self):
         ml_clf = MagicMock()
         ml_clf.is_trained = True
-        ml_clf.predict.return_value = MLPrediction(
+        confident = MLPrediction(
             category=ActionCategory.DATA_ENTRY,
             confidence=0.90,
             probabilities={"data_entry": 0.90},
         )
+        ml_clf.predict_batch.return_value = [confident, None]
 
         hybrid = HybridClassifier(ml_classifier=ml_clf, ml_threshold=0.75)
         results = hybrid.classify_batch([_make_session(), _make_session()])
 
         assert len(results) == 2
-        assert all(r.source == "ml" for r in results)
+        assert [r.source for r in results] == ["ml", "rule_based"]
+        ml_clf.predict_batch.assert_called_once()
+        ml_clf.predict.assert_not_called()
 
     def test_ml_available_property(self):
         ml_clf = MagicMock()
@@ -241,3 +247,71 @@ class TestSequenceMining:
         ab = next((p for p in result.patterns if p.pattern == ("a", "b")), None)
         assert ab is not None
         assert ab.support == 2  # 2 sessions, not 3 occurrences
+
+    def test_matches_brute_force_enumeration(self):
+        rng = random.Random(11)
+        sequences = [[rng.choice("abcdef") for _ in range(rng.randint(0, 12))] for _ in range(300)]
+
+        result = mine_sequences(sequences, min_n=2, max_n=5, min_support=4)
+
+        assert {p.pattern: p.support for p in result.patterns} == _brute_force_supports(sequences, 2, 5, 4)
+
+    def test_partitioned_matches_single_pass(self):
+        rng = random.Random(3)
+        sequences = [[rng.choice("abcde") for _ in range(rng.randint(1, 10))] for _ in range(200)]
+
+        single = mine_sequences(sequences, min_n=2, max_n=4, min_support=5)
+        partitioned = mine_sequences(sequences, min_n=2, max_n=4, min_support=5, partitions=7)
+
+        assert partitioned.patterns == single.patterns
+
+    def test_process_pool_matches_single_pass(self):
+        rng = random.Random(5)
+        sequences = [[rng.choice("abcd") for _ in range(rng.randint(1, 8))] for _ in range(120)]
+
+        single = mine_sequences(sequences, min_n=2, max_n=3, min_support=3, gapped=True)
+        pooled = mine_sequences(sequences, min_n=2, max_n=3, min_support=3, gapped=True, workers=2)
+
+        assert pooled.patterns == single.patterns
+
+    def test_ties_sorted_deterministically(self):
+        sequences = [["b", "a"], ["a", "b"], ["b", "a"], ["a", "b"]]
+        result = mine_sequences(sequences, min_n=2, max_n=2, min_support=2)
+
+        assert [p.pattern for p in result.patterns] == [("a", "b"), ("b", "a")]
+
+    def test_gapped_patterns_allow_interleaved_actions(self):
+        sequences = [
+            ["a", "x", "b", "c"],
+            ["a", "b", "y", "c"],
+            ["c", "a", "b"],
+        ]
+        contiguous = {p.pattern for p in mine_sequences(sequences, min_n=3, max_n=3, min_support=2).patterns}
+        gapped = {
+            p.pattern: p.support
+            for p in mine_sequences(sequences, min_n=2, max_n=3, min_support=2, gapped=True).patterns
+        }
+
+        assert ("a", "b", "c") not in contiguous
+        assert gapped[("a", "b", "c")] == 2
+        assert gapped[("a", "b")] == 3
+
+    def test_gapped_matches_brute_force_enumeration(self):
+        rng = random.Random(17)
+        sequences = [[rng.choice("abcd") for _ in range(rng.randint(0, 7))] for _ in range(80)]
+
+        result = mine_sequences(sequences, min_n=1, max_n=3, min_support=6, gapped=True)
+
+        expected: Counter[tuple[str, ...]] = Counter()
+        for seq in sequences:
+            expected.update({sub for n in range(1, 4) for sub in itertools.combinations(seq, n)})
+        assert {p.pattern: p.support for p in result.patterns} == {k: v for k, v in expected.items() if v >= 6}
+
+
+def _brute_force_supports(
+    sequences: list[list[str]], min_n: int, max_n: int, min_support: int
+) -> dict[tuple[str, ...], int]:
+    counts: Counter[tuple[str, ...]] = Counter()
+    for seq in sequences:
+        counts.update({tuple(seq[i : i + n]) for n in range(min_n, max_n + 1) for i in range(len(seq) - n + 1)})
+    return {k: v for k, v in counts.items() if v >= min_support}
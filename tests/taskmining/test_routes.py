@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import json
 import uuid
 from datetime import UTC, datetime
 from typing import Any
@@ -313,3 +316,66 @@ class TestDashboardStats:
         assert data["active_agents"] == 0
         assert data["total_events"] == 0
         assert data["app_usage"] == []
+
+
+class TestEncodedEventBodies:
+    """Tests for Content-Encoding handling on POST /api/v1/taskmining/events."""
+
+    @staticmethod
+    def _batch() -> bytes:
+        return json.dumps(
+            {
+                "agent_id": str(uuid.uuid4()),
+                "session_id": str(uuid.uuid4()),
+                "events": [{"event_type": "app_switch", "timestamp": datetime.now(UTC).isoformat()}],
+            }
+        ).encode()
+
+    @pytest.mark.asyncio
+    async def test_gzip_body_is_decoded_before_validation(
+        self, client: AsyncClient, mock_db_session: AsyncMock
+    ) -> None:
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_db_session.execute = AsyncMock(return_value=mock_result)
+        body = self._batch()
+
+        response = await client.post(
+            "/api/v1/taskmining/events",
+            content=gzip.compress(body),
+            headers={
+                "Content-Type": "application/json",
+                "Content-Encoding": "gzip",
+                "X-Checksum": hashlib.sha256(body).hexdigest(),
+            },
+        )
+        # Reaches the agent lookup, so the body was decoded and validated
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Agent not found"
+
+    @pytest.mark.asyncio
+    async def test_checksum_mismatch_rejected(self, client: AsyncClient) -> None:
+        response = await client.post(
+            "/api/v1/taskmining/events",
+            content=gzip.compress(self._batch()),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip", "X-Checksum": "0" * 64},
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_corrupt_gzip_rejected(self, client: AsyncClient) -> None:
+        response = await client.post(
+            "/api/v1/taskmining/events",
+            content=b"not gzip",
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_unknown_encoding_unsupported(self, client: AsyncClient) -> None:
+        response = await client.post(
+            "/api/v1/taskmining/events",
+            content=self._batch(),
+            headers={"Content-Type": "application/json", "Content-Encoding": "br"},
+        )
+        assert response.status_code == 415
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from datetime import UTC, datetime, timedelta
 
 from src.taskmining.aggregation.session import SessionAggregator
@@ -188,3 +189,39 @@ class TestEventCounting:
         ]
         sessions = agg.process_events(events)
         assert len(sessions) == 1
+
+
+class TestCheckpointState:
+    """Scenario: An open session survives a round trip through its saved state."""
+
+    def test_state_round_trip_resumes_open_session(self):
+        agg = SessionAggregator(idle_threshold_seconds=120)
+        agg.process_events(
+            [
+                _event("app_switch", "Excel", minutes=0),
+                _event("keyboard_action", "Excel", minutes=1),
+                _event("idle_start", "Excel", minutes=2),
+            ]
+        )
+        state = json.loads(json.dumps(agg.to_state()))
+
+        restored = SessionAggregator.from_state(state)
+        restored.process_events(
+            [
+                _event("idle_end", "Excel", minutes=3),
+                _event("app_switch", "Outlook", minutes=5),
+            ]
+        )
+        (session,) = restored.take_completed()
+        assert restored.idle_threshold_seconds == 120
+        assert session.keyboard_event_count == 1
+        assert session.idle_duration_ms == 60_000
+        assert session.duration_ms == 300_000
+        assert restored.take_completed() == []
+
+    def test_flush_closes_at_given_time(self):
+        agg = SessionAggregator()
+        agg.process_events([_event("app_switch", "Excel", minutes=0)])
+        end = datetime(2026, 2, 25, 10, 7, 0, tzinfo=UTC)
+        (session,) = agg.flush(end_time=end)
+        assert session.ended_at == end
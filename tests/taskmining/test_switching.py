@@ -7,6 +7,7 @@ from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from src.core.models.taskmining import DesktopEventType, SwitchingTrace
 from src.taskmining.switching import (
@@ -260,19 +261,13 @@ class TestAssembleSwitchingTraces:
 
 class TestComputeTransitionMatrix:
     @pytest.mark.asyncio
-    async def test_builds_matrix_from_events(self) -> None:
-        """Verifies transition counts are correctly assembled."""
+    async def test_builds_matrix_from_aggregated_pairs(self) -> None:
+        """Verifies transition counts are assembled from the aggregated rows."""
         engagement_id = uuid.uuid4()
         base_time = datetime(2026, 2, 1, 9, 0, tzinfo=UTC)
-        events = [
-            _make_event("Excel", base_time, engagement_id),
-            _make_event("Chrome", base_time + timedelta(seconds=10), engagement_id),
-            _make_event("Excel", base_time + timedelta(seconds=20), engagement_id),
-            _make_event("Chrome", base_time + timedelta(seconds=30), engagement_id),
-        ]
 
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = events
+        mock_result.all.return_value = [("Excel", "Chrome", 2), ("Chrome", "Excel", 1)]
         session = AsyncMock()
         session.execute = AsyncMock(return_value=mock_result)
         session.flush = AsyncMock()
@@ -291,13 +286,44 @@ class TestComputeTransitionMatrix:
 
         assert matrix.total_transitions == 3
         assert matrix.unique_apps == 2
-        assert "Excel" in matrix.matrix_data
-        assert matrix.matrix_data["Excel"]["Chrome"] >= 1
+        assert matrix.matrix_data == {"Excel": {"Chrome": 2}, "Chrome": {"Excel": 1}}
+        assert matrix.top_transitions[0] == {"from_app": "Excel", "to_app": "Chrome", "count": 2}
+        session.add.assert_called_once_with(matrix)
+
+    @pytest.mark.asyncio
+    async def test_pairs_are_counted_per_session_in_sql(self) -> None:
+        """The query pairs switches within a session and returns only counts."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=mock_result)
+        session.flush = AsyncMock()
+        session.add = MagicMock()
+
+        base = datetime(2026, 2, 1, 9, 0, tzinfo=UTC)
+        await compute_transition_matrix(
+            session=session,
+            engagement_id=uuid.uuid4(),
+            role_id=None,
+            period_start=base,
+            period_end=base + timedelta(days=30),
+        )
+
+        stmt = session.execute.call_args.args[0]
+        sql = " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+        assert "lag(coalesce(nullif(task_mining_events.application_name" in sql
+        assert (
+            "OVER (PARTITION BY task_mining_events.session_id"
+            " ORDER BY task_mining_events.timestamp, task_mining_events.id)" in sql
+        )
+        assert "count(*)" in sql
+        assert "GROUP BY anon_1.from_app, anon_1.to_app" in sql
+        assert [c.name for c in stmt.selected_columns] == ["from_app", "to_app", "count"]
 
     @pytest.mark.asyncio
     async def test_empty_events_creates_zero_matrix(self) -> None:
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.all.return_value = []
         session = AsyncMock()
         session.execute = AsyncMock(return_value=mock_result)
         session.flush = AsyncMock()
@@ -1,45 +1,88 @@
 """Unit tests for src/taskmining/worker.py process_task dispatch function.
 
-Tests focus on the process_task coroutine and _handle_assemble_switching
-without touching the Redis run_worker loop.
+Tests focus on the process_task coroutine and _handle_assemble_switching,
+plus the acknowledgement rules of the run_worker loop.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.taskmining.worker import process_task
+from src.core.redis import TASK_MINING_STREAM
+from src.taskmining.worker import process_task, run_worker
 
 # ---------------------------------------------------------------------------
-# aggregate task type
+# aggregate / materialize task types
 # ---------------------------------------------------------------------------
 
 
 class TestProcessTaskAggregate:
-    """aggregate task type raises NotImplementedError (stub pending Epic #206)."""
+    """aggregate and materialize entries are queued to the aggregation engine."""
 
     @pytest.mark.asyncio
-    async def test_aggregate_raises_not_implemented(self) -> None:
-        task = {"task_type": "aggregate"}
-        with pytest.raises(NotImplementedError, match="aggregate"):
-            await process_task(task)
+    @pytest.mark.parametrize("task_type", ["aggregate", "materialize"])
+    async def test_queued_to_engine(self, task_type: str) -> None:
+        engine = MagicMock()
+        engine.submit = AsyncMock()
+        task = {"task_type": task_type, "session_id": str(uuid.uuid4())}
+
+        result = await process_task(task, engine=engine, msg_id="1-0", redelivered=True)
+
+        assert result == {"status": "queued"}
+        engine.submit.assert_awaited_once_with("1-0", task, redelivered=True)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("task_type", ["aggregate", "materialize"])
+    async def test_requires_engine(self, task_type: str) -> None:
+        with pytest.raises(RuntimeError, match=task_type):
+            await process_task({"task_type": task_type})
 
 
 # ---------------------------------------------------------------------------
-# materialize task type
+# run_worker
 # ---------------------------------------------------------------------------
 
 
-class TestProcessTaskMaterialize:
-    """materialize task type raises NotImplementedError."""
+class TestRunWorker:
+    """The consumer loop re-reads its own pending entries and leaves engine entries unacked."""
 
     @pytest.mark.asyncio
-    async def test_materialize_raises_not_implemented(self) -> None:
-        task = {"task_type": "materialize"}
-        with pytest.raises(NotImplementedError, match="materialize"):
-            await process_task(task)
+    async def test_pending_entries_first_and_engine_owns_ack(self) -> None:
+        shutdown = asyncio.Event()
+        aggregate = {"payload": json.dumps({"task_type": "aggregate", "session_id": "s"})}
+        unknown = {"payload": json.dumps({"task_type": "assemble_switching"})}
+        reads = [
+            [(TASK_MINING_STREAM, [("1-0", aggregate)])],  # own pending entries
+            [(TASK_MINING_STREAM, [])],  # pending list exhausted
+            [(TASK_MINING_STREAM, [("2-0", aggregate), ("3-0", unknown), ("4-0", {})])],
+        ]
+
+        async def xreadgroup(*args: object, **kwargs: object) -> list:
+            if not reads:
+                shutdown.set()
+                return []
+            return reads.pop(0)
+
+        redis = MagicMock()
+        redis.xgroup_create = AsyncMock()
+        redis.xreadgroup = AsyncMock(side_effect=xreadgroup)
+        redis.xack = AsyncMock()
+        engine = MagicMock()
+        engine.submit = AsyncMock()
+
+        await run_worker(redis, "tm-worker-0", shutdown, engine=engine)
+
+        first, second, third = redis.xreadgroup.await_args_list[:3]
+        assert first.args[2] == {TASK_MINING_STREAM: "0"}
+        assert second.args[2] == {TASK_MINING_STREAM: "1-0"}
+        assert third.args[2] == {TASK_MINING_STREAM: ">"}
+        assert [c.kwargs["redelivered"] for c in engine.submit.await_args_list] == [True, False]
+        assert [c.args[2] for c in redis.xack.await_args_list] == ["3-0", "4-0"]
 
 
 # ---------------------------------------------------------------------------
@@ -125,9 +168,57 @@ class TestProcessTaskAssembleSwitchingInvalidUuid:
             "engagement_id": str(uuid.uuid4()),
             "session_id": "not-a-uuid",
         }
-        # The lazy imports will fail in a pure-unit test environment, but UUID
-        # validation happens before the lazy imports, so the invalid session_id
-        # causes an early error return without hitting the DB.
+        # No worker context is passed, but UUID validation happens first, so
+        # the invalid session_id causes an early error return.
         result = await process_task(task)
         assert result["status"] == "error"
         assert result["detail"] == "invalid UUID"
+
+
+# ---------------------------------------------------------------------------
+# assemble_switching — shared worker clients
+# ---------------------------------------------------------------------------
+
+
+class TestProcessTaskAssembleSwitchingContext:
+    """assemble_switching runs on the worker context's long-lived clients."""
+
+    @pytest.mark.asyncio
+    async def test_valid_task_without_context_raises(self) -> None:
+        task = {"task_type": "assemble_switching", "engagement_id": str(uuid.uuid4())}
+        with pytest.raises(RuntimeError, match="WorkerContext"):
+            await process_task(task)
+
+    @pytest.mark.asyncio
+    async def test_uses_shared_session_factory_and_driver(self) -> None:
+        db_session = AsyncMock()
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(return_value=db_session)
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+        context = MagicMock()
+        context.session_factory = MagicMock(return_value=session_cm)
+        context.neo4j_driver.close = AsyncMock()
+        engagement_id = uuid.uuid4()
+        task = {"task_type": "assemble_switching", "engagement_id": str(engagement_id)}
+
+        with (
+            patch(
+                "src.taskmining.switching.assemble_switching_traces",
+                new_callable=AsyncMock,
+                return_value=[MagicMock(), MagicMock()],
+            ) as assemble,
+            patch(
+                "src.taskmining.graph_ingest.ingest_switching_traces",
+                new_callable=AsyncMock,
+                return_value={"switching_traces": 2},
+            ) as ingest,
+            patch("src.core.neo4j.create_neo4j_driver") as create_driver,
+        ):
+            result = await process_task(task, context=context)
+
+        assert result == {"status": "ok", "traces_created": 2, "graph_nodes_created": 2}
+        assert context.session_factory.call_count == 2
+        assemble.assert_awaited_once_with(session=db_session, engagement_id=engagement_id, session_id=None)
+        assert ingest.await_args.kwargs["graph_service"]._driver is context.neo4j_driver
+        create_driver.assert_not_called()
+        context.neo4j_driver.close.assert_not_awaited()
@@ -12,7 +12,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from src.core.models import TOMDimension
-from src.tom.best_practice_matcher import BestPracticeMatcher
+from src.tom.best_practice_matcher import BestPracticeMatcher, reset_practice_index
 
 
 def _make_gap(dimension: TOMDimension, recommendation: str = "Improve the process") -> MagicMock:
@@ -191,26 +191,48 @@ async def test_bp_dict_structure():
 # =============================================================================
 
 
-def _make_embedding_service(similarities: list[float]) -> MagicMock:
-    """Mock embedding service returning preset cosine similarities."""
+def _make_embedding_service(similarities: dict[str, float]) -> MagicMock:
+    """Mock embedding service returning preset cosine similarities.
+
+    Texts in ``similarities`` (practice descriptions) embed at the given
+    similarity to every other text (gap recommendations).
+    """
     import math
 
-    svc = MagicMock()
     query_vec = [1.0, 0.0]
-    bp_vecs = []
-    for sim in similarities:
+    vectors = {}
+    for text, sim in similarities.items():
         angle = math.acos(max(-1.0, min(1.0, sim)))
-        bp_vecs.append([math.cos(angle), math.sin(angle)])
+        vectors[text] = [math.cos(angle), math.sin(angle)]
 
+    async def embed_texts(texts: list[str]) -> list[list[float]]:
+        return [vectors.get(text, query_vec) for text in texts]
+
+    svc = MagicMock()
     svc.embed_text_async = AsyncMock(return_value=query_vec)
-    svc.embed_texts_async = AsyncMock(return_value=bp_vecs)
+    svc.embed_texts_async = AsyncMock(side_effect=embed_texts)
     return svc
 
 
+def _session_for(gaps: list[MagicMock], practices: list[MagicMock]) -> AsyncMock:
+    gap_result = MagicMock()
+    gap_result.scalars.return_value.all.return_value = gaps
+    bp_result = MagicMock()
+    bp_result.scalars.return_value.all.return_value = practices
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=[gap_result, bp_result])
+    return session
+
+
+@pytest.fixture(autouse=True)
+def _fresh_practice_index() -> None:
+    reset_practice_index()
+
+
 @pytest.mark.asyncio
 async def test_embedding_ranking_filters_below_threshold():
     """Embedding scores below 0.5 are excluded from results."""
-    embedding_service = _make_embedding_service([0.3])
+    embedding_service = _make_embedding_service({"Use workflow automation": 0.3})
     matcher = BestPracticeMatcher(embedding_service=embedding_service)
     session = AsyncMock()
 
@@ -237,7 +259,7 @@ async def test_embedding_ranking_filters_below_threshold():
 @pytest.mark.asyncio
 async def test_embedding_ranking_includes_above_threshold():
     """Embedding scores >= 0.5 are included with score attached."""
-    embedding_service = _make_embedding_service([0.8])
+    embedding_service = _make_embedding_service({"Use workflow automation": 0.8})
     matcher = BestPracticeMatcher(embedding_service=embedding_service)
     session = AsyncMock()
 
@@ -264,7 +286,9 @@ async def test_embedding_ranking_includes_above_threshold():
 @pytest.mark.asyncio
 async def test_embedding_ranking_sorted_by_score():
     """Multiple BPs sorted descending by similarity score."""
-    embedding_service = _make_embedding_service([0.9, 0.6, 0.75])
+    embedding_service = _make_embedding_service(
+        {"BP with score 0.9": 0.9, "BP with score 0.6": 0.6, "BP with score 0.75": 0.75}
+    )
     matcher = BestPracticeMatcher(embedding_service=embedding_service)
     session = AsyncMock()
 
@@ -290,3 +314,59 @@ async def test_embedding_ranking_sorted_by_score():
     scores = [r["score"] for r in result[str(gap.id)]]
     assert scores == sorted(scores, reverse=True)
     assert scores[0] == pytest.approx(0.9, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_embedding_batches_gaps_and_reuses_practice_matrix():
+    """Gap texts are embedded in one call and practice embeddings only once."""
+    embedding_service = _make_embedding_service({"Automate approvals": 0.9, "Board oversight": 0.7})
+    matcher = BestPracticeMatcher(embedding_service=embedding_service)
+    gaps = [
+        _make_gap(TOMDimension.PROCESS_ARCHITECTURE, "Speed up approvals"),
+        _make_gap(TOMDimension.PROCESS_ARCHITECTURE, "Remove manual checks"),
+        _make_gap(TOMDimension.GOVERNANCE_STRUCTURES, "Clarify ownership"),
+    ]
+    practices = [
+        _make_bp(TOMDimension.PROCESS_ARCHITECTURE, "Automate approvals"),
+        _make_bp(TOMDimension.GOVERNANCE_STRUCTURES, "Board oversight"),
+    ]
+
+    first = await matcher.match_gaps_to_practices(_session_for(gaps, practices), "eng-1", "tom-1")
+    second = await matcher.match_gaps_to_practices(_session_for(gaps, practices), "eng-1", "tom-1")
+
+    assert first == second
+    assert [r["score"] for r in first[str(gaps[0].id)]] == [pytest.approx(0.9, abs=0.01)]
+    assert [r["score"] for r in first[str(gaps[2].id)]] == [pytest.approx(0.7, abs=0.01)]
+    # Run 1: gap batch + one matrix per dimension; run 2: gap batch only.
+    assert embedding_service.embed_texts_async.await_count == 4
+    embedding_service.embed_text_async.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_practice_matrix_refreshed_when_practice_changes():
+    """Changing a practice description re-embeds that dimension."""
+    embedding_service = _make_embedding_service({"Old text": 0.9, "New text": 0.6})
+    matcher = BestPracticeMatcher(embedding_service=embedding_service)
+    gap = _make_gap(TOMDimension.PROCESS_ARCHITECTURE, "Improve process")
+    bp = _make_bp(TOMDimension.PROCESS_ARCHITECTURE, "Old text")
+
+    before = await matcher.match_gaps_to_practices(_session_for([gap], [bp]), "eng-1", "tom-1")
+    bp.description = "New text"
+    after = await matcher.match_gaps_to_practices(_session_for([gap], [bp]), "eng-1", "tom-1")
+
+    assert before[str(gap.id)][0]["score"] == pytest.approx(0.9, abs=0.01)
+    assert after[str(gap.id)][0]["score"] == pytest.approx(0.6, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_embedding_failure_falls_back_to_default_scores():
+    """Embedding errors keep dimension matches with the default score."""
+    embedding_service = MagicMock()
+    embedding_service.embed_texts_async = AsyncMock(side_effect=ConnectionError("down"))
+    matcher = BestPracticeMatcher(embedding_service=embedding_service)
+    gap = _make_gap(TOMDimension.PROCESS_ARCHITECTURE)
+    bp = _make_bp(TOMDimension.PROCESS_ARCHITECTURE)
+
+    result = await matcher.match_gaps_to_practices(_session_for([gap], [bp]), "eng-1", "tom-1")
+
+    assert [r["score"] for r in result[str(gap.id)]] == [1.0]